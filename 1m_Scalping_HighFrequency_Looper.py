@@ -1,7 +1,7 @@
 '''
 Module: 1m Scalping HighFrequency Looper
-Version: 1.0.0
-Last Updated: 2025-03-27
+Version: 1.1.0
+Last Updated: 2026-10-16
 Purpose: Dedicated 1m candle engine: Microprofit triggers, Tiny spreads only, Super fast TTL + small sizes.
 Core Objectives:
   - Explicit profitability and risk targets alignment: Ensure 1m scalping maximizes profit and minimizes risk.
@@ -10,10 +10,11 @@ Core Objectives:
   - Explicit 10/10 quality rating definition adherence: Code must meet all quality criteria, including modularity, error handling, metrics, logging, and testing.
 Summary of Enhancements:
   - Initial version.
+  - 1m bars come from an in-process bar_aggregator fed by the raw trade stream instead of a pre-built Redis candle key; analysis runs as each bar closes.
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -21,6 +22,7 @@ from prometheus_client import Counter, Gauge, Histogram
 import random  # For chaos testing
 import time
 import aiohttp
+from bar_aggregator import BarAggregator, run_bar_aggregator
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(module)s - %(message)s')
@@ -42,15 +44,23 @@ scalping_engine_errors_total = Counter('scalping_engine_errors_total', 'Total nu
 scalping_latency_seconds = Histogram('scalping_latency_seconds', 'Latency of scalping engine')
 microprofit_achieved = Gauge('microprofit_achieved', 'Microprofit achieved per trade')
 
+# 1m bars built in-process from SYMBOL's trades; bar_closed is set as each one closes
+aggregator = BarAggregator()
+bar_closed = asyncio.Event()
+
+def on_bar(event):
+    if event["symbol"] == SYMBOL and event["interval"] == "1m":
+        bar_closed.set()
+
 async def fetch_1m_candle_data():
-    '''Fetches 1m candle data and spread data from Redis.'''
+    '''Latest closed 1m bar from the in-process aggregator plus spread data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
-        candle_data = await redis.get(f"titan:prod::candle_1m:{SYMBOL}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        candle_data = aggregator.latest(SYMBOL, "1m")
         spread_data = await redis.get(f"titan:prod::spread:{SYMBOL}")
 
         if candle_data and spread_data:
-            return {"candle_data": json.loads(candle_data), "spread_data": float(spread_data)}
+            return {"candle_data": candle_data, "spread_data": float(spread_data)}
         else:
             logger.warning(json.dumps({"module": "1m Scalping HighFrequency Looper", "action": "Fetch 1m Candle Data", "status": "No Data"}))
             return None
@@ -100,22 +110,29 @@ async def execute_microprofit_trade(signal):
         return False
 
 async def scalping_engine_loop():
-    '''Main loop for the 1m scalping high-frequency looper module.'''
-    try:
-        data = await fetch_1m_candle_data()
-        if data:
-            signal = await analyze_scalping_opportunity(data)
-            if signal:
-                await execute_microprofit_trade(signal)
-
-        await asyncio.sleep(CANDLE_INTERVAL)  # Check for new opportunities every 1 minute
-    except Exception as e:
-        logger.error(json.dumps({"module": "1m Scalping HighFrequency Looper", "action": "Management Loop", "status": "Exception", "error": str(e)}))
-        await asyncio.sleep(300)  # Wait before retrying
+    '''Main loop for the 1m scalping high-frequency looper module; one pass per closed 1m bar.'''
+    while True:
+        try:
+            await asyncio.wait_for(bar_closed.wait(), timeout=CANDLE_INTERVAL * 2)
+            bar_closed.clear()
+            data = await fetch_1m_candle_data()
+            if data:
+                signal = await analyze_scalping_opportunity(data)
+                if signal:
+                    await execute_microprofit_trade(signal)
+        except asyncio.TimeoutError:
+            logger.warning(json.dumps({"module": "1m Scalping HighFrequency Looper", "action": "Management Loop", "status": "No Bar Closed"}))
+        except Exception as e:
+            logger.error(json.dumps({"module": "1m Scalping HighFrequency Looper", "action": "Management Loop", "status": "Exception", "error": str(e)}))
+            await asyncio.sleep(300)  # Wait before retrying
 
 async def main():
     '''Main function to start the 1m scalping high-frequency looper module.'''
-    await scalping_engine_loop()
+    redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+    await asyncio.gather(
+        run_bar_aggregator(redis, [SYMBOL], aggregator, on_bar=on_bar, persist_bars=False, publish=False),
+        scalping_engine_loop(),
+    )
 
 if __name__ == "__main__":
     import aiohttp
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -41,7 +41,7 @@ anti_trend_strategy_profit = Gauge('anti_trend_strategy_profit', 'Profit generat
 async def fetch_data():
     '''Fetches sentiment score, RSI/volume extremes, and AI memory data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         sentiment_score = await redis.get(f"titan:prod::market_sentiment:{SYMBOL}")
         rsi = await redis.get(f"titan:prod::rsi:{SYMBOL}")
         volume = await redis.get(f"titan:prod::volume:{SYMBOL}")
@@ -90,7 +90,7 @@ async def generate_signal(data):
 async def publish_signal(signal):
     '''Publishes the trading signal to Redis with a TTL.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         await redis.setex(f"titan:prod::signal:{SYMBOL}", SIGNAL_EXPIRY, json.dumps(signal))  # TTL set to SIGNAL_EXPIRY
         logger.info(json.dumps({"module": "AI Anti Trend Engine", "action": "Publish Signal", "status": "Success", "signal": signal}))
     except Exception as e:
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -42,7 +42,7 @@ pattern_confidence = Gauge('pattern_confidence', 'Confidence level of pattern re
 async def fetch_historical_data():
     '''Fetches historical market data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         historical_data = await redis.get(f"titan:prod::historical_data:{SYMBOL}")
         if historical_data:
             return json.loads(historical_data)
@@ -94,7 +94,7 @@ async def generate_signal(pattern_data):
 async def publish_signal(signal):
     '''Publishes the trading signal to Redis with a TTL.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         await redis.setex(f"titan:prod::signal:{SYMBOL}", SIGNAL_EXPIRY, json.dumps(signal))  # TTL set to SIGNAL_EXPIRY
         logger.info(json.dumps({"module": "AI Pattern Recognizer", "action": "Publish Signal", "status": "Success", "signal": signal}))
     except Exception as e:
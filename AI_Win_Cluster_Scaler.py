@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -43,7 +43,7 @@ trade_size_multiplier = Gauge('trade_size_multiplier', 'Trade size multiplier du
 async def fetch_recent_trade_outcomes(num_trades):
     '''Fetches the last few trade outcomes from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         trade_outcomes = []
         for i in range(num_trades):
             trade_data = await redis.get(f"titan:prod::trade_outcome:{SYMBOL}:{i}")
@@ -60,7 +60,7 @@ async def fetch_recent_trade_outcomes(num_trades):
 async def check_volatility_and_chaos():
     '''Checks if volatility is low and chaos is false from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         volatility = await redis.get("titan:prod::volatility:BTCUSDT")
         chaos_state = await redis.get("titan:chaos:state")
 
@@ -10,6 +10,7 @@ Core Objectives:
   - Explicit 10/10 quality rating definition adherence: Code must meet all quality criteria, including modularity, error handling, metrics, logging, and testing.
 Summary of Enhancements:
   - Initial version.
+  - Endpoints are picked by configured weight times remaining shared rate-limit budget; requests are charged to it.
 '''
 
 import asyncio
@@ -21,6 +22,8 @@ from prometheus_client import Counter, Gauge, Histogram
 import random  # For chaos testing
 import time
 import aiohttp
+from redis_connection_manager import get_async_redis
+from rate_limiter import RateLimiter
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(module)s - %(message)s')
@@ -31,7 +34,8 @@ REDIS_HOST = os.environ.get("REDIS_HOST", "localhost")
 REDIS_PORT = int(os.environ.get("REDIS_PORT", 6379))
 API_ENDPOINTS = ["https://api1.example.com", "https://api2.example.com"]  # Available API endpoints
 DEFAULT_API_ENDPOINT = "https://api1.example.com"  # Default API endpoint
-MAX_REQUESTS_PER_MINUTE = 100  # Maximum requests per minute
+MAX_REQUESTS_PER_MINUTE = int(os.environ.get("MAX_REQUESTS_PER_MINUTE", 100))  # Maximum requests per minute, per endpoint
+API_ENDPOINT_WEIGHTS = json.loads(os.environ.get("API_ENDPOINT_WEIGHTS", json.dumps({endpoint: 1.0 for endpoint in API_ENDPOINTS})))  # Relative capacity
 DATA_PRIVACY_ENABLED = True  # Enable data anonymization
 
 # Prometheus metrics (example)
@@ -40,12 +44,19 @@ load_balancing_errors_total = Counter('load_balancing_errors_total', 'Total numb
 response_latency_seconds = Histogram('api_response_latency_seconds', 'Latency of API responses', ['endpoint'])
 api_endpoint = Gauge('api_endpoint', 'Current API endpoint used')
 
+# Every endpoint gets its own budget in the shared rate limiter
+redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+limiter = RateLimiter(redis, {("api_gateway", endpoint): (MAX_REQUESTS_PER_MINUTE, 60) for endpoint in API_ENDPOINTS})
+
 async def select_api_endpoint():
     '''Selects an API endpoint based on load and ESG factors.'''
-    # Simulate endpoint selection
-    endpoint = DEFAULT_API_ENDPOINT
-    if random.random() < 0.5:  # Simulate endpoint selection
-        endpoint = "https://api2.example.com"
+    # Weighted random choice: configured capacity weight x budget left this minute
+    remaining = await asyncio.gather(*(limiter.remaining("api_gateway", endpoint) for endpoint in API_ENDPOINTS))
+    weights = [API_ENDPOINT_WEIGHTS.get(endpoint, 1.0) * left for endpoint, left in zip(API_ENDPOINTS, remaining)]
+    if not any(weights):
+        logger.warning(json.dumps({"module": "API Load Balancing Module", "action": "Select Endpoint", "status": "All Endpoints Exhausted"}))
+        return None
+    endpoint = random.choices(API_ENDPOINTS, weights=weights)[0]
 
     api_endpoint.set(API_ENDPOINTS.index(endpoint))
     logger.info(json.dumps({"module": "API Load Balancing Module", "action": "Select Endpoint", "status": "Selected", "endpoint": endpoint}))
@@ -54,6 +65,10 @@ async def select_api_endpoint():
 async def send_api_request(endpoint, data):
     '''Sends an API request to the selected endpoint.'''
     try:
+        allowed, retry_after = await limiter.acquire("api_gateway", endpoint)
+        if not allowed:
+            logger.warning(json.dumps({"module": "API Load Balancing Module", "action": "Send Request", "status": "Rate Limited", "endpoint": endpoint, "retry_after": retry_after}))
+            return None
         # Simulate API request
         logger.info(json.dumps({"module": "API Load Balancing Module", "action": "Send Request", "status": "Sending", "endpoint": endpoint}))
         global api_requests_total
@@ -16,6 +16,8 @@ import json
 import logging
 import os
 import aioredis
+from redis_connection_manager import get_async_redis
+from portfolio_risk_engine import ensure_feed
 
 # Configuration from config.json or ENV
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
@@ -26,6 +28,7 @@ CENTRAL_AI_BRAIN_CHANNEL = "titan:prod:central_ai_brain:signal"
 SYMBOL = os.getenv("SYMBOL", "BTCUSDT")
 DEFAULT_LEVERAGE = int(os.getenv("DEFAULT_LEVERAGE", 5))
 MAX_LEVERAGE = int(os.getenv("MAX_LEVERAGE", 10))
+RISK_BUDGET = float(os.getenv("RISK_BUDGET", 0.01))  # VaR as a fraction of equity that maps to a risk score of 1
 
 # Logging setup
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -63,6 +66,10 @@ async def adjust_leverage(market_data: dict, strategy_performance: dict, risk_me
     # Ensure leverage is within acceptable bounds
     leverage = max(1, min(MAX_LEVERAGE, leverage))
 
+    # Without a warm risk engine there is no VaR behind the risk score: stay at the minimum
+    if not risk_metrics.get("warm", False):
+        leverage = 1
+
     logging.info(json.dumps({"message": "Adjusted leverage", "leverage": leverage, "volatility": volatility, "profitability": profitability, "risk_score": risk_score}))
     return leverage
 
@@ -122,7 +129,7 @@ async def fetch_strategy_performance(redis: aioredis.Redis) -> dict:
 
 async def fetch_risk_metrics(redis: aioredis.Redis) -> dict:
     """
-    Fetches risk metrics from Redis.
+    Reads risk metrics from the in-process portfolio risk engine.
 
     Args:
         redis: The Redis connection object.
@@ -130,9 +137,12 @@ async def fetch_risk_metrics(redis: aioredis.Redis) -> dict:
     Returns:
         dict: A dictionary containing risk metrics.
     """
-    # Mock data for demonstration purposes. In a real system, this would fetch data from Redis.
+    engine = ensure_feed()
+    warm = engine.is_warm()
     risk_metrics = {
-        "risk_score": 0.3,
+        "risk_score": min(1.0, engine.risk_fraction() / RISK_BUDGET) if warm else 1.0,  # An empty engine reads zero risk
+        "margin_usage": engine.margin_usage(),
+        "warm": warm,
     }
     logging.info(json.dumps({"message": "Fetched risk metrics", "risk_metrics": risk_metrics}))
     return risk_metrics
@@ -143,7 +153,7 @@ async def main():
     Main function to orchestrate leverage adjustment.
     """
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
 
         # Fetch market data, strategy performance, and risk metrics
         market_data = await fetch_market_data(redis)
@@ -171,7 +181,7 @@ if __name__ == "__main__":
     asyncio.run(main())
 
 # === Titan Module Footnotes ===
-# Implemented Features: redis-pub, TTL, async safety
+# Implemented Features: redis-pub, TTL, async safety, risk score from portfolio_risk_engine VaR
 # Deferred Features: ESG logic → esg_mode.py
 # Excluded Features: backtest → backtest_engine.py
 # Quality Rating: 10/10 reviewed by Gemini on 2024-07-04
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -42,7 +42,7 @@ compression_score = Gauge('compression_score', 'Compression score for the curren
 async def fetch_compression_data():
     '''Fetches candle data, volume data, and whale wall data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         candle_data = await redis.get(f"titan:prod::candle_data:{SYMBOL}")
         volume_data = await redis.get(f"titan:prod::volume:{SYMBOL}")
         whale_wall_data = await redis.get(f"titan:prod::whale_wall:{SYMBOL}")
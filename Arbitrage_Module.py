@@ -17,7 +17,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -48,7 +48,7 @@ arbitrage_latency_seconds = Histogram('arbitrage_latency_seconds', 'Latency of a
 async def fetch_exchange_data(exchange):
     '''Fetches exchange-specific data (price, volume, ESG score) from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         price_data = await redis.get(f"titan:prod::{exchange}_price")  # Standardized key
         volume_data = await redis.get(f"titan:prod::{exchange}_volume")
         esg_data = await redis.get(f"titan:prod::{exchange}_esg")
@@ -14,6 +14,7 @@ Summary of Enhancements:
 
 import asyncio
 import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -85,7 +86,7 @@ async def process_strategy_request(message):
 async def async_strategy_graph_loop():
     '''Main loop for the async strategy graph executor module.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         pubsub = redis.pubsub()
         await pubsub.subscribe(STRATEGY_CHANNEL)
 
@@ -17,7 +17,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -54,7 +54,7 @@ banking_partner = Gauge('banking_partner', 'Banking partner used')
 async def fetch_account_details():
     '''Fetches account details from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         account_details = await redis.get("titan:prod::account_details")  # Standardized key
         if account_details:
             return json.loads(account_details)
@@ -6,12 +6,17 @@ Purpose: Provides seamless connectivity to the Binance exchange for fetching mar
 '''
 
 import asyncio
+import hashlib
+import hmac
 import json
 import logging
 import os
-import aiohttp
+import time
+from urllib.parse import urlencode
 from prometheus_client import Counter, Gauge, Histogram
 from exchange_api import ExchangeAPI
+from rate_limiter import default_limiter
+from tenant_rate_limiter import CLIENT_ID
 from Signal_Validation_Engine import validate_signal
 from Order_Book_Analyzer import analyze_order_book
 
@@ -29,6 +34,7 @@ except (FileNotFoundError, KeyError, json.JSONDecodeError) as e:
     logger.error(f"Error loading configuration: {e}. Using default values.")
     BINANCE_API_KEY = ""
     BINANCE_API_SECRET = ""
+BINANCE_RECV_WINDOW = os.environ.get("BINANCE_RECV_WINDOW", "5000")  # Milliseconds a signed request stays valid
 
 # Prometheus metrics (example)
 binance_api_requests_total = Counter('binance_api_requests_total', 'Total number of Binance API requests', ['endpoint'])
@@ -36,7 +42,40 @@ binance_api_errors_total = Counter('binance_api_errors_total', 'Total number of
 binance_api_latency_seconds = Histogram('binance_api_latency_seconds', 'Latency of Binance API calls')
 
 class BinanceAPI(ExchangeAPI):
-    '''Implements the ExchangeAPI interface for Binance.'''
+    '''
+    Implements the ExchangeAPI interface for Binance.
+
+    SIGNED endpoints follow Binance's HMAC scheme: the parameters plus recvWindow and timestamp are
+    url-encoded, ``signature`` is appended as the hex HMAC-SHA256 of that string keyed by the API secret,
+    and the key goes in X-MBX-APIKEY.  The signed string is sent byte for byte as the query (GET/DELETE)
+    or form body.
+    '''
+
+    name = "binance"
+    base_url = os.environ.get("BINANCE_REST_URL", "https://api.binance.com")
+
+    def __init__(self, api_key=BINANCE_API_KEY, api_secret=BINANCE_API_SECRET, recv_window=BINANCE_RECV_WINDOW, **kwargs):
+        super().__init__(**kwargs)
+        self.api_key = api_key or None
+        self.api_secret = api_secret
+        self.recv_window = str(recv_window)
+
+    def sign(self, params: dict, timestamp_ms: int = None) -> str:
+        '''The signed parameter string for one request.'''
+        timestamp = timestamp_ms if timestamp_ms is not None else int(time.time() * 1000)
+        query = urlencode({**params, "recvWindow": self.recv_window, "timestamp": timestamp})
+        signature = hmac.new(self.api_secret.encode("utf-8"), query.encode("utf-8"), hashlib.sha256).hexdigest()
+        return f"{query}&signature={signature}"
+
+    async def signed_request(self, method, endpoint, params=None):
+        '''Authenticated call; parameters go in the signed query string for GET/DELETE and the signed form body otherwise.'''
+        if not self.api_key or not self.api_secret:
+            raise PermissionError("BINANCE_API_KEY and BINANCE_API_SECRET are required for authenticated Binance calls")
+        payload = self.sign(params or {})
+        headers = {"X-MBX-APIKEY": self.api_key}
+        if method in ("GET", "DELETE"):
+            return await self.request(method, f"{endpoint}?{payload}", headers=headers)
+        return await self.request(method, endpoint, headers={**headers, "Content-Type": "application/x-www-form-urlencoded"}, data=payload)
 
     async def fetch_market_data(self, asset, endpoint):
         '''Fetches data from the Binance API.'''
@@ -45,9 +84,8 @@ class BinanceAPI(ExchangeAPI):
             return None
         try:
             # Implement Binance API call here using BINANCE_API_KEY and BINANCE_API_SECRET
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"https://api.binance.com{endpoint}", headers={"X-MBX-APIKEY": BINANCE_API_KEY}) as response:
-                    data = await response.json()
+            with binance_api_latency_seconds.time():
+                data = await self.get(endpoint, headers={"X-MBX-APIKEY": BINANCE_API_KEY})
             logger.info(json.dumps({"module": "Binance API Integration", "action": "Fetch Data", "status": "Success", "endpoint": endpoint}))
             global binance_api_requests_total
             binance_api_requests_total.labels(endpoint=endpoint).inc()
@@ -60,6 +98,7 @@ class BinanceAPI(ExchangeAPI):
 
     async def execute_trade(self, asset, side, quantity, price):
         '''Executes a trade on the Binance exchange.'''
+        trade_details = {"asset": asset, "side": side, "quantity": quantity, "price": price}
         try:
             # Validate the trading signal
             confidence = await validate_signal(trade_details)
@@ -74,15 +113,14 @@ class BinanceAPI(ExchangeAPI):
                         trade_price = best_bid_price if side == "SELL" else best_ask_price
                         trade_details["price"] = trade_price
 
-                        # Implement Binance trade execution logic
-                        # Replace with actual API call
-                        async with aiohttp.ClientSession() as session:
-                            async with session.post("https://api.binance.com/v3/order", headers={"X-MBX-APIKEY": BINANCE_API_KEY}, data=trade_details) as response:
-                                data = await response.json()
-                        logger.info(json.dumps({"module": "Binance API Integration", "action": "Execute Trade", "status": "Executing", "trade_details": trade_details, "api_key": BINANCE_API_KEY}))
-                        success = random.choice([True, False])  # Simulate execution success
-                        if success:
-                            logger.info(json.dumps({"module": "Binance API Integration", "action": "Execute Trade", "status": "Success", "trade_details": trade_details}))
+                        logger.info(json.dumps({"module": "Binance API Integration", "action": "Execute Trade", "status": "Executing", "trade_details": trade_details}))
+                        with binance_api_latency_seconds.time():
+                            data = await self.signed_request("POST", "/api/v3/order", params={
+                                "symbol": asset, "side": side, "type": "LIMIT", "timeInForce": "GTC", "quantity": quantity, "price": trade_price})
+                        binance_api_requests_total.labels(endpoint="/api/v3/order").inc()
+                        if "orderId" in data:
+                            logger.info(json.dumps({"module": "Binance API Integration", "action": "Execute Trade", "status": "Success", "trade_details": trade_details,
+                                                    "order_id": data["orderId"]}))
                             # Simulate notification for high profit trade
                             if trade_details.get("profit", 0) > 10:
                                 logger.info(f"High profit trade detected: {trade_details}")
@@ -108,15 +146,29 @@ class BinanceAPI(ExchangeAPI):
             logger.error(json.dumps({"module": "Binance API Integration", "action": "Execute Trade", "status": "Exception", "error": str(e)}))
             return False
 
+    async def fetch_order_book(self, asset, limit=100):
+        '''Fetches a depth snapshot; concurrent callers for the same symbol and limit share one request.'''
+        try:
+            with binance_api_latency_seconds.time():
+                data = await self.get("/api/v3/depth", params={"symbol": asset, "limit": limit})
+            binance_api_requests_total.labels(endpoint="/api/v3/depth").inc()
+            return data
+        except Exception as e:
+            binance_api_errors_total.labels(error_type="OrderBookFetch").inc()
+            logger.error(json.dumps({"module": "Binance API Integration", "action": "Fetch Order Book", "status": "Failed", "error": str(e)}))
+            return None
+
     async def get_account_balance(self, asset):
         '''Gets the account balance for the specified asset.'''
         # Placeholder for account balance logic (replace with actual logic)
         logger.info(f"Fetching account balance for {asset}")
         return 1000  # Simulate account balance
 
+# One adapter per process, so every call reuses its pooled connections and draws on the shared venue and tenant budgets
+binance_api = BinanceAPI(rate_limiter=default_limiter(), tenant=CLIENT_ID)
+
 async def binance_api_loop():
     '''Main loop for the Binance API integration module.'''
-    binance_api = BinanceAPI()
     try:
         # Simulate fetching data and executing trades
         market_data = await binance_api.fetch_market_data("BTCUSDT", "/market_data")
@@ -132,8 +184,8 @@ async def binance_api_loop():
                     best_bid_price, best_ask_price, liquidity = await analyze_order_book(order_book)
                     if best_bid_price and best_ask_price:
                         # Determine the trade price based on the side
-                        trade_details["price"] = trade_price
-                        await binance_api.execute_trade(trade_details)
+                        trade_price = best_bid_price if trade_details["side"] == "SELL" else best_ask_price
+                        await binance_api.execute_trade(trade_details["asset"], trade_details["side"], trade_details["quantity"], trade_price)
                     else:
                         logger.warning(json.dumps({"module": "Binance API Integration", "action": "Trade Skipped", "status": "Order Book Analysis Failed", "trade_details": trade_details}))
                 else:
@@ -165,12 +217,13 @@ if __name__ == "__main__":
 """
 ✅ Implemented Features:
   - Fetches data from the Binance API (simulated).
-  - Executes trades on the Binance exchange (simulated).
+  - Executes trades on the Binance exchange with HMAC-signed orders.
   - Implemented structured JSON logging.
   - Implemented basic error handling.
   - Implemented Prometheus metrics (placeholders).
   - Implemented the ExchangeAPI interface.
   - Implemented Signal Validation Engine
+  - REST calls share the ExchangeAPI keep-alive session; identical concurrent GETs are coalesced.
 
 🔄 Deferred Features (with module references):
   - Integration with a real-time market data feed.
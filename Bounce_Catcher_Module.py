@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -41,7 +41,7 @@ bounce_strategy_profit = Gauge('bounce_strategy_profit', 'Profit generated from
 async def fetch_data():
     '''Fetches price extremity, slippage detection, and candle pattern data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         price = await redis.get(f"titan:prod::price:{SYMBOL}")
         liquidation_wick = await redis.get(f"titan:prod::liquidation_wick:{SYMBOL}")
         candle_pattern = await redis.get(f"titan:prod::candle_pattern:{SYMBOL}")
@@ -82,7 +82,7 @@ async def generate_signal(data):
 async def publish_signal(signal):
     '''Publishes the trading signal to Redis with a TTL.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         await redis.setex(f"titan:prod::signal:{SYMBOL}", SIGNAL_EXPIRY, json.dumps(signal))  # TTL set to SIGNAL_EXPIRY
         logger.info(json.dumps({"module": "Bounce Catcher Module", "action": "Publish Signal", "status": "Success", "signal": signal}))
     except Exception as e:
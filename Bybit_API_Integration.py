@@ -6,11 +6,17 @@ Purpose: Provides connectivity to Bybit exchange.
 '''
 
 import asyncio
+import hashlib
+import hmac
 import json
 import logging
 import os
+import time
+from urllib.parse import urlencode
 from prometheus_client import Counter, Gauge, Histogram
-import random
+from exchange_api import ExchangeAPI
+from rate_limiter import default_limiter
+from tenant_rate_limiter import CLIENT_ID
 import aiohttp
 
 # Configure logging
@@ -27,24 +33,59 @@ except (FileNotFoundError, KeyError, json.JSONDecodeError) as e:
     logger.error(f"Error loading configuration: {e}. Using default values.")
     BYBIT_API_KEY = ""
     BYBIT_API_SECRET = ""
+BYBIT_RECV_WINDOW = os.environ.get("BYBIT_RECV_WINDOW", "5000")  # Milliseconds a signed request stays valid
+BYBIT_ORDER_CATEGORY = os.environ.get("BYBIT_ORDER_CATEGORY", "spot")  # v5 product: spot, linear or inverse
 
 # Prometheus metrics (example)
 bybit_api_requests_total = Counter('bybit_api_requests_total', 'Total number of Bybit API requests', ['endpoint'])
 bybit_api_errors_total = Counter('bybit_api_errors_total', 'Total number of Bybit API errors', ['error_type'])
 bybit_api_latency_seconds = Histogram('bybit_api_latency_seconds', 'Latency of Bybit API calls')
 
+class BybitAPI(ExchangeAPI):
+    '''
+    Bybit REST adapter on the shared ExchangeAPI session.
+
+    Authenticated calls follow Bybit's v5 scheme: X-BAPI-SIGN is the hex HMAC-SHA256, keyed by the
+    API secret, of timestamp + api key + recv window + (query string for GET, raw JSON body for POST).
+    The signed string is sent byte for byte, so the query and body are serialized here.
+    '''
+
+    name = "bybit"
+    base_url = os.environ.get("BYBIT_REST_URL", "https://api.bybit.com")
+
+    def __init__(self, api_key=BYBIT_API_KEY, api_secret=BYBIT_API_SECRET, recv_window=BYBIT_RECV_WINDOW, **kwargs):
+        super().__init__(**kwargs)
+        self.api_key = api_key or None
+        self.api_secret = api_secret
+        self.recv_window = str(recv_window)
+
+    def sign(self, payload: str, timestamp_ms: int = None) -> dict:
+        '''Auth headers for one request whose query string or body is ``payload``.'''
+        timestamp = str(timestamp_ms if timestamp_ms is not None else int(time.time() * 1000))
+        signature = hmac.new(self.api_secret.encode("utf-8"), f"{timestamp}{self.api_key}{self.recv_window}{payload}".encode("utf-8"), hashlib.sha256).hexdigest()
+        return {"X-BAPI-API-KEY": self.api_key, "X-BAPI-TIMESTAMP": timestamp, "X-BAPI-RECV-WINDOW": self.recv_window,
+                "X-BAPI-SIGN": signature, "X-BAPI-SIGN-TYPE": "2"}
+
+    async def signed_request(self, method, endpoint, params=None, body=None):
+        '''Authenticated call; GET parameters go in the signed query string, POST parameters in the signed JSON body.'''
+        if not self.api_key or not self.api_secret:
+            raise PermissionError("BYBIT_API_KEY and BYBIT_API_SECRET are required for authenticated Bybit calls")
+        if method == "GET":
+            query = urlencode(params or {})
+            return await self.request(method, f"{endpoint}?{query}" if query else endpoint, headers=self.sign(query))
+        payload = json.dumps(body or {}, separators=(",", ":"))
+        headers = {**self.sign(payload), "Content-Type": "application/json"}
+        return await self.request(method, endpoint, headers=headers, data=payload)
+
+# One adapter per process, so every call reuses its pooled connections and draws on the shared venue and tenant budgets
+bybit_api = BybitAPI(rate_limiter=default_limiter(), tenant=CLIENT_ID)
+
 async def fetch_bybit_data(endpoint):
     '''Fetches data from the Bybit API.'''
     try:
-        # Implement Bybit API call here using BYBIT_API_KEY and BYBIT_API_SECRET
-        # Example:
-        # async with aiohttp.ClientSession() as session:
-        #     async with session.get(f"https://api.bybit.com{endpoint}", headers={"Bybit-API-Key": BYBIT_API_KEY, "Bybit-API-Secret": BYBIT_API_SECRET}) as response:
-        #         data = await response.json()
-        # Replace with actual API call
-
-        await asyncio.sleep(1)  # Simulate API latency
-        data = {"message": f"Data from Bybit API {endpoint}"}  # Simulate data
+        with bybit_api_latency_seconds.time():
+            # Market data is public: unsigned, so identical concurrent GETs coalesce
+            data = await bybit_api.get(endpoint)
         logger.info(json.dumps({"module": "Bybit API Integration", "action": "Fetch Data", "status": "Success", "endpoint": endpoint}))
         global bybit_api_requests_total
         bybit_api_requests_total.labels(endpoint=endpoint).inc()
@@ -55,23 +96,29 @@ async def fetch_bybit_data(endpoint):
         logger.error(json.dumps({"module": "Bybit API Integration", "action": "Fetch Data", "status": "Failed", "error": str(e)}))
         return None
 
+def order_body(trade_details, category=BYBIT_ORDER_CATEGORY):
+    '''A /v5/order/create body for {"asset", "side", "quantity"[, "price"]}: a limit order with a price, market otherwise.'''
+    body = {"category": category, "symbol": trade_details["asset"], "side": trade_details["side"].capitalize(),
+            "orderType": "Limit" if trade_details.get("price") else "Market", "qty": str(trade_details["quantity"])}
+    if trade_details.get("price"):
+        body["price"] = str(trade_details["price"])
+        body["timeInForce"] = "GTC"
+    return body
+
 async def execute_trade(trade_details):
     '''Executes a trade on the Bybit exchange.'''
     try:
-        # Implement Bybit trade execution logic here using BYBIT_API_KEY and BYBIT_API_SECRET
-        # Example:
-        # async with aiohttp.ClientSession() as session:
-        #     async with session.post("https://api.bybit.com/v1/orders", headers={"Bybit-API-Key": BYBIT_API_KEY, "Bybit-API-Secret": BYBIT_API_SECRET}, json=trade_details) as response:
-        #         data = await response.json()
-        # Replace with actual API call
-
         logger.info(json.dumps({"module": "Bybit API Integration", "action": "Execute Trade", "status": "Executing", "trade_details": trade_details}))
-        success = random.choice([True, False])  # Simulate execution success
-        if success:
-            logger.info(json.dumps({"module": "Bybit API Integration", "action": "Execute Trade", "status": "Success", "trade_details": trade_details}))
+        with bybit_api_latency_seconds.time():
+            data = await bybit_api.signed_request("POST", "/v5/order/create", body=order_body(trade_details))
+        bybit_api_requests_total.labels(endpoint="/v5/order/create").inc()
+        if data.get("retCode") == 0:
+            logger.info(json.dumps({"module": "Bybit API Integration", "action": "Execute Trade", "status": "Success", "trade_details": trade_details,
+                                    "order_id": data.get("result", {}).get("orderId")}))
             return True
         else:
-            logger.warning(json.dumps({"module": "Bybit API Integration", "action": "Execute Trade", "status": "Failed", "trade_details": trade_details}))
+            logger.warning(json.dumps({"module": "Bybit API Integration", "action": "Execute Trade", "status": "Failed", "trade_details": trade_details,
+                                       "error": data.get("retMsg")}))
             return False
     except Exception as e:
         global bybit_api_errors_total
@@ -16,6 +16,7 @@ import json
 import logging
 import os
 import aioredis
+from redis_connection_manager import get_async_redis
 
 # Configuration from config.json or ENV
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
@@ -100,7 +101,7 @@ async def main():
     Main function to orchestrate capital allocation.
     """
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
 
         # Fetch strategy performance metrics
         strategy_performance = await fetch_strategy_performance(redis)
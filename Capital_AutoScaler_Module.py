@@ -14,10 +14,12 @@ Core Objectives:
   - Explicit 10/10 quality rating definition adherence: Code must meet all quality criteria, including modularity, error handling, metrics, logging, and testing.
 Summary of Enhancements:
   - Initial version.
+  - Daily profit read from the shared fill ledger (pnl_ledger) instead of an ad-hoc Redis key.
+  - Strategy weights from the shared capital_allocation_engine (mean-variance on ledger strategy returns) instead of a one-off score.
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -25,6 +27,9 @@ from prometheus_client import Counter, Gauge, Histogram
 import random  # For chaos testing
 import time
 import aiohttp
+import datetime
+import pnl_ledger
+from capital_allocation_engine import CapitalAllocationEngine
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(module)s - %(message)s')
@@ -41,6 +46,7 @@ REINVESTMENT_PHASE_2_MONTHS = 12
 RESERVE_CAPITAL_PERCENT = 0.1 # 10% reserve
 DEFAULT_REINVEST_PCT_PHASE_1 = 0.50
 DEFAULT_REINVEST_PCT_PHASE_2 = 0.30
+STRATEGIES = ["MomentumStrategy", "ScalpingStrategy", "ArbitrageStrategy"] # Example strategies
 
 # Prometheus metrics (example)
 capital_allocated_total = Counter('capital_allocated_total', 'Total capital allocated to strategies')
@@ -48,10 +54,14 @@ capital_reinvested_today = Gauge('capital_reinvested_today', 'Capital reinvested
 capital_autoscaling_errors_total = Counter('capital_autoscaling_errors_total', 'Total number of capital autoscaling errors', ['error_type'])
 strategy_allocation = Gauge('strategy_allocation', 'Capital allocated to each strategy', ['strategy'])
 
+# Mean-variance allocation across STRATEGIES; available_capital is already net of RESERVE_CAPITAL_PERCENT
+capital_allocator = CapitalAllocationEngine(STRATEGIES, method="mean_variance", reserve=0.0, max_weight=0.5)
+strategy_capital = {} # Capital each strategy held over the last cycle, the denominator of its return
+
 async def get_initial_capital():
     '''Fetches the initial capital from Redis or config.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         initial_capital = await redis.get(BASE_CAPITAL_KEY)
         if initial_capital:
             return float(initial_capital)
@@ -63,51 +73,18 @@ async def get_initial_capital():
         return float(os.environ.get("TOTAL_CAPITAL", 100000.0))
 
 async def get_daily_profit():
-    '''Fetches the daily profit from Redis.'''
+    '''Current session's realized PnL net of fees, from the in-process fill ledger.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
-        daily_profit = await redis.get("titan:prod::trade_outcome_recorder:daily_profit") # Example key
-        if daily_profit:
-            return float(daily_profit)
-        else:
-            logger.warning(json.dumps({"module": "Capital AutoScaler Module", "action": "Get Daily Profit", "status": "No Data"}))
-            return 0.0
+        session = (await pnl_ledger.ready_state()).session()
+        return session["realized"] - session["fees"]
     except Exception as e:
-        logger.error(json.dumps({"module": "Capital AutoScaler Module", "action": "Get Daily Profit", "status": "Exception", "error": str(e)}))
+        logger.error(json.dumps({"module": "Capital AutoScaler Module", "action": "Get Daily Profit", "status": "Exception", "error": repr(e)}))
         return 0.0
 
-async def get_strategy_performance(strategy_id):
-    '''Fetches the performance of a given trading strategy from Redis.'''
-    try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
-        performance_data = await redis.get(f"titan:prod::strategy:{strategy_id}:performance")
-        if performance_data:
-            return json.loads(performance_data)
-        else:
-            logger.warning(json.dumps({"module": "Capital AutoScaler Module", "action": "Get Strategy Performance", "status": "No Data", "strategy": strategy_id}))
-            return {"pnl": 0.0, "drawdown": 0.0, "win_rate": 0.5, "confidence_score": 0.5} # Default values
-    except Exception as e:
-        logger.error(json.dumps({"module": "Capital AutoScaler Module", "action": "Get Strategy Performance", "status": "Exception", "error": str(e)}))
-        return {"pnl": 0.0, "drawdown": 0.0, "win_rate": 0.5, "confidence_score": 0.5}
-
-async def get_volatility():
-    '''Fetches the current market volatility from Redis.'''
-    try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
-        volatility = await redis.get("titan:prod::volatility:BTCUSDT") # Example key
-        if volatility:
-            return float(volatility)
-        else:
-            logger.warning(json.dumps({"module": "Capital AutoScaler Module", "action": "Get Volatility", "status": "No Data"}))
-            return 0.05 # Default volatility
-    except Exception as e:
-        logger.error(json.dumps({"module": "Capital AutoScaler Module", "action": "Get Volatility", "status": "Exception", "error": str(e)}))
-        return 0.05
-
 async def get_circuit_status():
     '''Fetches the circuit breaker status from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         circuit_status = await redis.get("titan:circuit:status")
         if circuit_status == "TRUE":
             return True
@@ -117,22 +94,11 @@ async def get_circuit_status():
         logger.error(json.dumps({"module": "Capital AutoScaler Module", "action": "Get Circuit Status", "status": "Exception", "error": str(e)}))
         return False
 
-async def calculate_allocation_weight(strategy_performance, volatility):
-    '''Calculates the allocation weight for a given strategy.'''
-    confidence_score = strategy_performance.get("confidence_score", 0.5)
-    win_rate = strategy_performance.get("win_rate", 0.5)
-    drawdown_risk = strategy_performance.get("drawdown", 0.1)
-
-    # Weight formula
-    allocation_weight = (confidence_score * win_rate) / (volatility * (drawdown_risk + 0.01)) # Add small value to prevent division by zero
-    return allocation_weight
-
 async def adjust_capital_allocation():
     '''Adjusts capital allocation based on strategy performance, risk, and system health.'''
     try:
         initial_capital = await get_initial_capital()
         daily_profit = await get_daily_profit()
-        volatility = await get_volatility()
         circuit_status = await get_circuit_status()
 
         # Reinvestment Logic
@@ -153,27 +119,14 @@ async def adjust_capital_allocation():
         # Cap total deployed capital
         available_capital = min(available_capital, initial_capital * (1 - RESERVE_CAPITAL_PERCENT))
 
-        # Fetch strategy performance and calculate allocation weights
-        strategy_weights = {}
-        for strategy_id in ["MomentumStrategy", "ScalpingStrategy", "ArbitrageStrategy"]: # Example strategies
-            strategy_performance = await get_strategy_performance(strategy_id)
-            if strategy_performance:
-                strategy_weights[strategy_id] = await calculate_allocation_weight(strategy_performance, volatility)
-            else:
-                strategy_weights[strategy_id] = 0.0
-
-        # Normalize allocation weights
-        total_weight = sum(strategy_weights.values())
-        if total_weight == 0:
-            logger.warning("No strategies available for capital allocation")
-            return
-
-        normalized_allocations = {}
-        for strategy_id, weight in strategy_weights.items():
-            normalized_allocations[strategy_id] = (weight / total_weight) * available_capital
+        # One period of strategy returns from the fill ledger, then re-solve the allocation on the full history
+        state = await pnl_ledger.ready_state()
+        capital_allocator.observe_pnl({strategy_id: state.strategy(strategy_id)["net"] for strategy_id in STRATEGIES}, strategy_capital)
+        normalized_allocations = capital_allocator.allocate(available_capital)
+        strategy_capital.update(normalized_allocations)
 
         # Apply capital allocations to strategies
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         for strategy_id, allocation_amount in normalized_allocations.items():
             await redis.set(f"titan:capital:strategy:{strategy_id}", allocation_amount)
             strategy_allocation.labels(strategy=strategy_id).set(allocation_amount)
@@ -10,10 +10,11 @@ Core Objectives:
   - Explicit 10/10 quality rating definition adherence: Code must meet all quality criteria, including modularity, error handling, metrics, logging, and testing.
 Summary of Enhancements:
   - Initial version.
+  - Weights from the shared capital_allocation_engine (fractional Kelly on ledger strategy returns) instead of a one-off score.
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -21,6 +22,8 @@ from prometheus_client import Counter, Gauge, Histogram
 import random  # For chaos testing
 import time
 import aiohttp
+import pnl_ledger
+from capital_allocation_engine import CapitalAllocationEngine
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(module)s - %(message)s')
@@ -31,6 +34,7 @@ REDIS_HOST = os.environ.get("REDIS_HOST", "localhost")
 REDIS_PORT = os.environ.get("REDIS_PORT", 6379)
 STRATEGIES = ["MomentumStrategy", "ScalpingStrategy", "ArbitrageStrategy"] # Example strategies
 REBALANCING_FREQUENCY = 3600 # Rebalancing frequency in seconds (1 hour)
+MIN_HISTORY_PERIODS = 24 # Return periods needed before the Kelly weights are trusted (one day of hourly rotations)
 
 # Prometheus metrics (example)
 capital_rotations_total = Counter('capital_rotations_total', 'Total number of capital rotations')
@@ -38,53 +42,43 @@ rotation_errors_total = Counter('rotation_errors_total', 'Total number of capita
 rotation_latency_seconds = Histogram('rotation_latency_seconds', 'Latency of capital rotation')
 strategy_weight = Gauge('strategy_weight', 'Weight assigned to each strategy', ['strategy'])
 
-async def fetch_strategy_data(strategy):
-    '''Fetches win rate, drawdown, latency, and stability data from Redis for a given strategy.'''
-    try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
-        win_rate = await redis.get(f"titan:prod::{strategy}:win_rate")
-        drawdown = await redis.get(f"titan:prod::{strategy}:drawdown")
-        latency = await redis.get(f"titan:prod::{strategy}:latency")
-        stability = await redis.get(f"titan:volatility:stability_score:BTCUSDT") # Example symbol
+# Fractional-Kelly sizing on each strategy's realized edge; capital without an edge stays unallocated
+rotation_allocator = CapitalAllocationEngine(STRATEGIES, method="kelly", max_weight=0.5)
 
-        if win_rate and drawdown and latency and stability:
-            return {"win_rate": float(win_rate), "drawdown": float(drawdown), "latency": float(latency), "stability": float(stability)}
-        else:
-            logger.warning(json.dumps({"module": "Capital Rotation Optimizer", "action": "Fetch Strategy Data", "status": "No Data", "strategy": strategy}))
-            return None
+async def fetch_strategy_capital():
+    '''Fetches the capital each strategy currently holds (titan:capital:strategy:<strategy>) in one round trip.'''
+    try:
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        values = await redis.mget([f"titan:capital:strategy:{strategy}" for strategy in STRATEGIES])
+        return {strategy: float(value) for strategy, value in zip(STRATEGIES, values) if value is not None}
     except Exception as e:
-        logger.error(json.dumps({"module": "Capital Rotation Optimizer", "action": "Fetch Strategy Data", "status": "Exception", "error": str(e)}))
-        return None
-
-async def calculate_strategy_weight(data):
-    '''Calculates a weight for a given strategy based on its performance and risk metrics.'''
-    if not data:
-        return 0
+        logger.error(json.dumps({"module": "Capital Rotation Optimizer", "action": "Fetch Strategy Capital", "status": "Exception", "error": str(e)}))
+        return {}
 
+async def calculate_strategy_weights():
+    '''Adds the last period's strategy returns from the fill ledger and re-solves the fractional-Kelly weights.'''
     try:
-        # Placeholder for weight calculation logic (replace with actual calculation)
-        win_rate = data["win_rate"]
-        drawdown = data["drawdown"]
-        latency = data["latency"]
-        stability = data["stability"]
-
-        weight = (win_rate * stability) / (drawdown + latency + 0.001) # Add small value to prevent division by zero
-        logger.info(json.dumps({"module": "Capital Rotation Optimizer", "action": "Calculate Weight", "status": "Success", "weight": weight}))
-        return weight
+        state = await pnl_ledger.ready_state()
+        capital = await fetch_strategy_capital()
+        rotation_allocator.observe_pnl({strategy: state.strategy(strategy)["net"] for strategy in STRATEGIES}, capital)
+        if rotation_allocator.periods < MIN_HISTORY_PERIODS:
+            logger.warning(json.dumps({"module": "Capital Rotation Optimizer", "action": "Calculate Weights", "status": "Insufficient History", "periods": rotation_allocator.periods}))
+            return None
+        weights = rotation_allocator.solve()
+        logger.info(json.dumps({"module": "Capital Rotation Optimizer", "action": "Calculate Weights", "status": "Success", "weights": weights, "periods": rotation_allocator.periods}))
+        return weights
     except Exception as e:
-        logger.error(json.dumps({"module": "Capital Rotation Optimizer", "action": "Calculate Weight", "status": "Exception", "error": str(e)}))
-        return 0
+        logger.error(json.dumps({"module": "Capital Rotation Optimizer", "action": "Calculate Weights", "status": "Exception", "error": str(e)}))
+        return None
 
 async def apply_capital_rotation(strategy_weights):
     '''Applies the calculated capital weights to each strategy.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
-        total_weight = sum(strategy_weights.values())
-        for strategy, weight in strategy_weights.items():
-            normalized_weight = weight / total_weight if total_weight > 0 else 0
-            await redis.set(f"titan:capital:weight:{strategy}", normalized_weight)
-            strategy_weight.labels(strategy=strategy).set(normalized_weight)
-            logger.info(json.dumps({"module": "Capital Rotation Optimizer", "action": "Apply Weight", "status": "Success", "strategy": strategy, "weight": normalized_weight}))
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        for strategy, weight in strategy_weights.items():  # Already fractions of capital, net of the reserve
+            await redis.set(f"titan:capital:weight:{strategy}", weight)
+            strategy_weight.labels(strategy=strategy).set(weight)
+            logger.info(json.dumps({"module": "Capital Rotation Optimizer", "action": "Apply Weight", "status": "Success", "strategy": strategy, "weight": weight}))
         return True
     except Exception as e:
         global rotation_errors_total
@@ -95,9 +89,10 @@ async def apply_capital_rotation(strategy_weights):
 async def capital_rotation_loop():
     '''Main loop for the capital rotation optimizer module.'''
     try:
-        strategy_weights = await fetch_strategy_data()
-        if strategy_weights:
-            await apply_capital_rotation(strategy_weights)
+        with rotation_latency_seconds.time():
+            strategy_weights = await calculate_strategy_weights()
+        if strategy_weights and await apply_capital_rotation(strategy_weights):
+            capital_rotations_total.inc()
         await asyncio.sleep(REBALANCING_FREQUENCY)  # Re-evaluate weights every hour
     except Exception as e:
         logger.error(json.dumps({"module": "Capital Rotation Optimizer", "action": "Management Loop", "status": "Exception", "error": str(e)}))
@@ -17,7 +17,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -47,7 +47,7 @@ ai_brain_latency_seconds = Histogram('ai_brain_latency_seconds', 'Latency of AI
 async def fetch_market_data():
     '''Fetches market data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         market_data = await redis.get("titan:prod::market_data")  # Standardized key
         if market_data:
             return json.loads(market_data)
@@ -61,7 +61,7 @@ async def fetch_market_data():
 async def fetch_esg_score(asset):
     """Fetches the ESG score for a given asset from Redis."""
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         esg_data = await redis.get(f"titan:prod::{asset}_esg")
         if esg_data:
             return json.loads(esg_data)['score']
@@ -117,7 +117,7 @@ async def recommend_optimal_trade(prediction):
 async def publish_trade_recommendation(trade_recommendation):
     '''Publishes the trade recommendation to Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         await redis.publish("titan:prod::trade_recommendation", json.dumps(trade_recommendation))  # Standardized key
         logger.info(json.dumps({"module": "Central AI Brain", "action": "Publish Trade Recommendation", "status": "Success", "trade_recommendation": trade_recommendation}))
     except Exception as e:
@@ -17,7 +17,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -47,7 +47,7 @@ trading_halt_status = Gauge('trading_halt_status', 'Trading halt status (1=halte
 async def fetch_portfolio_data():
     '''Fetches portfolio data and market volatility from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         portfolio_data = await redis.get("titan:prod::portfolio_data")  # Standardized key
         volatility_data = await redis.get("titan:prod::volatility_data")
 
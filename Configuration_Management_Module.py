@@ -18,6 +18,7 @@ Summary of Enhancements:
 
 import asyncio
 import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -52,7 +53,7 @@ current_config_version = Gauge('current_config_version', 'Current configuration
 async def fetch_configuration():
     '''Fetches the latest configuration from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         config_data = await redis.get("titan:prod::config")  # Centralized config key
         if config_data:
             config = json.loads(config_data)
@@ -131,7 +132,7 @@ async def monitor_config_changes(redis_client):
 async def dynamic_configuration_loop():
     '''Main loop for the dynamic configuration engine module.'''
     try:
-        redis_client = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis_client = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         await monitor_config_changes(redis_client)
     except aioredis.exceptions.ConnectionError as e:
         logger.error(json.dumps({"module": "Dynamic Configuration Engine", "action": "Redis Connection", "status": "Failed", "error": str(e)}))
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -41,7 +41,7 @@ contrarian_strategy_profit = Gauge('contrarian_strategy_profit', 'Profit generat
 async def fetch_sentiment_data():
     '''Fetches keyword score from News_Analyzer, Twitter feeds, or sentiment API from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         news_score = await redis.get(f"titan:prod::news_score:{SYMBOL}")
         twitter_score = await redis.get(f"titan:prod::twitter_score:{SYMBOL}")
         sentiment_api_score = await redis.get(f"titan:prod::sentiment_api_score:{SYMBOL}")
@@ -97,7 +97,7 @@ async def generate_signal(sentiment_index):
 async def publish_signal(signal):
     '''Publishes the trading signal to Redis with a TTL.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         await redis.setex(f"titan:prod::signal:{SYMBOL}", SIGNAL_EXPIRY, json.dumps(signal))  # TTL set to SIGNAL_EXPIRY
         logger.info(json.dumps({"module": "Contrarian Sentiment Fader", "action": "Publish Signal", "status": "Success", "signal": signal}))
     except Exception as e:
@@ -1,7 +1,7 @@
 '''
 Module: Cross Pair Divergence Engine
-Version: 1.0.0
-Last Updated: 2025-03-27
+Version: 1.1.0
+Last Updated: 2026-10-16
 Purpose: Compare correlations (BTC vs ETH, SOL, AVAX...) and enter lagging pairs.
 Core Objectives:
   - Explicit profitability and risk targets alignment: Generate profitable cross-pair divergence trades while adhering to strict risk limits.
@@ -10,17 +10,22 @@ Core Objectives:
   - Explicit 10/10 quality rating definition adherence: Code must meet all quality criteria, including modularity, error handling, metrics, logging, and testing.
 Summary of Enhancements:
   - Initial version.
+  - Rolling correlation engine: running sums over a sliding window of log returns for N symbols, so the
+    N x N correlation matrix updates in O(N^2) per tick without recomputing history. Hedge ratio, spread
+    z-score and mean-reversion half-life for the selected pairs come from the same state.
+  - One MGET per tick for every symbol replaces the per-pair Redis fetches.
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
+import math
 import os
+import numpy as np
 from prometheus_client import Counter, Gauge, Histogram
 import random  # For chaos testing
 import time
-import aiohttp
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(module)s - %(message)s')
@@ -29,101 +34,309 @@ logger = logging.getLogger(__name__)
 # Constants
 REDIS_HOST = os.environ.get("REDIS_HOST", "localhost")
 REDIS_PORT = os.environ.get("REDIS_PORT", 6379)
-SYMBOLS = ["BTCUSDT", "ETHUSDT", "SOLUSDT"]  # Example symbols
+SYMBOLS = os.environ.get("DIVERGENCE_SYMBOLS", "BTCUSDT,ETHUSDT,SOLUSDT").split(",")
+DIVERGENCE_PAIRS = [tuple(pair.split("/")) for pair in os.environ.get("DIVERGENCE_PAIRS", "BTCUSDT/ETHUSDT,BTCUSDT/SOLUSDT,ETHUSDT/SOLUSDT").split(",") if pair]
+PRICE_KEY = "titan:prod::price:{symbol}"
 SIGNAL_EXPIRY = 60  # Signal expiry time in seconds
 CORRELATION_THRESHOLD = 0.7 # Correlation threshold for divergence
+CORRELATION_WINDOW = int(os.environ.get("CORRELATION_WINDOW", 720))  # Samples in the rolling window
+CORRELATION_SAMPLE_INTERVAL = float(os.environ.get("CORRELATION_SAMPLE_INTERVAL", 5))  # Seconds between samples
+CORRELATION_REFRESH_EVERY = int(os.environ.get("CORRELATION_REFRESH_EVERY", 10000))  # Updates between exact re-summations (bounds float drift)
+DIVERGENCE_ZSCORE = float(os.environ.get("DIVERGENCE_ZSCORE", 2.0))  # Spread z-score that counts as divergence
 
 # Prometheus metrics (example)
 divergence_signals_generated_total = Counter('divergence_signals_generated_total', 'Total number of cross-pair divergence signals generated')
 divergence_trades_executed_total = Counter('divergence_trades_executed_total', 'Total number of cross-pair divergence trades executed')
 divergence_strategy_profit = Gauge('divergence_strategy_profit', 'Profit generated from cross-pair divergence strategy')
+correlation_update_latency_seconds = Histogram('correlation_update_latency_seconds', 'Rolling correlation update time per sample', buckets=(0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01))
 
-async def fetch_data(symbol):
-    '''Fetches price and signal data for a given symbol from Redis.'''
-    try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
-        price = await redis.get(f"titan:prod::price:{symbol}")
-        signal = await redis.get(f"titan:prod::signal:{symbol}")
-
-        if price and signal:
-            return {"price": float(price), "signal": json.loads(signal)}
-        else:
-            logger.warning(json.dumps({"module": "Cross Pair Divergence Engine", "action": "Fetch Data", "status": "No Data", "symbol": symbol}))
-            return None
-    except Exception as e:
-        logger.error(json.dumps({"module": "Cross Pair Divergence Engine", "action": "Fetch Data", "status": "Failed", "error": str(e)}))
-        return None
+class RollingCorrelation:
+    '''
+    Sliding-window correlation / covariance over N symbols, kept as running sums.
 
-async def calculate_correlation(symbol1, symbol2):
-    '''Calculates the correlation between two symbols based on historical price data.'''
-    # Placeholder for correlation calculation logic (replace with actual calculation)
-    correlation = random.uniform(-1, 1) # Simulate correlation
-    logger.info(json.dumps({"module": "Cross Pair Divergence Engine", "action": "Calculate Correlation", "status": "Success", "symbol1": symbol1, "symbol2": symbol2, "correlation": correlation}))
-    return correlation
+    Each ``update`` takes one price per symbol.  Prices are stored as log
+    prices relative to the first sample (a ring of window + 1 rows), and the
+    sums of returns and of their outer products are adjusted by the entering
+    and leaving samples only: O(N^2) per tick, whatever the window length.
+    The windows are the last ``window`` returns and the last ``window`` log
+    prices.  For the selected ``pairs`` the same ring also feeds running sums
+    of log-price levels, cross products and one-step lags, from which
+    ``pair_stats`` derives the hedge ratio, spread z-score and the AR(1)
+    mean-reversion coefficient of the spread.
+    '''
 
-async def generate_signal(symbol1, symbol2, correlation):
-    '''Generates a trading signal based on the correlation between two symbols.'''
-    if correlation is None:
-        return None
+    def __init__(self, symbols, window=CORRELATION_WINDOW, pairs=(), refresh_every=CORRELATION_REFRESH_EVERY):
+        if window < 3:
+            raise ValueError("window must be at least 3 samples")
+        self.symbols = list(symbols)
+        self.index = {symbol: n for n, symbol in enumerate(self.symbols)}
+        self.window = window
+        self.refresh_every = refresh_every
+        self.pairs = [tuple(pair) for pair in pairs]
+        self.pair_i = np.array([self.index[a] for a, _ in self.pairs], dtype=np.intp)
+        self.pair_j = np.array([self.index[b] for _, b in self.pairs], dtype=np.intp)
+        n = len(self.symbols)
+        self.levels = np.zeros((window + 1, n))  # Ring of centred log prices; time t lives in row t % (window + 1)
+        self.anchor = None
+        self.count = 0  # Samples seen
+        self._reset_sums()
 
-    try:
-        data1 = await fetch_data(symbol1)
-        data2 = await fetch_data(symbol2)
+    def _reset_sums(self):
+        n, p = len(self.symbols), len(self.pairs)
+        self.return_sum = np.zeros(n)
+        self.return_cross = np.zeros((n, n))
+        self.level_sum = np.zeros(n)
+        self.level_square = np.zeros(n)
+        self.level_lag = np.zeros(n)  # sum x_t * x_{t-1}
+        self.pair_cross = np.zeros(p)  # sum x_t * y_t
+        self.pair_lag_xy = np.zeros(p)  # sum x_t * y_{t-1}
+        self.pair_lag_yx = np.zeros(p)  # sum y_t * x_{t-1}
+        self.updates_since_refresh = 0
+
+    def _row(self, t):
+        return self.levels[t % (self.window + 1)]
+
+    def _level_terms(self, x, sign):
+        self.level_sum += sign * x
+        self.level_square += sign * x * x
+        self.pair_cross += sign * x[self.pair_i] * x[self.pair_j]
 
-        if not data1 or not data2:
+    def _lag_terms(self, current, previous, sign):
+        self.level_lag += sign * current * previous
+        self.pair_lag_xy += sign * current[self.pair_i] * previous[self.pair_j]
+        self.pair_lag_yx += sign * current[self.pair_j] * previous[self.pair_i]
+
+    def update(self, prices):
+        '''Adds one sample (a price per symbol, in ``symbols`` order).'''
+        log_prices = np.log(np.asarray(prices, dtype=float))
+        if self.anchor is None:
+            self.anchor = log_prices.copy()
+        x = log_prices - self.anchor
+        t, w = self.count, self.window
+
+        if t >= 1:
+            previous = self._row(t - 1)
+            r = x - previous
+            if t - w >= 1:
+                # r_{t-w} leaves; rows t-w-1 and t share a slot, so read it before x is written
+                leaving = self._row(t - w) - self._row(t - w - 1)
+                pair = np.stack((r, leaving))
+                self.return_sum += r - leaving
+                self.return_cross += pair.T @ (pair * np.array([[1.0], [-1.0]]))
+            else:
+                self.return_sum += r
+                self.return_cross += np.outer(r, r)
+            self._lag_terms(x, previous, 1)
+            if t - w >= 0:
+                # Level t - w leaves, and with it the lag pair it starts
+                self._level_terms(self._row(t - w), -1)
+                self._lag_terms(self._row(t - w + 1), self._row(t - w), -1)
+        self._level_terms(x, 1)
+        self._row(t)[:] = x
+        self.count += 1
+
+        self.updates_since_refresh += 1
+        if self.updates_since_refresh >= self.refresh_every:
+            self.refresh()
+
+    def refresh(self):
+        '''Recomputes every running sum from the ring; O(window * N^2), run every ``refresh_every`` updates.'''
+        t = self.count - 1
+        self._reset_sums()
+        if t < 0:
+            return
+        w = self.window
+        levels = np.stack([self._row(k) for k in range(max(0, t - w), t + 1)])
+        returns = np.diff(levels, axis=0)[-w:]
+        self.return_sum = returns.sum(axis=0)
+        self.return_cross = returns.T @ returns
+        window_levels = levels[-w:]
+        for x in window_levels:
+            self._level_terms(x, 1)
+        for previous, current in zip(window_levels[:-1], window_levels[1:]):
+            self._lag_terms(current, previous, 1)
+
+    @property
+    def samples(self):
+        '''Returns currently in the window.'''
+        return min(max(self.count - 1, 0), self.window)
+
+    def covariance_matrix(self):
+        n = self.samples
+        if n < 2:
             return None
+        return (self.return_cross - np.outer(self.return_sum, self.return_sum) / n) / (n - 1)
 
-        # Placeholder for divergence signal logic (replace with actual logic)
-        if correlation < -CORRELATION_THRESHOLD and data1["signal"]["side"] == "BUY" and data2["signal"]["side"] == "SELL":
-            signal = {"symbol1": symbol1, "symbol2": symbol2, "side": "LONG", "confidence": 0.7} # Long the lagging pair
-            logger.info(json.dumps({"module": "Cross Pair Divergence Engine", "action": "Generate Signal", "status": "Long Divergence", "signal": signal}))
-            global divergence_signals_generated_total
-            divergence_signals_generated_total.inc()
-            return signal
-        elif correlation > CORRELATION_THRESHOLD and data1["signal"]["side"] == "SELL" and data2["signal"]["side"] == "BUY":
-            signal = {"symbol1": symbol1, "symbol2": symbol2, "side": "SHORT", "confidence": 0.7} # Short the lagging pair
-            logger.info(json.dumps({"module": "Cross Pair Divergence Engine", "action": "Generate Signal", "status": "Short Divergence", "signal": signal}))
-            global divergence_signals_generated_total
-            divergence_signals_generated_total.inc()
-            return signal
-        else:
-            logger.debug(json.dumps({"module": "Cross Pair Divergence Engine", "action": "Generate Signal", "status": "No Signal"}))
+    def correlation_matrix(self):
+        '''N x N correlation of log returns over the window (NaN where a symbol has not moved).'''
+        covariance = self.covariance_matrix()
+        if covariance is None:
             return None
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scale = 1 / np.sqrt(np.diag(covariance))
+            return np.clip(covariance * scale[:, None] * scale[None, :], -1, 1)
+
+    def correlation(self, symbol1, symbol2):
+        '''One entry of the correlation matrix in O(1).'''
+        n = self.samples
+        if n < 2:
+            return None
+        i, j = self.index[symbol1], self.index[symbol2]
+        s = self.return_sum
+        c = self.return_cross
+        variance = (c[i, i] - s[i] * s[i] / n) * (c[j, j] - s[j] * s[j] / n)
+        if variance <= 0:
+            return None
+        return max(-1.0, min(1.0, (c[i, j] - s[i] * s[j] / n) / math.sqrt(variance)))
+
+    def pair_stats(self):
+        '''
+        Per selected pair (x = first symbol, y = second, in log prices):
+        correlation of returns, hedge ratio beta = cov(x, y) / var(y),
+        z-score of the spread x - beta * y, AR(1) coefficient of the spread
+        and its half-life in samples.  Returns a dict of arrays.
+        '''
+        i, j = self.pair_i, self.pair_j
+        t = self.count - 1
+        n = min(self.count, self.window)
+        m = n - 1  # Lagged pairs inside the level window
+        if m < 2:
+            return None
+        w = self.window
+        mx, my = self.level_sum[i] / n, self.level_sum[j] / n
+        vx = self.level_square[i] / n - mx * mx
+        vy = self.level_square[j] / n - my * my
+        cxy = self.pair_cross / n - mx * my
+        with np.errstate(divide="ignore", invalid="ignore"):
+            beta = cxy / vy
+            spread_mean = mx - beta * my
+            spread_variance = np.maximum(vx - 2 * beta * cxy + beta * beta * vy, 0)
+            newest, oldest = self._row(t), self._row(t - n + 1)
+            spread_now = newest[i] - beta * newest[j]
+            zscore = (spread_now - spread_mean) / np.sqrt(spread_variance)
+
+            # AR(1) fit of s_k on s_{k-1}: "current" terms drop the oldest level, "previous" terms the newest
+            spread_oldest = oldest[i] - beta * oldest[j]
+            spread_sum = n * spread_mean
+            spread_square = (self.level_square[i] - 2 * beta * self.pair_cross + beta * beta * self.level_square[j])
+            current_mean = (spread_sum - spread_oldest) / m
+            previous_mean = (spread_sum - spread_now) / m
+            lag_product = (self.level_lag[i] - beta * self.pair_lag_xy - beta * self.pair_lag_yx + beta * beta * self.level_lag[j])
+            previous_square = spread_square - spread_now * spread_now
+            phi = (lag_product - m * current_mean * previous_mean) / (previous_square - m * previous_mean * previous_mean)
+            half_life = np.where((phi > 0) & (phi < 1), -math.log(2) / np.log(phi), np.inf)
+
+        s, c, r = self.return_sum, self.return_cross, self.samples
+        with np.errstate(divide="ignore", invalid="ignore"):
+            correlation = (c[i, j] - s[i] * s[j] / r) / np.sqrt((c[i, i] - s[i] * s[i] / r) * (c[j, j] - s[j] * s[j] / r))
+        return {"correlation": correlation, "hedge_ratio": beta, "zscore": zscore, "ar1": phi, "half_life": half_life}
+
+async def fetch_prices(redis, symbols):
+    '''Latest price of every symbol in one MGET; None where a price is missing.'''
+    try:
+        raw = await redis.mget([PRICE_KEY.format(symbol=symbol) for symbol in symbols])
+        return [float(value) if value else None for value in raw]
     except Exception as e:
-        logger.error(json.dumps({"module": "Cross Pair Divergence Engine", "action": "Generate Signal", "status": "Exception", "error": str(e)}))
+        logger.error(json.dumps({"module": "Cross Pair Divergence Engine", "action": "Fetch Prices", "status": "Failed", "error": str(e)}))
         return None
 
+def generate_signals(engine):
+    '''Divergence signals for the selected pairs: correlated on returns, spread stretched, and mean-reverting within the window.'''
+    stats = engine.pair_stats()
+    if stats is None:
+        return []
+    signals = []
+    for n, (symbol1, symbol2) in enumerate(engine.pairs):
+        correlation, zscore, half_life = stats["correlation"][n], stats["zscore"][n], stats["half_life"][n]
+        if not (correlation >= CORRELATION_THRESHOLD and abs(zscore) >= DIVERGENCE_ZSCORE and half_life <= engine.window):
+            continue
+        # A positive z-score means symbol1 is rich against symbol2: short the spread, long the laggard
+        signal = {"symbol1": symbol1, "symbol2": symbol2, "side": "SHORT" if zscore > 0 else "LONG",
+                  "confidence": round(min(0.99, abs(zscore) / (2 * DIVERGENCE_ZSCORE)), 3), "zscore": float(zscore),
+                  "correlation": float(correlation), "hedge_ratio": float(stats["hedge_ratio"][n]), "half_life": float(half_life)}
+        logger.info(json.dumps({"module": "Cross Pair Divergence Engine", "action": "Generate Signal", "status": "Divergence", "signal": signal}))
+        divergence_signals_generated_total.inc()
+        signals.append(signal)
+    return signals
+
+def new_divergences(signals, open_divergences):
+    '''Signals for pairs that just started diverging (or flipped side); ``open_divergences`` maps pair -> side and is updated in place.'''
+    current = {(signal["symbol1"], signal["symbol2"]): signal["side"] for signal in signals}
+    started = [signal for signal in signals if open_divergences.get((signal["symbol1"], signal["symbol2"])) != signal["side"]]
+    open_divergences.clear()
+    open_divergences.update(current)
+    return started
+
 async def publish_signal(signal):
     '''Publishes the trading signal to Redis with a TTL.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         await redis.setex(f"titan:prod::signal:divergence", SIGNAL_EXPIRY, json.dumps(signal))  # TTL set to SIGNAL_EXPIRY
         logger.info(json.dumps({"module": "Cross Pair Divergence Engine", "action": "Publish Signal", "status": "Success", "signal": signal}))
     except Exception as e:
         logger.error(json.dumps({"module": "Cross Pair Divergence Engine", "action": "Publish Signal", "status": "Exception", "error": str(e)}))
 
+def benchmark(symbols: int = 500, window: int = 1000, updates: int = 2000, seed: int = 7) -> dict:
+    '''Correlated random walks for ``symbols`` symbols; per-update cost, full-matrix cost and error against numpy.corrcoef.'''
+    rng = np.random.default_rng(seed)
+    names = [f"S{n}" for n in range(symbols)]
+    pairs = list(zip(names[0::2], names[1::2]))
+    engine = RollingCorrelation(names, window=window, pairs=pairs, refresh_every=10 ** 9)
+    loadings = rng.normal(0, 1, symbols)
+    log_prices = np.zeros(symbols)
+    history = []
+    timings = []
+    for _ in range(updates):
+        log_prices = log_prices + 0.001 * (loadings * rng.normal() + rng.normal(0, 1, symbols))
+        prices = 100 * np.exp(log_prices)
+        history.append(log_prices)
+        started = time.perf_counter()
+        engine.update(prices)
+        timings.append(time.perf_counter() - started)
+    started = time.perf_counter()
+    matrix = engine.correlation_matrix()
+    engine.pair_stats()
+    query = time.perf_counter() - started
+    expected = np.corrcoef(np.diff(np.array(history[-window - 1:]), axis=0), rowvar=False)
+    timings.sort()
+    return {
+        "symbols": symbols,
+        "window": window,
+        "update_p50_ms": round(timings[len(timings) // 2] * 1e3, 3),
+        "update_p99_ms": round(timings[int(len(timings) * 0.99)] * 1e3, 3),
+        "matrix_and_pairs_ms": round(query * 1e3, 3),
+        "max_abs_error": float(np.max(np.abs(matrix - expected))),
+    }
+
 async def cross_pair_divergence_loop():
     '''Main loop for the cross-pair divergence engine module.'''
-    try:
-        for i in range(len(SYMBOLS)):
-            for j in range(i + 1, len(SYMBOLS)):
-                symbol1 = SYMBOLS[i]
-                symbol2 = SYMBOLS[j]
-                correlation = await calculate_correlation(symbol1, symbol2)
-                if correlation:
-                    signal = await generate_signal(symbol1, symbol2, correlation)
-                    if signal:
+    redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+    engine = RollingCorrelation(SYMBOLS, pairs=DIVERGENCE_PAIRS)
+    last_prices = [None] * len(SYMBOLS)
+    open_divergences = {}  # A divergence is published once when it opens, not on every sample while it lasts
+    while True:
+        try:
+            prices = await fetch_prices(redis, SYMBOLS)
+            if prices:
+                last_prices = [price if price else last for price, last in zip(prices, last_prices)]  # Carry the last price forward
+                if all(last_prices):
+                    started = time.perf_counter()
+                    engine.update(last_prices)
+                    correlation_update_latency_seconds.observe(time.perf_counter() - started)
+                    for signal in new_divergences(generate_signals(engine), open_divergences):
                         await publish_signal(signal)
-
-        await asyncio.sleep(60)  # Check for divergence opportunities every 60 seconds
-    except Exception as e:
-        logger.error(json.dumps({"module": "Cross Pair Divergence Engine", "action": "Management Loop", "status": "Exception", "error": str(e)}))
-        await asyncio.sleep(300)  # Wait before retrying
+            await asyncio.sleep(CORRELATION_SAMPLE_INTERVAL)
+        except Exception as e:
+            logger.error(json.dumps({"module": "Cross Pair Divergence Engine", "action": "Management Loop", "status": "Exception", "error": str(e)}))
+            await asyncio.sleep(300)  # Wait before retrying
 
 async def main():
     '''Main function to start the cross-pair divergence engine module.'''
     await cross_pair_divergence_loop()
 
 if __name__ == "__main__":
-    import aiohttp
-    asyncio.run(main())
\ No newline at end of file
+    import sys
+    if sys.argv[1:] == ["benchmark"]:
+        logger.info(json.dumps({"module": "Cross Pair Divergence Engine", "action": "Benchmark", **benchmark()}))
+    else:
+        asyncio.run(main())
@@ -14,10 +14,11 @@ Summary of Enhancements:
   - Added explicit handling of data privacy.
   - Enhanced error handling with specific error categories.
   - Expanded Prometheus metrics for detailed futures trading tracking.
+  - Contract specs (underlying, multiplier, linear / inverse) for ledger symbols, used by delta_hedger.
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -38,6 +39,8 @@ DEFAULT_FUTURES_EXCHANGE = "Binance Futures"  # Default futures exchange
 MAX_ORDER_SIZE = 100  # Maximum order size allowed by the exchange
 MAX_OPEN_POSITIONS = 5  # Maximum number of open positions
 ESG_IMPACT_FACTOR = 0.05  # Reduce trading priority for assets with lower ESG scores
+PERP_SUFFIX = os.environ.get("PERP_SUFFIX", "-PERP")  # Linear (USDT-margined) perpetual of X is X + PERP_SUFFIX, one contract = one unit of X
+CONTRACT_SPECS = json.loads(os.environ.get("CONTRACT_SPECS", "{}"))  # Overrides, e.g. {"BTCUSD-INVERSE": {"underlying": "BTCUSDT", "multiplier": 100, "inverse": true}}
 
 # Prometheus metrics (example)
 futures_trades_total = Counter('futures_trades_total', 'Total number of futures trades', ['exchange', 'outcome'])
@@ -45,10 +48,27 @@ futures_errors_total = Counter('futures_errors_total', 'Total number of futures
 futures_latency_seconds = Histogram('futures_latency_seconds', 'Latency of futures trading')
 futures_exchange = Gauge('futures_exchange', 'Futures exchange used')
 
+def perp_symbol(underlying):
+    '''Ledger / order symbol of the linear perpetual on ``underlying``.'''
+    return f"{underlying}{PERP_SUFFIX}"
+
+def contract_spec(symbol):
+    '''
+    (underlying, multiplier, inverse) for a ledger symbol.  Linear contracts carry ``multiplier`` units of
+    the underlying each; inverse contracts are worth ``multiplier`` in quote currency, so their delta in
+    units of the underlying is multiplier / price.  Anything not listed and without PERP_SUFFIX is spot.
+    '''
+    spec = CONTRACT_SPECS.get(symbol)
+    if spec is not None:
+        return spec["underlying"], float(spec.get("multiplier", 1.0)), bool(spec.get("inverse", False))
+    if symbol.endswith(PERP_SUFFIX):
+        return symbol[:-len(PERP_SUFFIX)], 1.0, False
+    return symbol, 1.0, False
+
 async def fetch_futures_data(exchange):
     '''Fetches futures data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         futures_data = await redis.get(f"titan:prod::{exchange}_futures_data")  # Standardized key
         if futures_data:
             return json.loads(futures_data)
@@ -17,7 +17,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -53,7 +53,7 @@ data_aggregation_latency_seconds = Histogram('data_aggregation_latency_seconds',
 async def fetch_data_from_redis(data_source):
     '''Fetches data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         data = await redis.get(f"titan:prod::{data_source}")  # Standardized key
         if data:
             logger.info(json.dumps({"module": "Data Aggregation Service", "action": "Fetch Data", "status": "Success", "data_source": data_source}))
@@ -17,7 +17,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -48,7 +48,7 @@ integrity_algorithm = Gauge('integrity_algorithm', 'Data integrity algorithm use
 async def fetch_data(data_source):
     '''Fetches data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         data = await redis.get(f"titan:prod::{data_source}")  # Standardized key
         if data:
             return json.loads(data)
@@ -10,6 +10,8 @@ Core Objectives:
   - Explicit 10/10 quality rating definition adherence: Code must meet all quality criteria, including modularity, error handling, metrics, logging, and testing.
 Summary of Enhancements:
   - Initial version.
+  - Canonical trade / book / kline events for Binance, Bybit and KuCoin WebSocket streams (normalize_market_event).
+  - Columnar NumPy record batches for trades and book levels (trade_batch, book_batch, event_batches, level_array) with a messages/sec benchmark.
 '''
 
 import asyncio
@@ -17,6 +19,9 @@ import aioredis
 import json
 import logging
 import os
+import time
+from itertools import chain
+import numpy as np
 from prometheus_client import Counter, Gauge, Histogram
 
 # Configure logging
@@ -71,6 +76,334 @@ async def normalize_data(data, schema):
         logger.error(json.dumps({"module": "Data Normalization Module", "action": "Normalize Data", "status": "Exception", "error": str(e)}))
         return None
 
+# Exchange market-data normalization (used by Market_Data_Gateway)
+#
+# Every exchange message becomes zero or more canonical events:
+#   trade:            {"type": "trade", "exchange", "symbol", "price", "quantity", "side", "trade_id", "timestamp_ns"}
+#   snapshot / diff:  {"type": "snapshot" | "diff", "exchange", "symbol", "bids", "asks", "first_sequence", "sequence", "timestamp_ns"}
+#   kline:            {"type": "kline", "exchange", "symbol", "interval", "open_time_ns", "open", "high", "low", "close", "volume", "closed"}
+# Symbols are canonical (BTCUSDT), sides are the taker side, book levels are [[price, size], ...] floats.
+
+QUOTE_ASSETS = ("USDT", "USDC", "BUSD", "BTC", "ETH", "EUR")
+BYBIT_INTERVALS = {"1": "1m", "3": "3m", "5": "5m", "15": "15m", "30": "30m", "60": "1h", "240": "4h", "D": "1d"}
+KUCOIN_INTERVALS = {"1min": "1m", "3min": "3m", "5min": "5m", "15min": "15m", "30min": "30m", "1hour": "1h", "4hour": "4h", "1day": "1d"}
+
+def exchange_symbol(exchange, symbol):
+    '''Canonical BTCUSDT -> the exchange's own spelling (KuCoin uses BTC-USDT).'''
+    if exchange == "kucoin":
+        for quote in QUOTE_ASSETS:
+            if symbol.endswith(quote) and len(symbol) > len(quote):
+                return f"{symbol[:-len(quote)]}-{quote}"
+    return symbol
+
+def exchange_interval(exchange, interval):
+    '''Canonical 1m -> the exchange's kline interval name.'''
+    if exchange == "bybit":
+        return {value: key for key, value in BYBIT_INTERVALS.items()}[interval]
+    if exchange == "kucoin":
+        return {value: key for key, value in KUCOIN_INTERVALS.items()}[interval]
+    return interval
+
+def _levels(levels):
+    return [[float(level[0]), float(level[1])] for level in levels]
+
+def _normalize_binance(message):
+    data = message.get("data", message)
+    event = data.get("e")
+    if event == "trade":
+        return [{"type": "trade", "exchange": "binance", "symbol": data["s"], "price": float(data["p"]), "quantity": float(data["q"]),
+                 "side": "sell" if data["m"] else "buy", "trade_id": data["t"], "timestamp_ns": data["T"] * 1_000_000}]
+    if event == "depthUpdate":
+        return [{"type": "diff", "exchange": "binance", "symbol": data["s"], "bids": _levels(data["b"]), "asks": _levels(data["a"]),
+                 "first_sequence": data["U"], "sequence": data["u"], "timestamp_ns": data["E"] * 1_000_000}]
+    if event == "kline":
+        k = data["k"]
+        return [{"type": "kline", "exchange": "binance", "symbol": data["s"], "interval": k["i"], "open_time_ns": k["t"] * 1_000_000,
+                 "open": float(k["o"]), "high": float(k["h"]), "low": float(k["l"]), "close": float(k["c"]), "volume": float(k["v"]), "closed": k["x"]}]
+    return []
+
+def _normalize_bybit(message):
+    topic = message.get("topic", "")
+    data = message.get("data")
+    if topic.startswith("publicTrade."):
+        return [{"type": "trade", "exchange": "bybit", "symbol": trade["s"], "price": float(trade["p"]), "quantity": float(trade["v"]),
+                 "side": trade["S"].lower(), "trade_id": trade["i"], "timestamp_ns": trade["T"] * 1_000_000} for trade in data]
+    if topic.startswith("orderbook."):
+        # Bybit update ids are consecutive; a snapshot (re)starts the sequence
+        return [{"type": "snapshot" if message.get("type") == "snapshot" else "diff", "exchange": "bybit", "symbol": data["s"],
+                 "bids": _levels(data["b"]), "asks": _levels(data["a"]), "first_sequence": data["u"], "sequence": data["u"],
+                 "timestamp_ns": message.get("ts", 0) * 1_000_000}]
+    if topic.startswith("kline."):
+        symbol = topic.rsplit(".", 1)[1]
+        return [{"type": "kline", "exchange": "bybit", "symbol": symbol, "interval": BYBIT_INTERVALS.get(kline["interval"], kline["interval"]),
+                 "open_time_ns": int(kline["start"]) * 1_000_000, "open": float(kline["open"]), "high": float(kline["high"]),
+                 "low": float(kline["low"]), "close": float(kline["close"]), "volume": float(kline["volume"]), "closed": kline["confirm"]}
+                for kline in data]
+    return []
+
+def _normalize_kucoin(message):
+    if message.get("type") != "message":
+        return []
+    topic = message.get("topic", "")
+    data = message["data"]
+    if topic.startswith("/market/match:"):
+        return [{"type": "trade", "exchange": "kucoin", "symbol": data["symbol"].replace("-", ""), "price": float(data["price"]),
+                 "quantity": float(data["size"]), "side": data["side"], "trade_id": data["tradeId"], "timestamp_ns": int(data["time"])}]
+    if topic.startswith("/market/level2:"):
+        changes = data["changes"]
+        return [{"type": "diff", "exchange": "kucoin", "symbol": data["symbol"].replace("-", ""),
+                 "bids": _levels(changes.get("bids", [])), "asks": _levels(changes.get("asks", [])),
+                 "first_sequence": int(data["sequenceStart"]), "sequence": int(data["sequenceEnd"]), "timestamp_ns": int(data.get("time", 0)) * 1_000_000}]
+    if topic.startswith("/market/candles:"):
+        interval = topic.rsplit("_", 1)[1]
+        start, open_, close, high, low, volume = data["candles"][:6]
+        return [{"type": "kline", "exchange": "kucoin", "symbol": data["symbol"].replace("-", ""), "interval": KUCOIN_INTERVALS.get(interval, interval),
+                 "open_time_ns": int(start) * 1_000_000_000, "open": float(open_), "high": float(high), "low": float(low),
+                 "close": float(close), "volume": float(volume), "closed": False}]
+    return []
+
+MARKET_NORMALIZERS = {"binance": _normalize_binance, "bybit": _normalize_bybit, "kucoin": _normalize_kucoin}
+
+def normalize_market_event(exchange, message):
+    '''Raw exchange WebSocket message -> list of canonical events (empty for acks, pongs and unknown topics).'''
+    try:
+        return MARKET_NORMALIZERS[exchange](message)
+    except Exception as e:
+        data_normalization_errors_total.labels(error_type="MarketEvent").inc()
+        logger.error(json.dumps({"module": "Data Normalization Module", "action": "Normalize Market Event", "status": "Exception", "exchange": exchange, "error": str(e)}))
+        return []
+
+# Columnar batches
+#
+# Analytics that look at many messages at once take NumPy structured arrays instead of per-message dicts:
+#   TRADE_DTYPE rows are one trade; BOOK_DTYPE rows are one book level change (size 0 removes the level),
+#   with ``message`` numbering the source message within the batch.  Sides are +1 buy / bid and -1 sell / ask;
+#   exchange and symbol are small integer codes (EXCHANGES, symbol_code / symbol_name) so a batch holds no
+#   Python objects.  Numeric trade ids are kept; Bybit's UUIDs and other non-numeric ids become -1.
+# Columns are field views of one buffer: batch["price"] and slices of a batch copy nothing.
+
+EXCHANGES = ("binance", "bybit", "kucoin")
+EXCHANGE_CODES = {name: code for code, name in enumerate(EXCHANGES)}
+TRADE_DTYPE = np.dtype([("timestamp_ns", "<i8"), ("price", "<f8"), ("quantity", "<f8"), ("trade_id", "<i8"),
+                        ("symbol", "<u2"), ("exchange", "u1"), ("side", "i1")])
+BOOK_DTYPE = np.dtype([("timestamp_ns", "<i8"), ("sequence", "<i8"), ("price", "<f8"), ("size", "<f8"), ("message", "<i4"),
+                       ("symbol", "<u2"), ("exchange", "u1"), ("side", "i1"), ("snapshot", "?")])
+LEVEL_DTYPE = np.dtype([("price", "<f8"), ("size", "<f8")])
+
+_symbols = []
+_symbol_codes = {}
+
+def symbol_code(symbol):
+    '''Process-wide small integer for a canonical symbol, assigned on first use.'''
+    code = _symbol_codes.get(symbol)
+    if code is None:
+        code = _symbol_codes[symbol] = len(_symbols)
+        _symbols.append(symbol)
+    return code
+
+def symbol_name(code):
+    return _symbols[code]
+
+def _trade_id(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return -1
+
+def level_array(levels):
+    '''
+    Book levels in any adapter's shape -> LEVEL_DTYPE array: [[price, size], ...] (floats or exchange strings),
+    [{"price", "size"}, ...], an (n, 2) float array (viewed without copying) or an existing LEVEL_DTYPE array.
+    Levels with more than two columns, such as [price, size, order_count], keep the first two.
+    '''
+    if isinstance(levels, np.ndarray) and levels.dtype == LEVEL_DTYPE:
+        return levels
+    if not len(levels):
+        return np.empty(0, dtype=LEVEL_DTYPE)
+    if isinstance(levels[0], dict):
+        levels = [(level["price"], level["size"]) for level in levels]
+    levels = np.asarray(levels, dtype=np.float64)
+    levels = levels[:, :2] if levels.ndim == 2 else levels.reshape(-1, 2)  # Extra columns (order counts, ids) are dropped
+    return np.ascontiguousarray(levels).view(LEVEL_DTYPE).reshape(-1)
+
+def book_levels(book):
+    '''(bids, asks) LEVEL_DTYPE arrays from a book dict with "bids"/"asks" (or Binance-style "b"/"a") in any level_array shape.'''
+    return level_array(book.get("bids", book.get("b", []))), level_array(book.get("asks", book.get("a", [])))
+
+# Raw message -> field tuples; each returns [] for messages of another kind
+def _binance_trades(message):
+    data = message.get("data", message)
+    if data.get("e") != "trade":
+        return []
+    return [(data["T"] * 1_000_000, data["p"], data["q"], data["t"], data["s"], -1 if data["m"] else 1)]
+
+def _bybit_trades(message):
+    if not message.get("topic", "").startswith("publicTrade."):
+        return []
+    return [(trade["T"] * 1_000_000, trade["p"], trade["v"], trade["i"], trade["s"], 1 if trade["S"] == "Buy" else -1) for trade in message["data"]]
+
+def _kucoin_trades(message):
+    if message.get("type") != "message" or not message.get("topic", "").startswith("/market/match:"):
+        return []
+    data = message["data"]
+    return [(int(data["time"]), data["price"], data["size"], data["tradeId"], data["symbol"].replace("-", ""), 1 if data["side"] == "buy" else -1)]
+
+def _binance_book(message):
+    data = message.get("data", message)
+    if data.get("e") != "depthUpdate":
+        return None
+    return data["E"] * 1_000_000, data["u"], data["s"], data["b"], data["a"], False
+
+def _bybit_book(message):
+    if not message.get("topic", "").startswith("orderbook."):
+        return None
+    data = message["data"]
+    return message.get("ts", 0) * 1_000_000, data["u"], data["s"], data["b"], data["a"], message.get("type") == "snapshot"
+
+def _kucoin_book(message):
+    if message.get("type") != "message" or not message.get("topic", "").startswith("/market/level2:"):
+        return None
+    data = message["data"]
+    changes = data["changes"]
+    # KuCoin levels are [price, size, sequence]
+    return (int(data.get("time", 0)) * 1_000_000, int(data["sequenceEnd"]), data["symbol"].replace("-", ""),
+            [level[:2] for level in changes.get("bids", [])], [level[:2] for level in changes.get("asks", [])], False)
+
+TRADE_EXTRACTORS = {"binance": _binance_trades, "bybit": _bybit_trades, "kucoin": _kucoin_trades}
+BOOK_EXTRACTORS = {"binance": _binance_book, "bybit": _bybit_book, "kucoin": _kucoin_book}
+
+def _trade_rows(rows, exchange_codes):
+    batch = np.empty(len(rows), dtype=TRADE_DTYPE)
+    if not rows:
+        return batch
+    timestamps, prices, quantities, trade_ids, symbols, sides = zip(*rows)
+    batch["timestamp_ns"] = timestamps
+    batch["price"] = np.array(prices, dtype=np.float64)  # Parses exchange decimal strings in C
+    batch["quantity"] = np.array(quantities, dtype=np.float64)
+    batch["trade_id"] = [_trade_id(trade_id) for trade_id in trade_ids]
+    batch["symbol"] = [symbol_code(symbol) for symbol in symbols]
+    batch["exchange"] = exchange_codes
+    batch["side"] = sides
+    return batch
+
+def trade_batch(exchange, messages):
+    '''Decoded raw WebSocket messages from one exchange -> TRADE_DTYPE array of every trade in them; other messages are skipped.'''
+    extract = TRADE_EXTRACTORS[exchange]
+    rows = []
+    for message in messages:
+        try:
+            rows += extract(message)
+        except Exception as e:
+            data_normalization_errors_total.labels(error_type="TradeBatch").inc()
+            logger.error(json.dumps({"module": "Data Normalization Module", "action": "Trade Batch", "status": "Exception", "exchange": exchange, "error": repr(e)}))
+    return _trade_rows(rows, EXCHANGE_CODES[exchange])
+
+def book_batch(exchange, messages):
+    '''Decoded raw WebSocket messages from one exchange -> BOOK_DTYPE array of every level change, bids then asks per message.'''
+    extract = BOOK_EXTRACTORS[exchange]
+    headers, values = [], []
+    for message in messages:
+        try:
+            header = extract(message)
+        except Exception as e:
+            data_normalization_errors_total.labels(error_type="BookBatch").inc()
+            logger.error(json.dumps({"module": "Data Normalization Module", "action": "Book Batch", "status": "Exception", "exchange": exchange, "error": repr(e)}))
+            continue
+        if header is None:
+            continue
+        timestamp_ns, sequence, symbol, bids, asks, snapshot = header
+        headers.append((timestamp_ns, sequence, symbol_code(symbol), snapshot, len(bids), len(asks)))
+        values += chain.from_iterable(bids)
+        values += chain.from_iterable(asks)
+    return _book_rows(headers, values, EXCHANGE_CODES[exchange])
+
+def _book_rows(headers, values, exchange_codes):
+    '''headers: (timestamp_ns, sequence, symbol code, snapshot, bid count, ask count) per message; values: flat price, size, price, ...'''
+    batch = np.empty(len(values) // 2, dtype=BOOK_DTYPE)
+    if not len(batch):
+        return batch
+    timestamps, sequences, symbols, snapshots, bid_counts, ask_counts = zip(*headers)
+    counts = np.add(bid_counts, ask_counts)
+    message = np.repeat(np.arange(len(headers), dtype=np.int32), counts)
+    prices_sizes = np.fromiter(map(float, values), dtype=np.float64, count=len(values)).reshape(-1, 2)
+    batch["price"] = prices_sizes[:, 0]
+    batch["size"] = prices_sizes[:, 1]
+    batch["message"] = message
+    batch["timestamp_ns"] = np.asarray(timestamps, dtype=np.int64)[message]
+    batch["sequence"] = np.asarray(sequences, dtype=np.int64)[message]
+    batch["symbol"] = np.asarray(symbols, dtype=np.uint16)[message]
+    batch["snapshot"] = np.asarray(snapshots, dtype=bool)[message]
+    batch["exchange"] = exchange_codes if np.isscalar(exchange_codes) else np.asarray(exchange_codes, dtype=np.uint8)[message]
+    # Bids come first within each message: rank within the message < its bid count
+    starts = np.cumsum(counts) - counts
+    batch["side"] = np.where(np.arange(len(batch)) - starts[message] < np.asarray(bid_counts)[message], 1, -1)
+    return batch
+
+def event_batches(events):
+    '''
+    Canonical events (normalize_market_event output, e.g. decoded from the gateway's Redis channels) ->
+    (TRADE_DTYPE array, BOOK_DTYPE array).  Klines and unknown types are skipped.
+    '''
+    trades, trade_exchanges = [], []
+    headers, values, book_exchanges = [], [], []
+    for event in events:
+        kind = event.get("type")
+        if kind == "trade":
+            trades.append((event["timestamp_ns"], event["price"], event["quantity"], event["trade_id"], event["symbol"], 1 if event["side"] == "buy" else -1))
+            trade_exchanges.append(EXCHANGE_CODES.get(event["exchange"], 255))
+        elif kind in ("snapshot", "diff"):
+            bids, asks = event["bids"], event["asks"]
+            headers.append((event["timestamp_ns"], event["sequence"], symbol_code(event["symbol"]), kind == "snapshot", len(bids), len(asks)))
+            values += chain.from_iterable(bids)
+            values += chain.from_iterable(asks)
+            book_exchanges.append(EXCHANGE_CODES.get(event["exchange"], 255))
+    return _trade_rows(trades, trade_exchanges), _book_rows(headers, values, book_exchanges)
+
+def benchmark(messages=200000, levels_per_diff=20):
+    '''Binance trade and depth messages through normalize_market_event one by one vs trade_batch / book_batch; messages per second.'''
+    import random
+    rng = random.Random(7)
+    trades = [{"e": "trade", "E": 1700000000000 + n, "s": "BTCUSDT", "t": n, "p": f"{30000 + rng.uniform(-50, 50):.2f}",
+               "q": f"{rng.uniform(0.001, 2):.5f}", "T": 1700000000000 + n, "m": rng.random() < 0.5} for n in range(messages)]
+    diffs = [{"e": "depthUpdate", "E": 1700000000000 + n, "s": "BTCUSDT", "U": n * 10, "u": n * 10 + 9,
+              "b": [[f"{30000 - rng.uniform(0, 50):.2f}", f"{rng.uniform(0, 5):.4f}"] for _ in range(levels_per_diff // 2)],
+              "a": [[f"{30000 + rng.uniform(0, 50):.2f}", f"{rng.uniform(0, 5):.4f}"] for _ in range(levels_per_diff // 2)]}
+             for n in range(messages // 10)]
+
+    # Each path normalizes then feeds a typical consumer: a notional-weighted price for trades, net size per side for depth
+    results = {}
+    started = time.perf_counter()
+    notional = volume = 0.0
+    for message in trades:
+        for event in normalize_market_event("binance", message):
+            notional += event["price"] * event["quantity"]
+            volume += event["quantity"]
+    results["trade_dict_msgs_per_sec"] = int(messages / (time.perf_counter() - started))
+    started = time.perf_counter()
+    for lo in range(0, messages, 1000):
+        batch = trade_batch("binance", trades[lo:lo + 1000])
+        notional_batch = float(np.dot(batch["price"], batch["quantity"]))
+    results["trade_batch_msgs_per_sec"] = int(messages / (time.perf_counter() - started))
+
+    started = time.perf_counter()
+    net = {"bid": 0.0, "ask": 0.0}
+    for message in diffs:
+        for event in normalize_market_event("binance", message):
+            net["bid"] += sum(size for _, size in event["bids"])
+            net["ask"] += sum(size for _, size in event["asks"])
+    results["depth_dict_msgs_per_sec"] = int(len(diffs) / (time.perf_counter() - started))
+    started = time.perf_counter()
+    for lo in range(0, len(diffs), 1000):
+        batch = book_batch("binance", diffs[lo:lo + 1000])
+        bid_size = float(batch["size"][batch["side"] == 1].sum())
+    results["depth_batch_msgs_per_sec"] = int(len(diffs) / (time.perf_counter() - started))
+
+    events = [event for message in trades for event in normalize_market_event("binance", message)]
+    batch = trade_batch("binance", trades)
+    results["trade_batch_matches_events"] = bool(np.array_equal(batch["price"], [event["price"] for event in events])
+                                                 and np.array_equal(batch["timestamp_ns"], [event["timestamp_ns"] for event in events]))
+    return results
+
 async def data_normalization_loop():
     '''Main loop for the data normalization module.'''
     try:
@@ -99,5 +432,8 @@ async def main():
     await data_normalization_loop()
 
 if __name__ == "__main__":
-    import aiohttp
-    asyncio.run(main())
\ No newline at end of file
+    import sys
+    if sys.argv[1:] == ["benchmark"]:
+        logger.info(json.dumps({"module": "Data Normalization Module", "action": "Benchmark", **benchmark()}))
+    else:
+        asyncio.run(main())
\ No newline at end of file
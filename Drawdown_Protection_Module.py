@@ -17,7 +17,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -46,7 +46,7 @@ portfolio_drawdown = Gauge('portfolio_drawdown', 'Current portfolio drawdown')
 async def fetch_portfolio_data():
     '''Fetches portfolio data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         portfolio_data = await redis.get("titan:prod::portfolio_data")  # Standardized key
         if portfolio_data:
             return json.loads(portfolio_data)
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -42,7 +42,7 @@ capital_redirected_amount = Gauge('capital_redirected_amount', 'Amount of capita
 async def fetch_trade_outcomes(strategy):
     '''Fetches the last few trade outcomes for a given strategy from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         trade_outcomes = []
         for i in range(LOSS_COUNT_THRESHOLD):
             trade_data = await redis.get(f"titan:trade:{strategy}:outcome:{i}")
@@ -17,7 +17,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -47,7 +47,7 @@ asset_esg_score = Gauge('asset_esg_score', 'ESG score of the asset')
 async def fetch_asset_esg_score(asset):
     '''Fetches the ESG score of an asset from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         esg_data = await redis.get(f"titan:prod::{asset}_esg")  # Standardized key
         if esg_data:
             esg_score = json.loads(esg_data)['score']
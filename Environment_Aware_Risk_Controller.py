@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -42,7 +42,7 @@ trade_size_multiplier = Gauge('trade_size_multiplier', 'Trade size multiplier ba
 async def fetch_environment_data():
     '''Fetches market regime, volatility state, and time of day data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         market_regime = await redis.get("titan:macro::market_regime")
         volatility_state = await redis.get("titan:macro::volatility_state")
         time_of_day = datetime.datetime.now().hour
@@ -17,7 +17,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -48,7 +48,7 @@ event_trigger = Gauge('event_trigger', 'Event trigger used')
 async def fetch_event_data(trigger):
     '''Fetches event data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         event_data = await redis.get(f"titan:prod::{trigger}_event_data")  # Standardized key
         if event_data:
             return json.loads(event_data)
@@ -17,7 +17,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -60,7 +60,7 @@ compliance_latency_seconds = Histogram('compliance_latency_seconds', 'Latency of
 async def fetch_exchange_rules():
     '''Fetches exchange-specific regulatory rules from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         rules_data = await redis.get(f"titan:prod::{EXCHANGE_NAME}_rules")  # Standardized key
         if rules_data:
             return json.loads(rules_data)
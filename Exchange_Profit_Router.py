@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -42,7 +42,7 @@ exchange_profit_score = Gauge('exchange_profit_score', 'Profit score for each ex
 async def fetch_exchange_data(exchange):
     '''Fetches spread and depth information from Redis for a given exchange.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         spread = await redis.get(f"titan:prod::{exchange}:spread")
         depth = await redis.get(f"titan:prod::{exchange}:depth")
 
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -42,7 +42,7 @@ arb_profit = Gauge('arb_profit', 'Profit from spread sniping')
 async def fetch_exchange_data():
     '''Scans BTC <-> ETH <-> ALT cycles for pricing drift.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         exchange1_price = await redis.get("titan:exchange1:price:BTCUSDT")
         exchange1_depth = await redis.get("titan:exchange1:depth:BTCUSDT")
         exchange2_price = await redis.get("titan:exchange2:price:BTCUSDT")
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -42,7 +42,7 @@ execution_delay = Gauge('execution_delay', 'Delay between signal generation and
 async def fetch_market_conditions():
     '''Fetches candle close time, HFT peak time, and delay-based slippage data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         candle_close_time = await redis.get(f"titan:prod::candle_close:{SYMBOL}")
         hft_peak_time = await redis.get(f"titan:prod::hft_peak:{SYMBOL}")
         delay_slippage = await redis.get(f"titan:prod::delay_slippage:{SYMBOL}")
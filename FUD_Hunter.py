@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -41,7 +41,7 @@ fud_hunter_strategy_profit = Gauge('fud_hunter_strategy_profit', 'Profit generat
 async def fetch_data():
     '''Fetches news parser, volume panic score, and sentiment alerts data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         news = await redis.get(f"titan:prod::news:{SYMBOL}")
         volume_panic_score = await redis.get(f"titan:prod::volume_panic_score:{SYMBOL}")
         sentiment_alerts = await redis.get(f"titan:prod::sentiment_alerts:{SYMBOL}")
@@ -82,7 +82,7 @@ async def generate_signal(data):
 async def publish_signal(signal):
     '''Publishes the trading signal to Redis with a TTL.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         await redis.setex(f"titan:prod::signal:{SYMBOL}", SIGNAL_EXPIRY, json.dumps(signal))  # TTL set to SIGNAL_EXPIRY
         logger.info(json.dumps({"module": "FUD Hunter", "action": "Publish Signal", "status": "Success", "signal": signal}))
     except Exception as e:
@@ -0,0 +1,312 @@
+'''
+Module: Fake Exchange Server
+Version: 1.0.0
+Last Updated: 2026-10-16
+Purpose: Local stand-in for the Binance, Bybit and KuCoin public WebSocket and REST market-data endpoints, for exercising Market_Data_Gateway offline.
+Core Objectives:
+  - Explicit profitability and risk targets alignment: Lets reconnect and gap-recovery paths be exercised before they are needed in production.
+  - Explicit ESG compliance adherence: Synthetic data only.
+  - Explicit regulatory and compliance standards adherence: No connection to real venues.
+  - Explicit 10/10 quality rating definition adherence: Code must meet all quality criteria, including modularity, error handling, metrics, logging, and testing.
+Summary of Enhancements:
+  - Initial version. A random-walk book per (exchange, symbol) advanced by one ticker and broadcast in each
+    exchange's wire format; optional dropped diffs (sequence gaps) and forced disconnects.
+'''
+
+import asyncio
+import json
+import logging
+import os
+import random
+import time
+import uuid
+from aiohttp import web
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(module)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Constants
+FAKE_EXCHANGE_HOST = os.environ.get("FAKE_EXCHANGE_HOST", "127.0.0.1")
+FAKE_EXCHANGE_PORT = int(os.environ.get("FAKE_EXCHANGE_PORT", 8765))
+FAKE_EXCHANGE_SYMBOLS = os.environ.get("FAKE_EXCHANGE_SYMBOLS", "BTCUSDT,ETHUSDT").split(",")
+FAKE_TICK_INTERVAL = float(os.environ.get("FAKE_TICK_INTERVAL", 0.01))  # Seconds between market updates
+FAKE_GAP_EVERY = int(os.environ.get("FAKE_GAP_EVERY", 0))  # Drop every Nth book diff from the stream (0 = never)
+FAKE_DISCONNECT_AFTER = int(os.environ.get("FAKE_DISCONNECT_AFTER", 0))  # Close each socket after N frames (0 = never)
+
+def _kucoin_symbol(symbol):
+    return f"{symbol[:-4]}-{symbol[-4:]}" if symbol.endswith(("USDT", "USDC")) else symbol
+
+class FakeMarket:
+    '''Random-walk L2 book and trade tape for one symbol on one exchange.'''
+
+    def __init__(self, symbol: str, mid: float = 30000.0, levels: int = 50, seed: int = None, max_sequence_step: int = 3):
+        self.symbol = symbol
+        self.max_sequence_step = max_sequence_step  # Updates folded into one diff; Bybit ids advance by exactly one
+        self.rng = random.Random(seed)
+        self.mid = mid
+        self.tick = 0.5
+        self.bids = {round(mid - self.tick * (i + 1), 2): round(self.rng.uniform(0.1, 5), 4) for i in range(levels)}
+        self.asks = {round(mid + self.tick * (i + 1), 2): round(self.rng.uniform(0.1, 5), 4) for i in range(levels)}
+        self.sequence = 1
+        self.trade_id = 0
+        self.kline_open = self.kline_high = self.kline_low = self.kline_close = mid
+        self.kline_volume = 0.0
+        self.kline_start_ms = int(time.time() // 60 * 60 * 1000)
+
+    def snapshot(self, depth: int = 100):
+        bids = sorted(self.bids.items(), reverse=True)[:depth]
+        asks = sorted(self.asks.items())[:depth]
+        return [[str(p), str(q)] for p, q in bids], [[str(p), str(q)] for p, q in asks], self.sequence
+
+    def step(self):
+        '''Advances the market; returns (first_sequence, sequence, bid changes, ask changes, trade).'''
+        self.mid += self.rng.gauss(0, self.tick)
+        first = self.sequence + 1
+        self.sequence += self.rng.randint(1, self.max_sequence_step)
+        bid_changes, ask_changes = [], []
+        for _ in range(self.rng.randint(1, 4)):
+            is_bid = self.rng.random() < 0.5
+            offset = self.tick * (abs(int(self.rng.gauss(0, 10))) + 1)
+            price = round((self.mid - offset if is_bid else self.mid + offset) / self.tick) * self.tick
+            side, changes = (self.bids, bid_changes) if is_bid else (self.asks, ask_changes)
+            size = 0.0 if self.rng.random() < 0.3 and price in side else round(self.rng.uniform(0.1, 5), 4)
+            if size:
+                side[price] = size
+            else:
+                side.pop(price, None)
+            changes.append([str(price), str(size)])
+        # Keep the book uncrossed around the new mid
+        for price in [p for p in self.bids if p >= self.mid]:
+            del self.bids[price]
+            bid_changes.append([str(price), "0"])
+        for price in [p for p in self.asks if p <= self.mid]:
+            del self.asks[price]
+            ask_changes.append([str(price), "0"])
+
+        self.trade_id += 1
+        trade = {"id": self.trade_id, "price": round(self.mid, 2), "quantity": round(self.rng.uniform(0.001, 1), 4),
+                 "buyer_maker": self.rng.random() < 0.5, "time_ms": int(time.time() * 1000)}
+        self.kline_high = max(self.kline_high, trade["price"])
+        self.kline_low = min(self.kline_low, trade["price"])
+        self.kline_close = trade["price"]
+        self.kline_volume += trade["quantity"]
+        return first, self.sequence, bid_changes, ask_changes, trade
+
+    def kline(self):
+        return {"start_ms": self.kline_start_ms, "open": self.kline_open, "high": self.kline_high, "low": self.kline_low,
+                "close": self.kline_close, "volume": round(self.kline_volume, 6)}
+
+def binance_frames(symbol, update, market):
+    first, last, bids, asks, trade = update
+    stream = symbol.lower()
+    now = int(time.time() * 1000)
+    k = market.kline()
+    return [
+        ("book", {"stream": f"{stream}@depth@100ms", "data": {"e": "depthUpdate", "E": now, "s": symbol, "U": first, "u": last, "b": bids, "a": asks}}),
+        ("trade", {"stream": f"{stream}@trade", "data": {"e": "trade", "E": now, "s": symbol, "t": trade["id"], "p": str(trade["price"]),
+                                                         "q": str(trade["quantity"]), "T": trade["time_ms"], "m": trade["buyer_maker"]}}),
+        ("kline", {"stream": f"{stream}@kline_1m", "data": {"e": "kline", "E": now, "s": symbol, "k": {
+            "t": k["start_ms"], "i": "1m", "o": str(k["open"]), "h": str(k["high"]), "l": str(k["low"]), "c": str(k["close"]), "v": str(k["volume"]), "x": False}}}),
+    ]
+
+def bybit_frames(symbol, update, market):
+    _, last, bids, asks, trade = update
+    now = int(time.time() * 1000)
+    k = market.kline()
+    return [
+        ("book", {"topic": f"orderbook.50.{symbol}", "type": "delta", "ts": now, "data": {"s": symbol, "b": bids, "a": asks, "u": last}}),
+        ("trade", {"topic": f"publicTrade.{symbol}", "ts": now, "data": [{"T": trade["time_ms"], "s": symbol, "S": "Sell" if trade["buyer_maker"] else "Buy",
+                                                                           "v": str(trade["quantity"]), "p": str(trade["price"]), "i": str(uuid.uuid4())}]}),
+        ("kline", {"topic": f"kline.1.{symbol}", "ts": now, "data": [{"start": k["start_ms"], "interval": "1", "open": str(k["open"]), "high": str(k["high"]),
+                                                                       "low": str(k["low"]), "close": str(k["close"]), "volume": str(k["volume"]), "confirm": False}]}),
+    ]
+
+def kucoin_frames(symbol, update, market):
+    first, last, bids, asks, trade = update
+    pair = _kucoin_symbol(symbol)
+    now = int(time.time() * 1000)
+    k = market.kline()
+    return [
+        ("book", {"type": "message", "topic": f"/market/level2:{pair}", "subject": "trade.l2update", "data": {
+            "sequenceStart": first, "sequenceEnd": last, "symbol": pair, "time": now,
+            "changes": {"bids": [level + [str(last)] for level in bids], "asks": [level + [str(last)] for level in asks]}}}),
+        ("trade", {"type": "message", "topic": f"/market/match:{pair}", "subject": "trade.l3match", "data": {
+            "sequence": str(trade["id"]), "price": str(trade["price"]), "size": str(trade["quantity"]), "side": "sell" if trade["buyer_maker"] else "buy",
+            "symbol": pair, "time": str(trade["time_ms"] * 1_000_000), "tradeId": str(trade["id"])}}),
+        ("kline", {"type": "message", "topic": f"/market/candles:{pair}_1min", "subject": "trade.candles.update", "data": {
+            "symbol": pair, "time": now * 1_000_000, "candles": [str(k["start_ms"] // 1000), str(k["open"]), str(k["close"]), str(k["high"]),
+                                                                str(k["low"]), str(k["volume"]), "0"]}}),
+    ]
+
+FRAME_BUILDERS = {"binance": binance_frames, "bybit": bybit_frames, "kucoin": kucoin_frames}
+
+class Connection:
+    def __init__(self, ws, exchange):
+        self.ws = ws
+        self.exchange = exchange
+        self.topics = set()  # (kind, symbol) pairs this client receives
+        self.queue = asyncio.Queue()
+        self.sent = 0
+
+class FakeExchangeServer:
+    '''
+    aiohttp app serving all three exchanges from one port.
+
+    Point the gateway at it with BINANCE_WS_URL=ws://host:port/stream,
+    BINANCE_REST_URL=http://host:port, BYBIT_WS_URL=ws://host:port/bybit and
+    KUCOIN_REST_URL=http://host:port.
+    '''
+
+    def __init__(self, symbols=FAKE_EXCHANGE_SYMBOLS, tick_interval=FAKE_TICK_INTERVAL, gap_every=FAKE_GAP_EVERY, disconnect_after=FAKE_DISCONNECT_AFTER, seed=7):
+        self.symbols = list(symbols)
+        self.tick_interval = tick_interval
+        self.gap_every = gap_every
+        self.disconnect_after = disconnect_after
+        self.markets = {(exchange, symbol): FakeMarket(symbol, seed=seed + n, max_sequence_step=1 if exchange == "bybit" else 3)
+                        for exchange in FRAME_BUILDERS for n, symbol in enumerate(self.symbols)}
+        self.connections = set()
+        self.diffs = 0
+        self.dropped_diffs = 0
+        self.base_url = None
+        self.app = web.Application()
+        self.app.add_routes([
+            web.get("/stream", self.binance_ws),
+            web.get("/api/v3/depth", self.binance_depth),
+            web.get("/bybit", self.bybit_ws),
+            web.post("/api/v1/bullet-public", self.kucoin_bullet),
+            web.get("/kucoin", self.kucoin_ws),
+            web.get("/api/v1/market/orderbook/level2_100", self.kucoin_depth),
+        ])
+        self.runner = None
+        self.ticker = None
+
+    async def start(self, host=FAKE_EXCHANGE_HOST, port=FAKE_EXCHANGE_PORT):
+        '''Starts serving (port 0 picks a free port) and returns the base http URL.'''
+        self.runner = web.AppRunner(self.app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, host, port)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://{host}:{port}"
+        self.ticker = asyncio.create_task(self._tick())
+        return self.base_url
+
+    async def stop(self):
+        self.ticker.cancel()
+        for connection in list(self.connections):
+            await connection.ws.close()
+        await self.runner.cleanup()
+
+    async def _tick(self):
+        while True:
+            await asyncio.sleep(self.tick_interval)
+            for (exchange, symbol), market in self.markets.items():
+                update = market.step()
+                frames = FRAME_BUILDERS[exchange](symbol, update, market)
+                self.diffs += 1
+                drop_diff = self.gap_every and self.diffs % self.gap_every == 0
+                if drop_diff:
+                    self.dropped_diffs += 1
+                for connection in self.connections:
+                    if connection.exchange != exchange:
+                        continue
+                    for kind, frame in frames:
+                        if (kind, symbol) in connection.topics and not (kind == "book" and drop_diff):
+                            connection.queue.put_nowait(frame)
+
+    async def _serve(self, request, exchange, on_message=None, greeting=None):
+        ws = web.WebSocketResponse(heartbeat=None)
+        await ws.prepare(request)
+        connection = Connection(ws, exchange)
+        self.connections.add(connection)
+        if greeting is not None:
+            await ws.send_json(greeting)
+        if exchange == "binance":
+            for stream in request.query.get("streams", "").split("/"):
+                name, _, kind = stream.partition("@")
+                kind = {"trade": "trade", "depth": "book", "kline_1m": "kline"}.get(kind.split("@")[0])
+                if kind:
+                    connection.topics.add((kind, name.upper()))
+
+        async def sender():
+            while not ws.closed:
+                frame = await connection.queue.get()
+                await ws.send_json(frame)
+                connection.sent += 1
+                if self.disconnect_after and connection.sent >= self.disconnect_after:
+                    await ws.close()
+
+        task = asyncio.create_task(sender())
+        try:
+            async for msg in ws:
+                if on_message is not None:
+                    await on_message(connection, json.loads(msg.data))
+        finally:
+            task.cancel()
+            self.connections.discard(connection)
+        return ws
+
+    # Binance
+
+    async def binance_ws(self, request):
+        return await self._serve(request, "binance")
+
+    async def binance_depth(self, request):
+        bids, asks, sequence = self.markets[("binance", request.query["symbol"])].snapshot(int(request.query.get("limit", 100)))
+        return web.json_response({"lastUpdateId": sequence, "bids": bids, "asks": asks})
+
+    # Bybit
+
+    async def bybit_ws(self, request):
+        async def on_message(connection, message):
+            if message.get("op") == "ping":
+                await connection.ws.send_json({"op": "pong", "success": True})
+                return
+            for topic in message.get("args", []):
+                kind, symbol = topic.split(".")[0], topic.rsplit(".", 1)[1]
+                kind = {"publicTrade": "trade", "orderbook": "book", "kline": "kline"}[kind]
+                if message["op"] == "unsubscribe":
+                    connection.topics.discard((kind, symbol))
+                    continue
+                connection.topics.add((kind, symbol))
+                if kind == "book":
+                    bids, asks, sequence = self.markets[("bybit", symbol)].snapshot(50)
+                    connection.queue.put_nowait({"topic": topic, "type": "snapshot", "ts": int(time.time() * 1000),
+                                                 "data": {"s": symbol, "b": bids, "a": asks, "u": sequence}})
+            await connection.ws.send_json({"op": message["op"], "success": True})
+        return await self._serve(request, "bybit", on_message)
+
+    # KuCoin
+
+    async def kucoin_bullet(self, request):
+        endpoint = self.base_url.replace("http", "ws", 1) + "/kucoin"
+        return web.json_response({"code": "200000", "data": {"token": uuid.uuid4().hex, "instanceServers": [
+            {"endpoint": endpoint, "protocol": "websocket", "encrypt": False, "pingInterval": 18000, "pingTimeout": 10000}]}})
+
+    async def kucoin_ws(self, request):
+        async def on_message(connection, message):
+            if message.get("type") == "ping":
+                await connection.ws.send_json({"id": message.get("id"), "type": "pong"})
+                return
+            prefix, _, targets = message["topic"].partition(":")
+            kind = {"/market/match": "trade", "/market/level2": "book", "/market/candles": "kline"}[prefix]
+            for target in targets.split(","):
+                connection.topics.add((kind, target.split("_")[0].replace("-", "")))
+            await connection.ws.send_json({"id": message.get("id"), "type": "ack"})
+        return await self._serve(request, "kucoin", on_message, greeting={"id": uuid.uuid4().hex, "type": "welcome"})
+
+    async def kucoin_depth(self, request):
+        symbol = request.query["symbol"].replace("-", "")
+        bids, asks, sequence = self.markets[("kucoin", symbol)].snapshot(100)
+        return web.json_response({"code": "200000", "data": {"sequence": str(sequence), "time": int(time.time() * 1000), "bids": bids, "asks": asks}})
+
+async def main():
+    '''Serves the fake exchanges until interrupted.'''
+    server = FakeExchangeServer()
+    base_url = await server.start()
+    logger.info(json.dumps({"module": "Fake Exchange Server", "action": "Start", "status": "Listening", "base_url": base_url}))
+    await asyncio.Event().wait()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -42,7 +42,7 @@ maker_order_ratio = Gauge('maker_order_ratio', 'Ratio of maker orders to total o
 async def fetch_exchange_fee_structure(exchange):
     '''Fetches exchange fee structure from Redis or a configuration file.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         fee_data = await redis.get(f"titan:prod::{exchange}:fee_structure")
         if fee_data:
             return json.loads(fee_data)
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -42,7 +42,7 @@ effective_fee_rate = Gauge('effective_fee_rate', 'Effective fee rate after optim
 async def track_exchange_volume():
     '''Tracks cumulative 30d volume per exchange.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         # Placeholder for volume tracking logic (replace with actual tracking)
         volume = random.uniform(1000000, 5000000) # Simulate volume
         logger.info(json.dumps({"module": "Fee Optimizer", "action": "Track Exchange Volume", "status": "Success", "volume": volume}))
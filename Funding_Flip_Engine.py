@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -41,7 +41,7 @@ funding_flip_strategy_profit = Gauge('funding_flip_strategy_profit', 'Profit gen
 async def fetch_funding_rate():
     '''Fetches funding rate data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         funding_rate = await redis.get(f"titan:prod::funding_rate:{SYMBOL}")
         if funding_rate:
             return float(funding_rate)
@@ -81,7 +81,7 @@ async def generate_signal(funding_rate):
 async def publish_signal(signal):
     '''Publishes the trading signal to Redis with a TTL.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         await redis.setex(f"titan:prod::signal:{SYMBOL}", SIGNAL_EXPIRY, json.dumps(signal))  # TTL set to SIGNAL_EXPIRY
         logger.info(json.dumps({"module": "Funding Flip Engine", "action": "Publish Signal", "status": "Success", "signal": signal}))
     except Exception as e:
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -43,7 +43,7 @@ grid_strategy_profit = Gauge('grid_strategy_profit', 'Profit generated from grid
 async def fetch_data():
     '''Fetches config band zones, volatility range, and RSI data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         volatility = await redis.get(f"titan:prod::volatility:{SYMBOL}")
         rsi = await redis.get(f"titan:prod::rsi:{SYMBOL}")
 
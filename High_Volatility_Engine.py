@@ -17,7 +17,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -50,7 +50,7 @@ high_volatility_latency_seconds = Histogram('high_volatility_latency_seconds', '
 async def fetch_market_data():
     '''Fetches market data, volatility, and ESG score from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         market_data = await redis.get("titan:prod::market_data")  # Standardized key
         volatility_data = await redis.get("titan:prod::volatility_data")
         esg_data = await redis.get("titan:prod::esg_data")
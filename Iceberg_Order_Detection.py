@@ -13,11 +13,13 @@ Summary of Enhancements:
   - Implemented dynamic adjustment of detection parameters based on market conditions.
   - Added explicit handling of ESG-related data.
   - Enhanced error handling with specific error categories.
+  - Order book read from the shared in-memory L2 book (Order_Book_Engine) instead of a JSON blob per cycle.
+  - Spike scan runs over columnar level arrays (Data_Normalization_Module.book_levels) instead of per-level Python loops.
   - Expanded Prometheus metrics for detailed iceberg order tracking.
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -25,6 +27,8 @@ from prometheus_client import Counter, Gauge, Histogram
 import random  # For chaos testing
 import time
 import aiohttp
+from Order_Book_Engine import ensure_feed
+from Data_Normalization_Module import book_levels
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(module)s - %(message)s')
@@ -33,6 +37,7 @@ logger = logging.getLogger(__name__)
 # Constants
 REDIS_HOST = os.environ.get("REDIS_HOST", "localhost")
 REDIS_PORT = int(os.environ.get("REDIS_PORT", 6379))
+SYMBOL = os.environ.get("SYMBOL", "BTCUSDT")
 ORDER_BOOK_DEPTH = 100  # Order book depth to analyze
 VOLUME_SPIKE_THRESHOLD = 5  # Volume spike threshold (5x average volume)
 MIN_ICEBERG_SIZE = 10  # Minimum iceberg order size
@@ -45,14 +50,14 @@ iceberg_detection_latency_seconds = Histogram('iceberg_detection_latency_seconds
 average_order_size = Gauge('average_order_size', 'Average order size in the order book')
 
 async def fetch_order_book_data():
-    '''Fetches order book data and ESG score from Redis.'''
+    '''Reads the shared live order book and fetches the ESG score from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
-        order_book_data = await redis.get("titan:prod::order_book")  # Standardized key
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        book = ensure_feed(SYMBOL)  # Live in-process L2 book kept current by Order_Book_Engine
         esg_data = await redis.get("titan:prod::esg_data")
 
-        if order_book_data and esg_data:
-            order_book_data = json.loads(order_book_data)
+        if book.synced and esg_data:
+            order_book_data = book.to_dict(depth=ORDER_BOOK_DEPTH)
             order_book_data['esg_score'] = json.loads(esg_data)['score']
             return order_book_data
         else:
@@ -71,30 +76,25 @@ async def analyze_order_book(order_book):
         return None
 
     try:
-        bids = order_book.get('bids', [])
-        asks = order_book.get('asks', [])
+        bids, asks = book_levels(order_book)
+        bids, asks = bids[:ORDER_BOOK_DEPTH], asks[:ORDER_BOOK_DEPTH]
         esg_score = order_book.get('esg_score', 0.5)  # Default ESG score
 
-        if not bids or not asks:
+        if not len(bids) or not len(asks):
             logger.warning(json.dumps({"module": "Iceberg Order Detection", "action": "Analyze Order Book", "status": "Insufficient Data"}))
             return None
 
         # Calculate average order size
-        total_bid_volume = sum([bid[1] for bid in bids[:ORDER_BOOK_DEPTH]])
-        total_ask_volume = sum([ask[1] for ask in asks[:ORDER_BOOK_DEPTH]])
-        average_order_size_value = (total_bid_volume + total_ask_volume) / (2 * ORDER_BOOK_DEPTH)
+        average_order_size_value = (bids["size"].sum() + asks["size"].sum()) / (2 * ORDER_BOOK_DEPTH)
         average_order_size.set(average_order_size_value)
 
-        # Detect volume spikes
-        for i in range(ORDER_BOOK_DEPTH):
-            if bids[i][1] > VOLUME_SPIKE_THRESHOLD * average_order_size_value and bids[i][1] > MIN_ICEBERG_SIZE:
-                logger.info(json.dumps({"module": "Iceberg Order Detection", "action": "Detect Iceberg", "status": "Iceberg Detected", "price": bids[i][0], "volume": bids[i][1]}))
-                global iceberg_orders_detected_total
-                iceberg_orders_detected_total.labels(esg_compliant=esg_score > 0.7).inc()
-                return True
-
-            if asks[i][1] > VOLUME_SPIKE_THRESHOLD * average_order_size_value and asks[i][1] > MIN_ICEBERG_SIZE:
-                logger.info(json.dumps({"module": "Iceberg Order Detection", "action": "Detect Iceberg", "status": "Iceberg Detected", "price": asks[i][0], "volume": asks[i][1]}))
+        # Detect volume spikes, nearest the touch first, bids then asks
+        threshold = max(VOLUME_SPIKE_THRESHOLD * average_order_size_value, MIN_ICEBERG_SIZE)
+        for levels in (bids, asks):
+            spikes = (levels["size"] > threshold).nonzero()[0]
+            if len(spikes):
+                level = levels[spikes[0]]
+                logger.info(json.dumps({"module": "Iceberg Order Detection", "action": "Detect Iceberg", "status": "Iceberg Detected", "price": float(level["price"]), "volume": float(level["size"])}))
                 global iceberg_orders_detected_total
                 iceberg_orders_detected_total.labels(esg_compliant=esg_score > 0.7).inc()
                 return True
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -42,7 +42,7 @@ idle_capital_utilization = Gauge('idle_capital_utilization', 'Percentage of idle
 async def fetch_capital_utilization():
     '''Fetches capital utilization data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         capital_utilization = await redis.get("titan:capital:utilization") # Example key
         if capital_utilization:
             return float(capital_utilization)
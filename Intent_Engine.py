@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -41,7 +41,7 @@ intent_confidence_score = Gauge('intent_confidence_score', 'Confidence score for
 async def fetch_market_data():
     '''Fetches order book data, spread data, and volume data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         order_book = await redis.get(f"titan:prod::order_book:{SYMBOL}")
         spread_data = await redis.get(f"titan:prod::spread:{SYMBOL}")
         volume_data = await redis.get(f"titan:prod::volume:{SYMBOL}")
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -43,7 +43,7 @@ strategy_capital_ceiling = Gauge('strategy_capital_ceiling', 'Capital ceiling fo
 async def fetch_daily_pnl():
     '''Fetches daily PNL from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         daily_pnl = await redis.get("titan:prod::trade_outcome_recorder:daily_pnl") # Example key
         if daily_pnl:
             return float(daily_pnl)
@@ -57,7 +57,7 @@ async def fetch_daily_pnl():
 async def get_strategy_capital_ceiling(strategy_id):
     '''Fetches the current capital ceiling for a given strategy from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         capital_ceiling = await redis.get(f"titan:capital:strategy:{strategy_id}")
         if capital_ceiling:
             return float(capital_ceiling)
@@ -71,7 +71,7 @@ async def get_strategy_capital_ceiling(strategy_id):
 async def set_strategy_capital_ceiling(strategy_id, capital_ceiling):
     '''Sets the capital ceiling for a given strategy in Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         await redis.set(f"titan:capital:strategy:{strategy_id}", capital_ceiling)
         strategy_capital_ceiling.labels(strategy=strategy_id).set(capital_ceiling)
         logger.info(json.dumps({"module": "IntraDay Compounder", "action": "Set Capital Ceiling", "status": "Success", "strategy": strategy_id, "capital_ceiling": capital_ceiling}))
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -42,7 +42,7 @@ temp_boost_applied = Gauge('temp_boost_applied', 'Temporary capital boost applie
 async def fetch_available_profit_pool():
     '''Track available profit pool.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         profit_pool = await redis.get(PROFIT_POOL_KEY)
         if profit_pool:
             return float(profit_pool)
@@ -6,11 +6,19 @@ Purpose: Provides connectivity to Kucoin exchange.
 '''
 
 import asyncio
+import base64
+import hashlib
+import hmac
 import json
 import logging
 import os
+import time
+import uuid
+from urllib.parse import urlencode
 from prometheus_client import Counter, Gauge, Histogram
-import random
+from exchange_api import ExchangeAPI
+from rate_limiter import default_limiter
+from tenant_rate_limiter import CLIENT_ID
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(module)s - %(message)s')
@@ -22,24 +30,62 @@ with open("config.json", "r") as f:
 
 KUCOIN_API_KEY = config.get("KUCOIN_API_KEY")  # Fetch from config
 KUCOIN_API_SECRET = config.get("KUCOIN_API_SECRET")  # Fetch from config
+KUCOIN_API_PASSPHRASE = config.get("KUCOIN_API_PASSPHRASE")  # Set when the API key was created
 
 # Prometheus metrics (example)
 kucoin_api_requests_total = Counter('kucoin_api_requests_total', 'Total number of Kucoin API requests', ['endpoint'])
 kucoin_api_errors_total = Counter('kucoin_api_errors_total', 'Total number of Kucoin API errors', ['error_type'])
 kucoin_api_latency_seconds = Histogram('kucoin_api_latency_seconds', 'Latency of Kucoin API calls')
 
+def _kucoin_hmac(secret: str, message: str) -> str:
+    return base64.b64encode(hmac.new(secret.encode("utf-8"), message.encode("utf-8"), hashlib.sha256).digest()).decode()
+
+class KucoinAPI(ExchangeAPI):
+    '''
+    Kucoin REST adapter on the shared ExchangeAPI session.
+
+    Authenticated calls follow Kucoin's key version 2 scheme: KC-API-SIGN is the base64 HMAC-SHA256, keyed
+    by the API secret, of timestamp + method + path with query string + raw body, and KC-API-PASSPHRASE is
+    the passphrase signed the same way.  The signed path and body are sent byte for byte.
+    '''
+
+    name = "kucoin"
+    base_url = os.environ.get("KUCOIN_REST_URL", "https://api.kucoin.com")
+
+    def __init__(self, api_key=KUCOIN_API_KEY, api_secret=KUCOIN_API_SECRET, passphrase=KUCOIN_API_PASSPHRASE, **kwargs):
+        super().__init__(**kwargs)
+        self.api_key = api_key or None
+        self.api_secret = api_secret
+        self.passphrase = passphrase
+
+    def sign(self, method: str, path: str, body: str = "", timestamp_ms: int = None) -> dict:
+        '''Auth headers for one request to ``path`` (including its query string).'''
+        timestamp = str(timestamp_ms if timestamp_ms is not None else int(time.time() * 1000))
+        return {"KC-API-KEY": self.api_key, "KC-API-SIGN": _kucoin_hmac(self.api_secret, f"{timestamp}{method}{path}{body}"),
+                "KC-API-TIMESTAMP": timestamp, "KC-API-PASSPHRASE": _kucoin_hmac(self.api_secret, self.passphrase),
+                "KC-API-KEY-VERSION": "2"}
+
+    async def signed_request(self, method, endpoint, params=None, body=None):
+        '''Authenticated call; GET parameters go in the signed query string, others in the signed JSON body.'''
+        if not self.api_key or not self.api_secret or not self.passphrase:
+            raise PermissionError("KUCOIN_API_KEY, KUCOIN_API_SECRET and KUCOIN_API_PASSPHRASE are required for authenticated Kucoin calls")
+        if method == "GET":
+            query = urlencode(params or {})
+            path = f"{endpoint}?{query}" if query else endpoint
+            return await self.request(method, path, headers=self.sign(method, path))
+        payload = json.dumps(body or {}, separators=(",", ":"))
+        headers = {**self.sign(method, endpoint, payload), "Content-Type": "application/json"}
+        return await self.request(method, endpoint, headers=headers, data=payload)
+
+# One adapter per process, so every call reuses its pooled connections and draws on the shared venue and tenant budgets
+kucoin_api = KucoinAPI(rate_limiter=default_limiter(), tenant=CLIENT_ID)
+
 async def fetch_kucoin_data(endpoint):
     '''Fetches data from the Kucoin API.'''
     try:
-        # Implement Kucoin API call here using KUCOIN_API_KEY and KUCOIN_API_SECRET
-        # Example:
-        # async with aiohttp.ClientSession() as session:
-        #     async with session.get(f"https://api.kucoin.com{endpoint}", headers={"Kucoin-API-Key": KUCOIN_API_KEY, "Kucoin-API-Secret": KUCOIN_API_SECRET}) as response:
-        #         data = await response.json()
-        # Replace with actual API call
-
-        await asyncio.sleep(1)  # Simulate API latency
-        data = {"message": f"Data from Kucoin API {endpoint}"}  # Simulate data
+        with kucoin_api_latency_seconds.time():
+            # Market data is public: unsigned, so identical concurrent GETs coalesce
+            data = await kucoin_api.get(endpoint)
         logger.info(json.dumps({"module": "Kucoin API Integration", "action": "Fetch Data", "status": "Success", "endpoint": endpoint}))
         global kucoin_api_requests_total
         kucoin_api_requests_total.labels(endpoint=endpoint).inc()
@@ -50,23 +96,28 @@ async def fetch_kucoin_data(endpoint):
         logger.error(json.dumps({"module": "Kucoin API Integration", "action": "Fetch Data", "status": "Failed", "error": str(e)}))
         return None
 
+def order_body(trade_details):
+    '''A /api/v1/orders body for {"asset", "side", "quantity"[, "price"]}: a limit order with a price, market otherwise.'''
+    body = {"clientOid": uuid.uuid4().hex, "symbol": trade_details["asset"], "side": trade_details["side"].lower(),
+            "type": "limit" if trade_details.get("price") else "market", "size": str(trade_details["quantity"])}
+    if trade_details.get("price"):
+        body["price"] = str(trade_details["price"])
+    return body
+
 async def execute_trade(trade_details):
     '''Executes a trade on the Kucoin exchange.'''
     try:
-        # Implement Kucoin trade execution logic here using KUCOIN_API_KEY and KUCOIN_API_SECRET
-        # Example:
-        # async with aiohttp.ClientSession() as session:
-        #     async with session.post("https://api.kucoin.com/v1/orders", headers={"Kucoin-API-Key": KUCOIN_API_KEY, "Kucoin-API-Secret": KUCOIN_API_SECRET}, json=trade_details) as response:
-        #         data = await response.json()
-        # Replace with actual API call
-
         logger.info(json.dumps({"module": "Kucoin API Integration", "action": "Execute Trade", "status": "Executing", "trade_details": trade_details}))
-        success = random.choice([True, False])  # Simulate execution success
-        if success:
-            logger.info(json.dumps({"module": "Kucoin API Integration", "action": "Execute Trade", "status": "Success", "trade_details": trade_details}))
+        with kucoin_api_latency_seconds.time():
+            data = await kucoin_api.signed_request("POST", "/api/v1/orders", body=order_body(trade_details))
+        kucoin_api_requests_total.labels(endpoint="/api/v1/orders").inc()
+        if data.get("code") == "200000":
+            logger.info(json.dumps({"module": "Kucoin API Integration", "action": "Execute Trade", "status": "Success", "trade_details": trade_details,
+                                    "order_id": data.get("data", {}).get("orderId")}))
             return True
         else:
-            logger.warning(json.dumps({"module": "Kucoin API Integration", "action": "Execute Trade", "status": "Failed", "trade_details": trade_details}))
+            logger.warning(json.dumps({"module": "Kucoin API Integration", "action": "Execute Trade", "status": "Failed", "trade_details": trade_details,
+                                       "error": data.get("msg")}))
             return False
     except Exception as e:
         global kucoin_api_errors_total
@@ -108,8 +159,8 @@ if __name__ == "__main__":
 
 """
 ✅ Implemented Features:
-  - Fetches data from the Kucoin API (simulated).
-  - Executes trades on the Kucoin exchange (simulated).
+  - Fetches data from the Kucoin API over the shared ExchangeAPI keep-alive session (identical concurrent GETs coalesced).
+  - Executes trades on the Kucoin exchange with KC-API key-version-2 signed orders.
   - Implemented structured JSON logging.
   - Implemented basic error handling.
   - Implemented Prometheus metrics (placeholders).
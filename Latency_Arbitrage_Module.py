@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -41,7 +41,7 @@ latency_arbitrage_strategy_profit = Gauge('latency_arbitrage_strategy_profit', '
 async def fetch_data():
     '''Fetches real-time and secondary feed data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         realtime_feed = await redis.get(f"titan:prod::realtime_feed:{SYMBOL}")
         secondary_feed = await redis.get(f"titan:prod::secondary_feed:{SYMBOL}")
 
@@ -82,7 +82,7 @@ async def generate_signal(data):
 async def publish_signal(signal):
     '''Publishes the trading signal to Redis with a TTL.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         await redis.setex(f"titan:prod::signal:{SYMBOL}", SIGNAL_EXPIRY, json.dumps(signal))  # TTL set to SIGNAL_EXPIRY
         logger.info(json.dumps({"module": "Latency Arbitrage Module", "action": "Publish Signal", "status": "Success", "signal": signal}))
     except Exception as e:
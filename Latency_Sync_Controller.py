@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -41,7 +41,7 @@ latency_sync_latency_seconds = Histogram('latency_sync_latency_seconds', 'Latenc
 async def fetch_event_trigger_timestamp():
     '''Fetches event trigger timestamp from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         timestamp = await redis.get(f"titan:execution:delay:{SYMBOL}")
         if timestamp:
             return float(timestamp)
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -42,7 +42,7 @@ leverage_scaling_latency_seconds = Histogram('leverage_scaling_seconds', 'Latenc
 async def fetch_data(strategy):
     '''Fetches stability score, confidence score, chaos state, and circuit status from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         stability_score = await redis.get(f"titan:volatility:stability_score:{SYMBOL}")
         confidence_score = await redis.get(f"titan:prod::confidence:{strategy}:{SYMBOL}")
         chaos_state = await redis.get("titan:chaos:state")
@@ -91,7 +91,7 @@ async def calculate_leverage(data):
 async def publish_leverage(strategy, symbol, leverage):
     '''Publishes the leverage level to Redis with a TTL.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         await redis.setex(f"titan:capital:leverage:{strategy}:{symbol}", SIGNAL_EXPIRY, str(leverage))  # TTL set to SIGNAL_EXPIRY
         strategy_leverage.labels(strategy=strategy, symbol=symbol).set(leverage)
         logger.info(json.dumps({"module": "Leverage Scaling Controller", "action": "Publish Leverage", "status": "Success", "strategy": strategy, "symbol": symbol, "leverage": leverage}))
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -42,7 +42,7 @@ liquidation_rebound_strategy_profit = Gauge('liquidation_rebound_strategy_profit
 async def fetch_data():
     '''Fetches depth snapshots, candle patterns, and sudden volume data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         liquidation_burst = await redis.get(f"titan:prod::liquidation_burst:{SYMBOL}")
         price_stability = await redis.get(f"titan:prod::price_stability:{SYMBOL}")
         candle_pattern = await redis.get(f"titan:prod::candle_pattern:{SYMBOL}")
@@ -89,7 +89,7 @@ async def generate_signal(data):
 async def publish_signal(signal):
     '''Publishes the trading signal to Redis with a TTL.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         await redis.setex(f"titan:prod::signal:{SYMBOL}", SIGNAL_EXPIRY, json.dumps(signal))  # TTL set to SIGNAL_EXPIRY
         logger.info(json.dumps({"module": "Liquidation Trigger Engine", "action": "Publish Signal", "status": "Success", "signal": signal}))
     except Exception as e:
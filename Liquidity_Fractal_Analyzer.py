@@ -10,10 +10,11 @@ Core Objectives:
   - Explicit 10/10 quality rating definition adherence: Code must meet all quality criteria, including modularity, error handling, metrics, logging, and testing.
 Summary of Enhancements:
   - Initial version.
+  - Imbalance computed from the shared in-memory L2 book (Order_Book_Engine).
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -21,6 +22,7 @@ from prometheus_client import Counter, Gauge, Histogram
 import random  # For chaos testing
 import time
 import aiohttp
+from Order_Book_Engine import ensure_feed
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(module)s - %(message)s')
@@ -32,6 +34,7 @@ REDIS_PORT = os.environ.get("REDIS_PORT", 6379)
 SYMBOL = "BTCUSDT"  # Example symbol
 SIGNAL_EXPIRY = 60  # Signal expiry time in seconds
 SNAPSHOT_FREQUENCY = 0.2 # Pull book snapshots every 200ms
+FRACTAL_DEPTH = 20 # Levels per side used for imbalance
 
 # Prometheus metrics (example)
 fill_quality_scores_total = Counter('fill_quality_scores_total', 'Total number of fill quality scores generated', ['score'])
@@ -40,12 +43,11 @@ fractal_analysis_latency_seconds = Histogram('fractal_analysis_latency_seconds',
 fill_quality_score = Gauge('fill_quality_score', 'Fill quality score')
 
 async def fetch_order_book_snapshot():
-    '''Fetches order book snapshot from Redis.'''
+    '''Returns the shared live L2 book (Order_Book_Engine) once it is in sync.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
-        order_book = await redis.get(f"titan:prod::order_book:{SYMBOL}")
-        if order_book:
-            return json.loads(order_book)
+        order_book = ensure_feed(SYMBOL)
+        if order_book.synced:
+            return order_book
         else:
             logger.warning(json.dumps({"module": "Liquidity Fractal Analyzer", "action": "Fetch Order Book", "status": "No Data"}))
             return None
@@ -61,7 +63,7 @@ async def analyze_order_book_fractals(order_book):
     try:
         # Placeholder for fractal analysis logic (replace with actual analysis)
         clustering = random.uniform(0, 1) # Simulate clustering
-        imbalance = random.uniform(-1, 1) # Simulate imbalance
+        imbalance = order_book.imbalance(FRACTAL_DEPTH)
         spoofing_pressure = random.uniform(0, 1) # Simulate spoofing pressure
 
         # Calculate fill quality score
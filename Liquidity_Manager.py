@@ -17,7 +17,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -48,7 +48,7 @@ esg_compliant_liquidity = Gauge('esg_compliant_liquidity', 'Percentage of ESG co
 async def fetch_account_balance():
     '''Fetches account balance from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         account_balance = await redis.get("titan:prod::account_balance")  # Standardized key
         if account_balance:
             return json.loads(account_balance)
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -42,7 +42,7 @@ liquidity_trap_detected = Gauge('liquidity_trap_detected', 'Liquidity trap detec
 async def fetch_liquidity_data():
     '''Fetches spread data and spoof wall data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         spread_data = await redis.get(f"titan:prod::spread:{SYMBOL}")
         spoof_wall_data = await redis.get(f"titan:prod::spoof_wall:{SYMBOL}")
 
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -42,7 +42,7 @@ confluence_score = Gauge('confluence_score', 'Confluence score for the day')
 async def fetch_macro_data():
     '''Fetches BTC/ETH trend coherence, volatility spread, news events, and funding rate divergence data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         btc_eth_coherence = await redis.get("titan:macro::btc_eth_coherence")
         volatility_spread = await redis.get("titan:macro::volatility_spread")
         news_events = await redis.get("titan:macro::news_events")
@@ -0,0 +1,384 @@
+'''
+Module: Market Data Gateway
+Version: 1.0.0
+Last Updated: 2026-10-16
+Purpose: One process holding persistent WebSocket subscriptions to Binance, Bybit and KuCoin (trades, book diffs, klines), normalizing and fanning them out to local consumers.
+Core Objectives:
+  - Explicit profitability and risk targets alignment: Replace per-module REST polling with streamed data so signals see the market within milliseconds.
+  - Explicit ESG compliance adherence: Read-only public market data; no orders are placed here.
+  - Explicit regulatory and compliance standards adherence: Sequence-gap recovery ensures downstream books are never silently inconsistent.
+  - Explicit 10/10 quality rating definition adherence: Code must meet all quality criteria, including modularity, error handling, metrics, logging, and testing.
+Summary of Enhancements:
+  - Initial version. Each exchange feed reconnects with jittered exponential backoff, sends the exchange's
+    application-level ping, treats a silent socket as dead, and re-syncs its order books from a REST
+    snapshot (Binance, KuCoin) or a resubscription (Bybit) whenever a diff sequence gap is seen.
+  - Events go to in-process listeners and to Redis: trades and klines on their own channels, books in the
+    Order_Book_Engine snapshot/diff format so ensure_feed() consumers follow the gateway's books.
+  - Endpoints are configurable, so the whole gateway runs against Fake_Exchange_Server locally.
+'''
+
+import asyncio
+import inspect
+import json
+import logging
+import os
+import random
+import time
+import uuid
+import aiohttp
+from prometheus_client import Counter, Gauge
+
+from redis_connection_manager import get_async_redis
+from Data_Normalization_Module import normalize_market_event, exchange_symbol, exchange_interval
+from Order_Book_Engine import OrderBook, BOOK_DIFF_CHANNEL, BOOK_SNAPSHOT_KEY
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(module)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Constants
+REDIS_HOST = os.environ.get("REDIS_HOST", "localhost")
+REDIS_PORT = int(os.environ.get("REDIS_PORT", 6379))
+GATEWAY_EXCHANGES = os.environ.get("GATEWAY_EXCHANGES", "binance,bybit,kucoin").split(",")
+GATEWAY_SYMBOLS = os.environ.get("GATEWAY_SYMBOLS", "BTCUSDT,ETHUSDT").split(",")
+PRIMARY_BOOK_EXCHANGE = os.environ.get("PRIMARY_BOOK_EXCHANGE", "binance")  # Its books are also published under the bare symbol
+KLINE_INTERVAL = os.environ.get("GATEWAY_KLINE_INTERVAL", "1m")
+TRADES_CHANNEL = os.environ.get("TRADES_CHANNEL", "titan:prod:market:trades:{symbol}")
+KLINES_CHANNEL = os.environ.get("KLINES_CHANNEL", "titan:prod:market:klines:{symbol}")
+HEARTBEAT_INTERVAL = float(os.environ.get("GATEWAY_HEARTBEAT_INTERVAL", 20))  # Seconds between pings
+STALE_TIMEOUT = float(os.environ.get("GATEWAY_STALE_TIMEOUT", 30))  # A socket silent this long is reconnected
+RECONNECT_DELAY = float(os.environ.get("GATEWAY_RECONNECT_DELAY", 1))
+RECONNECT_DELAY_MAX = float(os.environ.get("GATEWAY_RECONNECT_DELAY_MAX", 60))
+RECOVERY_RETRY_DELAY = float(os.environ.get("GATEWAY_RECOVERY_RETRY_DELAY", 1))
+BOOK_PUBLISH_DEPTH = int(os.environ.get("GATEWAY_BOOK_PUBLISH_DEPTH", 1000))  # Levels in published snapshots
+BOOK_SNAPSHOT_INTERVAL = float(os.environ.get("GATEWAY_BOOK_SNAPSHOT_INTERVAL", 1))  # Seconds between BOOK_SNAPSHOT_KEY refreshes
+BINANCE_WS_URL = os.environ.get("BINANCE_WS_URL", "wss://stream.binance.com:9443/stream")
+BINANCE_REST_URL = os.environ.get("BINANCE_REST_URL", "https://api.binance.com")
+BYBIT_WS_URL = os.environ.get("BYBIT_WS_URL", "wss://stream.bybit.com/v5/public/spot")
+BYBIT_BOOK_DEPTH = int(os.environ.get("BYBIT_BOOK_DEPTH", 50))
+KUCOIN_REST_URL = os.environ.get("KUCOIN_REST_URL", "https://api.kucoin.com")
+
+# Prometheus metrics
+gateway_messages_total = Counter('gateway_messages_total', 'Normalized market data events received', ['exchange', 'type'])
+gateway_reconnects_total = Counter('gateway_reconnects_total', 'WebSocket reconnects', ['exchange'])
+gateway_book_recoveries_total = Counter('gateway_book_recoveries_total', 'Order book re-syncs after a sequence gap or reconnect', ['exchange', 'symbol'])
+gateway_trade_gaps_total = Counter('gateway_trade_gaps_total', 'Trade id gaps observed on streams with consecutive ids', ['exchange', 'symbol'])
+gateway_connected = Gauge('gateway_connected', 'Whether the exchange WebSocket is connected', ['exchange'])
+
+def book_id(exchange: str, symbol: str) -> str:
+    '''Key of an exchange's book in the BOOK_DIFF_CHANNEL / BOOK_SNAPSHOT_KEY namespaces.'''
+    return f"{exchange}:{symbol}"
+
+class ExchangeFeed:
+    '''
+    Transport for one exchange: connect + subscribe, heartbeat, book
+    recovery.  Parsing lives in Data_Normalization_Module.
+    '''
+
+    name = ""
+    pushes_snapshots = False  # True when the exchange sends a book snapshot on (re)subscription
+
+    def __init__(self, gateway, symbols):
+        self.gateway = gateway
+        self.symbols = symbols
+        self.ws = None
+
+    async def open(self, session):
+        '''Connects and subscribes; returns the WebSocket.'''
+        raise NotImplementedError
+
+    async def ping(self, ws):
+        '''Application-level keep-alive; protocol pings are handled by aiohttp's heartbeat.'''
+
+    async def recover_book(self, session, symbol):
+        '''Returns a REST snapshot (bids, asks, sequence), or None when the exchange pushes one itself.'''
+        return None
+
+    async def _heartbeat(self, ws):
+        while not ws.closed:
+            await asyncio.sleep(HEARTBEAT_INTERVAL)
+            await self.ping(ws)
+
+    async def run(self, session):
+        '''Connects, reads until the socket dies, and reconnects with jittered exponential backoff; never returns.'''
+        delay = RECONNECT_DELAY
+        while True:
+            ws = None
+            try:
+                ws = self.ws = await self.open(session)
+                gateway_connected.labels(exchange=self.name).set(1)
+                delay = RECONNECT_DELAY
+                logger.info(json.dumps({"module": "Market Data Gateway", "action": "Connect", "status": "Success", "exchange": self.name, "symbols": self.symbols}))
+                for symbol in self.symbols:
+                    self.gateway.invalidate_book(self, session, symbol)  # Diffs were missed while disconnected
+                await self._read(ws, session)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(json.dumps({"module": "Market Data Gateway", "action": "Read Stream", "status": "Disconnected", "exchange": self.name, "error": repr(e)}))
+            finally:
+                gateway_connected.labels(exchange=self.name).set(0)
+                self.ws = None
+                if ws is not None:
+                    await ws.close()
+            gateway_reconnects_total.labels(exchange=self.name).inc()
+            await asyncio.sleep(delay * random.uniform(0.8, 1.2))
+            delay = min(delay * 2, RECONNECT_DELAY_MAX)
+
+    async def _read(self, ws, session):
+        heartbeat = asyncio.create_task(self._heartbeat(ws))
+        try:
+            while True:
+                msg = await ws.receive(timeout=STALE_TIMEOUT)  # asyncio.TimeoutError on a silent socket
+                if msg.type == aiohttp.WSMsgType.TEXT:
+                    await self.gateway.handle(self, session, json.loads(msg.data))
+                elif msg.type in (aiohttp.WSMsgType.CLOSE, aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.CLOSING, aiohttp.WSMsgType.ERROR):
+                    raise ConnectionError(f"WebSocket closed: {msg.type.name}")
+        finally:
+            heartbeat.cancel()
+
+class BinanceFeed(ExchangeFeed):
+    name = "binance"
+
+    async def open(self, session):
+        streams = []
+        for symbol in self.symbols:
+            stream = symbol.lower()
+            streams += [f"{stream}@trade", f"{stream}@depth@100ms", f"{stream}@kline_{KLINE_INTERVAL}"]
+        return await session.ws_connect(f"{BINANCE_WS_URL}?streams={'/'.join(streams)}", heartbeat=HEARTBEAT_INTERVAL)
+
+    async def recover_book(self, session, symbol):
+        async with session.get(f"{BINANCE_REST_URL}/api/v3/depth", params={"symbol": symbol, "limit": 1000}) as response:
+            response.raise_for_status()
+            snapshot = await response.json()
+        return snapshot["bids"], snapshot["asks"], snapshot["lastUpdateId"]
+
+class BybitFeed(ExchangeFeed):
+    name = "bybit"
+    pushes_snapshots = True
+
+    def _book_topic(self, symbol):
+        return f"orderbook.{BYBIT_BOOK_DEPTH}.{symbol}"
+
+    async def open(self, session):
+        ws = await session.ws_connect(BYBIT_WS_URL, heartbeat=HEARTBEAT_INTERVAL)
+        topics = []
+        for symbol in self.symbols:
+            topics += [f"publicTrade.{symbol}", self._book_topic(symbol), f"kline.{exchange_interval(self.name, KLINE_INTERVAL)}.{symbol}"]
+        await ws.send_json({"op": "subscribe", "args": topics})
+        return ws
+
+    async def ping(self, ws):
+        await ws.send_json({"op": "ping"})
+
+    async def recover_book(self, session, symbol):
+        # Bybit sends a fresh snapshot on every orderbook subscription
+        if self.ws is not None:
+            await self.ws.send_json({"op": "unsubscribe", "args": [self._book_topic(symbol)]})
+            await self.ws.send_json({"op": "subscribe", "args": [self._book_topic(symbol)]})
+        return None
+
+class KucoinFeed(ExchangeFeed):
+    name = "kucoin"
+
+    def __init__(self, gateway, symbols):
+        super().__init__(gateway, symbols)
+        self.ping_interval = HEARTBEAT_INTERVAL
+
+    async def open(self, session):
+        # Public connections need a short-lived token and server endpoint from the bullet API
+        async with session.post(f"{KUCOIN_REST_URL}/api/v1/bullet-public") as response:
+            response.raise_for_status()
+            bullet = (await response.json())["data"]
+        server = bullet["instanceServers"][0]
+        self.ping_interval = server.get("pingInterval", HEARTBEAT_INTERVAL * 1000) / 1000
+        ws = await session.ws_connect(f"{server['endpoint']}?token={bullet['token']}&connectId={uuid.uuid4().hex}", heartbeat=HEARTBEAT_INTERVAL)
+        markets = ",".join(exchange_symbol(self.name, symbol) for symbol in self.symbols)
+        candles = ",".join(f"{exchange_symbol(self.name, symbol)}_{exchange_interval(self.name, KLINE_INTERVAL)}" for symbol in self.symbols)
+        for topic in (f"/market/match:{markets}", f"/market/level2:{markets}", f"/market/candles:{candles}"):
+            await ws.send_json({"id": uuid.uuid4().hex, "type": "subscribe", "topic": topic, "response": True})
+        return ws
+
+    async def _heartbeat(self, ws):
+        while not ws.closed:
+            await asyncio.sleep(self.ping_interval)
+            await self.ping(ws)
+
+    async def ping(self, ws):
+        await ws.send_json({"id": str(int(time.time() * 1000)), "type": "ping"})
+
+    async def recover_book(self, session, symbol):
+        async with session.get(f"{KUCOIN_REST_URL}/api/v1/market/orderbook/level2_100", params={"symbol": exchange_symbol(self.name, symbol)}) as response:
+            response.raise_for_status()
+            snapshot = (await response.json())["data"]
+        return snapshot["bids"], snapshot["asks"], int(snapshot["sequence"])
+
+FEEDS = {"binance": BinanceFeed, "bybit": BybitFeed, "kucoin": KucoinFeed}
+
+class MarketDataGateway:
+    '''
+    Owns the feeds, one OrderBook per (exchange, symbol), and fan-out.
+
+    Listeners added with ``add_listener`` receive every canonical event
+    (sync or async callables).  With a Redis client, trades and klines are
+    published to TRADES_CHANNEL / KLINES_CHANNEL and books to
+    BOOK_DIFF_CHANNEL keyed by ``book_id`` -- only diffs that applied
+    cleanly, plus a full snapshot after each recovery.
+    '''
+
+    def __init__(self, exchanges=GATEWAY_EXCHANGES, symbols=GATEWAY_SYMBOLS, redis=None):
+        self.redis = redis
+        self.feeds = [FEEDS[exchange](self, list(symbols)) for exchange in exchanges]
+        self.books = {}
+        self.listeners = []
+        self.recoveries = {}
+        self.last_trade_ids = {}
+
+    def add_listener(self, callback):
+        self.listeners.append(callback)
+
+    def book(self, exchange: str, symbol: str) -> OrderBook:
+        key = book_id(exchange, symbol)
+        book = self.books.get(key)
+        if book is None:
+            book = self.books[key] = OrderBook(key)
+        return book
+
+    def _book_channels(self, exchange, symbol):
+        channels = [BOOK_DIFF_CHANNEL.format(symbol=book_id(exchange, symbol))]
+        if exchange == PRIMARY_BOOK_EXCHANGE:
+            channels.append(BOOK_DIFF_CHANNEL.format(symbol=symbol))
+        return channels
+
+    def invalidate_book(self, feed, session, symbol):
+        '''Marks the book unsynced (later diffs buffer inside it) and starts a recovery if none is running.'''
+        self.book(feed.name, symbol).synced = False
+        key = book_id(feed.name, symbol)
+        task = self.recoveries.get(key)
+        if task is None or task.done():
+            self.recoveries[key] = asyncio.create_task(self._recover(feed, session, symbol))
+
+    async def _recover(self, feed, session, symbol):
+        book = self.book(feed.name, symbol)
+        while True:
+            if feed.pushes_snapshots:
+                await asyncio.sleep(RECOVERY_RETRY_DELAY)  # The subscription's own snapshot usually lands first
+                if book.synced:
+                    break
+            try:
+                snapshot = await feed.recover_book(session, symbol)
+            except Exception as e:
+                snapshot = None
+                logger.warning(json.dumps({"module": "Market Data Gateway", "action": "Recover Book", "status": "Exception", "exchange": feed.name, "symbol": symbol, "error": repr(e)}))
+            if snapshot is not None:
+                book.apply_snapshot(*snapshot)  # Replays diffs buffered since the gap
+                if book.synced:
+                    await self._publish_book_snapshot(feed.name, symbol)
+                    break
+            if not feed.pushes_snapshots:
+                await asyncio.sleep(RECOVERY_RETRY_DELAY)  # Snapshot older than the buffered diffs, or the request failed
+        gateway_book_recoveries_total.labels(exchange=feed.name, symbol=symbol).inc()
+        logger.info(json.dumps({"module": "Market Data Gateway", "action": "Recover Book", "status": "Success", "exchange": feed.name, "symbol": symbol, "sequence": book.sequence}))
+
+    async def _publish_book_snapshot(self, exchange, symbol):
+        book = self.book(exchange, symbol)
+        snapshot = {"type": "snapshot", "exchange": exchange, **book.to_dict(BOOK_PUBLISH_DEPTH), "symbol": symbol}
+        if self.redis is not None:
+            pipe = self.redis.pipeline(transaction=False)
+            for channel in self._book_channels(exchange, symbol):
+                pipe.publish(channel, json.dumps(snapshot))
+            await pipe.execute()
+        await self._notify(snapshot)
+
+    async def write_book_snapshots(self):
+        '''Refreshes BOOK_SNAPSHOT_KEY for every synced book so Order_Book_Engine consumers can resync.'''
+        pipe = self.redis.pipeline(transaction=False)
+        for book in self.books.values():
+            if book.synced:
+                exchange, symbol = book.symbol.split(":", 1)
+                payload = json.dumps(book.to_dict(BOOK_PUBLISH_DEPTH))
+                pipe.set(BOOK_SNAPSHOT_KEY.format(symbol=book.symbol), payload)
+                if exchange == PRIMARY_BOOK_EXCHANGE:
+                    pipe.set(BOOK_SNAPSHOT_KEY.format(symbol=symbol), payload)
+        await pipe.execute()
+
+    async def _notify(self, event):
+        for listener in self.listeners:
+            try:
+                result = listener(event)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.error(json.dumps({"module": "Market Data Gateway", "action": "Notify Listener", "status": "Exception", "error": repr(e)}))
+
+    async def handle(self, feed, session, message: dict):
+        '''Normalizes one exchange frame, applies book events, and fans the result out in one Redis round trip.'''
+        outgoing = []
+        for event in normalize_market_event(feed.name, message):
+            kind = event["type"]
+            symbol = event["symbol"]
+            gateway_messages_total.labels(exchange=feed.name, type=kind).inc()
+            if kind == "trade":
+                self._check_trade_id(feed.name, symbol, event["trade_id"])
+                outgoing.append(([TRADES_CHANNEL.format(symbol=symbol)], event))
+            elif kind == "kline":
+                outgoing.append(([KLINES_CHANNEL.format(symbol=symbol)], event))
+            elif kind == "snapshot":
+                self.book(feed.name, symbol).apply_snapshot(event["bids"], event["asks"], event["sequence"])
+                outgoing.append((self._book_channels(feed.name, symbol), event))
+            else:
+                book = self.book(feed.name, symbol)
+                was_synced = book.synced
+                if book.apply_diff(event["bids"], event["asks"], event["first_sequence"], event["sequence"]):
+                    outgoing.append((self._book_channels(feed.name, symbol), event))
+                elif was_synced:
+                    self.invalidate_book(feed, session, symbol)
+
+        if not outgoing:
+            return
+        if self.redis is not None:
+            pipe = self.redis.pipeline(transaction=False)
+            for channels, event in outgoing:
+                payload = json.dumps(event)
+                for channel in channels:
+                    pipe.publish(channel, payload)
+            await pipe.execute()
+        for _, event in outgoing:
+            await self._notify(event)
+
+    def _check_trade_id(self, exchange, symbol, trade_id):
+        if not isinstance(trade_id, int):
+            return  # Only Binance trade ids are consecutive integers
+        key = (exchange, symbol)
+        last = self.last_trade_ids.get(key)
+        if last is not None and trade_id > last + 1:
+            gateway_trade_gaps_total.labels(exchange=exchange, symbol=symbol).inc()
+        self.last_trade_ids[key] = trade_id
+
+    async def _snapshot_writer(self):
+        while True:
+            await asyncio.sleep(BOOK_SNAPSHOT_INTERVAL)
+            try:
+                await self.write_book_snapshots()
+            except Exception as e:
+                logger.error(json.dumps({"module": "Market Data Gateway", "action": "Write Book Snapshots", "status": "Exception", "error": repr(e)}))
+
+    async def run(self):
+        '''Runs every feed on one shared HTTP/WebSocket session until cancelled.'''
+        async with aiohttp.ClientSession() as session:
+            tasks = [asyncio.create_task(feed.run(session)) for feed in self.feeds]
+            if self.redis is not None:
+                tasks.append(asyncio.create_task(self._snapshot_writer()))
+            try:
+                await asyncio.gather(*tasks)
+            finally:
+                for task in tasks + list(self.recoveries.values()):
+                    task.cancel()
+
+async def main():
+    '''Main function to start the market data gateway.'''
+    redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+    await MarketDataGateway(redis=redis).run()
+
+if __name__ == "__main__":
+    asyncio.run(main())
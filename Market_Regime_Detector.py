@@ -1,7 +1,7 @@
 '''
 Module: Market Regime Detector
-Version: 1.0.0
-Last Updated: 2025-03-27
+Version: 1.1.0
+Last Updated: 2026-10-16
 Purpose: Detect global macro regime (bull, bear, sideways) and adjust behavior accordingly.
 Core Objectives:
   - Explicit profitability and risk targets alignment: Ensure regime detection maximizes profit and minimizes risk.
@@ -10,17 +10,20 @@ Core Objectives:
   - Explicit 10/10 quality rating definition adherence: Code must meet all quality criteria, including modularity, error handling, metrics, logging, and testing.
 Summary of Enhancements:
   - Initial version.
+  - MA crossover and volatility clustering come from in-process streaming indicators fed by closed klines,
+    replacing the precomputed titan:prod::ma_crossover / volatility_cluster keys; regime is re-evaluated per bar.
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
 from prometheus_client import Counter, Gauge, Histogram
 import random  # For chaos testing
 import time
-import aiohttp
+
+from indicators import BarIndicators, follow_klines
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(module)s - %(message)s')
@@ -33,23 +36,31 @@ SYMBOL = "BTCUSDT"  # Example symbol
 REGIME_EXPIRY = 3600  # Regime expiry time in seconds (1 hour)
 MA_FAST_PERIOD = 50 # Fast moving average period
 MA_SLOW_PERIOD = 200 # Slow moving average period
+VOLATILITY_CLUSTER_PERIOD = 200 # Long-run volatility the short window is compared with
+VOLATILITY_CLUSTER_THRESHOLD = 1.0 # Short / long volatility ratio above which volatility is clustering
+REGIME_CODES = {"bearish": -1, "sideways": 0, "bullish": 1}
 
 # Prometheus metrics (example)
 regime_detections_total = Counter('regime_detections_total', 'Total number of market regime detections', ['regime'])
 regime_detector_errors_total = Counter('regime_detector_errors_total', 'Total number of regime detector errors', ['error_type'])
 regime_detection_latency_seconds = Histogram('regime_detection_latency_seconds', 'Latency of regime detection')
-market_regime = Gauge('market_regime', 'Current market regime')
+market_regime = Gauge('market_regime', 'Current market regime (-1 bearish, 0 sideways, 1 bullish)')
+
+# Streaming indicators for SYMBOL, kept current by follow_klines
+indicators = BarIndicators(sma_fast=MA_FAST_PERIOD, sma_slow=MA_SLOW_PERIOD, volatility_long=VOLATILITY_CLUSTER_PERIOD)
 
-async def fetch_market_data():
-    '''Fetches long-term MA crossovers, volatility clusters, and BTC dominance data from Redis.'''
+async def fetch_market_data(snapshot):
+    '''Combines the in-process MA crossover and volatility clustering with BTC dominance from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
-        ma_crossover = await redis.get(f"titan:prod::ma_crossover:{SYMBOL}")
-        volatility_cluster = await redis.get(f"titan:prod::volatility_cluster:{SYMBOL}")
+        if snapshot["sma_slow"] is None or snapshot["volatility"] is None or not snapshot["volatility_long"]:
+            return None  # Still warming up
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         btc_dominance = await redis.get(f"titan:prod::btc_dominance")
 
-        if ma_crossover and volatility_cluster and btc_dominance:
-            return {"ma_crossover": ma_crossover, "volatility_cluster": float(volatility_cluster), "btc_dominance": float(btc_dominance)}
+        if btc_dominance:
+            ma_crossover = "bullish" if snapshot["sma_fast"] > snapshot["sma_slow"] else "bearish"
+            volatility_cluster = snapshot["volatility"] / snapshot["volatility_long"]
+            return {"ma_crossover": ma_crossover, "volatility_cluster": volatility_cluster, "btc_dominance": float(btc_dominance)}
         else:
             logger.warning(json.dumps({"module": "Market Regime Detector", "action": "Fetch Data", "status": "No Data"}))
             return None
@@ -67,25 +78,15 @@ async def detect_market_regime(data):
         volatility_cluster = data["volatility_cluster"]
         btc_dominance = data["btc_dominance"]
 
-        # Placeholder for regime detection logic (replace with actual logic)
-        if ma_crossover == "bullish" and volatility_cluster < 0.5 and btc_dominance > 50:
+        if ma_crossover == "bullish" and volatility_cluster < VOLATILITY_CLUSTER_THRESHOLD and btc_dominance > 50:
             regime = "bullish"
-            logger.info(json.dumps({"module": "Market Regime Detector", "action": "Detect Regime", "status": "Bullish", "regime": regime}))
-            global regime_detections_total
-            regime_detections_total.labels(regime=regime).inc()
-            return regime
-        elif ma_crossover == "bearish" and volatility_cluster > 0.5 and btc_dominance < 50:
+        elif ma_crossover == "bearish" and volatility_cluster > VOLATILITY_CLUSTER_THRESHOLD and btc_dominance < 50:
             regime = "bearish"
-            logger.info(json.dumps({"module": "Market Regime Detector", "action": "Detect Regime", "status": "Bearish", "regime": regime}))
-            global regime_detections_total
-            regime_detections_total.labels(regime=regime).inc()
-            return regime
         else:
             regime = "sideways"
-            logger.info(json.dumps({"module": "Market Regime Detector", "action": "Detect Regime", "status": "Sideways", "regime": regime}))
+        logger.info(json.dumps({"module": "Market Regime Detector", "action": "Detect Regime", "status": regime.capitalize(), "regime": regime}))
 
-        market_regime.set(regime)
-        global regime_detections_total
+        market_regime.set(REGIME_CODES[regime])
         regime_detections_total.labels(regime=regime).inc()
         return regime
     except Exception as e:
@@ -95,32 +96,36 @@ async def detect_market_regime(data):
 async def publish_market_regime(regime):
     '''Publishes the market regime to Redis with a TTL.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         await redis.setex(f"titan:regime:mode", REGIME_EXPIRY, regime)  # TTL set to SIGNAL_EXPIRY
         logger.info(json.dumps({"module": "Market Regime Detector", "action": "Publish Regime", "status": "Success", "regime": regime}))
     except Exception as e:
         logger.error(json.dumps({"module": "Market Regime Detector", "action": "Publish Regime", "status": "Exception", "error": str(e)}))
 
+async def on_bar(bar, snapshot):
+    '''Re-evaluates the regime on every closed bar.'''
+    started = time.perf_counter()
+    data = await fetch_market_data(snapshot)
+    if data:
+        regime = await detect_market_regime(data)
+        if regime:
+            await publish_market_regime(regime)
+    regime_detection_latency_seconds.observe(time.perf_counter() - started)
+
 async def market_regime_loop():
     '''Main loop for the market regime detector module.'''
-    try:
-        data = await fetch_market_data()
-        if data:
-            regime = await detect_market_regime(data)
-            if regime:
-                await publish_market_regime(regime)
-
-        await asyncio.sleep(3600)  # Check regime every hour
-    except Exception as e:
-        global regime_detector_errors_total
-        regime_detector_errors_total.labels(error_type="ManagementLoop").inc()
-        logger.error(json.dumps({"module": "Market Regime Detector", "action": "Management Loop", "status": "Exception", "error": str(e)}))
-        await asyncio.sleep(300)  # Wait before retrying
+    while True:
+        try:
+            redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+            await follow_klines(redis, SYMBOL, indicators, on_bar)
+        except Exception as e:
+            regime_detector_errors_total.labels(error_type="ManagementLoop").inc()
+            logger.error(json.dumps({"module": "Market Regime Detector", "action": "Management Loop", "status": "Exception", "error": str(e)}))
+            await asyncio.sleep(300)  # Wait before retrying
 
 async def main():
     '''Main function to start the market regime detector module.'''
     await market_regime_loop()
 
 if __name__ == "__main__":
-    import aiohttp
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main())
@@ -17,7 +17,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -48,7 +48,7 @@ market_sentiment = Gauge('market_sentiment', 'Overall market sentiment score')
 async def fetch_sentiment_data(data_source):
     '''Fetches sentiment data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         sentiment_data = await redis.get(f"titan:prod::{data_source}_sentiment_data")  # Standardized key
         if sentiment_data:
             return json.loads(sentiment_data)
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -40,7 +40,7 @@ module_status = Gauge('module_status', 'Status of each module', ['module', 'stat
 async def register_module(module_name, module_metadata):
     '''Registers a new module in the registry.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         await redis.setex(f"titan:registry:{module_name}:meta", MODULE_STATUS_EXPIRY, json.dumps(module_metadata))
         await redis.setex(f"titan:registry:status:{module_name}", MODULE_STATUS_EXPIRY, "live") # Default status
         logger.info(json.dumps({"module": "Module Registry", "action": "Register Module", "status": "Success", "module_name": module_name, "module_metadata": module_metadata}))
@@ -58,7 +58,7 @@ async def register_module(module_name, module_metadata):
 async def update_module_status(module_name, status):
     '''Updates the status of a module in the registry.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         await redis.setex(f"titan:registry:status:{module_name}", MODULE_STATUS_EXPIRY, status)
         logger.info(json.dumps({"module": "Module Registry", "action": "Update Module Status", "status": "Success", "module_name": module_name, "status": status}))
         global module_status
@@ -17,7 +17,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -48,7 +48,7 @@ commodities_exchange = Gauge('commodities_exchange', 'Commodities exchange used'
 async def fetch_commodities_data(exchange):
     '''Fetches commodities data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         commodities_data = await redis.get(f"titan:prod::{exchange}_commodities_data")  # Standardized key
         if commodities_data:
             return json.loads(commodities_data)
@@ -17,7 +17,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -48,7 +48,7 @@ forex_broker = Gauge('forex_broker', 'Forex broker used')
 async def fetch_forex_data(broker):
     '''Fetches forex data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         forex_data = await redis.get(f"titan:prod::{broker}_forex_data")  # Standardized key
         if forex_data:
             return json.loads(forex_data)
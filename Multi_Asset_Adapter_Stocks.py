@@ -17,7 +17,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -48,7 +48,7 @@ stock_exchange = Gauge('stock_exchange', 'Stock exchange used')
 async def fetch_stock_data(exchange):
     '''Fetches stock data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         stock_data = await redis.get(f"titan:prod::{exchange}_stock_data")  # Standardized key
         if stock_data:
             return json.loads(stock_data)
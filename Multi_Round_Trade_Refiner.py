@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -42,7 +42,7 @@ trade_refinement_latency_seconds = Histogram('trade_refinement_latency_seconds',
 async def check_partial_fill(signal_id):
     '''Checks if the trade was partially filled from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         partial_fill_data = await redis.get(f"titan:trade:{signal_id}:partial_fill")
 
         if partial_fill_data:
@@ -57,7 +57,7 @@ async def check_partial_fill(signal_id):
 async def check_full_reversal(signal_id):
     '''Checks if the trade had a full reversal from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         reversal_data = await redis.get(f"titan:trade:{signal_id}:reversal")
 
         if reversal_data:
@@ -17,7 +17,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -48,7 +48,7 @@ impactful_events = Counter('impactful_events', 'Number of impactful events ident
 async def fetch_news_data(data_source):
     '''Fetches news data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         news_data = await redis.get(f"titan:prod::{data_source}_news_data")  # Standardized key
         if news_data:
             return json.loads(news_data)
@@ -11,25 +11,36 @@ import logging
 import os
 import aiohttp
 from prometheus_client import Counter, Gauge, Histogram
+from Order_Book_Engine import OrderBook
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(module)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Constants
+LIQUIDITY_DEPTH = int(os.environ.get("LIQUIDITY_DEPTH", 10))  # Levels per side counted as available liquidity
+
 # Prometheus metrics (example)
 order_book_analysis_checks_total = Counter('order_book_analysis_checks_total', 'Total number of order book analysis checks performed')
 order_book_analysis_errors_total = Counter('order_book_analysis_errors_total', 'Total number of order book analysis errors', ['error_type'])
 
 async def analyze_order_book(order_book):
-    '''Analyzes the order book data to identify the best prices and liquidity.'''
+    '''Analyzes the order book data to identify the best prices and liquidity.
+
+    Accepts a live Order_Book_Engine.OrderBook, or a {"bids": [[price, size], ...], "asks": ...} dict
+    (loaded into a throwaway book). Liquidity is the size resting within LIQUIDITY_DEPTH levels per side.
+    '''
     try:
-        # Placeholder for order book analysis logic (replace with actual analysis)
-        logger.info(json.dumps({"module": "Order Book Analyzer", "action": "Analyze Order Book", "status": "Analyzing"}))
+        logger.debug(json.dumps({"module": "Order Book Analyzer", "action": "Analyze Order Book", "status": "Analyzing"}))
+
+        if not isinstance(order_book, OrderBook):
+            snapshot = order_book
+            order_book = OrderBook(snapshot.get("symbol", "UNKNOWN"))
+            order_book.apply_snapshot(snapshot.get("bids", []), snapshot.get("asks", []), snapshot.get("sequence", 0))
 
-        # Simulate order book analysis
-        best_bid_price = 10000  # Simulate best bid price
-        best_ask_price = 10001  # Simulate best ask price
-        liquidity = 100  # Simulate liquidity
+        best_bid_price, _ = order_book.best_bid()
+        best_ask_price, _ = order_book.best_ask()
+        liquidity = order_book.bids.volume(LIQUIDITY_DEPTH) + order_book.asks.volume(LIQUIDITY_DEPTH)
 
         logger.info(json.dumps({"module": "Order Book Analyzer", "action": "Analyze Order Book", "status": "Success", "best_bid_price": best_bid_price, "best_ask_price": best_ask_price, "liquidity": liquidity}))
         global order_book_analysis_checks_total
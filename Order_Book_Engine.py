@@ -0,0 +1,328 @@
+'''
+Module: Order Book Engine
+Version: 1.0.0
+Last Updated: 2026-10-16
+Purpose: In-memory L2 order books maintained from snapshot + diff updates, shared by every order-book consumer in the process.
+Core Objectives:
+  - Explicit profitability and risk targets alignment: Give scalping, iceberg and liquidity modules a current, consistent book instead of a periodically re-fetched blob.
+  - Explicit ESG compliance adherence: Read-only market data; no trading decisions are taken here.
+  - Explicit regulatory and compliance standards adherence: Sequence-gap detection guarantees no module trades on a silently corrupted book.
+  - Explicit 10/10 quality rating definition adherence: Code must meet all quality criteria, including modularity, error handling, metrics, logging, and testing.
+Summary of Enhancements:
+  - Initial version. Price levels live in sorted array('d') storage keyed so the best level is always last:
+    lookups are O(log n) bisects and inserts near the top of book shift only the few levels above them.
+'''
+
+import asyncio
+import json
+import logging
+import os
+import time
+from array import array
+from bisect import bisect_left
+from prometheus_client import Counter, Gauge
+
+from redis_connection_manager import get_async_redis
+from pubsub_dispatcher import PubSubDispatcher, decode_json
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(module)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Constants
+REDIS_HOST = os.environ.get("REDIS_HOST", "localhost")
+REDIS_PORT = int(os.environ.get("REDIS_PORT", 6379))
+BOOK_DIFF_CHANNEL = os.environ.get("BOOK_DIFF_CHANNEL", "titan:prod:book_diffs:{symbol}")  # Snapshot / diff messages per symbol
+BOOK_SNAPSHOT_KEY = os.environ.get("BOOK_SNAPSHOT_KEY", "titan:prod::order_book:{symbol}")  # Latest full snapshot, used to resync
+MAX_BUFFERED_DIFFS = int(os.environ.get("MAX_BUFFERED_DIFFS", 10000))  # Diffs held while waiting for a resync snapshot
+RESYNC_MIN_INTERVAL = float(os.environ.get("RESYNC_MIN_INTERVAL", 1.0))  # Seconds between snapshot fetches while out of sync
+
+# Prometheus metrics
+order_book_gaps_total = Counter('order_book_gaps_total', 'Sequence gaps detected in order book diff streams', ['symbol'])
+order_book_resyncs_total = Counter('order_book_resyncs_total', 'Order book resyncs from snapshot', ['symbol'])
+order_book_levels = Gauge('order_book_levels', 'Price levels held per book side', ['symbol', 'side'])
+
+class BookSide:
+    '''
+    One side of an L2 book.
+
+    Levels are kept in two parallel array('d') buffers sorted by
+    ``sign * price`` ascending (sign +1 for bids, -1 for asks), so the best
+    level is always at the end for both sides.
+    '''
+
+    def __init__(self, is_bid: bool):
+        self.sign = 1.0 if is_bid else -1.0
+        self.keys = array('d')
+        self.sizes = array('d')
+
+    def __len__(self):
+        return len(self.keys)
+
+    def clear(self):
+        self.keys = array('d')
+        self.sizes = array('d')
+
+    def update(self, price: float, size: float):
+        '''Sets the size at ``price``; a size of 0 removes the level.'''
+        key = self.sign * price
+        keys = self.keys
+        i = bisect_left(keys, key)
+        if i < len(keys) and keys[i] == key:
+            if size > 0:
+                self.sizes[i] = size
+            else:
+                del keys[i]
+                del self.sizes[i]
+        elif size > 0:
+            keys.insert(i, key)
+            self.sizes.insert(i, size)
+
+    def load(self, levels):
+        '''Replaces every level from an iterable of (price, size).'''
+        pairs = sorted((self.sign * float(price), float(size)) for price, size in levels if float(size) > 0)
+        self.keys = array('d', (key for key, _ in pairs))
+        self.sizes = array('d', (size for _, size in pairs))
+
+    def best(self):
+        '''(price, size) of the best level, or (None, 0.0) when the side is empty.'''
+        if not self.keys:
+            return None, 0.0
+        return self.sign * self.keys[-1], self.sizes[-1]
+
+    def level(self, n: int):
+        '''(price, size) of the n-th best level (0 = best), or (None, 0.0).'''
+        if n >= len(self.keys):
+            return None, 0.0
+        return self.sign * self.keys[-1 - n], self.sizes[-1 - n]
+
+    def top(self, depth: int) -> list:
+        '''Best ``depth`` levels as [[price, size], ...], best first.'''
+        count = min(depth, len(self.keys))
+        sign = self.sign
+        return [[sign * self.keys[-1 - n], self.sizes[-1 - n]] for n in range(count)]
+
+    def volume(self, depth: int = None) -> float:
+        '''Total size over the best ``depth`` levels (all levels when None).'''
+        if depth is None or depth >= len(self.sizes):
+            return sum(self.sizes)
+        return sum(self.sizes[-depth:]) if depth > 0 else 0.0
+
+    def depth_to_price(self, price: float) -> float:
+        '''Total size resting at prices at least as good as ``price``.'''
+        return sum(self.sizes[bisect_left(self.keys, self.sign * price):])
+
+    def sweep(self, quantity: float):
+        '''Walks from the best level consuming ``quantity``; returns (filled, notional, worst_price).'''
+        filled = 0.0
+        notional = 0.0
+        worst = None
+        keys, sizes, sign = self.keys, self.sizes, self.sign
+        for n in range(len(keys) - 1, -1, -1):
+            take = min(sizes[n], quantity - filled)
+            worst = sign * keys[n]
+            filled += take
+            notional += take * worst
+            if filled >= quantity:
+                break
+        return filled, notional, worst
+
+class OrderBook:
+    '''
+    L2 book for one symbol, kept current from a snapshot followed by diffs.
+
+    Diffs carry (first_sequence, sequence) as exchange update ids.  A diff
+    that starts past ``sequence + 1`` is a gap: the book is marked out of
+    sync, later diffs are buffered, and the next snapshot is applied
+    together with any buffered diffs newer than it.
+    '''
+
+    def __init__(self, symbol: str):
+        self.symbol = symbol
+        self.bids = BookSide(is_bid=True)
+        self.asks = BookSide(is_bid=False)
+        self.sequence = 0
+        self.synced = False
+        self.buffered = []
+        self.updated_at = 0.0
+        self.resync_attempted_at = 0.0
+
+    def apply_snapshot(self, bids, asks, sequence: int):
+        self.bids.load(bids)
+        self.asks.load(asks)
+        self.sequence = int(sequence)
+        self.synced = True
+        self.updated_at = time.time()
+        buffered, self.buffered = self.buffered, []
+        for first_sequence, last_sequence, diff_bids, diff_asks in buffered:
+            if last_sequence > self.sequence:
+                self.apply_diff(diff_bids, diff_asks, first_sequence, last_sequence)
+        order_book_levels.labels(symbol=self.symbol, side="bid").set(len(self.bids))
+        order_book_levels.labels(symbol=self.symbol, side="ask").set(len(self.asks))
+
+    def apply_diff(self, bids, asks, first_sequence: int, sequence: int) -> bool:
+        '''Applies one diff; returns False when the book is (now) out of sync and needs a snapshot.'''
+        if not self.synced:
+            if len(self.buffered) < MAX_BUFFERED_DIFFS:
+                self.buffered.append((first_sequence, sequence, bids, asks))
+            return False
+        if sequence <= self.sequence:
+            return True  # Already covered by the snapshot
+        if first_sequence > self.sequence + 1:
+            order_book_gaps_total.labels(symbol=self.symbol).inc()
+            logger.warning(json.dumps({"module": "Order Book Engine", "action": "Apply Diff", "status": "Sequence Gap", "symbol": self.symbol, "expected": self.sequence + 1, "received": first_sequence}))
+            self.synced = False
+            self.buffered = [(first_sequence, sequence, bids, asks)]
+            return False
+
+        update = self.bids.update
+        for price, size in bids:
+            update(float(price), float(size))
+        update = self.asks.update
+        for price, size in asks:
+            update(float(price), float(size))
+        self.sequence = int(sequence)
+        self.updated_at = time.time()
+        return True
+
+    # Queries
+
+    def best_bid(self):
+        return self.bids.best()
+
+    def best_ask(self):
+        return self.asks.best()
+
+    def mid(self):
+        bid, _ = self.bids.best()
+        ask, _ = self.asks.best()
+        if bid is None or ask is None:
+            return None
+        return (bid + ask) / 2
+
+    def spread(self):
+        bid, _ = self.bids.best()
+        ask, _ = self.asks.best()
+        if bid is None or ask is None:
+            return None
+        return ask - bid
+
+    def depth_to_price(self, side: str, price: float) -> float:
+        '''Size available to a ``side`` order ("buy" takes asks) at or better than ``price``.'''
+        return (self.asks if side == "buy" else self.bids).depth_to_price(price)
+
+    def vwap(self, side: str, quantity: float):
+        '''Average fill price for a market ``side`` order of ``quantity``; None when the book is too thin.'''
+        filled, notional, _ = (self.asks if side == "buy" else self.bids).sweep(quantity)
+        if filled < quantity or filled == 0:
+            return None
+        return notional / filled
+
+    def imbalance(self, depth: int = 10) -> float:
+        '''(bid volume - ask volume) / total over the best ``depth`` levels, in [-1, 1].'''
+        bid_volume = self.bids.volume(depth)
+        ask_volume = self.asks.volume(depth)
+        total = bid_volume + ask_volume
+        return (bid_volume - ask_volume) / total if total else 0.0
+
+    def to_dict(self, depth: int = 20) -> dict:
+        '''Legacy {"bids": [[price, size], ...], "asks": ...} view for analyzers that take a dict.'''
+        return {"symbol": self.symbol, "sequence": self.sequence, "bids": self.bids.top(depth), "asks": self.asks.top(depth)}
+
+# Process-wide books, shared by every module that imports this one
+books = {}
+feeds = {}
+
+def get_book(symbol: str) -> OrderBook:
+    book = books.get(symbol)
+    if book is None:
+        book = books[symbol] = OrderBook(symbol)
+    return book
+
+async def fetch_snapshot(redis, symbol: str):
+    '''Reads the latest full snapshot published for ``symbol``; returns (bids, asks, sequence) or None.'''
+    raw = await redis.get(BOOK_SNAPSHOT_KEY.format(symbol=symbol))
+    if not raw:
+        return None
+    snapshot = json.loads(raw)
+    return snapshot.get("bids", []), snapshot.get("asks", []), snapshot.get("sequence", 0)
+
+async def resync(redis, book: OrderBook, snapshot_fetcher=fetch_snapshot) -> bool:
+    now = time.monotonic()
+    if now - book.resync_attempted_at < RESYNC_MIN_INTERVAL:
+        return False  # Diffs keep buffering until the next attempt
+    book.resync_attempted_at = now
+    snapshot = await snapshot_fetcher(redis, book.symbol)
+    if snapshot is None:
+        return False
+    book.apply_snapshot(*snapshot)
+    order_book_resyncs_total.labels(symbol=book.symbol).inc()
+    logger.info(json.dumps({"module": "Order Book Engine", "action": "Resync", "status": "Success", "symbol": book.symbol, "sequence": book.sequence}))
+    return True
+
+async def handle_book_message(redis, book: OrderBook, message: dict, snapshot_fetcher=fetch_snapshot):
+    '''Applies one {"type": "snapshot"|"diff", "bids", "asks", "first_sequence", "sequence"} message.'''
+    if message.get("type") == "snapshot":
+        book.apply_snapshot(message.get("bids", []), message.get("asks", []), message.get("sequence", 0))
+        return
+    sequence = message["sequence"]
+    if not book.apply_diff(message.get("bids", []), message.get("asks", []), message.get("first_sequence", sequence), sequence):
+        await resync(redis, book, snapshot_fetcher)
+
+async def run_book_feed(symbol: str, redis=None, snapshot_fetcher=fetch_snapshot):
+    '''Keeps ``get_book(symbol)`` current from the diff channel until cancelled.'''
+    redis = redis or get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+    book = get_book(symbol)
+    dispatcher = PubSubDispatcher(redis, f"order_book:{symbol}", channels=[BOOK_DIFF_CHANNEL.format(symbol=symbol)])
+    dispatcher.add_handler(lambda message: handle_book_message(redis, book, decode_json(message), snapshot_fetcher), name="apply_book_update")
+    runner = asyncio.create_task(dispatcher.run())
+    await asyncio.sleep(0)  # Subscribe before the first snapshot so no diff falls in between
+    await resync(redis, book, snapshot_fetcher)
+    await runner
+
+def ensure_feed(symbol: str) -> OrderBook:
+    '''Starts the diff feed for ``symbol`` once per process (needs a running loop) and returns the shared book.'''
+    task = feeds.get(symbol)
+    if task is None or task.done():
+        feeds[symbol] = asyncio.ensure_future(run_book_feed(symbol))
+    return get_book(symbol)
+
+def benchmark(levels: int = 2000, updates: int = 200000) -> dict:
+    '''Random-walk diff stream against one book; returns mean microseconds per update and per query.'''
+    import random
+    rng = random.Random(7)
+    book = OrderBook("BENCH")
+    mid = 30000.0
+    book.apply_snapshot([[mid - 0.5 - i * 0.5, rng.uniform(0.1, 5)] for i in range(levels)],
+                        [[mid + 0.5 + i * 0.5, rng.uniform(0.1, 5)] for i in range(levels)], 1)
+    diffs = []
+    for n in range(updates):
+        offset = abs(int(rng.gauss(0, 20))) * 0.5 + 0.5
+        size = 0.0 if rng.random() < 0.3 else rng.uniform(0.1, 5)
+        diffs.append(([[mid - offset, size]], []) if n % 2 else ([], [[mid + offset, size]]))
+
+    started = time.perf_counter()
+    for n, (bids, asks) in enumerate(diffs, start=2):
+        book.apply_diff(bids, asks, n, n)
+    update_us = (time.perf_counter() - started) / updates * 1e6
+
+    queries = {
+        "best_bid": lambda: book.best_bid(),
+        "depth_to_price": lambda: book.depth_to_price("buy", mid + 10),
+        "vwap_5": lambda: book.vwap("buy", 5.0),
+        "imbalance_10": lambda: book.imbalance(10),
+    }
+    timings = {}
+    for name, query in queries.items():
+        started = time.perf_counter()
+        for _ in range(20000):
+            query()
+        timings[name] = round((time.perf_counter() - started) / 20000 * 1e6, 3)
+    return {"levels": levels, "updates": updates, "update_us": round(update_us, 3), "query_us": timings}
+
+async def main():
+    '''Main function to start the order book engine module.'''
+    await run_book_feed(os.environ.get("SYMBOL", "BTCUSDT"))
+
+if __name__ == "__main__":
+    logger.info(json.dumps({"module": "Order Book Engine", "action": "Benchmark", **benchmark()}))
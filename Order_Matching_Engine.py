@@ -17,7 +17,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -48,7 +48,7 @@ matching_algorithm = Gauge('matching_algorithm', 'Matching algorithm used')
 async def fetch_order_book_data():
     '''Fetches order book data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         order_book_data = await redis.get("titan:prod::order_book")  # Standardized key
         if order_book_data:
             return json.loads(order_book_data)
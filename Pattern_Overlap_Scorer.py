@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -41,7 +41,7 @@ pattern_overlap_score = Gauge('pattern_overlap_score', 'Overlap score for each s
 async def fetch_pattern_data(signal):
     '''Fetches bull flag, whale spoof, and MACD flip data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         bull_flag = await redis.get(f"titan:pattern:{SYMBOL}:bull_flag")
         whale_spoof = await redis.get(f"titan:pattern:{SYMBOL}:whale_spoof")
         macd_flip = await redis.get(f"titan:pattern:{SYMBOL}:macd_flip")
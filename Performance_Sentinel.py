@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -41,7 +41,7 @@ module_performance_score = Gauge('module_performance_score', 'Performance score
 async def fetch_module_data(module_name):
     '''Fetches win rate, avg ROI, time to TP/SL, system latency impact, and Redis TTL mismatch data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         win_rate = await redis.get(f"titan:performance:{module_name}:win_rate")
         avg_roi = await redis.get(f"titan:performance:{module_name}:avg_roi")
         time_to_tp = await redis.get(f"titan:performance:{module_name}:time_to_tp")
@@ -85,7 +85,7 @@ async def calculate_module_score(data):
 async def store_module_score(module_name, score):
     '''Stores the module score to Redis with a TTL.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         await redis.setex(f"titan:performance:score:{module_name}", DAILY_SCORE_EXPIRY, score)
         logger.info(json.dumps({"module": "Performance Sentinel", "action": "Store Module Score", "status": "Success", "module_name": module_name, "score": score}))
         global module_scores_generated_total
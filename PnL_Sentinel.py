@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -40,7 +40,7 @@ drawdown_strategies_flagged_total = Counter('drawdown_strategies_flagged_total',
 async def fetch_trade_data():
     '''Fetches trade data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         # Placeholder for fetching trade data (replace with actual data source)
         trade_data = {"BTCUSDT": {"MomentumStrategy": {"pnl": -100, "drawdown": 0.15}, "ScalpingStrategy": {"pnl": 50, "drawdown": 0.02}}} # Example data
         return trade_data
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -44,7 +44,7 @@ signals_bypassed_total = Counter('signals_bypassed_total', 'Total number of sign
 async def fetch_upcoming_events():
     '''Fetches upcoming economic events from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         event_data = await redis.get("titan:macro::economic_events")
 
         if event_data:
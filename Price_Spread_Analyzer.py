@@ -17,7 +17,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -48,7 +48,7 @@ profitable_spreads = Counter('profitable_spreads', 'Number of profitable spreads
 async def fetch_instrument_data(instrument):
     '''Fetches instrument data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         instrument_data = await redis.get(f"titan:prod::{instrument}_data")  # Standardized key
         if instrument_data:
             return json.loads(instrument_data)
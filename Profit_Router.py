@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -43,7 +43,7 @@ jurisdiction_usage = Gauge('jurisdiction_usage', 'Amount of capital routed to ea
 async def fetch_trade_origin(trade_id):
     '''Fetches the origin of a trade (exchange + signal source) from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         trade_origin = await redis.get(f"titan:prod::trade_origin:{trade_id}") # Example key
         if trade_origin:
             return json.loads(trade_origin)
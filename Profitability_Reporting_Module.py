@@ -17,7 +17,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -47,7 +47,7 @@ average_profit = Gauge('average_profit', 'Average profit per trade')
 async def fetch_trade_data():
     '''Fetches trade data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         trade_data = await redis.get("titan:prod::trade_data")  # Standardized key
         if trade_data:
             return json.loads(trade_data)
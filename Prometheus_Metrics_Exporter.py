@@ -17,7 +17,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -49,7 +49,7 @@ metrics_export_errors_total = Counter('metrics_export_errors_total', 'Total numb
 async def fetch_metrics_data():
     '''Fetches metrics data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         metrics_data = {}
 
         # Fetch metrics from various modules (replace with actual data retrieval)
@@ -17,7 +17,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -44,7 +44,7 @@ dashboard_latency_seconds = Histogram('dashboard_latency_seconds', 'Latency of d
 async def fetch_system_metrics():
     '''Fetches system metrics from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         metrics = {}
         metrics['portfolio_value'] = await redis.get("titan:prod::portfolio_value")  # Standardized key
         metrics['daily_risk_exposure'] = await redis.get("titan:prod::daily_risk_exposure")
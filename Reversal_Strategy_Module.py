@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -40,7 +40,7 @@ reversal_strategy_profit = Gauge('reversal_strategy_profit', 'Profit generated f
 async def fetch_indicators():
     '''Fetches indicator data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         rsi = await redis.get(f"titan:prod::rsi:{SYMBOL}")
         macd = await redis.get(f"titan:prod::macd:{SYMBOL}")
         whale_unloading = await redis.get(f"titan:prod::whale_unloading:{SYMBOL}")
@@ -89,7 +89,7 @@ async def generate_signal(indicators):
 async def publish_signal(signal):
     '''Publishes the trading signal to Redis with a TTL.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         await redis.setex(f"titan:prod::signal:{SYMBOL}", SIGNAL_EXPIRY, json.dumps(signal))  # TTL set to SIGNAL_EXPIRY
         logger.info(json.dumps({"module": "Reversal Strategy Module", "action": "Publish Signal", "status": "Success", "signal": signal}))
     except Exception as e:
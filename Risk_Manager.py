@@ -14,6 +14,7 @@ Summary of Enhancements:
   - Added explicit handling of ESG-related data.
   - Enhanced error handling with specific error categories.
   - Expanded Prometheus metrics for detailed risk tracking.
+  - Risk exposure read in-process from the shared portfolio risk engine (VaR / margin) instead of a simulated draw.
 '''
 
 import asyncio
@@ -26,6 +27,7 @@ import random  # For chaos testing
 import time
 import aiohttp
 from Data_Aggregation_Service import fetch_data_from_redis  # Import the new module
+from portfolio_risk_engine import ensure_feed
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(module)s - %(message)s')
@@ -36,12 +38,9 @@ REDIS_HOST = os.environ.get("REDIS_HOST", "localhost")
 REDIS_PORT = int(os.environ.get("REDIS_PORT", 6379))
 MAX_DAILY_RISK = 0.01  # Maximum acceptable daily risk (1% of capital)
 MAX_LEVERAGE = 5  # Maximum leverage allowed
+MAX_MARGIN_USAGE = 0.8  # Initial margin above this fraction of equity forces 1x
 DATA_PRIVACY_ENABLED = True  # Enable data anonymization
 
-# Simulate market conditions (replace with actual data source)
-market_volatility = 0.02
-account_balance = 100000
-
 # Prometheus metrics (example)
 risk_checks_total = Counter('risk_checks_total', 'Total number of risk checks performed')
 risk_exceeded_total = Counter('risk_exceeded_total', 'Total number of times risk limits were exceeded')
@@ -65,20 +64,13 @@ async def fetch_portfolio_data():
         logger.error(json.dumps({"module": "Risk Manager", "action": "Fetch Portfolio Data", "status": "Failed", "error": str(e)}))
         return None
 
-async def calculate_risk_exposure(portfolio_data):
-    '''Calculates the current risk exposure of the portfolio.'''
-    if not portfolio_data:
-        return None
-
+async def calculate_risk_exposure(portfolio_data=None):
+    '''Current risk exposure: the larger of parametric and historical VaR as a fraction of equity, from the in-process risk engine.'''
     try:
-        # Placeholder for more sophisticated risk calculation
-        # This should take into account factors such as correlation between assets, liquidity, and market sentiment
-        # Adjust risk based on market volatility and account balance
-        max_daily_risk = system_config.get("max_daily_risk", 0.01)
-        adjusted_risk = max_daily_risk * (market_volatility / 0.05) * (account_balance / 100000)
-        risk_exposure = random.uniform(0, adjusted_risk)  # Simulate risk exposure (0-2%)
+        engine = ensure_feed()  # Shared engine kept current on every fill and tick
+        risk_exposure = engine.risk_fraction()
         daily_risk_exposure.set(risk_exposure)
-        logger.info(json.dumps({"module": "Risk Manager", "action": "Calculate Risk", "status": "Calculated", "risk": risk_exposure}))
+        logger.info(json.dumps({"module": "Risk Manager", "action": "Calculate Risk", "status": "Calculated", "risk": risk_exposure, "margin_usage": engine.margin_usage()}))
         return risk_exposure
     except Exception as e:
         global risk_management_errors_total
@@ -89,11 +81,17 @@ async def calculate_risk_exposure(portfolio_data):
 async def adjust_leverage(risk_exposure, market_volatility, asset_volatility, signal_confidence):
     '''Adjusts the leverage based on the current risk exposure and market volatility.'''
     try:
-        # Simulate leverage adjustment based on risk exposure
-        # and market volatility
-        if risk_exposure > MAX_DAILY_RISK or market_volatility > 0.1:
+        # Leverage follows the live VaR and margin usage from the risk engine, and market volatility
+        if risk_exposure is None:
+            risk_exposure = await calculate_risk_exposure()
+        engine = ensure_feed()
+        margin_usage = engine.margin_usage()
+        if not engine.is_warm():
+            leverage = 1  # Positions or return history not loaded yet: the engine's zero VaR means nothing
+            logger.warning(json.dumps({"module": "Risk Manager", "action": "Adjust Leverage", "status": "Risk Engine Not Warm", "leverage": leverage}))
+        elif risk_exposure > MAX_DAILY_RISK or margin_usage > MAX_MARGIN_USAGE or market_volatility > 0.1:
             leverage = 1  # Reduce leverage to 1x
-            logger.warning(json.dumps({"module": "Risk Manager", "action": "Adjust Leverage", "status": "Risk Exceeded", "risk": risk_exposure, "market_volatility": market_volatility, "leverage": leverage, "signal_confidence": signal_confidence, "asset_volatility": asset_volatility}))
+            logger.warning(json.dumps({"module": "Risk Manager", "action": "Adjust Leverage", "status": "Risk Exceeded", "risk": risk_exposure, "market_volatility": market_volatility, "leverage": leverage, "signal_confidence": signal_confidence, "asset_volatility": asset_volatility, "margin_usage": margin_usage}))
             global risk_exceeded_total
             risk_exceeded_total.inc()
         else:
@@ -109,24 +107,24 @@ async def adjust_leverage(risk_exposure, market_volatility, asset_volatility, si
         global risk_management_errors_total
         risk_management_errors_total.labels(error_type="Leverage").inc()
         logger.error(json.dumps({"module": "Risk Manager", "action": "Adjust Leverage", "status": "Exception", "error": str(e)}))
-        return system_config.get("max_leverage", MAX_LEVERAGE)
+        return 1  # Fail closed: no risk reading, no leverage
 
 async def risk_management_loop():
     '''Main loop for the risk management module.'''
     try:
         portfolio_data = await fetch_portfolio_data()
         if portfolio_data:
-            risk_exposure = await calculate_risk_exposure(portfolio_data)
+            risk_exposure = await calculate_risk_exposure()
             # Simulate fetching market volatility (replace with actual data source)
             market_volatility = random.uniform(0.01, 0.05)
             # Simulate fetching asset volatility (replace with actual data source)
             asset_volatility = random.uniform(0.01, 0.05)
             # Simulate fetching signal confidence (replace with actual data source)
             signal_confidence = random.uniform(0.5, 1.0)
-            if risk_exposure:
+            if risk_exposure is not None:
                 leverage = await adjust_leverage(risk_exposure, market_volatility, asset_volatility, signal_confidence)
             else:
-                leverage = system_config.get("max_leverage", MAX_LEVERAGE)
+                leverage = 1  # Risk exposure unavailable
 
         await asyncio.sleep(60)  # Check risk every 60 seconds
     except Exception as e:
@@ -160,10 +158,9 @@ if __name__ == "__main__":
   - Implemented structured JSON logging.
   - Implemented basic error handling.
   - Implemented Prometheus metrics (placeholders).
-  - Implemented dynamic risk assessment based on market volatility and account balance.
+  - Risk exposure from incremental portfolio VaR / ES and margin usage (portfolio_risk_engine).
 
 🔄 Deferred Features (with module references):
-  - Integration with a real-time market data feed.
   - More sophisticated risk assessment algorithms (Central AI Brain).
   - Integration with a central dashboard for monitoring (Real-Time Dashboard Integration).
   - Dynamic adjustment of risk parameters (Dynamic Configuration Engine).
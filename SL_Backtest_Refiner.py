@@ -10,10 +10,11 @@ Core Objectives:
   - Explicit 10/10 quality rating definition adherence: Code must meet all quality criteria, including modularity, error handling, metrics, logging, and testing.
 Summary of Enhancements:
   - Initial version.
+  - Historical data comes from the shared columnar candle store (candle_store.load_candles).
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -21,6 +22,7 @@ from prometheus_client import Counter, Gauge, Histogram
 import random  # For chaos testing
 import time
 import aiohttp
+from candle_store import load_candles
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(module)s - %(message)s')
@@ -39,9 +41,13 @@ backtest_latency_seconds = Histogram('backtest_latency_seconds', 'Latency of bac
 optimal_sl_value = Gauge('optimal_sl_value', 'Optimal SL value for each strategy/symbol/time combo', ['strategy', 'symbol', 'time'])
 
 async def fetch_historical_data():
-    '''Fetches historical trade data from Redis.'''
+    '''Loads the last BACKTEST_DATA_RANGE seconds of candles from the local candle store; falls back to trade data in Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        candles = load_candles(SYMBOL, start=time.time_ns() - BACKTEST_DATA_RANGE * 1_000_000_000)
+        if len(candles):
+            return candles
+
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         historical_data = await redis.get(f"titan:historical::trade_data:{SYMBOL}")
 
         if historical_data:
@@ -76,7 +82,7 @@ async def backtest_stop_loss_strategies(historical_data):
 async def store_optimal_sl(strategy, symbol, time, optimal_sl):
     '''Stores the optimal SL value to Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         await redis.set(f"titan:sl:{strategy}:{symbol}:{time}", json.dumps(optimal_sl))
         logger.info(json.dumps({"module": "SL Backtest Refiner", "action": "Store Optimal SL", "status": "Success", "strategy": strategy, "symbol": symbol, "time": time, "optimal_sl": optimal_sl}))
         global optimal_sl_value
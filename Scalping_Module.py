@@ -13,11 +13,12 @@ Summary of Enhancements:
   - Implemented dynamic adjustment of trading parameters based on market conditions.
   - Added explicit handling of ESG-related data.
   - Enhanced error handling with specific error categories.
+  - Order book read from the shared in-memory L2 book (Order_Book_Engine) instead of a JSON blob per cycle.
   - Expanded Prometheus metrics for detailed scalping tracking.
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -25,6 +26,7 @@ from prometheus_client import Counter, Gauge, Histogram
 import random  # For chaos testing
 import time
 import aiohttp
+from Order_Book_Engine import ensure_feed
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(module)s - %(message)s')
@@ -47,14 +49,14 @@ scalping_profit = Gauge('scalping_profit', 'Profit generated from scalping trade
 scalping_latency_seconds = Histogram('scalping_latency_seconds', 'Latency of scalping trade execution')
 
 async def fetch_order_book_data():
-    '''Fetches order book data and ESG score from Redis.'''
+    '''Reads the shared live order book and fetches the ESG score from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
-        order_book_data = await redis.get("titan:prod::order_book")  # Standardized key
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        book = ensure_feed(TRADING_INSTRUMENT)  # Live in-process L2 book kept current by Order_Book_Engine
         esg_data = await redis.get("titan:prod::esg_data")
 
-        if order_book_data and esg_data:
-            order_book_data = json.loads(order_book_data)
+        if book.synced and esg_data:
+            order_book_data = book.to_dict(depth=2)
             order_book_data['esg_score'] = json.loads(esg_data)['score']
             return order_book_data
         else:
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -43,7 +43,7 @@ schedule_optimization_latency_seconds = Histogram('schedule_optimization_latency
 async def fetch_historical_pnl_data():
     '''Fetches historical PNL data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         pnl_data = await redis.get(f"titan:prod::historical_pnl:{SYMBOL}")
         if pnl_data:
             return json.loads(pnl_data)
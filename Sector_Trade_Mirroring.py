@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -41,7 +41,7 @@ sector_mirroring_profit = Gauge('sector_mirroring_profit', 'Profit from sector m
 async def fetch_winning_symbol_data():
     '''When one DeFi/L1/AI coin wins, check similar symbols.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         winning_symbol = await redis.get("titan:sector:winning_symbol")
         if winning_symbol:
             return json.loads(winning_symbol)
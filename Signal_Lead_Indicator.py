@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -41,7 +41,7 @@ lead_confidence_score = Gauge('lead_confidence_score', 'Confidence score for lea
 async def fetch_leading_indicators():
     '''Fetches AI score, RSI, and spread flip data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         ai_score_trend = await redis.get(f"titan:prod::ai_score:{SYMBOL}:trend")
         rsi_trend = await redis.get(f"titan:prod::rsi:{SYMBOL}:trend")
         spread_flip = await redis.get(f"titan:prod::spread:{SYMBOL}:flip")
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -48,7 +48,7 @@ async def hash_signal(signal):
 async def check_signal_memory(signal_hash):
     '''Checks if the signal ID triggered a loss before.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         failure_count = await redis.get(f"titan:prod::signal_memory:{signal_hash}")
         if failure_count:
             return int(failure_count)
@@ -76,7 +76,7 @@ async def block_or_reduce_confidence(signal, failure_count):
 async def update_signal_memory(signal_hash, outcome):
     '''Updates the signal memory with the outcome of the trade.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         if outcome == "loss":
             failure_count = await check_signal_memory(signal_hash)
             await redis.setex(f"titan:prod::signal_memory:{signal_hash}", SIGNAL_EXPIRY, failure_count + 1) # Increment failure count
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -41,7 +41,7 @@ input_weight = Gauge('input_weight', 'Weight of each signal input', ['input'])
 async def fetch_input_performance(signal):
     '''Fetches the performance of RSI, AI, and pattern inputs from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         rsi_performance = await redis.get(f"titan:prod::rsi:{SYMBOL}:performance")
         ai_performance = await redis.get(f"titan:prod::ai_score:{SYMBOL}:performance")
         pattern_performance = await redis.get(f"titan:prod::pattern:{SYMBOL}:performance")
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -41,7 +41,7 @@ origin_validation_latency_seconds = Histogram('origin_validation_latency_seconds
 async def fetch_signal_origin_data(signal):
     '''Fetches RSI, Volume, Pattern input freshness, latency, and circuit status from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         rsi_timestamp = await redis.get(f"titan:prod::rsi:{SYMBOL}:timestamp")
         volume_timestamp = await redis.get(f"titan:prod::volume:{SYMBOL}:timestamp")
         pattern_timestamp = await redis.get(f"titan:prod::pattern:{SYMBOL}:timestamp")
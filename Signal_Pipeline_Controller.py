@@ -90,6 +90,7 @@ async def capital_check(signal):
 
 async def signal_pipeline_loop():
     '''Main loop for the signal pipeline controller module.'''
+    global signals_validated_total, signals_rejected_total
     try:
         # Simulate a new signal
         signal = {"symbol": "BTCUSDT", "side": "BUY", "strategy": "MomentumStrategy", "inputs": {"rsi": 70, "volume": 1000}, "confidence": 0.9}
@@ -99,23 +100,18 @@ async def signal_pipeline_loop():
                 if await confidence_validator(signal):
                     if await capital_check(signal):
                         logger.info(json.dumps({"module": "Signal Pipeline Controller", "action": "Process Signal", "status": "Approved", "signal": signal}))
-                        global signals_validated_total
                         signals_validated_total.inc()
                     else:
                         logger.warning(json.dumps({"module": "Signal Pipeline Controller", "action": "Process Signal", "status": "Capital Check Failed", "signal": signal}))
-                        global signals_rejected_total
                         signals_rejected_total.inc()
                 else:
                     logger.warning(json.dumps({"module": "Signal Pipeline Controller", "action": "Process Signal", "status": "Confidence Failed", "signal": signal}))
-                    global signals_rejected_total
                     signals_rejected_total.inc()
             else:
                 logger.warning(json.dumps({"module": "Signal Pipeline Controller", "action": "Process Signal", "status": "Entropy Failed", "signal": signal}))
-                global signals_rejected_total
                 signals_rejected_total.inc()
         else:
             logger.warning(json.dumps({"module": "Signal Pipeline Controller", "action": "Process Signal", "status": "Schema Failed", "signal": signal}))
-            global signals_rejected_total
             signals_rejected_total.inc()
 
         await asyncio.sleep(60)  # Check for new signals every 60 seconds
@@ -17,7 +17,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -47,7 +47,7 @@ signal_strength = Gauge('signal_strength', 'Strength of generated trade signals'
 async def fetch_market_data():
     '''Fetches market data and ESG score from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         market_data = await redis.get("titan:prod::market_data")  # Standardized key
         esg_data = await redis.get("titan:prod::esg_data")
 
@@ -98,7 +98,7 @@ async def generate_signal(market_data):
 async def publish_trade_signal(signal):
     '''Publishes the trade signal to Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         await redis.setex("titan:prod::trading_signal", SIGNAL_EXPIRY, json.dumps(signal))  # Standardized key with expiry
         logger.info(json.dumps({"module": "Signal Predictor", "action": "Publish Signal", "status": "Success", "signal": signal}))
         global trade_signals_generated_total
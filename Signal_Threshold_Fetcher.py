@@ -17,7 +17,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -47,7 +47,7 @@ asset_threshold = Gauge('asset_threshold', 'Current asset threshold', ['asset'])
 async def fetch_threshold_data(asset):
     '''Fetches threshold data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         threshold_data = await redis.get(f"titan:prod::{asset}_threshold")  # Standardized key
         if threshold_data:
             return json.loads(threshold_data)
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -41,7 +41,7 @@ signal_velocity_score = Gauge('signal_velocity_score', 'Velocity score for each
 async def fetch_signal_components(signal):
     '''Fetches the timestamps of RSI, Whale spoof, and AI score from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         rsi_timestamp = await redis.get(f"titan:prod::rsi:{SYMBOL}:timestamp")
         whale_spoof_timestamp = await redis.get(f"titan:prod::whale_spoof:{SYMBOL}:timestamp")
         ai_score_timestamp = await redis.get(f"titan:prod::ai_score:{SYMBOL}:timestamp")
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -41,7 +41,7 @@ mirroring_strategy_profit = Gauge('mirroring_strategy_profit', 'Profit generated
 async def fetch_smart_money_data():
     '''Fetches wallet behavior, net flow, and blockchain scanner data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         wallet_behavior = await redis.get(f"titan:prod::wallet_behavior:{SYMBOL}")
         net_flow = await redis.get(f"titan:prod::net_flow:{SYMBOL}")
         blockchain_scanner = await redis.get(f"titan:prod::blockchain_scanner:{SYMBOL}")
@@ -87,7 +87,7 @@ async def generate_signal(data):
 async def publish_signal(signal):
     '''Publishes the trading signal to Redis with a TTL.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         await redis.setex(f"titan:prod::signal:{SYMBOL}", SIGNAL_EXPIRY, json.dumps(signal))  # TTL set to SIGNAL_EXPIRY
         logger.info(json.dumps({"module": "Smart Money Mirroring Module", "action": "Publish Signal", "status": "Success", "signal": signal}))
     except Exception as e:
@@ -1,7 +1,7 @@
 '''
 Module: Smart Order Router
-Version: 1.0.0
-Last Updated: 2025-03-26
+Version: 1.1.0
+Last Updated: 2026-10-16
 Purpose: Routes orders optimally across multiple exchanges.
 Core Objectives:
   - Explicit profitability and risk targets alignment: Ensure orders are routed to maximize profit and minimize risk.
@@ -14,17 +14,23 @@ Summary of Enhancements:
   - Added explicit handling of data privacy.
   - Enhanced error handling with specific error categories.
   - Expanded Prometheus metrics for detailed order routing tracking.
+  - Depth-aware routing: parent orders are split across venues by walking every venue's L2 book in order of
+    all-in unit cost (price, taker fee, latency penalty), which is the exact cost minimum for ladder books.
 '''
 
 import asyncio
-import aioredis
+import heapq
 import json
 import logging
 import os
-from prometheus_client import Counter, Gauge, Histogram
-import random  # For chaos testing
+import random
 import time
-import aiohttp
+from prometheus_client import Counter, Gauge, Histogram
+
+from Order_Book_Engine import OrderBook, ensure_feed
+from Market_Data_Gateway import book_id
+from Fee_Optimization_Engine import fetch_exchange_fee_structure
+from exchange_api import measured_latency
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(module)s - %(message)s')
@@ -33,58 +39,126 @@ logger = logging.getLogger(__name__)
 # Constants
 REDIS_HOST = os.environ.get("REDIS_HOST", "localhost")
 REDIS_PORT = int(os.environ.get("REDIS_PORT", 6379))
-EXCHANGES = ["Binance", "Coinbase", "Kraken"]
-DEFAULT_EXCHANGE_WEIGHTS = {"Binance": 0.4, "Coinbase": 0.3, "Kraken": 0.3} # Weights for each exchange
-MAX_SPREAD_DEVIATION = 0.001 # Maximum acceptable spread difference (0.1%)
-ESG_EXCHANGE_IMPACT = 0.05 # How much ESG score impacts exchange selection
+EXCHANGES = os.environ.get("ROUTER_VENUES", "binance,bybit,kucoin").split(",")
+LATENCY_PENALTY_BPS_PER_MS = float(os.environ.get("LATENCY_PENALTY_BPS_PER_MS", 0.02))  # Expected adverse move per ms of venue latency
+DEFAULT_VENUE_LATENCY_MS = float(os.environ.get("DEFAULT_VENUE_LATENCY_MS", 50))  # Used until a venue's latency has been measured
+MIN_CHILD_QUANTITY = float(os.environ.get("MIN_CHILD_QUANTITY", 0))  # Children smaller than this are folded into other venues
+BOOK_STALE_SECONDS = float(os.environ.get("BOOK_STALE_SECONDS", 5))  # Books not updated this recently are not routed to
+FEE_CACHE_TTL = float(os.environ.get("FEE_CACHE_TTL", 300))  # Seconds fee tiers are reused before re-reading
 
 # Prometheus metrics (example)
 orders_routed_total = Counter('orders_routed_total', 'Total number of API requests routed', ['exchange'])
 routing_errors_total = Counter('api_routing_errors_total', 'Total number of API routing errors', ['exchange', 'error_type'])
-response_latency_seconds = Histogram('api_response_latency_seconds', 'Latency of API responses', ['exchange'])
+routing_decision_seconds = Histogram('routing_decision_seconds', 'Time to compute an order split', buckets=(0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.01))
 exchange_selection = Gauge('exchange_selection', 'Exchange selected for order routing')
 
-async def fetch_exchange_data(exchange):
-    '''Fetches exchange-specific data (price, volume, ESG score) from Redis.'''
-    try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
-        price_data = await redis.get(f"titan:prod::{exchange}_price")  # Standardized key
-        volume_data = await redis.get(f"titan:prod::{exchange}_volume")
-        esg_data = await redis.get(f"titan:prod::{exchange}_esg")
-
-        if price_data and volume_data and esg_data:
-            price = json.loads(price_data)['price']
-            volume = json.loads(volume_data)['volume']
-            esg_score = json.loads(esg_data)['score']
-            return price, volume, esg_score
+def compute_split(side, quantity, venues, min_child_quantity=MIN_CHILD_QUANTITY):
+    '''
+    Cost-minimizing split of a parent order.
+
+    ``venues`` is a list of (name, OrderBook, taker_fee, latency_ms).  Every
+    level is priced all-in, price * (1 + fee + latency penalty) for buys and
+    price * (1 - fee - latency penalty) for sells, and levels are consumed
+    best-first across venues with a k-way heap merge.  Each venue's ladder
+    is monotone, so the greedy merge is the exact optimum and touches only
+    the levels it fills.  Returns (children, unfilled quantity).
+    '''
+    buy = side.upper() == "BUY"
+    ladders = []
+    heap = []
+    for name, book, fee, latency_ms in venues:
+        book_side = book.asks if buy else book.bids
+        keys, sizes, sign = book_side.keys, book_side.sizes, book_side.sign
+        if not keys:
+            continue
+        adjustment = fee + latency_ms * LATENCY_PENALTY_BPS_PER_MS / 10000
+        multiplier = 1 + adjustment if buy else 1 - adjustment
+        index = len(ladders)
+        ladders.append((name, keys, sizes, sign, multiplier, fee, latency_ms))
+        price = sign * keys[-1]
+        # Heap key: all-in cost for buys, negated all-in proceeds for sells (smallest first either way)
+        heap.append((price * multiplier if buy else -price * multiplier, index, len(keys) - 1))
+    heapq.heapify(heap)
+
+    fills = {}
+    remaining = quantity
+    while remaining > 1e-12 and heap:
+        _, index, level = heapq.heappop(heap)
+        name, keys, sizes, sign, multiplier, _, _ = ladders[index]
+        take = min(sizes[level], remaining)
+        price = sign * keys[level]
+        fill = fills.get(index)
+        if fill is None:
+            fills[index] = [take, take * price, price]
         else:
-            logger.warning(json.dumps({"module": "Smart Order Router", "action": "Fetch Exchange Data", "status": "No Data", "exchange": exchange}))
-            return None, None, None
-    except Exception as e:
-        global routing_errors_total
-        routing_errors_total = Counter('api_routing_errors_total', 'Total number of API routing errors', ['exchange', 'error_type'])
-        routing_errors_total.labels(exchange=exchange, error_type="RedisFetch").inc()
-        logger.error(json.dumps({"module": "Smart Order Router", "action": "Fetch Exchange Data", "status": "Failed", "exchange": exchange, "error": str(e)}))
-        return None, None, None
+            fill[0] += take
+            fill[1] += take * price
+            fill[2] = price
+        remaining -= take
+        if level > 0:
+            price = sign * keys[level - 1]
+            heapq.heappush(heap, (price * multiplier if buy else -price * multiplier, index, level - 1))
 
-async def select_best_exchange(order_details):
-    '''Selects the best exchange for order routing based on price, volume, and ESG score.'''
-    best_exchange = None
-    best_score = -1
+    children = []
+    for index, (filled, notional, worst) in fills.items():
+        name, _, _, _, _, fee, latency_ms = ladders[index]
+        children.append({
+            "venue": name,
+            "side": side.upper(),
+            "quantity": filled,
+            "limit_price": worst,  # IOC limit: the deepest level this child was priced against
+            "avg_price": notional / filled,
+            "fee_rate": fee,
+            "expected_fee": notional * fee,
+            "latency_ms": latency_ms,
+        })
 
-    for exchange in EXCHANGES:
-        price, volume, esg_score = await fetch_exchange_data(exchange)
-        if price is None or volume is None:
-            continue
+    small = [child for child in children if child["quantity"] < min_child_quantity]
+    if small and len(children) > 1:
+        # Drop the smallest child's venue and re-solve; repeats until every child is large enough
+        smallest = min(small, key=lambda child: child["quantity"])["venue"]
+        return compute_split(side, quantity, [venue for venue in venues if venue[0] != smallest], min_child_quantity)
+    children.sort(key=lambda child: -child["quantity"])
+    return children, max(remaining, 0.0)
+
+fee_cache = {}
+
+async def fetch_venue_fees(venues):
+    '''Taker fee per venue from Fee_Optimization_Engine, fetched concurrently and cached for FEE_CACHE_TTL.'''
+    now = time.monotonic()
+    stale = [venue for venue in venues if venue not in fee_cache or now - fee_cache[venue][1] > FEE_CACHE_TTL]
+    if stale:
+        structures = await asyncio.gather(*(fetch_exchange_fee_structure(venue.capitalize()) for venue in stale))
+        for venue, structure in zip(stale, structures):
+            fee_cache[venue] = (float(structure["taker"]), now)
+    return {venue: fee_cache[venue][0] for venue in venues}
 
-        # Calculate a score based on price, volume, and ESG
-        score = price * volume * (1 + (esg_score - 0.5) * ESG_EXCHANGE_IMPACT)
+def live_books(symbol, venues=EXCHANGES):
+    '''Synced, fresh per-venue books for ``symbol`` from the local L2 book store (feeds start on first use).'''
+    books = {}
+    now = time.time()
+    for venue in venues:
+        book = ensure_feed(book_id(venue, symbol))
+        if book.synced and now - book.updated_at <= BOOK_STALE_SECONDS:
+            books[venue] = book
+    return books
 
-        if score > best_score:
-            best_score = score
-            best_exchange = exchange
+async def plan_order(order_details, venues=EXCHANGES):
+    '''Child orders for one parent order: {"asset", "side", "quantity"} -> (children, unfilled).'''
+    books = live_books(order_details["asset"], venues)
+    fees = await fetch_venue_fees(list(books))
+    quotes = [(venue, book, fees[venue], measured_latency(venue, DEFAULT_VENUE_LATENCY_MS / 1000) * 1000) for venue, book in books.items()]
+    with routing_decision_seconds.time():
+        children, unfilled = compute_split(order_details["side"], float(order_details["quantity"]), quotes)
+    for child in children:
+        child["asset"] = order_details["asset"]
+    return children, unfilled
 
-    if best_exchange:
+async def select_best_exchange(order_details):
+    '''Selects the venue that takes the largest share of the cost-minimizing split.'''
+    children, _ = await plan_order(order_details)
+    if children:
+        best_exchange = children[0]["venue"]
         exchange_selection.set(EXCHANGES.index(best_exchange))
         logger.info(json.dumps({"module": "Smart Order Router", "action": "Select Exchange", "status": "Success", "exchange": best_exchange}))
         return best_exchange
@@ -93,27 +167,51 @@ async def select_best_exchange(order_details):
         return None
 
 async def route_order(order_details):
-    '''Routes the order to the selected exchange.'''
+    '''Splits the order across venues; returns the child orders (empty list when nothing can be routed).'''
     try:
-        exchange = await select_best_exchange(order_details)
-        if not exchange:
+        children, unfilled = await plan_order(order_details)
+        if not children:
             logger.error("No suitable exchange found to route order")
-            global routing_errors_total
-            routing_errors_total = Counter('api_routing_errors_total', 'Total number of API routing errors', ['exchange', 'error_type'])
             routing_errors_total.labels(exchange="All", error_type="NoExchange").inc()
-            return False
+            return []
 
-        # Placeholder for order routing logic (replace with actual API call)
-        logger.info(json.dumps({"module": "Smart Order Router", "action": "Route Order", "status": "Routing", "exchange": exchange, "order_details": order_details}))
-        global orders_routed_total
-        orders_routed_total.labels(exchange=exchange).inc()
-        return True
+        # Placeholder for order placement (children go to the venue adapters as IOC limit orders)
+        logger.info(json.dumps({"module": "Smart Order Router", "action": "Route Order", "status": "Routing", "order_details": order_details, "children": children, "unfilled": unfilled}))
+        for child in children:
+            orders_routed_total.labels(exchange=child["venue"]).inc()
+        return children
     except Exception as e:
-        global routing_errors_total
-        routing_errors_total = Counter('api_routing_errors_total', 'Total number of API routing errors', ['exchange', 'error_type'])
         routing_errors_total.labels(exchange="All", error_type="Routing").inc()
         logger.error(json.dumps({"module": "Smart Order Router", "action": "Route Order", "status": "Exception", "error": str(e)}))
-        return False
+        return []
+
+def synthetic_book(name, mid, levels, tick, rng):
+    book = OrderBook(name)
+    book.apply_snapshot([[mid - tick * (n + 1), rng.uniform(0.05, 3)] for n in range(levels)],
+                        [[mid + tick * (n + 1), rng.uniform(0.05, 3)] for n in range(levels)], 1)
+    return book
+
+def benchmark(venues: int = 5, levels: int = 1000, orders: int = 20000, seed: int = 7) -> dict:
+    '''Routes random parent orders over synthetic venue books; returns decision latency percentiles in microseconds.'''
+    rng = random.Random(seed)
+    quotes = [(f"venue{n}", synthetic_book(f"venue{n}", 30000 + rng.uniform(-5, 5), levels, 0.5, rng),
+               rng.choice([0.0002, 0.0005, 0.001]), rng.uniform(5, 80)) for n in range(venues)]
+    timings = []
+    for _ in range(orders):
+        side = "BUY" if rng.random() < 0.5 else "SELL"
+        quantity = rng.lognormvariate(0, 1.5)
+        started = time.perf_counter()
+        compute_split(side, quantity, quotes)
+        timings.append(time.perf_counter() - started)
+    timings.sort()
+    return {
+        "venues": venues,
+        "levels": levels,
+        "orders": orders,
+        "p50_us": round(timings[len(timings) // 2] * 1e6, 2),
+        "p99_us": round(timings[int(len(timings) * 0.99)] * 1e6, 2),
+        "max_us": round(timings[-1] * 1e6, 2),
+    }
 
 async def smart_order_router_loop():
     '''Main loop for the smart order router module.'''
@@ -140,14 +238,17 @@ if __name__ == "__main__":
     # Example of activating chaos testing
     # asyncio.run(simulate_exchange_api_failure()) # Simulate API failure
 
-    import aiohttp
-    asyncio.run(main())
+    import sys
+    if sys.argv[1:] == ["benchmark"]:
+        logger.info(json.dumps({"module": "Smart Order Router", "action": "Benchmark", **benchmark()}))
+    else:
+        asyncio.run(main())
 
 """
 ✅ Implemented Features:
-  - Fetches exchange-specific data from Redis (simulated).
-  - Selects the best exchange for order routing based on price, volume, and ESG score.
-  - Routes orders to the selected exchange (simulated).
+  - Splits parent orders across venues from live L2 books, taker fee tiers and measured venue latency.
+  - Returns IOC child orders with limit, expected average price and fee (placement simulated).
+  - Sub-millisecond split decisions; benchmark over synthetic books.
   - Implemented structured JSON logging.
   - Implemented basic error handling.
   - Implemented Prometheus metrics (placeholders).
@@ -158,7 +259,8 @@ if __name__ == "__main__":
   - Integration with a central dashboard for monitoring (Real-Time Dashboard Integration).
   - Dynamic adjustment of routing parameters (Dynamic Configuration Engine).
   - Integration with a real-time risk assessment module (Risk Manager).
-  - Integration with a real ESG scoring system (ESG Compliance Module).
+  - Integration with a real ESG scoring system (ESG Compliance Module); venue ESG weighting is not part of the cost model.
+  - Maker / passive child orders (Fee Optimization Engine).
 
 ❌ Excluded Features (with explicit justification):
   - Manual override of order routing: Excluded for ensuring automated routing.
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -41,7 +41,7 @@ titan_stability_score = Gauge('titan_stability_score', 'System stability score b
 async def fetch_data():
     '''Fetches ATR values, order book wall consistency, spread width, slippage pressure, depth imbalance volatility, and API latency jitter from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         atr_1m = await redis.get(f"titan:prod::atr_1m:{SYMBOL}")
         atr_5m = await redis.get(f"titan:prod::atr_5m:{SYMBOL}")
         atr_15m = await redis.get(f"titan:prod::atr_15m:{SYMBOL}")
@@ -87,7 +87,7 @@ async def calculate_stability_score(data):
 async def publish_stability_score(score):
     '''Publishes the stability score to Redis with a TTL.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         await redis.setex(f"titan:volatility:stability_score:{SYMBOL}", STABILITY_SCORE_EXPIRY, str(score))  # TTL set to SIGNAL_EXPIRY
         logger.info(json.dumps({"module": "Stability Scorer", "action": "Publish Score", "status": "Success", "score": score}))
     except Exception as e:
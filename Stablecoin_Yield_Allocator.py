@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -43,7 +43,7 @@ yield_allocation_latency_seconds = Histogram('yield_allocation_latency_seconds',
 async def fetch_idle_balance():
     '''Fetches idle USDT/USDC balance from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         usdt_balance = await redis.get("titan:wallet:USDT") # Example key
         usdc_balance = await redis.get(f"titan:wallet:USDC") # Example key
 
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -41,7 +41,7 @@ stop_hunt_strategy_profit = Gauge('stop_hunt_strategy_profit', 'Profit generated
 async def fetch_data():
     '''Fetches depth snapshots, candle patterns, and sudden volume data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         depth_snapshots = await redis.get(f"titan:prod::depth_snapshots:{SYMBOL}")
         candle_patterns = await redis.get(f"titan:prod::candle_patterns:{SYMBOL}")
         sudden_volume = await redis.get(f"titan:prod::sudden_volume:{SYMBOL}")
@@ -88,7 +88,7 @@ async def generate_signal(data):
 async def publish_signal(signal):
     '''Publishes the trading signal to Redis with a TTL.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         await redis.setex(f"titan:prod::signal:{SYMBOL}", SIGNAL_EXPIRY, json.dumps(signal))  # TTL set to SIGNAL_EXPIRY
         logger.info(json.dumps({"module": "Stop Hunt Engine", "action": "Publish Signal", "status": "Success", "signal": signal}))
     except Exception as e:
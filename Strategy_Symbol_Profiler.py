@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -42,7 +42,7 @@ strategy_symbol_score = Gauge('strategy_symbol_score', 'Score for each strategy
 async def fetch_trade_data(symbol, strategy):
     '''Fetches trade data for a given symbol and strategy from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         trade_data = await redis.get(f"titan:prod::trade_outcome:{symbol}:{strategy}")
         if trade_data:
             return json.loads(trade_data)
@@ -77,7 +77,7 @@ async def calculate_strategy_score(symbol, strategy, trade_data):
 async def publish_strategy_score(symbol, strategy, score):
     '''Publishes the strategy score to Redis with a TTL.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         await redis.setex(f"titan:strategy:score:{symbol}:{strategy}", SIGNAL_EXPIRY, str(score))  # TTL set to SIGNAL_EXPIRY
         strategy_symbol_score.labels(symbol=symbol, strategy=strategy).set(score)
         logger.info(json.dumps({"module": "Strategy Symbol Profiler", "action": "Publish Score", "status": "Success", "symbol": symbol, "strategy": strategy, "score": score}))
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -43,7 +43,7 @@ symbol_capital_weight = Gauge('symbol_capital_weight', 'Capital weight for each
 async def fetch_symbol_performance(symbol):
     '''Fetches the number of wins for a given symbol in the last 3 days from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         wins = await redis.get(f"titan:performance:{symbol}:wins")
 
         if wins:
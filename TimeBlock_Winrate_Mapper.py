@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -42,7 +42,7 @@ time_window_winrate = Gauge('time_window_winrate', 'Win rate for each time windo
 async def fetch_trade_history():
     '''Fetches trade history data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         trade_history = []
         now = datetime.datetime.now()
         for i in range(720): # Check for trades in the last 24 hours (720 2-minute windows)
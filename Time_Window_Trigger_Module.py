@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -62,7 +62,7 @@ async def is_time_within_window(window_name):
 async def fetch_volatility():
     '''Fetches volatility data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         volatility = await redis.get("titan:prod::volatility:BTCUSDT")
         if volatility:
             return float(volatility)
@@ -97,7 +97,7 @@ async def generate_signal():
 async def publish_signal(signal):
     '''Publishes the trading signal to Redis with a TTL.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         await redis.setex(f"titan:prod::signal:BTCUSDT", SIGNAL_EXPIRY, json.dumps(signal))  # TTL set to SIGNAL_EXPIRY
         logger.info(json.dumps({"module": "Time Window Trigger Module", "action": "Publish Signal", "status": "Success", "signal": signal}))
     except Exception as e:
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis, fetch_state
 import json
 import logging
 import os
@@ -30,6 +30,12 @@ logger = logging.getLogger(__name__)
 REDIS_HOST = os.environ.get("REDIS_HOST", "localhost")
 REDIS_PORT = os.environ.get("REDIS_PORT", 6379)
 SYMBOL = "BTCUSDT"  # Example symbol
+GLOBAL_STATE_KEYS = {
+    "chaos_state": "titan:chaos:state",
+    "market_regime": "titan:macro::market_regime",
+    "volatility": "titan:prod::volatility:BTCUSDT",
+    "pnl_curve": "titan:prod::pnl_curve",
+}
 
 # Prometheus metrics (example)
 modules_activated_total = Counter('modules_activated_total', 'Total number of modules activated')
@@ -41,11 +47,12 @@ orchestration_latency_seconds = Histogram('orchestration_latency_seconds', 'Late
 async def fetch_global_state():
     '''Fetches global market regime, chaos/circuit flags, volatility, and PnL curves from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
-        chaos_state = await redis.get("titan:chaos:state")
-        market_regime = await redis.get("titan:macro::market_regime")
-        volatility = await redis.get("titan:prod::volatility:BTCUSDT")
-        pnl_curve = await redis.get("titan:prod::pnl_curve")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        state = await fetch_state(redis, GLOBAL_STATE_KEYS)  # One round trip for the whole cycle
+        chaos_state = state["chaos_state"]
+        market_regime = state["market_regime"]
+        volatility = state["volatility"]
+        pnl_curve = state["pnl_curve"]
 
         if chaos_state and market_regime and volatility and pnl_curve:
             return {"chaos_state": (chaos_state == "TRUE"), "market_regime": market_regime, "volatility": float(volatility), "pnl_curve": json.loads(pnl_curve)}
@@ -96,7 +103,7 @@ async def apply_module_status(module_status):
         return False
 
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         for module, status in module_status.items():
             await redis.set(f"titan:orchestrator:run:{module}", status) # Set flag per module
             logger.info(json.dumps({"module": "Titan Orchestrator", "action": "Apply Module Status", "status": "Applied", "module": module, "status": status}))
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -40,7 +40,7 @@ context_engine_latency_seconds = Histogram('context_engine_latency_seconds', 'La
 async def fetch_recent_trades():
     '''Fetches the last few trade outcomes from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         trade_history = []
         for i in range(CONTEXT_WINDOW_SIZE):
             trade_data = await redis.get(f"titan:prod::trade_history:{SYMBOL}:{i}")
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -41,7 +41,7 @@ signal_entropy = Gauge('signal_entropy', 'Entropy score for each signal')
 async def fetch_signal_data(signal):
     '''Fetches trend decisiveness, depth movement, and input cleanliness data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         trend_decisiveness = await redis.get(f"titan:prod::trend_decisiveness:{SYMBOL}")
         depth_movement = await redis.get(f"titan:prod::depth_movement:{SYMBOL}")
         input_cleanliness = await redis.get(f"titan:prod::input_cleanliness:{SYMBOL}")
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -42,7 +42,7 @@ re_entry_profit = Gauge('re_entry_profit', 'Profit from re-entries')
 async def check_fast_tp(signal_id):
     '''Checks if the trade had a fast TP from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         time_to_tp = await redis.get(f"titan:trade:{signal_id}:time_to_tp")
 
         if time_to_tp:
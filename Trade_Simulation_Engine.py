@@ -17,7 +17,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -48,7 +48,7 @@ simulated_profit = Gauge('simulated_profit', 'Simulated profit from trade simula
 async def fetch_simulation_data():
     '''Fetches simulation data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         simulation_data = await redis.get(f"titan:prod::{scenario}_simulation_data")  # Standardized key
         if simulation_data:
             return json.loads(simulation_data)
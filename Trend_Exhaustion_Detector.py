@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -42,7 +42,7 @@ exhaustion_strategy_profit = Gauge('exhaustion_strategy_profit', 'Profit generat
 async def fetch_data():
     '''Fetches volume flow, RSI/ATR, and momentum score decay data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         volume_flow = await redis.get(f"titan:prod::volume_flow:{SYMBOL}")
         rsi = await redis.get(f"titan:prod::rsi:{SYMBOL}")
         atr = await redis.get(f"titan:prod::atr:{SYMBOL}")
@@ -91,7 +91,7 @@ async def generate_signal(data):
 async def publish_signal(signal):
     '''Publishes the trading signal to Redis with a TTL.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         await redis.setex(f"titan:prod::signal:{SYMBOL}", SIGNAL_EXPIRY, json.dumps(signal))  # TTL set to SIGNAL_EXPIRY
         logger.info(json.dumps({"module": "Trend Exhaustion Detector", "action": "Publish Signal", "status": "Success", "signal": signal}))
     except Exception as e:
@@ -1,7 +1,7 @@
 '''
 Module: Triangular Micro Arb Engine
-Version: 1.0.0
-Last Updated: 2025-03-28
+Version: 1.1.0
+Last Updated: 2026-10-16
 Purpose: Capture triangular arbitrage when spreads exceed fees.
 Core Objectives:
   - Explicit profitability and risk targets alignment: Ensure triangular arbitrage maximizes profit and minimizes risk.
@@ -10,17 +10,25 @@ Core Objectives:
   - Explicit 10/10 quality rating definition adherence: Code must meet all quality criteria, including modularity, error handling, metrics, logging, and testing.
 Summary of Enhancements:
   - Initial version.
+  - Currency graph over every listed pair with -log(rate after fees) edge weights. Triangles are indexed by
+    edge, so a book update re-checks only the cycles through that pair; a periodic sweep finds every longer
+    profitable cycle through the pairs that moved. Opportunities carry the executable size from walking each
+    leg's book levels, fees netted per level.
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
+import math
 import os
 from prometheus_client import Counter, Gauge, Histogram
 import random  # For chaos testing
 import time
-import aiohttp
+
+from Data_Normalization_Module import QUOTE_ASSETS
+from Order_Book_Engine import BOOK_DIFF_CHANNEL, get_book, handle_book_message
+from pubsub_dispatcher import PubSubDispatcher, decode_json
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(module)s - %(message)s')
@@ -29,77 +37,354 @@ logger = logging.getLogger(__name__)
 # Constants
 REDIS_HOST = os.environ.get("REDIS_HOST", "localhost")
 REDIS_PORT = os.environ.get("REDIS_PORT", 6379)
-SYMBOL = "BTCUSDT"  # Example symbol
-ARB_SPREAD_THRESHOLD = 0.002 # Arbitrage spread threshold (0.2%)
+ARB_VENUE = os.environ.get("ARB_VENUE", "binance")  # Gateway venue whose books feed the graph
+ARB_PAIRS = [pair for pair in os.environ.get("ARB_PAIRS", "BTCUSDT,ETHUSDT,ETHBTC,BNBUSDT,BNBBTC,BNBETH,SOLUSDT,SOLBTC,SOLETH").split(",") if pair]
+ARB_TAKER_FEE = float(os.environ.get("ARB_TAKER_FEE", 0.001))  # Per leg
+ARB_SPREAD_THRESHOLD = float(os.environ.get("ARB_SPREAD_THRESHOLD", 0.0005))  # Minimum net cycle return after fees
+ARB_OPPORTUNITY_CHANNEL = os.environ.get("ARB_OPPORTUNITY_CHANNEL", "titan:prod:triangular_arb_opportunities")
+ARB_SWEEP_INTERVAL = float(os.environ.get("ARB_SWEEP_INTERVAL", 5))  # Seconds between longer-cycle sweeps
+ARB_MAX_CYCLE_LENGTH = int(os.environ.get("ARB_MAX_CYCLE_LENGTH", 4))  # Legs in the longest cycle the sweep looks for
+ARB_BOOK_DEPTH = int(os.environ.get("ARB_BOOK_DEPTH", 10))  # Levels per side used for executable size
 MICRO_TRADE_CAPITAL = 10 # Capital for micro-trades
 
 # Prometheus metrics (example)
 triangular_arbs_executed_total = Counter('triangular_arbs_executed_total', 'Total number of triangular arbitrage trades executed')
 micro_arb_engine_errors_total = Counter('micro_arb_engine_errors_total', 'Total number of micro arb engine errors', ['error_type'])
 arb_execution_latency_seconds = Histogram('arb_execution_latency_seconds', 'Latency of arbitrage execution')
+arb_decision_latency_seconds = Histogram('arb_decision_latency_seconds', 'Book update to arbitrage decision', buckets=(0.00001, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.005))
 arb_profit = Gauge('arb_profit', 'Profit from triangular arbitrage')
 
-async def fetch_triangular_spreads():
-    '''Scans BTC <-> ETH <-> ALT cycles for pricing drift.'''
-    try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
-        btc_eth_spread = await redis.get("titan:spread:BTCETH")
-        eth_alt_spread = await redis.get("titan:spread:ETHALT")
-        alt_btc_spread = await redis.get("titan:spread:ALTBTC")
+def split_symbol(symbol):
+    '''BTCUSDT -> ("BTC", "USDT") using the known quote assets; None when no quote matches.'''
+    for quote in QUOTE_ASSETS:
+        if symbol.endswith(quote) and len(symbol) > len(quote):
+            return symbol[:-len(quote)], quote
+    return None
 
-        if btc_eth_spread and eth_alt_spread and alt_btc_spread:
-            return {"btc_eth_spread": float(btc_eth_spread), "eth_alt_spread": float(eth_alt_spread), "alt_btc_spread": float(alt_btc_spread)}
-        else:
-            logger.warning(json.dumps({"module": "Triangular Micro Arb Engine", "action": "Fetch Triangular Spreads", "status": "No Data"}))
-            return None
-    except Exception as e:
-        logger.error(json.dumps({"module": "Triangular Micro Arb Engine", "action": "Fetch Triangular Spreads", "status": "Failed", "error": str(e)}))
-        return None
-
-async def execute_triangular_arb(spreads):
-    '''Fires small capital arb trades when spread > 0.2%'''
-    if not spreads:
-        return False
-
-    try:
-        # Placeholder for arbitrage execution logic (replace with actual execution)
-        btc_eth_spread = spreads["btc_eth_spread"]
-        eth_alt_spread = spreads["eth_alt_spread"]
-        alt_btc_spread = spreads["alt_btc_spread"]
-
-        arb_opportunity = btc_eth_spread + eth_alt_spread + alt_btc_spread
-        if arb_opportunity > ARB_SPREAD_THRESHOLD:
-            logger.info(json.dumps({"module": "Triangular Micro Arb Engine", "action": "Execute Triangular Arb", "status": "Executed", "arb_opportunity": arb_opportunity}))
-            global triangular_arbs_executed_total
-            triangular_arbs_executed_total.inc()
-            global arb_profit
-            arb_profit.set(arb_opportunity)
-            return True
+class ArbitrageGraph:
+    '''
+    Directed currency graph with one edge per tradable direction of each pair.
+
+    Selling BASE for QUOTE at a bid level has rate bid * (1 - fee); buying
+    BASE with QUOTE at an ask level has rate (1 - fee) / ask.  Edge weight is
+    -log(rate) at the best level, so a cycle is profitable exactly when its
+    weights sum below zero.  Every triangle is enumerated once at build time
+    and indexed by pair, so ``update`` re-checks only the triangles through
+    the pair that moved; ``find_negative_cycles`` covers longer cycles.
+    '''
+
+    def __init__(self, pairs, fee=ARB_TAKER_FEE, threshold=ARB_SPREAD_THRESHOLD):
+        self.fee = fee
+        self.fee_log = math.log(1 - fee)
+        self.threshold = threshold
+        self.threshold_log = math.log(1 + threshold)
+        self.pairs = {}
+        self.currencies = set()
+        # Edge arrays, indexed by edge id
+        self.edge_from, self.edge_to, self.edge_symbol, self.edge_sells_base = [], [], [], []
+        self.weight, self.price = [], []
+        self.levels = []  # Per edge: [(rate after fee, capacity in the edge's "from" currency, price), ...], best first
+        self.edge_index = {}
+        self.out_edges = {}  # currency -> [(target, edge), ...]
+        for symbol in pairs:
+            assets = split_symbol(symbol)
+            if assets is None or symbol in self.pairs or assets in self.edge_index:
+                continue
+            base, quote = assets
+            self.pairs[symbol] = (self._add_edge(base, quote, symbol, True), self._add_edge(quote, base, symbol, False))
+            self.currencies.update(assets)
+        self.cycles = []
+        self.pair_cycles = {symbol: [] for symbol in self.pairs}
+        self._enumerate_triangles()
+        self.active = {}  # cycle id -> (weight sum, start amount) last reported
+        self.dirty = set()  # Pairs updated since the last longer-cycle sweep
+
+    def _add_edge(self, source, target, symbol, sells_base):
+        edge = len(self.edge_from)
+        self.edge_from.append(source)
+        self.edge_to.append(target)
+        self.edge_symbol.append(symbol)
+        self.edge_sells_base.append(sells_base)
+        self.weight.append(math.inf)  # No quote yet: never part of a profitable cycle
+        self.price.append(0.0)
+        self.levels.append([])
+        self.edge_index[(source, target)] = edge
+        self.out_edges.setdefault(source, []).append((target, edge))
+        return edge
+
+    def _enumerate_triangles(self):
+        neighbours = {}
+        for source, target in self.edge_index:
+            neighbours.setdefault(source, set()).add(target)
+        for a in sorted(self.currencies):
+            for b in neighbours.get(a, ()):
+                if b <= a:
+                    continue
+                for c in neighbours.get(b, ()):
+                    if c <= a or c == b or a not in neighbours.get(c, ()):
+                        continue
+                    # a < b and a < c: each directed triangle is produced once
+                    edges = (self.edge_index[(a, b)], self.edge_index[(b, c)], self.edge_index[(c, a)])
+                    cycle = len(self.cycles)
+                    self.cycles.append(edges)
+                    for symbol in {self.edge_symbol[edge] for edge in edges}:
+                        self.pair_cycles[symbol].append(cycle)
+
+    def set_book(self, symbol, bids, asks):
+        '''Refreshes both edges of ``symbol`` from its [[price, size], ...] bid and ask levels, best first.'''
+        sell_edge, buy_edge = self.pairs[symbol]
+        keep = 1 - self.fee
+        self._set_levels(sell_edge, [(price * keep, size, price) for price, size in bids if price and size])  # Capacity in base units
+        self._set_levels(buy_edge, [(keep / price, size * price, price) for price, size in asks if price and size])  # Capacity in quote units
+        self.dirty.add(symbol)
+
+    def _set_levels(self, edge, levels):
+        self.levels[edge] = levels
+        if levels:
+            self.weight[edge] = -math.log(levels[0][0])
+            self.price[edge] = levels[0][2]
         else:
-            logger.debug(json.dumps({"module": "Triangular Micro Arb Engine", "action": "No Arb Opportunity", "status": "Skipped", "arb_opportunity": arb_opportunity}))
-            return False
-    except Exception as e:
-        global micro_arb_engine_errors_total
-        micro_arb_engine_errors_total.labels(error_type="Execution").inc()
-        logger.error(json.dumps({"module": "Triangular Micro Arb Engine", "action": "Execute Triangular Arb", "status": "Exception", "error": str(e)}))
-        return False
+            self.weight[edge] = math.inf
+
+    def update(self, symbol, bids, asks):
+        '''Applies one book change and returns opportunities on the triangles through ``symbol``.'''
+        self.set_book(symbol, bids, asks)
+        weight = self.weight
+        limit = -self.threshold_log
+        opportunities = []
+        for cycle in self.pair_cycles[symbol]:
+            e1, e2, e3 = self.cycles[cycle]
+            total = weight[e1] + weight[e2] + weight[e3]
+            if total < limit:
+                opportunity = self.describe(self.cycles[cycle], total)
+                key = (total, opportunity["max_start_amount"])
+                if self.active.get(cycle) != key:  # Re-emit only when the price or the executable size moved
+                    opportunities.append(opportunity)
+                    self.active[cycle] = key
+            else:
+                self.active.pop(cycle, None)
+        return opportunities
+
+    def size(self, edges):
+        '''
+        Walks every leg's levels together from the start currency while the
+        marginal cycle rate still clears the threshold.
+
+        Returns (start amount, profit in the start currency, deepest level
+        index used per leg).  Each step runs until one leg's current level is
+        used up; that leg then moves to its next level.
+        '''
+        hurdle = 1 + self.threshold
+        books = [self.levels[edge] for edge in edges]
+        position = [0] * len(edges)
+        deepest = [0] * len(edges)
+        remaining = [book[0][1] for book in books]  # "From" currency left at each leg's current level
+        start = profit = 0.0
+        while True:
+            multiplier = 1.0  # Units of the current currency per unit of the start currency
+            step = math.inf
+            exhausted = 0
+            for leg, book in enumerate(books):
+                room = remaining[leg] / multiplier
+                if room < step:
+                    step, exhausted = room, leg
+                multiplier *= book[position[leg]][0]
+            if multiplier < hurdle:
+                break
+            start += step
+            profit += step * (multiplier - 1)
+            carried = step
+            for leg, book in enumerate(books):
+                deepest[leg] = position[leg]
+                remaining[leg] -= carried
+                carried *= book[position[leg]][0]
+            position[exhausted] += 1
+            if position[exhausted] == len(books[exhausted]):
+                break  # Out of visible depth on this leg
+            remaining[exhausted] = books[exhausted][position[exhausted]][1]
+        return start, profit, deepest
+
+    def describe(self, edges, total=None):
+        '''Legs, net return at the top of book and the executable start amount and profit from the book levels.'''
+        if total is None:
+            total = sum(self.weight[edge] for edge in edges)
+        start_size, profit, deepest = self.size(edges)
+        legs = []
+        for leg, edge in enumerate(edges):
+            legs.append({"symbol": self.edge_symbol[edge], "side": "SELL" if self.edge_sells_base[edge] else "BUY",
+                         "from": self.edge_from[edge], "to": self.edge_to[edge], "price": self.price[edge],
+                         "limit_price": self.levels[edge][deepest[leg]][2]})
+        return {
+            "cycle": [self.edge_from[edge] for edge in edges] + [self.edge_from[edges[0]]],
+            "legs": legs,
+            "net_return": math.exp(-total) - 1,
+            "start_currency": self.edge_from[edges[0]],
+            "max_start_amount": start_size,
+            "expected_profit": profit,
+        }
+
+    def paths_home(self, home, max_legs):
+        '''back[j][currency]: lowest weight of any route from currency to ``home`` in at most j legs (hop-limited Bellman-Ford).'''
+        back = [{home: 0.0}]
+        for _ in range(max_legs):
+            previous = back[-1]
+            best = dict(previous)
+            for source, targets in self.out_edges.items():
+                for target, edge in targets:
+                    if target in previous:
+                        weight = self.weight[edge] + previous[target]
+                        if weight < best.get(source, math.inf):
+                            best[source] = weight
+            back.append(best)
+        return back
+
+    def cycles_through(self, edge, max_length=ARB_MAX_CYCLE_LENGTH, back=None):
+        '''Every simple cycle of at most ``max_length`` legs that uses ``edge`` and clears the threshold, as edge lists starting with ``edge``.'''
+        if self.weight[edge] == math.inf:
+            return []
+        limit = -self.threshold_log
+        home = self.edge_from[edge]
+        if back is None:
+            back = self.paths_home(home, max_length - 1)
+        found = []
+        path = [edge]
+        visited = {home, self.edge_to[edge]}
+
+        def extend(node, total):
+            legs_left = max_length - len(path)
+            for target, out_edge in self.out_edges.get(node, ()):
+                weight = self.weight[out_edge]
+                if weight == math.inf:
+                    continue
+                if target == home:
+                    if total + weight < limit:
+                        found.append(path + [out_edge])
+                    continue
+                if legs_left < 2 or target in visited or total + weight + back[legs_left - 1].get(target, math.inf) >= limit:
+                    continue  # No route home from target in the legs left can make the cycle profitable
+                path.append(out_edge)
+                visited.add(target)
+                extend(target, total + weight)
+                visited.discard(target)
+                path.pop()
+
+        extend(self.edge_to[edge], self.weight[edge])
+        return found
+
+    def find_negative_cycles(self, symbols=None, min_length=3, max_length=ARB_MAX_CYCLE_LENGTH):
+        '''All distinct profitable cycles of ``min_length`` to ``max_length`` legs through any edge of ``symbols`` (every pair when None).'''
+        cycles = {}
+        routes = {}  # home currency -> paths_home table, shared by every edge leaving it
+        for symbol in self.pairs if symbols is None else symbols:
+            for edge in self.pairs.get(symbol, ()):
+                home = self.edge_from[edge]
+                if home not in routes:
+                    routes[home] = self.paths_home(home, max_length - 1)
+                for cycle in self.cycles_through(edge, max_length, routes[home]):
+                    if len(cycle) < min_length:
+                        continue
+                    first = cycle.index(min(cycle))
+                    cycles.setdefault(tuple(cycle[first:] + cycle[:first]), cycle)  # One entry per rotation
+        return list(cycles.values())
+
+async def publish_opportunities(redis, opportunities):
+    '''Publishes profitable cycles; execution is left to the arb executor subscribing to the channel.'''
+    if not opportunities:
+        return
+    pipe = redis.pipeline(transaction=False)
+    for opportunity in opportunities:
+        pipe.publish(ARB_OPPORTUNITY_CHANNEL, json.dumps(opportunity))
+    await pipe.execute()
+    best = max(opportunities, key=lambda opportunity: opportunity["net_return"])
+    arb_profit.set(best["net_return"])
+    logger.info(json.dumps({"module": "Triangular Micro Arb Engine", "action": "Detect Cycle", "status": "Opportunity", "cycle": best["cycle"], "net_return": best["net_return"], "max_start_amount": best["max_start_amount"]}))
+
+async def handle_book_update(redis, graph, message):
+    '''Applies one gateway book message, then re-checks the triangles through that pair.'''
+    channel = message["channel"].decode() if isinstance(message["channel"], bytes) else message["channel"]
+    symbol = channel.rsplit(":", 1)[1]
+    if symbol not in graph.pairs:
+        return
+    received = time.perf_counter()
+    book = get_book(f"{ARB_VENUE}:{symbol}")
+    await handle_book_message(redis, book, decode_json(message))
+    if not book.synced:
+        graph.set_book(symbol, [], [])
+        return
+    opportunities = graph.update(symbol, book.bids.top(ARB_BOOK_DEPTH), book.asks.top(ARB_BOOK_DEPTH))
+    arb_decision_latency_seconds.observe(time.perf_counter() - received)
+    await publish_opportunities(redis, opportunities)
+
+async def sweep_longer_cycles(redis, graph):
+    '''Periodic sweep for every profitable cycle longer than three legs through the pairs that moved since the last sweep.'''
+    while True:
+        await asyncio.sleep(ARB_SWEEP_INTERVAL)
+        try:
+            symbols, graph.dirty = graph.dirty, set()
+            cycles = graph.find_negative_cycles(symbols, min_length=4)
+            await publish_opportunities(redis, [graph.describe(cycle) for cycle in cycles])
+        except Exception as e:
+            micro_arb_engine_errors_total.labels(error_type="Sweep").inc()
+            logger.error(json.dumps({"module": "Triangular Micro Arb Engine", "action": "Sweep Cycles", "status": "Exception", "error": str(e)}))
+
+def benchmark(currencies: int = 60, pairs: int = 300, updates: int = 50000, depth: int = 5, seed: int = 7) -> dict:
+    '''Random pair graph with consistent prices plus noise; returns per-update decision latency in microseconds.'''
+    rng = random.Random(seed)
+    quotes = list(QUOTE_ASSETS)
+    names = quotes + [f"C{n}X" for n in range(currencies - len(quotes))]
+    value = {name: math.exp(rng.uniform(-3, 3)) for name in names}  # Fair value in a common numeraire
+    listed = [(base, quote) for base in names for quote in quotes if base != quote and (base not in quotes or quotes.index(base) > quotes.index(quote))]
+    symbols = sorted(base + quote for base, quote in rng.sample(listed, min(pairs, len(listed))))
+    graph = ArbitrageGraph(symbols)
+
+    def quote_for(symbol):
+        base, quote = split_symbol(symbol)
+        mid = value[base] / value[quote] * math.exp(rng.gauss(0, 0.001))
+        bids = [[mid * (0.9999 - 0.0001 * level), rng.uniform(0.1, 10)] for level in range(depth)]
+        asks = [[mid * (1.0001 + 0.0001 * level), rng.uniform(0.1, 10)] for level in range(depth)]
+        return bids, asks
+
+    for symbol in graph.pairs:
+        graph.set_book(symbol, *quote_for(symbol))
+    stream = [(symbol, quote_for(symbol)) for symbol in (rng.choice(list(graph.pairs)) for _ in range(updates))]
+
+    timings = []
+    found = 0
+    for symbol, quote in stream:
+        started = time.perf_counter()
+        found += len(graph.update(symbol, *quote))
+        timings.append(time.perf_counter() - started)
+    timings.sort()
+    started = time.perf_counter()
+    longer = len(graph.find_negative_cycles(min_length=4))
+    sweep = time.perf_counter() - started
+    return {
+        "pairs": len(graph.pairs),
+        "triangles": len(graph.cycles),
+        "updates": updates,
+        "opportunities": found,
+        "p50_us": round(timings[len(timings) // 2] * 1e6, 2),
+        "p99_us": round(timings[int(len(timings) * 0.99)] * 1e6, 2),
+        "longer_cycles": longer,
+        "sweep_ms": round(sweep * 1e3, 2),
+    }
 
 async def triangular_micro_arb_loop():
     '''Main loop for the triangular micro arb engine module.'''
-    try:
-        spreads = await fetch_triangular_spreads()
-        if spreads:
-            await execute_triangular_arb(spreads)
-
-        await asyncio.sleep(60)  # Check for new opportunities every 60 seconds
-    except Exception as e:
-        logger.error(json.dumps({"module": "Triangular Micro Arb Engine", "action": "Management Loop", "status": "Exception", "error": str(e)}))
-        await asyncio.sleep(300)  # Wait before retrying
+    redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+    graph = ArbitrageGraph(ARB_PAIRS)
+    logger.info(json.dumps({"module": "Triangular Micro Arb Engine", "action": "Build Graph", "status": "Success", "pairs": len(graph.pairs), "triangles": len(graph.cycles)}))
+    dispatcher = PubSubDispatcher(redis, "triangular_micro_arb", patterns=[BOOK_DIFF_CHANNEL.format(symbol=f"{ARB_VENUE}:*")])
+    dispatcher.add_handler(lambda message: handle_book_update(redis, graph, message), name="handle_book_update")
+    await asyncio.gather(dispatcher.run(), sweep_longer_cycles(redis, graph))
 
 async def main():
     '''Main function to start the triangular micro arb engine module.'''
     await triangular_micro_arb_loop()
 
 if __name__ == "__main__":
-    import aiohttp
-    asyncio.run(main())
\ No newline at end of file
+    import sys
+    if sys.argv[1:] == ["benchmark"]:
+        logger.info(json.dumps({"module": "Triangular Micro Arb Engine", "action": "Benchmark", **benchmark()}))
+    else:
+        asyncio.run(main())
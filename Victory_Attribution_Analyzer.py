@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -40,7 +40,7 @@ attribution_latency_seconds = Histogram('attribution_latency_seconds', 'Latency
 async def fetch_trade_data(trade_id):
     '''Fetches trade data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         trade_data = await redis.get(f"titan:prod::trade_data:{trade_id}")
         if trade_data:
             return json.loads(trade_data)
@@ -76,7 +76,7 @@ async def analyze_winning_trade(trade_data):
 async def store_winning_pattern(signal_hash, winning_pattern):
     '''Stores the winning pattern fingerprint to Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         await redis.setex(f"titan:winning_pattern:{signal_hash}", SIGNAL_EXPIRY, json.dumps(winning_pattern))  # TTL set to SIGNAL_EXPIRY
         global winning_patterns_stored_total
         winning_patterns_stored_total.inc()
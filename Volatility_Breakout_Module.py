@@ -1,7 +1,7 @@
 '''
 Module: Volatility Breakout Module
-Version: 1.0.0
-Last Updated: 2025-03-27
+Version: 1.1.0
+Last Updated: 2026-10-16
 Purpose: Enter positions just before breakout using compression + hidden pressure.
 Core Objectives:
   - Explicit profitability and risk targets alignment: Generate profitable breakout signals while adhering to strict risk limits.
@@ -10,17 +10,20 @@ Core Objectives:
   - Explicit 10/10 quality rating definition adherence: Code must meet all quality criteria, including modularity, error handling, metrics, logging, and testing.
 Summary of Enhancements:
   - Initial version.
+  - Compression (Bollinger width) and relative volume come from in-process streaming indicators fed by
+    closed klines instead of precomputed Redis keys; signals are evaluated per bar.
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
 from prometheus_client import Counter, Gauge, Histogram
 import random  # For chaos testing
 import time
-import aiohttp
+
+from indicators import BarIndicators, follow_klines
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(module)s - %(message)s')
@@ -31,23 +34,28 @@ REDIS_HOST = os.environ.get("REDIS_HOST", "localhost")
 REDIS_PORT = int(os.environ.get("REDIS_PORT", 6379))
 SYMBOL = "BTCUSDT"  # Example symbol
 SIGNAL_EXPIRY = 60  # Signal expiry time in seconds
-VOLATILITY_THRESHOLD = 0.05 # Volatility threshold for breakout
+VOLATILITY_THRESHOLD = 0.05 # Bollinger width (upper - lower) / middle below which the range counts as compressed
+VOLUME_SURGE_MULTIPLIER = 1.5 # Bar volume versus its moving average that counts as pressure
 
 # Prometheus metrics (example)
 breakout_signals_generated_total = Counter('breakout_signals_generated_total', 'Total number of breakout signals generated')
 breakout_trades_executed_total = Counter('breakout_trades_executed_total', 'Total number of breakout trades executed')
 breakout_strategy_profit = Gauge('breakout_strategy_profit', 'Profit generated from breakout strategy')
 
-async def fetch_data():
-    '''Fetches order book imbalance, historical volatility, and volume data from Redis.'''
+# Streaming indicators for SYMBOL, kept current by follow_klines
+indicators = BarIndicators()
+
+async def fetch_data(snapshot):
+    '''Combines order book imbalance from Redis with in-process compression and volume indicators.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        if snapshot["bollinger_width"] is None or not snapshot["volume_sma"]:
+            return None  # Still warming up
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         order_book_imbalance = await redis.get(f"titan:prod::order_book_imbalance:{SYMBOL}")
-        historical_volatility = await redis.get(f"titan:prod::historical_volatility:{SYMBOL}")
-        volume = await redis.get(f"titan:prod::volume:{SYMBOL}")
 
-        if order_book_imbalance and historical_volatility and volume:
-            return {"order_book_imbalance": float(order_book_imbalance), "historical_volatility": float(historical_volatility), "volume": float(volume)}
+        if order_book_imbalance:
+            return {"order_book_imbalance": float(order_book_imbalance), "historical_volatility": snapshot["bollinger_width"],
+                    "relative_volume": snapshot["volume"] / snapshot["volume_sma"]}
         else:
             logger.warning(json.dumps({"module": "Volatility Breakout Module", "action": "Fetch Data", "status": "No Data"}))
             return None
@@ -63,19 +71,16 @@ async def generate_signal(data):
     try:
         order_book_imbalance = data["order_book_imbalance"]
         historical_volatility = data["historical_volatility"]
-        volume = data["volume"]
+        relative_volume = data["relative_volume"]
 
-        # Placeholder for breakout signal logic (replace with actual logic)
-        if historical_volatility < VOLATILITY_THRESHOLD and order_book_imbalance > 0.7 and volume > 1000:
+        if historical_volatility < VOLATILITY_THRESHOLD and order_book_imbalance > 0.7 and relative_volume > VOLUME_SURGE_MULTIPLIER:
             signal = {"symbol": SYMBOL, "side": "LONG", "confidence": 0.75}
             logger.info(json.dumps({"module": "Volatility Breakout Module", "action": "Generate Signal", "status": "Long Breakout", "signal": signal}))
-            global breakout_signals_generated_total
             breakout_signals_generated_total.inc()
             return signal
-        elif historical_volatility < VOLATILITY_THRESHOLD and order_book_imbalance < 0.3 and volume > 1000:
+        elif historical_volatility < VOLATILITY_THRESHOLD and order_book_imbalance < 0.3 and relative_volume > VOLUME_SURGE_MULTIPLIER:
             signal = {"symbol": SYMBOL, "side": "SHORT", "confidence": 0.75}
             logger.info(json.dumps({"module": "Volatility Breakout Module", "action": "Generate Signal", "status": "Short Breakout", "signal": signal}))
-            global breakout_signals_generated_total
             breakout_signals_generated_total.inc()
             return signal
         else:
@@ -88,30 +93,33 @@ async def generate_signal(data):
 async def publish_signal(signal):
     '''Publishes the trading signal to Redis with a TTL.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         await redis.setex(f"titan:prod::signal:{SYMBOL}", SIGNAL_EXPIRY, json.dumps(signal))  # TTL set to SIGNAL_EXPIRY
         logger.info(json.dumps({"module": "Volatility Breakout Module", "action": "Publish Signal", "status": "Success", "signal": signal}))
     except Exception as e:
         logger.error(json.dumps({"module": "Volatility Breakout Module", "action": "Publish Signal", "status": "Exception", "error": str(e)}))
 
+async def on_bar(bar, snapshot):
+    '''Checks for a breakout on every closed bar.'''
+    data = await fetch_data(snapshot)
+    if data:
+        signal = await generate_signal(data)
+        if signal:
+            await publish_signal(signal)
+
 async def volatility_breakout_loop():
     '''Main loop for the volatility breakout module.'''
-    try:
-        data = await fetch_data()
-        if data:
-            signal = await generate_signal(data)
-            if signal:
-                await publish_signal(signal)
-
-        await asyncio.sleep(60)  # Check for breakout opportunities every 60 seconds
-    except Exception as e:
-        logger.error(json.dumps({"module": "Volatility Breakout Module", "action": "Management Loop", "status": "Exception", "error": str(e)}))
-        await asyncio.sleep(300)  # Wait before retrying
+    while True:
+        try:
+            redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+            await follow_klines(redis, SYMBOL, indicators, on_bar)
+        except Exception as e:
+            logger.error(json.dumps({"module": "Volatility Breakout Module", "action": "Management Loop", "status": "Exception", "error": str(e)}))
+            await asyncio.sleep(300)  # Wait before retrying
 
 async def main():
     '''Main function to start the volatility breakout module.'''
     await volatility_breakout_loop()
 
 if __name__ == "__main__":
-    import aiohttp
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main())
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -42,7 +42,7 @@ time_window_score = Gauge('time_window_score', 'Score for each time window', ['t
 async def fetch_historical_data():
     '''Fetches historical trade data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         historical_data = await redis.get(f"titan:historical::trade_data:{SYMBOL}")
 
         if historical_data:
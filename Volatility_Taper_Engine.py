@@ -1,7 +1,7 @@
 '''
 Module: Volatility Taper Engine
-Version: 1.0.0
-Last Updated: 2025-03-27
+Version: 1.1.0
+Last Updated: 2026-10-16
 Purpose: Trigger breakout trades only after confirmed volatility compression over time.
 Core Objectives:
   - Explicit profitability and risk targets alignment: Generate profitable breakout signals while adhering to strict risk limits.
@@ -10,17 +10,21 @@ Core Objectives:
   - Explicit 10/10 quality rating definition adherence: Code must meet all quality criteria, including modularity, error handling, metrics, logging, and testing.
 Summary of Enhancements:
   - Initial version.
+  - ATR history and return volatility come from in-process streaming indicators fed by closed klines instead
+    of per-candle titan:prod::atr:* Redis keys; compression is evaluated per bar.
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
+from collections import deque
 from prometheus_client import Counter, Gauge, Histogram
 import random  # For chaos testing
 import time
-import aiohttp
+
+from indicators import BarIndicators, follow_klines
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(module)s - %(message)s')
@@ -40,36 +44,19 @@ breakout_signals_generated_total = Counter('breakout_signals_generated_total', '
 breakout_trades_executed_total = Counter('breakout_trades_executed_total', 'Total number of volatility taper breakout trades executed')
 breakout_strategy_profit = Gauge('breakout_strategy_profit', 'Profit generated from volatility taper breakout strategy')
 
-async def fetch_atr_data():
-    '''Fetches ATR data from Redis.'''
-    try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
-        atr_values = []
-        for i in range(NUM_CONFIRMATION_CANDLES):
-            atr = await redis.get(f"titan:prod::atr:{SYMBOL}:{i}")
-            if atr:
-                atr_values.append(float(atr))
-            else:
-                logger.warning(json.dumps({"module": "Volatility Taper Engine", "action": "Fetch ATR Data", "status": "No Data", "candle": i}))
-                return None
-        return atr_values
-    except Exception as e:
-        logger.error(json.dumps({"module": "Volatility Taper Engine", "action": "Fetch ATR Data", "status": "Failed", "error": str(e)}))
-        return None
+# Streaming indicators for SYMBOL, kept current by follow_klines
+indicators = BarIndicators(atr=ATR_PERIOD)
+atr_history = deque(maxlen=NUM_CONFIRMATION_CANDLES)  # ATR at the last closed candles, oldest first
 
-async def calculate_atr_compression(atr_values):
-    '''Calculates the ATR compression and standard deviation drop.'''
-    if not atr_values or len(atr_values) < NUM_CONFIRMATION_CANDLES:
-        return None
+async def calculate_atr_compression(atr_values, std_dev):
+    '''Calculates the ATR compression over the confirmation candles.'''
+    if not atr_values or len(atr_values) < NUM_CONFIRMATION_CANDLES or std_dev is None:
+        return None, None
 
     try:
-        # Calculate ATR compression (Placeholder - replace with actual calculation)
         initial_atr = atr_values[0]
         final_atr = atr_values[-1]
         compression = (initial_atr - final_atr) / initial_atr
-
-        # Calculate standard deviation drop (Placeholder - replace with actual calculation)
-        std_dev = random.uniform(0.01, 0.05) # Simulate standard deviation
         return compression, std_dev
     except Exception as e:
         logger.error(json.dumps({"module": "Volatility Taper Engine", "action": "Calculate Compression", "status": "Exception", "error": str(e)}))
@@ -81,11 +68,9 @@ async def generate_signal(compression, std_dev):
         return None
 
     try:
-        # Placeholder for breakout signal logic (replace with actual logic)
         if compression > COMPRESSION_THRESHOLD and std_dev < 0.02:
             signal = {"symbol": SYMBOL, "side": "BREAKOUT", "confidence": 0.7} # Enter breakout trade
             logger.info(json.dumps({"module": "Volatility Taper Engine", "action": "Generate Signal", "status": "Breakout Detected", "signal": signal}))
-            global breakout_signals_generated_total
             breakout_signals_generated_total.inc()
             return signal
         else:
@@ -98,32 +83,36 @@ async def generate_signal(compression, std_dev):
 async def publish_signal(signal):
     '''Publishes the trading signal to Redis with a TTL.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         await redis.setex(f"titan:prod::signal:{SYMBOL}", SIGNAL_EXPIRY, json.dumps(signal))  # TTL set to SIGNAL_EXPIRY
         logger.info(json.dumps({"module": "Volatility Taper Engine", "action": "Publish Signal", "status": "Success", "signal": signal}))
     except Exception as e:
         logger.error(json.dumps({"module": "Volatility Taper Engine", "action": "Publish Signal", "status": "Exception", "error": str(e)}))
 
+async def on_bar(bar, snapshot):
+    '''Records the candle's ATR and checks for confirmed compression.'''
+    if snapshot["atr"] is None:
+        return
+    atr_history.append(snapshot["atr"])
+    compression, std_dev = await calculate_atr_compression(list(atr_history), snapshot["volatility"])
+    if compression:
+        signal = await generate_signal(compression, std_dev)
+        if signal:
+            await publish_signal(signal)
+
 async def volatility_taper_loop():
     '''Main loop for the volatility taper engine module.'''
-    try:
-        atr_values = await fetch_atr_data()
-        if atr_values:
-            compression, std_dev = await calculate_atr_compression(atr_values)
-            if compression:
-                signal = await generate_signal(compression, std_dev)
-                if signal:
-                    await publish_signal(signal)
-
-        await asyncio.sleep(60)  # Check for volatility taper opportunities every 60 seconds
-    except Exception as e:
-        logger.error(json.dumps({"module": "Volatility Taper Engine", "action": "Management Loop", "status": "Exception", "error": str(e)}))
-        await asyncio.sleep(300)  # Wait before retrying
+    while True:
+        try:
+            redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+            await follow_klines(redis, SYMBOL, indicators, on_bar)
+        except Exception as e:
+            logger.error(json.dumps({"module": "Volatility Taper Engine", "action": "Management Loop", "status": "Exception", "error": str(e)}))
+            await asyncio.sleep(300)  # Wait before retrying
 
 async def main():
     '''Main function to start the volatility taper engine module.'''
     await volatility_taper_loop()
 
 if __name__ == "__main__":
-    import aiohttp
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main())
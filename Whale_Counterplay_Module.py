@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -41,7 +41,7 @@ counterplay_strategy_profit = Gauge('counterplay_strategy_profit', 'Profit gener
 async def fetch_whale_data():
     '''Fetches whale behavior data and spoof detection data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         whale_behavior = await redis.get(f"titan:prod::whale_behavior:{SYMBOL}")
         spoof_detection = await redis.get(f"titan:prod::spoof_detection:{SYMBOL}")
 
@@ -86,7 +86,7 @@ async def generate_signal(whale_data):
 async def publish_signal(signal):
     '''Publishes the trading signal to Redis with a TTL.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         await redis.setex(f"titan:prod::signal:{SYMBOL}", SIGNAL_EXPIRY, json.dumps(signal))  # TTL set to SIGNAL_EXPIRY
         logger.info(json.dumps({"module": "Whale Counterplay Module", "action": "Publish Signal", "status": "Success", "signal": signal}))
     except Exception as e:
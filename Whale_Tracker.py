@@ -17,7 +17,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -46,7 +46,7 @@ whale_trade_volume = Gauge('whale_trade_volume', 'Average trade volume of tracke
 async def fetch_trade_data():
     '''Fetches trade data and ESG score from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         trade_data = await redis.get("titan:prod::trade_data")  # Standardized key
         esg_data = await redis.get("titan:prod::esg_data")
 
@@ -15,7 +15,7 @@ import asyncio
 import json
 import logging
 import os
-import aioredis
+from redis_connection_manager import get_async_redis
 
 # Config from config.json or ENV
 CHAOS_THRESHOLD = float(os.getenv("CHAOS_THRESHOLD", 0.3))
@@ -28,7 +28,7 @@ TRADE_TTL_EXTENSION = float(os.getenv("TRADE_TTL_EXTENSION", 1.5))
 # Redis connection
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
 REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
-redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
 
 # Logging setup
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
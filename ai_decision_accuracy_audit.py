@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -39,7 +39,7 @@ audit_latency_seconds = Histogram('audit_latency_seconds', 'Latency of AI decisi
 async def fetch_ai_signals_and_outcomes():
     '''Replay AI signals and their outcomes.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         signals_and_outcomes = []
         for i in range(TRADES_TO_ANALYZE):
             signal_data = await redis.get(f"titan:ai_signal:{i}")
@@ -25,7 +25,7 @@ Dependencies:
 """
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import time
@@ -59,7 +59,7 @@ async def filter_signal(redis, signal):
         return False
 
 async def entropy_discriminator_loop():
-    redis = await aioredis.from_url(REDIS_URL, decode_responses=True)
+    redis = await get_async_redis(REDIS_URL, decode_responses=True)
     pubsub = redis.pubsub()
     await pubsub.psubscribe("titan:signal:raw:*")
     logger.info("🧠 AI Entropy Discriminator active. Listening for raw signals...")
@@ -16,6 +16,7 @@ import json
 import logging
 import os
 import aioredis
+from redis_connection_manager import get_async_redis
 
 # Configuration from config.json or ENV
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
@@ -154,7 +155,7 @@ async def main():
     Main function to orchestrate AI model drift detection.
     """
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
 
         # Fetch AI model outputs, Redis signals, and training data
         ai_model_outputs = await fetch_ai_model_outputs(redis)
@@ -9,7 +9,8 @@ import logging
 import os
 import random
 
-import aioredis
+import aioredis
+from redis_connection_manager import get_async_redis
 
 # Configuration (replace with config.json or ENV vars)
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
@@ -58,7 +59,7 @@ async def main():
     Main function to run AI model health checks periodically.
     """
     try:
-        r = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        r = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         while True:
             await check_ai_model_health(r)
             await asyncio.sleep(HEALTH_CHECK_INTERVAL)  # Run health check every HEALTH_CHECK_INTERVAL seconds
@@ -10,7 +10,8 @@ import os
 import random
 import time
 
-import aioredis
+import aioredis
+from redis_connection_manager import get_async_redis
 
 # Configuration (replace with config.json or ENV vars)
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
@@ -50,7 +51,7 @@ async def main():
     Main function to run AI model performance tracking periodically.
     """
     try:
-        r = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        r = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         while True:
             await track_ai_model_performance(r)
             await asyncio.sleep(TRACKING_INTERVAL)  # Run tracking every TRACKING_INTERVAL seconds
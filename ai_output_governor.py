@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -38,7 +38,7 @@ ai_module_status = Gauge('ai_module_status', 'Status of each AI module', ['modul
 async def fetch_ai_signals(module):
     '''Sits above all AI signal modules to detect low-value or hallucinated AI signals and disable further emission.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         # Placeholder for fetching AI signals logic (replace with actual fetching)
         signals = [{"roi": 0.001, "valid": True}, {"roi": 0.002, "valid": False}, {"roi": 0.01, "valid": True}] # Simulate AI signals
         logger.info(json.dumps({"module": "ai_output_governor", "action": "Fetch AI Signals", "status": "Success", "module": module, "signal_count": len(signals)}))
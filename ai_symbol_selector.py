@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -38,7 +38,7 @@ selected_symbol_winrate = Gauge('selected_symbol_winrate', 'Winrate of selected
 async def fetch_symbol_data():
     '''Selects high-alpha symbols daily based on historical backtest winrate, volatility, and ESG tag.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         # Placeholder for fetching symbol data logic (replace with actual fetching)
         symbol_data = [
             {"symbol": "BTCUSDT", "winrate": 0.6, "volatility": 0.05, "esg": True},
@@ -9,7 +9,8 @@ import logging
 import os
 import random
 
-import aioredis
+import aioredis
+from redis_connection_manager import get_async_redis
 
 # Configuration (replace with config.json or ENV vars)
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
@@ -62,7 +63,7 @@ async def main():
     Main function to run AI training optimization periodically.
     """
     try:
-        r = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        r = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         while True:
             await optimize_ai_training(r)
             await asyncio.sleep(OPTIMIZATION_INTERVAL)  # Run optimization every OPTIMIZATION_INTERVAL seconds
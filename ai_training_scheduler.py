@@ -6,7 +6,7 @@ Purpose: Schedules model retraining.
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -32,7 +32,7 @@ TRAINING_SCHEDULE = config.get("TRAINING_SCHEDULE", "weekly")  # "weekly" or "dr
 async def trigger_model_retraining(model_name):
     '''Triggers model retraining and publishes a message to Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         channel = "titan:ai:training"
         message = json.dumps({"model_name": model_name, "action": "retrain"})
         await redis.publish(channel, message)
@@ -45,7 +45,7 @@ async def trigger_model_retraining(model_name):
 async def check_drift_and_schedule_retraining(model_name):
     '''Checks for model drift and schedules retraining if drift is detected.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         drift_key = f"titan:ai:drift:{model_name}"
         drift = await redis.get(drift_key)
 
@@ -6,11 +6,13 @@ Purpose: Identifies which strategy clusters (e.g. sniper, trend, momentum) are p
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
 import random
+import pnl_ledger
+from capital_allocation_engine import CapitalAllocationEngine, ALLOCATION_RISK_AVERSION
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(module)s - %(message)s')
@@ -26,7 +28,10 @@ except (FileNotFoundError, KeyError, json.JSONDecodeError) as e:
 
 REDIS_HOST = config.get("REDIS_HOST", "localhost")
 REDIS_PORT = config.get("REDIS_PORT", 6379)
-CAPITAL_BOOST_FACTOR = config.get("CAPITAL_BOOST_FACTOR", 1.3)  # Capital boost for top cluster
+CLUSTER_CAPITAL = config.get("CLUSTER_CAPITAL", 100000.0)  # Capital rotated across clusters
+MAX_CLUSTER_WEIGHT = config.get("MAX_CLUSTER_WEIGHT", 0.6)  # No cluster gets more than this fraction
+CLUSTER_RISK_AVERSION = config.get("CLUSTER_RISK_AVERSION", ALLOCATION_RISK_AVERSION)
+CAPITAL_ALLOCATOR_CHANNEL = "titan:prod:capital_allocator:signal"
 
 STRATEGY_CLUSTERS = {
     "momentum": ["momentum_module", "rsi_module"],
@@ -34,41 +39,51 @@ STRATEGY_CLUSTERS = {
     "scalping": ["scalping_module", "range_trading_module"]
 }
 
-async def get_cluster_roi(cluster_name):
-    '''Retrieves the ROI for a given strategy cluster from Redis (placeholder).'''
+# Mean-variance across clusters on their ledger returns; starts from an equal split
+cluster_allocator = CapitalAllocationEngine(STRATEGY_CLUSTERS, method="mean_variance", max_weight=MAX_CLUSTER_WEIGHT, risk_aversion=CLUSTER_RISK_AVERSION)
+cluster_capital = {cluster_name: CLUSTER_CAPITAL / len(STRATEGY_CLUSTERS) for cluster_name in STRATEGY_CLUSTERS}
+
+async def get_cluster_pnl(cluster_name):
+    '''Retrieves the cumulative net PnL of a strategy cluster's modules from the fill ledger.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
-        # Placeholder: Replace with actual logic to fetch ROI data
-        roi = random.uniform(-0.05, 0.15)  # Simulate ROI
-        logger.info(json.dumps({"module": "alpha_cluster_rotator", "action": "get_cluster_roi", "status": "success", "cluster_name": cluster_name, "roi": roi}))
-        return roi
+        state = await pnl_ledger.ready_state()
+        pnl = sum(state.strategy(strategy)["net"] for strategy in STRATEGY_CLUSTERS[cluster_name])
+        logger.info(json.dumps({"module": "alpha_cluster_rotator", "action": "get_cluster_pnl", "status": "success", "cluster_name": cluster_name, "pnl": pnl}))
+        return pnl
     except Exception as e:
-        logger.error(json.dumps({"module": "alpha_cluster_rotator", "action": "get_cluster_roi", "status": "error", "cluster_name": cluster_name, "error": str(e)}))
+        logger.error(json.dumps({"module": "alpha_cluster_rotator", "action": "get_cluster_pnl", "status": "error", "cluster_name": cluster_name, "error": str(e)}))
         return None
 
 async def rotate_capital():
     '''Rotates capital allocation based on cluster performance.'''
     try:
-        cluster_rois = {}
+        cluster_pnl = {}
         for cluster_name in STRATEGY_CLUSTERS:
-            roi = await get_cluster_roi(cluster_name)
-            if roi is not None:
-                cluster_rois[cluster_name] = roi
+            pnl = await get_cluster_pnl(cluster_name)
+            if pnl is not None:
+                cluster_pnl[cluster_name] = pnl
+
+        if not cluster_pnl:
+            logger.warning("No PnL data available for any cluster")
+            return
 
-        if not cluster_rois:
-            logger.warning("No ROI data available for any cluster")
+        # ROI since the previous rotation on the capital each cluster held; the first call only records the baseline
+        cluster_rois = cluster_allocator.observe_pnl(cluster_pnl, cluster_capital)
+        if cluster_rois is None:
+            logger.info(json.dumps({"module": "alpha_cluster_rotator", "action": "rotate_capital", "status": "baseline_recorded"}))
             return
 
-        sorted_clusters = sorted(cluster_rois.items(), key=lambda item: item[1], reverse=True)
-        top_cluster = sorted_clusters[0][0]
-        logger.info(json.dumps({"module": "alpha_cluster_rotator", "action": "rotate_capital", "status": "top_cluster", "top_cluster": top_cluster}))
+        weights = cluster_allocator.solve()
+        top_cluster = max(weights, key=weights.get)
+        cluster_capital.update({cluster_name: weight * CLUSTER_CAPITAL for cluster_name, weight in weights.items()})
+        logger.info(json.dumps({"module": "alpha_cluster_rotator", "action": "rotate_capital", "status": "top_cluster", "top_cluster": top_cluster, "cluster_rois": cluster_rois}))
 
-        # Placeholder: Replace with actual logic to adjust capital allocation
-        # This would involve publishing a message to Capital_Allocator_Module
-        logger.info(f"Boosting capital allocation for {top_cluster} by {CAPITAL_BOOST_FACTOR}x")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        message = {"action": "cluster_rotation", "weights": weights, "cluster_rois": cluster_rois, "strategy": "alpha_cluster_rotator"}
+        await redis.publish(CAPITAL_ALLOCATOR_CHANNEL, json.dumps(message))
 
         # Log the capital rotation event
-        logger.info(json.dumps({"module": "alpha_cluster_rotator", "action": "rotate_capital", "status": "success", "top_cluster": top_cluster, "boost_factor": CAPITAL_BOOST_FACTOR}))
+        logger.info(json.dumps({"module": "alpha_cluster_rotator", "action": "rotate_capital", "status": "success", "top_cluster": top_cluster, "weights": weights}))
 
     except Exception as e:
         logger.error(json.dumps({"module": "alpha_cluster_rotator", "action": "rotate_capital", "status": "error", "error": str(e)}))
@@ -102,7 +117,7 @@ if os.getenv("CHAOS_MODE", "off") == "on":
 # Morphic mode control
 morphic_mode = os.getenv("MORPHIC_MODE", "default")
 if morphic_mode == "aggressive":
-    CAPITAL_BOOST_FACTOR *= 1.1
+    cluster_allocator.risk_aversion /= 1.1
 
 if __name__ == "__main__":
     import os
@@ -110,7 +125,7 @@ if __name__ == "__main__":
     asyncio.run(main())
 
 # === Titan Module Footnotes ===
-# Implemented Features: async safety, cluster ROI tracking, capital rotation, chaos hook, morphic mode control
-# Deferred Features: integration with actual ROI data, dynamic adjustment of boost factor
+# Implemented Features: async safety, cluster ROI tracking from the fill ledger, mean-variance capital rotation (capital_allocation_engine), chaos hook, morphic mode control
+# Deferred Features: cluster membership from the strategy registry
 # Excluded Features: direct capital allocation
 # Quality Rating: 10/10 reviewed by Roo on 2025-03-28
\ No newline at end of file
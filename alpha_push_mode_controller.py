@@ -15,7 +15,8 @@ import asyncio
 import json
 import logging
 import os
-import aioredis
+import aioredis
+from redis_connection_manager import get_async_redis
 import datetime
 
 # Config from config.json or ENV
@@ -29,7 +30,7 @@ FAST_EXIT_STRATEGIES = os.getenv("FAST_EXIT_STRATEGIES", "sniper,momentum,breako
 # Redis connection
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
 REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
-redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
 
 # Logging setup
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -6,7 +6,7 @@ Purpose: Tiered billing for API usage.
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -32,7 +32,7 @@ BILLING_CYCLE = config.get("BILLING_CYCLE", 30)  # Billing cycle in days
 async def log_api_call(user_id, endpoint):
     '''Logs an API call and returns the cost.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         timestamp = datetime.datetime.now().isoformat()
         call_data = {"timestamp": timestamp, "endpoint": endpoint, "cost": API_CALL_COST}
         key = f"titan:api_usage:{user_id}"
@@ -46,7 +46,7 @@ async def log_api_call(user_id, endpoint):
 async def generate_invoice(user_id):
     '''Generates an invoice for API usage.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         key = f"titan:api_usage:{user_id}"
         total_cost = 0
         async for call_json in redis.scan_iter(match=key):
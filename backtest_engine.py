@@ -1,6 +1,6 @@
 # Module: backtest_engine.py
-# Version: 1.0.0
-# Last Updated: 2024-07-24
+# Version: 1.1.0
+# Last Updated: 2026-10-16
 # Purpose: Provides a framework for backtesting trading strategies using historical data.
 
 # Core Objectives:
@@ -14,19 +14,27 @@
 import asyncio
 import json
 import logging
+import math
 import os
-import aioredis
-import datetime
+import time
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from redis_connection_manager import get_async_redis
+from candle_store import load_candles
 
 # Config from config.json or ENV
 HISTORICAL_DATA_SOURCE = os.getenv("HISTORICAL_DATA_SOURCE", "data/historical_data.csv")
 INITIAL_CAPITAL = float(os.getenv("INITIAL_CAPITAL", 10000.0))
 TRADING_FEE = float(os.getenv("TRADING_FEE", 0.001))  # 0.1%
+SLIPPAGE_BPS = float(os.getenv("SLIPPAGE_BPS", 5))  # Adverse slippage applied to every fill, in basis points
+MAX_BAR_PARTICIPATION = float(os.getenv("MAX_BAR_PARTICIPATION", 0.1))  # Largest fraction of a bar's volume one order can fill
+BARS_PER_YEAR = int(os.getenv("BARS_PER_YEAR", 525600))  # 1m bars; used to annualize Sharpe
+BACKTEST_ORDER_QUANTITY = float(os.getenv("BACKTEST_ORDER_QUANTITY", 0.1))
 
 # Redis connection
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
 REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
-redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
 
 # Logging setup
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -34,74 +42,241 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 # Module name
 MODULE_NAME = "backtest_engine"
 
-async def load_historical_data(data_source: str) -> list:
-    """Loads historical market data from a file or API."""
-    # TODO: Implement logic to load historical data
-    # Placeholder: Return a list of historical data points
-    historical_data = [
-        {"timestamp": datetime.datetime(2024, 1, 1, 0, 0, 0), "open": 40000, "high": 41000, "low": 39000, "close": 40500},
-        {"timestamp": datetime.datetime(2024, 1, 1, 0, 1, 0), "open": 40500, "high": 41500, "low": 39500, "close": 41000}
-    ]
-    return historical_data
-
-async def simulate_trade_execution(signal: dict, historical_data: list) -> dict:
-    """Simulates trade execution based on strategy configurations."""
-    # TODO: Implement logic to simulate trade execution
-    # Placeholder: Return a trade execution result
-    trade_result = {
-        "timestamp": datetime.datetime.now(),
-        "symbol": signal["symbol"],
-        "side": signal["side"],
-        "price": historical_data[-1]["close"],
-        "quantity": 0.1,
-        "profit": 50.0
+async def load_historical_data(data_source: str, symbol: str = "BTCUSDT"):
+    """Loads historical candles from the local candle store, ingesting any new rows in data_source first."""
+    return load_candles(symbol, csv_path=data_source)
+
+def as_columns(candles) -> dict:
+    """Accepts a CandleFrame, a dict of arrays or a list of candle dicts; returns float64 column arrays."""
+    if isinstance(candles, list):
+        candles = {column: [candle.get(column, math.nan) for candle in candles] for column in ("open", "high", "low", "close", "volume")}
+    columns = {column: np.asarray(candles[column], dtype=np.float64) for column in ("open", "high", "low", "close")}
+    try:
+        columns["volume"] = np.asarray(candles["volume"], dtype=np.float64)
+    except KeyError:
+        columns["volume"] = np.full(len(columns["close"]), math.nan)
+    return columns
+
+class FillModel:
+    """
+    Fees, slippage and partial fills.
+
+    Orders fill at the reference price moved SLIPPAGE_BPS against the order.
+    A single bar can absorb at most max_participation of its volume; the rest
+    of the order stays working for the next bar.  A bar that traded nothing
+    fills nothing; bars without volume data (NaN) fill in full.
+    """
+
+    def __init__(self, fee_rate: float = TRADING_FEE, slippage_bps: float = SLIPPAGE_BPS,
+                 max_participation: float = MAX_BAR_PARTICIPATION):
+        self.fee_rate = fee_rate
+        self.slippage = slippage_bps / 10000
+        self.max_participation = max_participation
+
+    def fill(self, quantity: float, reference_price: float, bar_volume: float):
+        """Signed order quantity -> (signed filled quantity, fill price, fee)."""
+        size = abs(quantity)
+        if not math.isnan(bar_volume):
+            size = min(size, self.max_participation * max(bar_volume, 0.0))
+        filled = math.copysign(size, quantity)
+        price = reference_price * (1 + math.copysign(self.slippage, quantity))
+        return filled, price, size * price * self.fee_rate
+
+class Strategy:
+    """Event-driven strategy callback interface; subclass and override on_bar."""
+
+    def on_start(self, ctx):
+        pass
+
+    def on_bar(self, ctx):
+        raise NotImplementedError
+
+    def on_fill(self, ctx, quantity: float, price: float, fee: float):
+        pass
+
+class BarContext:
+    """
+    What a strategy sees on bar ``index``.
+
+    history() returns array views ending at the current bar, so looking back
+    never copies and never sees the future.  Orders placed here fill from the
+    next bar's open.
+    """
+
+    def __init__(self, columns: dict):
+        self.columns = columns
+        self.index = -1
+        self.position = 0.0
+        self.cash = 0.0
+        self.pending = 0.0
+
+    def history(self, column: str, lookback: int) -> np.ndarray:
+        return self.columns[column][max(0, self.index - lookback + 1):self.index + 1]
+
+    def price(self, column: str = "close") -> float:
+        return self.columns[column][self.index]
+
+    def order(self, quantity: float):
+        self.pending += quantity
+
+    def order_target(self, target: float):
+        """Replaces any working order with whatever gets the position to ``target``."""
+        self.pending = target - self.position
+
+class BacktestEngine:
+    """Streams bars through a Strategy with per-bar position / cash / equity arrays."""
+
+    def __init__(self, candles, strategy: Strategy, fill_model: FillModel = None, initial_capital: float = INITIAL_CAPITAL):
+        self.columns = as_columns(candles)
+        self.strategy = strategy
+        self.fill_model = fill_model or FillModel()
+        self.initial_capital = initial_capital
+
+    def run(self) -> dict:
+        started = time.perf_counter()
+        open_, close, volume = self.columns["open"], self.columns["close"], self.columns["volume"]
+        bars = len(close)
+        position = np.zeros(bars)
+        cash = np.empty(bars)
+        equity = np.empty(bars)
+        fills = []  # (bar, quantity, price, fee)
+
+        ctx = BarContext(self.columns)
+        ctx.cash = self.initial_capital
+        self.strategy.on_start(ctx)
+        fill = self.fill_model.fill
+        for i in range(bars):
+            ctx.index = i
+            if ctx.pending:
+                quantity, price, fee = fill(ctx.pending, open_[i], volume[i])
+                if quantity:
+                    ctx.position += quantity
+                    ctx.cash -= quantity * price + fee
+                    ctx.pending -= quantity  # Unfilled remainder keeps working
+                    fills.append((i, quantity, price, fee))
+                    self.strategy.on_fill(ctx, quantity, price, fee)
+            self.strategy.on_bar(ctx)
+            position[i] = ctx.position
+            cash[i] = ctx.cash
+            equity[i] = ctx.cash + ctx.position * close[i]
+
+        fill_array = np.array(fills, dtype=np.float64).reshape(-1, 4)
+        return summarize(equity, position, fill_array[:, 3].sum(), len(fills), time.perf_counter() - started, self.initial_capital)
+
+def run_vectorized(candles, target_position, fill_model: FillModel = None, initial_capital: float = INITIAL_CAPITAL) -> dict:
+    """
+    Fast path for signal-array strategies.
+
+    ``target_position[i]`` is the position wanted after bar i closes; it is
+    reached at bar i + 1's open, exactly as in the event-driven engine.
+    Orders fill in full here (partial fills are path dependent, so use
+    BacktestEngine when participation limits matter).
+    """
+    started = time.perf_counter()
+    fill_model = fill_model or FillModel()
+    columns = as_columns(candles)
+    target = np.asarray(target_position, dtype=np.float64)
+    if not len(target):
+        return summarize(np.empty(0), np.empty(0), 0.0, 0, time.perf_counter() - started, initial_capital)
+
+    held = np.empty(len(target))
+    held[0] = 0.0
+    held[1:] = target[:-1]
+    delta = np.diff(held, prepend=0.0)
+    price = columns["open"] * (1 + np.sign(delta) * fill_model.slippage)
+    fees = np.abs(delta) * price * fill_model.fee_rate
+    cash = initial_capital - np.cumsum(delta * price + fees)
+    equity = cash + held * columns["close"]
+    return summarize(equity, held, fees.sum(), int(np.count_nonzero(delta)), time.perf_counter() - started, initial_capital)
+
+def summarize(equity, position, fees_paid: float, trades: int, seconds: float, initial_capital: float) -> dict:
+    """PnL, drawdown, Sharpe and throughput for one run; arrays are kept for callers that want curves."""
+    bars = len(equity)
+    returns = np.diff(equity, prepend=initial_capital) / np.maximum(np.concatenate(([initial_capital], equity[:-1])), 1e-12)
+    volatility = returns.std() if bars else 0.0
+    peak = np.maximum.accumulate(np.concatenate(([initial_capital], equity)))[1:]
+    final = float(equity[-1]) if bars else initial_capital
+    return {
+        "total_profit": final - initial_capital,
+        "return_pct": (final / initial_capital - 1) * 100,
+        "max_drawdown_pct": float(((peak - equity) / peak).max() * 100) if bars else 0.0,
+        "sharpe_ratio": float(returns.mean() / volatility * math.sqrt(BARS_PER_YEAR)) if volatility > 0 else 0.0,
+        "trades": trades,
+        "fees_paid": float(fees_paid),
+        "bars": bars,
+        "bars_per_sec": round(bars / seconds, 1) if seconds > 0 else math.inf,
+        "equity": equity,
+        "position": position,
     }
-    return trade_result
 
-async def calculate_pnl(trades: list) -> float:
-    """Calculates PnL and ROI metrics."""
-    total_profit = sum([trade["profit"] for trade in trades])
-    return total_profit
+def momentum_signals(close, momentum_window: int, overbought_threshold: float, quantity: float = BACKTEST_ORDER_QUANTITY) -> np.ndarray:
+    """
+    Target positions for the sample momentum strategy: long while price is
+    above its level momentum_window bars ago, unless it sits above
+    overbought_threshold of its rolling high-low range.
+    """
+    close = np.asarray(close, dtype=np.float64)
+    target = np.zeros(len(close))
+    if len(close) <= momentum_window:
+        return target
+    windows = sliding_window_view(close, momentum_window + 1)
+    low, high = windows.min(axis=1), windows.max(axis=1)
+    stretch = (close[momentum_window:] - low) / np.where(high > low, high - low, np.inf)
+    rising = close[momentum_window:] > close[:-momentum_window]
+    target[momentum_window:] = np.where(rising & (stretch <= overbought_threshold), quantity, 0.0)
+    return target
+
+class MomentumStrategy(Strategy):
+    """Event-driven twin of momentum_signals; both produce the same positions."""
+
+    def __init__(self, momentum_window: int, overbought_threshold: float, quantity: float = BACKTEST_ORDER_QUANTITY):
+        self.momentum_window = momentum_window
+        self.overbought_threshold = overbought_threshold
+        self.quantity = quantity
+
+    def on_bar(self, ctx):
+        window = ctx.history("close", self.momentum_window + 1)
+        if len(window) <= self.momentum_window:
+            return
+        low, high = window.min(), window.max()
+        stretch = (window[-1] - low) / (high - low) if high > low else 0.0
+        rising = window[-1] > window[0]
+        ctx.order_target(self.quantity if rising and stretch <= self.overbought_threshold else 0.0)
 
 async def main():
     """Main function to run backtests."""
     try:
-        historical_data = await load_historical_data(HISTORICAL_DATA_SOURCE)
-
         # TODO: Implement logic to load trading strategy configurations
         # Placeholder: Create a sample trading strategy
         trading_strategy = {
             "name": "momentum_strategy",
             "symbol": "BTCUSDT",
-            "parameters": {"momentum_window": 10}
+            "parameters": {"momentum_window": 10, "overbought_threshold": 0.8}
         }
 
-        trades = []
-        for i in range(1, len(historical_data)):
-            # TODO: Implement logic to generate trading signals based on the trading strategy
-            # Placeholder: Create a sample trading signal
-            signal = {
-                "timestamp": datetime.datetime.now(),
+        candles = await load_historical_data(HISTORICAL_DATA_SOURCE, trading_strategy["symbol"])
+        if len(candles) == 0:
+            logging.warning(json.dumps({
+                "module": MODULE_NAME,
+                "action": "no_data",
                 "symbol": trading_strategy["symbol"],
-                "side": "buy",
-                "confidence": 0.8,
-                "strategy": trading_strategy["name"]
-            }
-
-            # Simulate trade execution
-            trade_result = await simulate_trade_execution(signal, historical_data[:i])
-            trades.append(trade_result)
+                "message": "No candles in the candle store for this symbol."
+            }))
+            return
 
-        # Calculate PnL
-        total_profit = await calculate_pnl(trades)
+        parameters = trading_strategy["parameters"]
+        event_result = BacktestEngine(candles, MomentumStrategy(**parameters)).run()
+        vector_result = run_vectorized(candles, momentum_signals(candles.close, **parameters))
 
         # Log backtesting results
-        logging.info(json.dumps({
-            "module": MODULE_NAME,
-            "action": "backtest_completed",
-            "strategy": trading_strategy["name"],
-            "total_profit": total_profit
-        }))
+        for mode, result in (("event", event_result), ("vectorized", vector_result)):
+            logging.info(json.dumps({
+                "module": MODULE_NAME,
+                "action": "backtest_completed",
+                "strategy": trading_strategy["name"],
+                "mode": mode,
+                **{key: value for key, value in result.items() if key not in ("equity", "position")}
+            }))
 
     except Exception as e:
         logging.error(json.dumps({
@@ -131,7 +306,7 @@ if __name__ == "__main__":
     asyncio.run(main())
 
 # === Titan Module Footnotes ===
-# Implemented Features: redis-pub, async safety, backtesting framework
-# Deferred Features: ESG logic -> esg_mode.py, historical data loading, strategy configuration
+# Implemented Features: redis-pub, async safety, backtesting framework, candle store loading, event-driven engine with strategy callbacks, fee / slippage / partial-fill model, vectorized signal-array fast path, bars/sec reporting
+# Deferred Features: ESG logic -> esg_mode.py, strategy configuration, tick-level replay
 # Excluded Features: live trading execution (in execution_handler.py)
-# Quality Rating: 10/10 reviewed by [Grok|Gemini|Claude] on [YYYY-MM-DD]
\ No newline at end of file
+# Quality Rating: 10/10 reviewed by [Grok|Gemini|Claude] on [YYYY-MM-DD]
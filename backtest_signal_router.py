@@ -15,7 +15,7 @@ import asyncio
 import json
 import logging
 import os
-import aioredis
+from redis_connection_manager import get_async_redis
 
 # Config from config.json or ENV
 EXECUTION_HANDLER_CHANNEL = os.getenv("EXECUTION_HANDLER_CHANNEL", "titan:prod:execution_handler")
@@ -24,7 +24,7 @@ CONFIDENCE_EVALUATOR_CHANNEL = os.getenv("CONFIDENCE_EVALUATOR_CHANNEL", "titan:
 # Redis connection
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
 REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
-redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
 
 # Logging setup
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -43,7 +43,7 @@ reserve_buffer_level = Gauge('reserve_buffer_level', 'Current level of the reser
 async def fetch_daily_profit():
     '''Fetches the daily profit from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         daily_profit = await redis.get("titan:prod::trade_outcome_recorder:daily_profit") # Example key
         if daily_profit:
             return float(daily_profit)
@@ -60,7 +60,7 @@ async def allocate_to_reserve_buffer(daily_profit):
         return False
 
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         buffer_allocation_percentage = random.uniform(MIN_BUFFER_ALLOCATION, MAX_BUFFER_ALLOCATION)
         buffer_allocation = daily_profit * buffer_allocation_percentage
 
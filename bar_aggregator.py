@@ -0,0 +1,482 @@
+# Module: bar_aggregator.py
+# Version: 1.0.0
+# Last Updated: 2026-10-16
+# Purpose: Trade-to-bar aggregation; builds 1s/1m/5m/15m/1h OHLCV bars from the raw trade stream in one pass with hierarchical roll-up.
+
+# Core Objectives:
+# - Profitability (50–100% daily ROI target)
+# - Risk reduction (50:1 profit:loss ratio)
+# - ESG-safe actions only
+# - Compliance with UAE financial law
+# - Clean async logic and Redis safety
+# - Prometheus metrics (if needed)
+
+import asyncio
+import json
+import logging
+import os
+import time
+import numpy as np
+from prometheus_client import Counter
+from candle_store import CandleFrame, COLUMNS, default_store
+from pubsub_dispatcher import PubSubDispatcher, decode_json
+from Market_Data_Gateway import TRADES_CHANNEL, PRIMARY_BOOK_EXCHANGE
+
+# Config from config.json or ENV
+BAR_INTERVALS = os.getenv("BAR_INTERVALS", "1s,1m,5m,15m,1h")  # Each interval must divide the next
+BAR_GRACE_MS = int(os.getenv("BAR_GRACE_MS", 2000))  # How long a bar stays open for late trades after its end
+BAR_RING_SIZE = int(os.getenv("BAR_RING_SIZE", 1440))  # Finished bars kept in memory per symbol and interval
+BAR_FLUSH_INTERVAL = float(os.getenv("BAR_FLUSH_INTERVAL", 5))  # Seconds between candle-store writes
+BAR_TICK_INTERVAL = float(os.getenv("BAR_TICK_INTERVAL", 0.25))  # Seconds between wall-clock watermark advances
+BAR_EXCHANGE = os.getenv("BAR_EXCHANGE", PRIMARY_BOOK_EXCHANGE)  # Trades from this venue feed the bars
+BARS_CHANNEL = os.getenv("BARS_CHANNEL", "titan:prod:market:bars:{symbol}")
+BAR_PUBLISH = os.getenv("BAR_PUBLISH", "on") == "on"
+SYMBOLS = os.getenv("BAR_SYMBOLS", "BTCUSDT,ETHUSDT")
+
+# Logging setup
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# Module name
+MODULE_NAME = "bar_aggregator"
+
+# Prometheus metrics
+bar_trades_total = Counter('bar_trades_total', 'Trades applied to bars', ['symbol'])
+bar_late_trades_total = Counter('bar_late_trades_total', 'Trades dropped for arriving after their bar closed', ['symbol'])
+bars_finished_total = Counter('bars_finished_total', 'Bars closed', ['interval'])
+
+UNIT_NS = {"s": 1_000_000_000, "m": 60_000_000_000, "h": 3_600_000_000_000, "d": 86_400_000_000_000}
+NEVER = 1 << 62
+
+def interval_ns(interval: str) -> int:
+    """'1s' / '5m' / '1h' / '1d' -> bar length in nanoseconds."""
+    return int(interval[:-1]) * UNIT_NS[interval[-1]]
+
+# A bar under construction is a list [open, high, low, close, volume, first_ts, last_ts, trades];
+# open and close belong to the earliest and latest trade by exchange timestamp, not by arrival.
+
+def _merge(bar: list, part: list):
+    """Folds ``part`` (a trade or a finished child bar) into ``bar``."""
+    if part[1] > bar[1]:
+        bar[1] = part[1]
+    if part[2] < bar[2]:
+        bar[2] = part[2]
+    if part[5] < bar[5]:
+        bar[0] = part[0]
+        bar[5] = part[5]
+    if part[6] >= bar[6]:
+        bar[3] = part[3]
+        bar[6] = part[6]
+    bar[4] += part[4]
+    bar[7] += part[7]
+
+class BarRing:
+    """Fixed-capacity ring of finished bars for one symbol/interval, stored column-wise."""
+
+    def __init__(self, capacity: int = BAR_RING_SIZE):
+        self.capacity = capacity
+        self.timestamp = np.zeros(capacity, dtype=np.int64)
+        self.values = np.zeros((capacity, 5))  # open, high, low, close, volume
+        self.count = 0  # Bars ever appended
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+    def append(self, start: int, bar: list):
+        slot = self.count % self.capacity
+        self.timestamp[slot] = start
+        self.values[slot] = bar[:5]
+        self.count += 1
+
+    def last(self, n: int = None):
+        """(timestamps, values) of the newest ``n`` bars, oldest first, as copies."""
+        n = len(self) if n is None else min(n, len(self))
+        slots = np.arange(self.count - n, self.count) % self.capacity
+        return self.timestamp[slots], self.values[slots]
+
+class _SymbolBars:
+    __slots__ = ("watermark", "current_start", "current", "open", "final_end", "next_sweep")
+
+    def __init__(self, levels: int):
+        self.watermark = 0  # Latest trade time (or wall clock, see BarAggregator.advance) seen, epoch ns
+        self.current_start = None  # Newest open 1s bucket, which almost every trade lands in
+        self.current = None
+        self.open = [{} for _ in range(levels)]  # Per interval: bucket start -> bar under construction
+        self.final_end = [0] * levels  # Per interval: buckets starting before this are closed
+        self.next_sweep = NEVER  # Watermark at which the earliest-closing open bucket (any interval) closes
+
+class BarAggregator:
+    """
+    Builds OHLCV bars at every interval in BAR_INTERVALS from one trade stream.
+
+    Trades only touch the base (1s) bucket; a base bar that closes is rolled
+    into its 1m parent, a closed 1m bar into its 5m parent and so on, so each
+    trade costs O(1) regardless of how many intervals are kept.
+
+    A bucket closes once the watermark -- the latest trade time seen -- passes
+    its end by the grace window, so trades arriving out of order by up to
+    BAR_GRACE_MS still land in the right bar with open and close chosen by
+    timestamp.  Trades for a closed bucket are dropped and counted.  Intervals
+    without trades produce no bar.  Closed bars go to a per-symbol/interval
+    ring for in-process readers and queue up for ``drain`` (publishing and
+    persistence).
+    """
+
+    def __init__(self, intervals=BAR_INTERVALS, grace_ms: int = BAR_GRACE_MS, ring_size: int = BAR_RING_SIZE):
+        self.intervals = [i.strip() for i in intervals.split(",")] if isinstance(intervals, str) else list(intervals)
+        self.lengths = [interval_ns(i) for i in self.intervals]
+        for child, parent in zip(self.lengths, self.lengths[1:]):
+            if parent % child:
+                raise ValueError(f"Bar intervals must each divide the next: {self.intervals}")
+        self.base = self.lengths[0]
+        self.grace = grace_ms * 1_000_000
+        self.ring_size = ring_size
+        self.symbols = {}
+        self.rings = {}
+        self.finished = []  # (symbol, interval, start, bar) awaiting drain()
+        self.late = {}  # symbol -> trades dropped
+
+    def _state(self, symbol: str) -> _SymbolBars:
+        state = self.symbols[symbol] = _SymbolBars(len(self.lengths))
+        for interval in self.intervals:
+            self.rings[(symbol, interval)] = BarRing(self.ring_size)
+        return state
+
+    def add_trade(self, symbol: str, timestamp_ns: int, price: float, quantity: float) -> bool:
+        """Applies one trade; False if it arrived after its bar closed."""
+        state = self.symbols.get(symbol) or self._state(symbol)
+        if timestamp_ns > state.watermark:
+            state.watermark = timestamp_ns
+            if timestamp_ns >= state.next_sweep:
+                self._sweep(symbol, state)
+        start = timestamp_ns - timestamp_ns % self.base
+        if start != state.current_start:
+            return self._place(symbol, state, start, [price, price, price, price, quantity, timestamp_ns, timestamp_ns, 1])
+        bar = state.current
+        if price > bar[1]:
+            bar[1] = price
+        elif price < bar[2]:
+            bar[2] = price
+        if timestamp_ns >= bar[6]:
+            bar[3] = price
+            bar[6] = timestamp_ns
+        elif timestamp_ns < bar[5]:
+            bar[0] = price
+            bar[5] = timestamp_ns
+        bar[4] += quantity
+        bar[7] += 1
+        return True
+
+    def add_trades(self, symbol: str, timestamps, prices, quantities) -> int:
+        """
+        Applies a batch of trades for one symbol with one partial bar per
+        base bucket computed in NumPy; returns how many were applied.
+        The batch is ordered by timestamp first.
+        """
+        timestamps = np.asarray(timestamps, dtype=np.int64)
+        if not len(timestamps):
+            return 0
+        prices = np.asarray(prices, dtype=np.float64)
+        quantities = np.asarray(quantities, dtype=np.float64)
+        if np.any(timestamps[1:] < timestamps[:-1]):
+            order = np.argsort(timestamps, kind="stable")
+            timestamps, prices, quantities = timestamps[order], prices[order], quantities[order]
+        starts = timestamps - timestamps % self.base
+        first = np.concatenate(([0], np.flatnonzero(starts[1:] != starts[:-1]) + 1))
+        last = np.append(first[1:], len(timestamps)) - 1
+        parts = zip(
+            starts[first].tolist(), prices[first].tolist(), np.maximum.reduceat(prices, first).tolist(),
+            np.minimum.reduceat(prices, first).tolist(), prices[last].tolist(), np.add.reduceat(quantities, first).tolist(),
+            timestamps[first].tolist(), timestamps[last].tolist(), (last - first + 1).tolist())
+
+        state = self.symbols.get(symbol) or self._state(symbol)
+        applied = 0
+        for start, open_, high, low, close, volume, first_ts, last_ts, trades in parts:
+            if last_ts > state.watermark:
+                state.watermark = last_ts
+                if last_ts >= state.next_sweep:
+                    self._sweep(symbol, state)
+            if self._place(symbol, state, start, [open_, high, low, close, volume, first_ts, last_ts, trades]):
+                applied += trades
+        return applied
+
+    def _place(self, symbol: str, state: _SymbolBars, start: int, part: list) -> bool:
+        if start < state.final_end[0]:
+            self.late[symbol] = self.late.get(symbol, 0) + part[7]
+            bar_late_trades_total.labels(symbol=symbol).inc(part[7])
+            return False
+        buckets = state.open[0]
+        bar = buckets.get(start)
+        if bar is None:
+            bar = buckets[start] = part
+            state.next_sweep = min(state.next_sweep, start + self.base + self.grace)
+        else:
+            _merge(bar, part)
+        if state.current_start is None or start > state.current_start:
+            state.current_start = start
+            state.current = bar
+        return True
+
+    def _sweep(self, symbol: str, state: _SymbolBars):
+        """Closes every bucket the watermark has passed, finest interval first, rolling each into its parent."""
+        limit = state.watermark - self.grace
+        levels = len(self.lengths)
+        for level, length in enumerate(self.lengths):
+            final_end = limit - limit % length
+            if final_end <= state.final_end[level]:
+                break  # Coarser intervals cannot have closed either
+            state.final_end[level] = final_end
+            buckets = state.open[level]
+            for start in sorted(start for start in buckets if start < final_end):
+                bar = buckets.pop(start)
+                self._finish(symbol, level, start, bar)
+                if level + 1 < levels:
+                    parent_start = start - start % self.lengths[level + 1]
+                    parent = state.open[level + 1].get(parent_start)
+                    if parent is None:
+                        state.open[level + 1][parent_start] = list(bar)
+                    else:
+                        _merge(parent, bar)
+        self._schedule(state)
+        if state.current_start is not None and state.current_start < state.final_end[0]:
+            state.current_start = state.current = None
+
+    def _schedule(self, state: _SymbolBars):
+        """Sets the next sweep to when the earliest-closing open bucket at any interval closes."""
+        state.next_sweep = min((min(buckets) + length + self.grace for buckets, length in zip(state.open, self.lengths) if buckets),
+                               default=NEVER)
+
+    def _finish(self, symbol: str, level: int, start: int, bar: list):
+        interval = self.intervals[level]
+        self.rings[(symbol, interval)].append(start, bar)
+        self.finished.append((symbol, interval, start, bar))
+        bars_finished_total.labels(interval=interval).inc()
+
+    def advance(self, now_ns: int = None):
+        """
+        Moves every symbol's watermark up to ``now_ns`` (default: wall clock) so
+        bars close on time in quiet markets.  Exchange timestamps running more
+        than the grace window behind the local clock would then count as late.
+        """
+        now_ns = time.time_ns() if now_ns is None else now_ns
+        for symbol, state in self.symbols.items():
+            if now_ns > state.watermark:
+                state.watermark = now_ns
+                if now_ns >= state.next_sweep:
+                    self._sweep(symbol, state)
+
+    def drain(self) -> list:
+        """Bars closed since the last call as (symbol, interval, start_ns, bar), in close order."""
+        finished, self.finished = self.finished, []
+        return finished
+
+    def frame(self, symbol: str, interval: str, count: int = None) -> CandleFrame:
+        """The newest ``count`` closed bars (all in the ring by default) as a candle_store.CandleFrame."""
+        ring = self.rings.get((symbol, interval))
+        if ring is None:
+            return CandleFrame(symbol, interval, {column: np.empty(0, dtype=dtype) for column, dtype in COLUMNS.items()})
+        timestamp, values = ring.last(count)
+        columns = {"timestamp": timestamp}
+        for position, column in enumerate(("open", "high", "low", "close", "volume")):
+            columns[column] = values[:, position]
+        return CandleFrame(symbol, interval, columns)
+
+    def latest(self, symbol: str, interval: str):
+        """The newest closed bar as a kline-style dict, or None before the first one."""
+        frame = self.frame(symbol, interval, 1)
+        if not len(frame):
+            return None
+        return {"open_time_ns": int(frame.timestamp[0]), **{column: float(frame[column][0]) for column in ("open", "high", "low", "close", "volume")}}
+
+    def load_history(self, symbol: str, store=default_store):
+        """
+        Fills the rings from the candle store and marks stored bars closed, so a restart neither re-emits nor
+        rewrites them.  A coarser bar that was still open at shutdown is rebuilt from the stored finer bars
+        inside it, so it closes with its true open and full volume (its trade count covers new trades only).
+        """
+        state = self.symbols.get(symbol) or self._state(symbol)
+        finer = None
+        for level, (interval, length) in enumerate(zip(self.intervals, self.lengths)):
+            frame = store.load(symbol, interval)
+            start = max(len(frame) - self.ring_size, 0)
+            ring = self.rings[(symbol, interval)]
+            for row in zip(frame.timestamp[start:].tolist(), frame.open[start:].tolist(), frame.high[start:].tolist(),
+                           frame.low[start:].tolist(), frame.close[start:].tolist(), frame.volume[start:].tolist()):
+                ring.append(row[0], row[1:])
+            if len(frame):
+                state.final_end[level] = max(state.final_end[level], int(frame.timestamp[-1]) + length)
+            if finer is not None and len(finer):
+                self._reopen(state, level, finer)
+            finer = frame
+
+    def _reopen(self, state: _SymbolBars, level: int, finer: CandleFrame):
+        """Rebuilds the open ``level`` bucket holding the newest stored bar one level down, if that bucket is not stored itself."""
+        length, child = self.lengths[level], self.lengths[level - 1]
+        newest = int(finer.timestamp[-1])
+        parent_start = newest - newest % length
+        if parent_start < state.final_end[level] or parent_start in state.open[level]:
+            return
+        rows = np.flatnonzero(finer.timestamp >= parent_start)
+        bar = None
+        for i in rows.tolist():
+            start = int(finer.timestamp[i])
+            part = [float(finer.open[i]), float(finer.high[i]), float(finer.low[i]), float(finer.close[i]), float(finer.volume[i]),
+                    start, start + child - 1, 0]
+            if bar is None:
+                bar = part
+            else:
+                _merge(bar, part)
+        state.open[level][parent_start] = bar
+        state.next_sweep = min(state.next_sweep, parent_start + length + self.grace)
+
+def bar_event(symbol: str, interval: str, start: int, bar: list, exchange: str = BAR_EXCHANGE) -> dict:
+    """A closed bar in the gateway's canonical kline format, plus its trade count."""
+    return {"type": "kline", "exchange": exchange, "symbol": symbol, "interval": interval, "open_time_ns": start,
+            "open": bar[0], "high": bar[1], "low": bar[2], "close": bar[3], "volume": bar[4], "trades": bar[7], "closed": True}
+
+def persist(bars: list, store=default_store) -> int:
+    """Appends drained bars to the candle store, one append per symbol/interval; returns rows written."""
+    grouped = {}
+    for symbol, interval, start, bar in bars:
+        grouped.setdefault((symbol, interval), []).append((start, *bar[:5]))
+    written = 0
+    for (symbol, interval), rows in grouped.items():
+        columns = dict(zip(COLUMNS, map(list, zip(*rows))))
+        written += store.append(symbol, interval, columns)
+    return written
+
+async def run_bar_aggregator(redis, symbols, aggregator: BarAggregator, on_bar=None, store=default_store,
+                             persist_bars: bool = True, publish: bool = BAR_PUBLISH, exchange: str = BAR_EXCHANGE):
+    """
+    Feeds ``aggregator`` from the gateway's trade channels for ``symbols`` (trades from ``exchange`` only)
+    until cancelled.  Rings are first filled from ``store``.  Each closed bar is published to BARS_CHANNEL
+    when ``publish`` is set, passed to ``on_bar(event)`` (sync or async), and, with ``persist_bars``, written
+    to ``store`` every BAR_FLUSH_INTERVAL seconds.  Only the aggregation service should persist; in-process
+    readers pass persist_bars=False and publish=False.
+    """
+    for symbol in symbols:
+        try:
+            aggregator.load_history(symbol, store)
+        except Exception as e:
+            logging.warning(json.dumps({"module": MODULE_NAME, "action": "history_load_failed", "symbol": symbol, "error": str(e)}))
+    pending = []
+
+    async def emit():
+        bars = aggregator.drain()
+        if not bars:
+            return
+        events = [bar_event(symbol, interval, start, bar, exchange) for symbol, interval, start, bar in bars]
+        if publish:
+            pipe = redis.pipeline(transaction=False)
+            for event in events:
+                pipe.publish(BARS_CHANNEL.format(symbol=event["symbol"]), json.dumps(event))
+            await pipe.execute()
+        if on_bar is not None:
+            for event in events:
+                result = on_bar(event)
+                if asyncio.iscoroutine(result):
+                    await result
+        if persist_bars:
+            pending.extend(bars)
+
+    async def ingest(batch):
+        applied = {}
+        for message in batch:
+            trade = decode_json(message)
+            if trade.get("exchange") != exchange:
+                continue
+            symbol = trade["symbol"]
+            if aggregator.add_trade(symbol, trade["timestamp_ns"], trade["price"], trade["quantity"]):
+                applied[symbol] = applied.get(symbol, 0) + 1
+        for symbol, count in applied.items():
+            bar_trades_total.labels(symbol=symbol).inc(count)
+        await emit()
+
+    async def tick():
+        flushed = time.monotonic()
+        while True:
+            await asyncio.sleep(BAR_TICK_INTERVAL)
+            try:
+                aggregator.advance()
+                await emit()
+                if pending and time.monotonic() - flushed >= BAR_FLUSH_INTERVAL:
+                    bars = pending[:]
+                    del pending[:]
+                    written = await asyncio.to_thread(persist, bars, store)
+                    flushed = time.monotonic()
+                    logging.info(json.dumps({"module": MODULE_NAME, "action": "bars_persisted", "bars": written}))
+            except Exception as e:
+                logging.error(json.dumps({"module": MODULE_NAME, "action": "error", "message": str(e)}))
+
+    dispatcher = PubSubDispatcher(redis, MODULE_NAME, channels=[TRADES_CHANNEL.format(symbol=symbol) for symbol in symbols])
+    dispatcher.add_handler(ingest, name="ingest_trades", batch=True)
+    ticker = asyncio.create_task(tick())
+    try:
+        await dispatcher.run()
+    finally:
+        ticker.cancel()
+        if persist_bars and pending:
+            persist(pending, store)
+
+def benchmark(trades: int = 1_000_000, seed: int = 11) -> dict:
+    """Aggregates a random trade tape (~200 trades/s, some out of order) trade by trade and in batches; trades/sec and agreement."""
+    rng = np.random.default_rng(seed)
+    timestamps = 1_700_000_000_000_000_000 + np.cumsum(rng.exponential(5e6, trades)).astype(np.int64)
+    jitter = rng.random(trades) < 0.01
+    timestamps[jitter] -= rng.integers(0, 1_500_000_000, int(jitter.sum()))  # 1% arrive up to 1.5s late
+    prices = 30000 * np.exp(np.cumsum(rng.normal(0, 1e-4, trades)))
+    quantities = rng.uniform(0.001, 1, trades)
+
+    streaming = BarAggregator()
+    started = time.perf_counter()
+    for ts, price, quantity in zip(timestamps.tolist(), prices.tolist(), quantities.tolist()):
+        streaming.add_trade("BTCUSDT", ts, price, quantity)
+    stream_seconds = time.perf_counter() - started
+
+    batched = BarAggregator()
+    started = time.perf_counter()
+    for lo in range(0, trades, 1000):
+        batched.add_trades("BTCUSDT", timestamps[lo:lo + 1000], prices[lo:lo + 1000], quantities[lo:lo + 1000])
+    batch_seconds = time.perf_counter() - started
+
+    # Reference 1h bars straight from the tape (every trade is within the grace window)
+    hour = interval_ns("1h")
+    frame = streaming.frame("BTCUSDT", "1h")
+    starts = timestamps - timestamps % hour
+    order = np.argsort(timestamps, kind="stable")
+    volume_error = max((abs(volume - quantities[starts == start].sum()) for start, volume in zip(frame.timestamp, frame.volume)), default=0.0)  # Short tapes close no 1h bar
+    close_ok = all(prices[order][starts[order] == start][-1] == close for start, close in zip(frame.timestamp, frame.close))
+    return {
+        "trades": trades,
+        "stream_trades_per_sec": int(trades / stream_seconds),
+        "batch_trades_per_sec": int(trades / batch_seconds),
+        "bars": {interval: len(ring) for (_, interval), ring in streaming.rings.items()},
+        "late_dropped": streaming.late.get("BTCUSDT", 0),
+        "hourly_volume_error": float(volume_error),
+        "hourly_close_matches": close_ok,
+        "batch_matches_stream": all(np.allclose(streaming.frame("BTCUSDT", i)[c], batched.frame("BTCUSDT", i)[c], rtol=1e-12, atol=0)
+                                    for i in streaming.intervals for c in COLUMNS),  # Volumes differ only in summation order
+    }
+
+# Chaos hook example
+if os.getenv("CHAOS_MODE", "off") == "on":
+    raise Exception("Simulated failure - chaos mode")
+
+# Morphic mode control
+morphic_mode = os.getenv("MORPHIC_MODE", "default")
+# No morphic mode control specified for this module
+
+# Test entry
+if __name__ == "__main__":
+    import sys
+    if sys.argv[1:] == ["benchmark"]:
+        logging.info(json.dumps({"module": MODULE_NAME, "action": "benchmark", **benchmark()}))
+    else:
+        from redis_connection_manager import get_async_redis
+        redis = get_async_redis(f"redis://{os.getenv('REDIS_HOST', 'localhost')}:{int(os.getenv('REDIS_PORT', 6379))}")
+        asyncio.run(run_bar_aggregator(redis, [s.strip() for s in SYMBOLS.split(",")], BarAggregator()))
+
+# === Titan Module Footnotes ===
+# Implemented Features: single-pass 1s->1m->5m->15m->1h roll-up, timestamp-ordered OHLC under out-of-order trades, grace-window late handling with drop metrics, wall-clock bar closing, NumPy batch ingestion, per-interval ring buffers, kline-format bar publishing, batched candle-store persistence with restart dedupe
+# Deferred Features: multi-venue composite bars
+# Excluded Features: tick storage (bars only; see candle_store.py)
+# Quality Rating: 10/10 reviewed by [Grok|Gemini|Claude] on [YYYY-MM-DD]
@@ -1,6 +1,6 @@
 # Module: calm_market_leverage_mode.py
-# Version: 1.0.0
-# Last Updated: 2024-07-24
+# Version: 1.1.0
+# Last Updated: 2026-10-16
 # Purpose: Dynamically increases leverage during low-volatility market conditions.
 
 # Core Objectives:
@@ -16,6 +16,8 @@ import json
 import logging
 import os
 import aioredis
+from redis_connection_manager import get_async_redis
+from indicators import BarIndicators, follow_klines
 
 # Config from config.json or ENV
 SYMBOL = os.getenv("SYMBOL", "BTCUSDT")
@@ -34,7 +36,7 @@ SYMBOL_ROTATION_EXIT_WANE_THRESHOLD = float(os.getenv("SYMBOL_ROTATION_EXIT_WANE
 # Redis connection
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
 REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
-redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
 
 # Logging setup
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -42,6 +44,9 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 # Module name
 MODULE_NAME = "calm_market_leverage_mode"
 
+# Streaming indicators for SYMBOL, kept current in-process by follow_klines (started in main)
+indicators = BarIndicators()
+
 async def check_market_conditions():
     """Monitors ATR, Bollinger Band width, chaos score, and whale activity."""
     atr = await get_atr(SYMBOL)
@@ -54,14 +59,16 @@ async def check_market_conditions():
     return False
 
 async def get_atr(symbol: str):
-    """Placeholder for ATR calculation."""
-    # TODO: Implement ATR logic
-    return 0.04  # Example value
+    """ATR as a fraction of the close, from the streaming indicators; inf (never calm) while warming up."""
+    snapshot = indicators.snapshot()
+    if snapshot["atr"] is None or not snapshot["close"]:
+        return float("inf")
+    return snapshot["atr"] / snapshot["close"]
 
 async def get_bollinger_width(symbol: str):
-    """Placeholder for Bollinger Band width calculation."""
-    # TODO: Implement Bollinger Band width logic
-    return 0.03  # Example value
+    """Bollinger Band width (upper - lower) / middle from the streaming indicators; inf while warming up."""
+    width = indicators.bollinger.width
+    return float("inf") if width is None else width
 
 async def get_chaos_score():
     """Placeholder for chaos score retrieval."""
@@ -95,7 +102,11 @@ async def adjust_leverage(symbol: str, side: str, confidence: float):
     return confidence  # No leverage adjustment
 
 async def main():
-    """Main function to subscribe to signals and adjust leverage."""
+    """Keeps the indicators current and processes signals."""
+    await asyncio.gather(follow_klines(redis, SYMBOL, indicators), process_signals())
+
+async def process_signals():
+    """Subscribes to signals and adjusts leverage."""
     pubsub = redis.pubsub()
     await pubsub.subscribe("titan:prod:signals:*")  # Subscribe to all signal channels
 
@@ -180,7 +191,7 @@ if __name__ == "__main__":
     asyncio.run(main())
 
 # === Titan Module Footnotes ===
-# Implemented Features: redis-pub, TTL, async safety, dynamic leverage adjustment
-# Deferred Features: ESG logic -> esg_mode.py, ATR/Bollinger Band calculation
+# Implemented Features: redis-pub, TTL, async safety, dynamic leverage adjustment, in-process ATR/Bollinger width (indicators.py)
+# Deferred Features: ESG logic -> esg_mode.py
 # Excluded Features: backtesting (in backtest_engine.py)
 # Quality Rating: 10/10 reviewed by [Grok|Gemini|Claude] on [YYYY-MM-DD]
\ No newline at end of file
@@ -0,0 +1,258 @@
+# Module: candle_store.py
+# Version: 1.0.0
+# Last Updated: 2026-10-16
+# Purpose: Local columnar candle store; per-symbol/per-interval memory-mapped arrays with a time index and append-only ingestion.
+
+# Core Objectives:
+# - Profitability (50–100% daily ROI target)
+# - Risk reduction (50:1 profit:loss ratio)
+# - ESG-safe actions only
+# - Compliance with UAE financial law
+# - Clean async logic and Redis safety
+# - Prometheus metrics (if needed)
+
+import datetime
+import json
+import logging
+import os
+import warnings
+import numpy as np
+
+# Config from config.json or ENV
+CANDLE_STORE_DIR = os.getenv("CANDLE_STORE_DIR", "data/candles")
+CANDLE_INTERVAL = os.getenv("CANDLE_INTERVAL", "1m")
+CSV_CHUNK_ROWS = int(os.getenv("CSV_CHUNK_ROWS", 1000000))  # Rows parsed per ingestion chunk
+
+# Logging setup
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# Module name
+MODULE_NAME = "candle_store"
+
+# On-disk layout: <root>/<SYMBOL>/<interval>/<column>.bin holds raw little-endian values,
+# meta.json holds the committed row count.  Rows past the committed count (a crash mid-append)
+# are ignored and overwritten by the next append.
+COLUMNS = {
+    "timestamp": np.dtype("<i8"),  # Candle open time, epoch nanoseconds UTC
+    "open": np.dtype("<f8"),
+    "high": np.dtype("<f8"),
+    "low": np.dtype("<f8"),
+    "close": np.dtype("<f8"),
+    "volume": np.dtype("<f8"),
+}
+PRICE_COLUMNS = ("open", "high", "low", "close", "volume")
+
+def to_epoch_ns(values) -> np.ndarray:
+    """Normalizes second / millisecond / nanosecond epoch timestamps to int64 nanoseconds by magnitude."""
+    values = np.asarray(values, dtype=np.float64)
+    if not len(values):
+        return values.astype(np.int64)
+    magnitude = np.nanmax(np.abs(values))
+    if magnitude < 1e11:  # Seconds
+        scale = 1_000_000_000
+    elif magnitude < 1e14:  # Milliseconds
+        scale = 1_000_000
+    elif magnitude < 1e17:  # Microseconds
+        scale = 1_000
+    else:
+        scale = 1
+    return np.round(values * scale).astype(np.int64)
+
+class CandleFrame:
+    """
+    A time range of one symbol/interval.
+
+    Column attributes are slices of read-only memory maps, so building a frame
+    copies nothing; pages are read lazily as the arrays are touched.
+    """
+
+    def __init__(self, symbol: str, interval: str, columns: dict):
+        self.symbol = symbol
+        self.interval = interval
+        self.columns = columns
+        self.timestamp = columns["timestamp"]
+        self.open = columns["open"]
+        self.high = columns["high"]
+        self.low = columns["low"]
+        self.close = columns["close"]
+        self.volume = columns["volume"]
+
+    def __len__(self):
+        return len(self.timestamp)
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        return self.columns[column]
+
+    def to_records(self) -> list:
+        """Row dicts with naive-UTC datetime timestamps, for callers still on the list-of-dicts format."""
+        epoch = datetime.datetime(1970, 1, 1)
+        return [
+            {
+                "timestamp": epoch + datetime.timedelta(microseconds=int(timestamp) // 1000),
+                "open": float(open_), "high": float(high), "low": float(low),
+                "close": float(close), "volume": float(volume),
+            }
+            for timestamp, open_, high, low, close, volume in zip(
+                self.timestamp, self.open, self.high, self.low, self.close, self.volume)
+        ]
+
+class CandleStore:
+    """Append-only columnar candle files under one root directory."""
+
+    def __init__(self, root: str = CANDLE_STORE_DIR):
+        self.root = root
+
+    def _dir(self, symbol: str, interval: str) -> str:
+        return os.path.join(self.root, symbol.upper(), interval)
+
+    def _column_path(self, symbol: str, interval: str, column: str) -> str:
+        return os.path.join(self._dir(symbol, interval), f"{column}.bin")
+
+    def _meta_path(self, symbol: str, interval: str) -> str:
+        return os.path.join(self._dir(symbol, interval), "meta.json")
+
+    def rows(self, symbol: str, interval: str) -> int:
+        try:
+            with open(self._meta_path(symbol, interval)) as f:
+                return json.load(f)["rows"]
+        except FileNotFoundError:
+            return 0
+
+    def _write_meta(self, symbol: str, interval: str, rows: int, last_timestamp: int):
+        path = self._meta_path(symbol, interval)
+        with open(path + ".tmp", "w") as f:
+            json.dump({"rows": rows, "last_timestamp": last_timestamp, "columns": list(COLUMNS)}, f)
+        os.replace(path + ".tmp", path)  # Commits the append atomically
+
+    def _map(self, symbol: str, interval: str, column: str, rows: int) -> np.ndarray:
+        if rows == 0:
+            return np.empty(0, dtype=COLUMNS[column])
+        return np.memmap(self._column_path(symbol, interval, column), dtype=COLUMNS[column], mode="r", shape=(rows,))
+
+    def fingerprint(self, symbol: str, interval: str) -> str:
+        """Identifies the stored content; the store is append-only, so row count plus last timestamp suffices."""
+        rows = self.rows(symbol, interval)
+        return f"{symbol.upper()}:{interval}:{rows}:{self.last_timestamp(symbol, interval)}"
+
+    def last_timestamp(self, symbol: str, interval: str):
+        rows = self.rows(symbol, interval)
+        if rows == 0:
+            return None
+        return int(self._map(symbol, interval, "timestamp", rows)[-1])
+
+    def append(self, symbol: str, interval: str, columns: dict) -> int:
+        """
+        Appends candles; ``columns`` maps column name to equal-length arrays.
+
+        Rows must be in time order.  Rows at or before the stored last
+        timestamp are dropped, so re-ingesting an overlapping file is safe.
+        Returns the number of rows written.
+        """
+        timestamp = np.asarray(columns["timestamp"], dtype=np.int64)
+        if len(timestamp) > 1 and np.any(np.diff(timestamp) <= 0):
+            raise ValueError("Candle timestamps must be strictly increasing")
+
+        os.makedirs(self._dir(symbol, interval), exist_ok=True)
+        rows = self.rows(symbol, interval)
+        last = self.last_timestamp(symbol, interval)
+        keep = slice(int(np.searchsorted(timestamp, last, side="right")), None) if last is not None else slice(None)
+        timestamp = timestamp[keep]
+        if not len(timestamp):
+            return 0
+
+        for column, dtype in COLUMNS.items():
+            values = timestamp if column == "timestamp" else np.asarray(columns.get(column, np.full(len(columns["timestamp"]), np.nan)), dtype=dtype)[keep]
+            with open(self._column_path(symbol, interval, column), "r+b" if rows else "wb") as f:
+                f.truncate(rows * dtype.itemsize)  # Discard any uncommitted tail
+                f.seek(rows * dtype.itemsize)
+                f.write(np.ascontiguousarray(values, dtype=dtype).tobytes())
+        self._write_meta(symbol, interval, rows + len(timestamp), int(timestamp[-1]))
+        return len(timestamp)
+
+    def ingest_csv(self, symbol: str, interval: str, path: str, chunk_rows: int = CSV_CHUNK_ROWS) -> int:
+        """
+        Appends a timestamp,open,high,low,close[,volume] CSV (header row
+        skipped) in chunks.  Timestamps may be epoch s/ms/ns.
+        """
+        sources_path = os.path.join(self._dir(symbol, interval), "sources.json")
+        try:
+            with open(sources_path) as f:
+                sources = json.load(f)
+        except FileNotFoundError:
+            sources = {}
+        stat = os.stat(path)
+        fingerprint = [stat.st_size, stat.st_mtime_ns]
+        if sources.get(os.path.abspath(path)) == fingerprint:
+            return 0  # Unchanged since the last ingestion
+
+        written = 0
+        with open(path) as f:
+            f.readline()
+            while True:
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore", UserWarning)  # Empty final chunk when rows divide evenly
+                    chunk = np.loadtxt(f, delimiter=",", max_rows=chunk_rows, ndmin=2)
+                if not chunk.size:
+                    break
+                columns = {"timestamp": to_epoch_ns(chunk[:, 0])}
+                for position, column in enumerate(PRICE_COLUMNS, start=1):
+                    if position < chunk.shape[1]:
+                        columns[column] = chunk[:, position]
+                written += self.append(symbol, interval, columns)
+                if len(chunk) < chunk_rows:
+                    break
+        os.makedirs(self._dir(symbol, interval), exist_ok=True)
+        sources[os.path.abspath(path)] = fingerprint
+        with open(sources_path, "w") as f:
+            json.dump(sources, f)
+        logging.info(json.dumps({
+            "module": MODULE_NAME,
+            "action": "csv_ingested",
+            "symbol": symbol,
+            "interval": interval,
+            "path": path,
+            "rows_written": written
+        }))
+        return written
+
+    def load(self, symbol: str, interval: str, start=None, end=None) -> CandleFrame:
+        """Candles with start <= timestamp < end (epoch ns, datetime, or None for open-ended); zero-copy."""
+        rows = self.rows(symbol, interval)
+        columns = {column: self._map(symbol, interval, column, rows) for column in COLUMNS}
+        timestamp = columns["timestamp"]
+        lo = int(np.searchsorted(timestamp, _as_ns(start), side="left")) if start is not None else 0
+        hi = int(np.searchsorted(timestamp, _as_ns(end), side="left")) if end is not None else rows
+        return CandleFrame(symbol, interval, {column: values[lo:hi] for column, values in columns.items()})
+
+def _as_ns(value) -> int:
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=datetime.timezone.utc)
+        return int(round(value.timestamp() * 1e6)) * 1000
+    return int(value)
+
+# Shared loader API
+default_store = CandleStore()
+
+def load_candles(symbol: str, interval: str = CANDLE_INTERVAL, start=None, end=None, csv_path: str = None) -> CandleFrame:
+    """
+    Loads a candle range from the local store.
+
+    When ``csv_path`` is given and exists, new rows in it are ingested first
+    (already-stored rows are skipped), so a CSV drop-in keeps the store current.
+    """
+    if csv_path and os.path.exists(csv_path):
+        default_store.ingest_csv(symbol, interval, csv_path)
+    return default_store.load(symbol, interval, start, end)
+
+# Test entry
+if __name__ == "__main__":
+    import sys
+    if len(sys.argv) == 4:
+        default_store.ingest_csv(sys.argv[1], sys.argv[2], sys.argv[3])  # candle_store.py SYMBOL INTERVAL file.csv
+
+# === Titan Module Footnotes ===
+# Implemented Features: mmap columnar arrays, searchsorted time index, zero-copy range slicing, append-only idempotent CSV ingestion (skips unchanged files), atomic row-count commits
+# Deferred Features: Parquet export
+# Excluded Features: tick / order book storage
+# Quality Rating: 10/10 reviewed by [Grok|Gemini|Claude] on [YYYY-MM-DD]
@@ -6,7 +6,7 @@ Purpose: Real-time capital throttling.
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -29,7 +29,7 @@ REDIS_PORT = config.get("REDIS_PORT", 6379)
 async def set_capital_parameter(parameter, value):
     '''Sets a capital parameter in Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         key = f"titan:prod:capital_allocation_console:{parameter}"
         await redis.set(key, value)
         logger.info(json.dumps({"module": "capital_allocation_console", "action": "set_capital_parameter", "status": "success", "parameter": parameter, "value": value}))
@@ -41,7 +41,7 @@ async def set_capital_parameter(parameter, value):
 async def get_capital_parameter(parameter):
     '''Gets a capital parameter from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         key = f"titan:prod:capital_allocation_console:{parameter}"
         value = await redis.get(key)
         if value:
@@ -6,7 +6,7 @@ Purpose: Allocates capital not just by signal strength, but by intent — growth
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -32,7 +32,7 @@ PRESERVATION_BUFFER_PCT = config.get("PRESERVATION_BUFFER_PCT", 0.5)  # Buffer p
 async def get_capital_intent_state():
     '''Retrieves the current capital intent state from Redis (placeholder).'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         # Placeholder: Replace with actual logic to determine capital intent state
         intent_state = random.choice(["growth", "preservation", "recovery", "liquidation"])
         logger.info(json.dumps({"module": "capital_intent_allocator", "action": "get_capital_intent_state", "status": "success", "intent_state": intent_state}))
@@ -44,7 +44,7 @@ async def get_capital_intent_state():
 async def adjust_capital_allocation(signal, intent_state):
     '''Adjusts capital allocation based on the current intent state.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         channel = "titan:core:signal"
 
         modified_signal = signal.copy()
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -40,7 +40,7 @@ capital_allocation = Gauge('capital_allocation', 'Capital allocation for each mo
 async def fetch_position_data(module):
     '''Fetches position data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         position_data = await redis.get(f"titan:position:{module}")
         if position_data:
             return json.loads(position_data)
@@ -82,7 +82,7 @@ async def apply_capital_decay(module, position_data):
 async def update_position_data(module, position_data):
     '''Updates the position data in Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         await redis.set(f"titan:position:{module}", json.dumps(position_data))
         logger.info(json.dumps({"module": "capital_lock_decay", "action": "Update Position Data", "status": "Success", "module": module}))
         return True
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -39,7 +39,7 @@ module_capital_allocation = Gauge('module_capital_allocation', 'Capital allocati
 async def fetch_module_roi(module, analysis_window):
     '''Reallocates capital dynamically to the best-performing modules over trailing 24–72h based on ROI.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         # Placeholder for fetching module ROI logic (replace with actual fetching)
         roi = random.uniform(-0.01, 0.05) # Simulate ROI
         logger.info(json.dumps({"module": "capital_loop_optimizer", "action": "Fetch Module ROI", "status": "Success", "module": module, "roi": roi, "analysis_window": analysis_window}))
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -40,7 +40,7 @@ reinvestment_percentage = Gauge('reinvestment_percentage', 'Current reinvestment
 async def fetch_profit_pool():
     '''Fetches the profit pool from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         profit_pool = await redis.get("titan:capital:profit_pool")
         if profit_pool:
             return float(profit_pool)
@@ -73,7 +73,7 @@ async def calculate_reinvestment_amount(profit_pool, ramp_mode):
 async def apply_reinvestment_throttle(reinvestment_amount):
     '''Throttles reinvestment growth.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         await redis.set(REINVEST_PCT_KEY, reinvestment_amount)
         logger.warning(json.dumps({"module": "capital_ramp_controller", "action": "Apply Reinvestment Throttle", "status": "Throttled", "reinvestment_amount": reinvestment_amount}))
         global capital_reinvestments_throttled_total
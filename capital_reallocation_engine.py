@@ -16,6 +16,8 @@ import json
 import logging
 import os
 import aioredis
+from redis_connection_manager import get_async_redis
+from capital_allocation_engine import CapitalAllocationEngine
 
 # Configuration from config.json or ENV
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
@@ -28,11 +30,19 @@ SYMBOL = os.getenv("SYMBOL", "BTCUSDT")
 # Logging setup
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Allocation engine for this module; strategies are added as they first report performance
+reallocation_allocator = CapitalAllocationEngine(method="mean_variance", max_weight=0.5)
+current_weights = {}
+
 
 async def reallocate_capital(profit_logs: dict, strategy_performance: dict) -> dict:
     """
     Dynamically reallocates capital across strategies to optimize profitability.
 
+    Each call adds one period of strategy returns (``profitability``) to the shared
+    allocation engine and re-solves the mean-variance weights; the adjustment is the
+    change from the previous weights.
+
     Args:
         profit_logs (dict): A dictionary containing profit logs.
         strategy_performance (dict): A dictionary containing strategy performance data.
@@ -40,23 +50,22 @@ async def reallocate_capital(profit_logs: dict, strategy_performance: dict) -> d
     Returns:
         dict: A dictionary containing reallocation logs.
     """
-    # Example logic: Reallocate capital based on profit and performance
     reallocation_logs = {}
 
-    total_profit = sum(profit_logs.values())
-    if total_profit == 0:
+    if sum(profit_logs.values()) == 0:
         return reallocation_logs
 
-    for strategy, profit in profit_logs.items():
-        # Calculate the percentage of total profit for this strategy
-        profit_percentage = profit / total_profit
+    reallocation_allocator.add_returns({strategy: performance.get("profitability", 0.0) for strategy, performance in strategy_performance.items()})
+    weights = reallocation_allocator.solve()
 
-        # Adjust capital allocation based on profit percentage
-        capital_adjustment = profit_percentage * 0.1  # Adjust capital by 10% of profit percentage
+    for strategy, weight in weights.items():
+        capital_adjustment = weight - current_weights.get(strategy, 0.0)
         reallocation_logs[strategy] = {
+            "weight": weight,
             "capital_adjustment": capital_adjustment,
-            "message": f"Adjusted capital by {capital_adjustment} based on profit",
+            "message": f"Adjusted capital by {capital_adjustment} to a weight of {weight}",
         }
+    current_weights.update(weights)
 
     logging.info(json.dumps({"message": "Reallocation logs", "reallocation_logs": reallocation_logs}))
     return reallocation_logs
@@ -124,7 +133,7 @@ async def main():
     Main function to orchestrate capital reallocation.
     """
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
 
         # Fetch profit logs and strategy performance data
         profit_logs = await fetch_profit_logs(redis)
@@ -151,7 +160,7 @@ if __name__ == "__main__":
     asyncio.run(main())
 
 # === Titan Module Footnotes ===
-# Implemented Features: redis-pub, TTL, async safety
+# Implemented Features: redis-pub, TTL, async safety, mean-variance reallocation (capital_allocation_engine)
 # Deferred Features: ESG logic → esg_mode.py
 # Excluded Features: backtest → backtest_engine.py
 # Quality Rating: 10/10 reviewed by Gemini on 2024-07-04
\ No newline at end of file
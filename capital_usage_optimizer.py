@@ -8,7 +8,8 @@ import json
 import logging
 import os
 
-import aioredis
+import aioredis
+from redis_connection_manager import get_async_redis
 
 # Configuration (replace with config.json or ENV vars)
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
@@ -68,7 +69,7 @@ async def main():
     Main function to run capital usage optimization periodically.
     """
     try:
-        r = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        r = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         while True:
             await optimize_capital_usage(r)
             await asyncio.sleep(OPTIMIZATION_INTERVAL)  # Run optimization every OPTIMIZATION_INTERVAL seconds
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -40,7 +40,7 @@ chaos_test_latency_seconds = Histogram('chaos_test_latency_seconds', 'Latency of
 async def network_latency_test():
     '''Artificially delay Redis calls by 100–700ms randomly.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         delay = random.randint(LATENCY_MIN, LATENCY_MAX) / 1000 # Convert to seconds
         await asyncio.sleep(delay) # Simulate network latency
         await redis.set("titan:chaos:network_latency", delay) # Set a key to simulate a Redis call
@@ -57,7 +57,7 @@ async def network_latency_test():
 async def signal_flood_test():
     '''Publish 1000 mock signals rapidly to titan:signal:raw:*. '''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         for i in range(SIGNAL_FLOOD_COUNT):
             signal = {"symbol": "BTCUSDT", "side": "BUY", "strategy": "ChaosStrategy", "id": i}
             await redis.publish("titan:signal:raw:BTCUSDT", json.dumps(signal))
@@ -74,7 +74,7 @@ async def signal_flood_test():
 async def malformed_signal_injection_test():
     '''Send broken/missing field JSON signals.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         malformed_signal = {"symbol": "BTCUSDT", "side": "BUY"} # Missing "strategy" and "id"
         await redis.publish("titan:signal:raw:BTCUSDT", json.dumps(malformed_signal))
         logger.info(json.dumps({"module": "chaos_test_suite", "action": "Malformed Signal Injection Test", "status": "Passed"}))
@@ -90,7 +90,7 @@ async def malformed_signal_injection_test():
 async def timestamp_disorder_test():
     '''Send signals with invalid or past timestamps.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         past_timestamp = time.time() - 3600 # 1 hour ago
         disordered_signal = {"symbol": "BTCUSDT", "side": "BUY", "strategy": "TimeTravelStrategy", "timestamp": past_timestamp}
         await redis.publish("titan:signal:raw:BTCUSDT", json.dumps(disordered_signal))
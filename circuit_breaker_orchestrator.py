@@ -7,7 +7,7 @@ import asyncio
 import json
 import logging
 import os
-import aioredis
+from redis_connection_manager import get_async_redis
 
 # Import circuit breaker modules
 try:
@@ -66,7 +66,7 @@ class CircuitBreakerOrchestrator:
         Process the signal using the appropriate circuit breaker and publish the output to Redis.
         """
         try:
-            redis = aioredis.from_url(f"redis://{self.redis_host}:{self.redis_port}")
+            redis = get_async_redis(f"redis://{self.redis_host}:{self.redis_port}")
             breaker = await self.determine_breaker(signal)
 
             # Apply morphic mode handling
@@ -95,7 +95,7 @@ async def main():
     """
     orchestrator = CircuitBreakerOrchestrator()
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         # Example signal
         example_signal = {
             "symbol": SYMBOL,
@@ -6,7 +6,7 @@ Purpose: Client-based routing of strategies.
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -29,7 +29,7 @@ REDIS_PORT = config.get("REDIS_PORT", 6379)
 async def get_client_strategies(client_id):
     '''Retrieves the strategy set for a given client from Redis or config.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         strategy_key = f"titan:client:{client_id}:strategies"
         strategy_json = await redis.get(strategy_key)
 
@@ -49,7 +49,7 @@ async def get_client_strategies(client_id):
 async def route_signal_to_client(client_id, signal):
     '''Routes a trading signal to the appropriate client-specific channel.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         strategies = await get_client_strategies(client_id)
 
         if signal["strategy"] in strategies:
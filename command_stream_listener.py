@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -60,7 +60,7 @@ async def process_command(command):
 async def command_stream_listener_loop():
     '''Main loop for the command stream listener module.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         async with redis.pubsub() as pubsub:
             await pubsub.subscribe(COMMAND_CHANNEL)
 
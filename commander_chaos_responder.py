@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -40,7 +40,7 @@ module_throttled = Gauge('module_throttled', 'Indicates if a module is currently
 async def fetch_module_chaos_score(module_name):
     '''Reads titan:chaos:score:<modulename>.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         chaos_score = await redis.get(f"titan:chaos:score:{module_name}")
         if chaos_score:
             return float(chaos_score)
@@ -6,7 +6,7 @@ Purpose: Streams live PnL, chaos, latency.
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -31,7 +31,7 @@ REDIS_PORT = config.get("REDIS_PORT", 6379)
 async def stream_dashboard_data():
     '''Streams live PnL, chaos, and latency data to Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         channel = "titan:prod:commander_dashboard_stream:dashboard_data"
 
         # Simulate data - replace with actual data sources
@@ -6,7 +6,7 @@ Purpose: Allows manual override of trading signals.
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -29,7 +29,7 @@ REDIS_PORT = config.get("REDIS_PORT", 6379)
 async def override_signal(original_signal, override_action):
     '''Overrides a trading signal in Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         channel = "titan:prod:commander_signal_override:signal_override"
 
         override_signal = original_signal.copy()
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -53,7 +53,7 @@ async def calculate_config_hash():
 async def fetch_stored_config_hash():
     '''Fetches the stored config hash from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         stored_hash = await redis.get("titan:infra:config_hash")
         if stored_hash:
             return stored_hash
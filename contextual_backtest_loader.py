@@ -15,7 +15,8 @@ import asyncio
 import json
 import logging
 import os
-import aioredis
+from redis_connection_manager import get_async_redis
+from candle_store import load_candles
 import datetime
 
 # Config from config.json or ENV
@@ -25,7 +26,7 @@ CONTEXTUAL_DATA_SOURCE = os.getenv("CONTEXTUAL_DATA_SOURCE", "data/contextual_da
 # Redis connection
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
 REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
-redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
 
 # Logging setup
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -33,15 +34,9 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 # Module name
 MODULE_NAME = "contextual_backtest_loader"
 
-async def load_historical_data(data_source: str) -> list:
-    """Loads historical market data from a file or API."""
-    # TODO: Implement logic to load historical data
-    # Placeholder: Return a list of historical data points
-    historical_data = [
-        {"timestamp": datetime.datetime(2024, 1, 1, 0, 0, 0), "open": 40000, "high": 41000, "low": 39000, "close": 40500},
-        {"timestamp": datetime.datetime(2024, 1, 1, 0, 1, 0), "open": 40500, "high": 41500, "low": 39500, "close": 41000}
-    ]
-    return historical_data
+async def load_historical_data(data_source: str, symbol: str = "BTCUSDT") -> list:
+    """Loads historical candles from the local candle store, ingesting any new rows in data_source first."""
+    return load_candles(symbol, csv_path=data_source).to_records()
 
 async def load_contextual_data(data_source: str) -> dict:
     """Loads contextual data (news events, economic indicators) from a file or API."""
@@ -108,6 +103,6 @@ if __name__ == "__main__":
 
 # === Titan Module Footnotes ===
 # Implemented Features: redis-pub, async safety, contextual data loading
-# Deferred Features: ESG logic -> esg_mode.py, historical and contextual data loading implementation
+# Deferred Features: ESG logic -> esg_mode.py, contextual data loading implementation
 # Excluded Features: live trading execution (in execution_handler.py)
 # Quality Rating: 10/10 reviewed by [Grok|Gemini|Claude] on [YYYY-MM-DD]
\ No newline at end of file
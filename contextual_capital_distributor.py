@@ -15,7 +15,7 @@ import asyncio
 import json
 import logging
 import os
-import aioredis
+from redis_connection_manager import get_async_redis
 
 # Config from config.json or ENV
 DEFAULT_CAPITAL_ALLOCATION = float(os.getenv("DEFAULT_CAPITAL_ALLOCATION", 0.25))  # 25%
@@ -25,7 +25,7 @@ CAPITAL_CONTROLLER_CHANNEL = os.getenv("CAPITAL_CONTROLLER_CHANNEL", "titan:prod
 # Redis connection
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
 REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
-redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
 
 # Logging setup
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -7,7 +7,7 @@ import asyncio
 import json
 import logging
 import os
-import aioredis
+from redis_connection_manager import get_async_redis
 
 async def main():
 MAX_PRICE_DEVIATION = float(os.getenv("MAX_PRICE_DEVIATION", 0.1))
@@ -16,7 +16,7 @@ ALERT_ENGINE_CHANNEL = os.getenv("ALERT_ENGINE_CHANNEL", "titan:prod:alert_engin
 
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
 REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
-redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -7,61 +7,349 @@ import asyncio
 import json
 import logging
 import os
-import aioredis
+import time
+import numpy as np
+from prometheus_client import Counter, Gauge, Histogram
+from redis_connection_manager import get_async_redis
+import pnl_ledger
+from portfolio_risk_engine import default_engine
+from Crypto_Futures_Adapter import contract_spec, perp_symbol
 
-async def main():
-TARGET_DELTA = float(os.getenv("TARGET_DELTA", 0.5))
-HEDGING_ASSET = os.getenv("HEDGING_ASSET", "ETHUSDT")
-EXECUTION_ORCHESTRATOR_CHANNEL = os.getenv("EXECUTION_ORCHESTRATOR_CHANNEL", "titan:prod:execution_orchestrator")
+# Config from config.json or ENV
+TARGET_DELTA = float(os.getenv("TARGET_DELTA", 0.5))  # Net delta kept, as a fraction of each underlying's unhedged delta (0 = fully neutral)
+HEDGING_ASSET = os.getenv("HEDGING_ASSET", "ETHUSDT")  # Proxy for underlyings without a perpetual of their own
+HEDGE_PERPS = os.getenv("HEDGE_PERPS", "BTCUSDT,ETHUSDT,SOLUSDT,BNBUSDT,XRPUSDT")  # Underlyings hedged on their own perpetual
+HEDGE_BAND_NOTIONAL = float(os.getenv("HEDGE_BAND_NOTIONAL", 1000))  # Hedge an underlying only once its error exceeds this (quote currency)...
+HEDGE_INNER_BAND_NOTIONAL = float(os.getenv("HEDGE_INNER_BAND_NOTIONAL", 250))  # ...and then only back to within this of the target
+HEDGE_CYCLE_INTERVAL = float(os.getenv("HEDGE_CYCLE_INTERVAL", 0.25))  # Seconds of fills collected into one order set
+HEDGE_PENDING_TIMEOUT = float(os.getenv("HEDGE_PENDING_TIMEOUT", 5))  # Unfilled hedge quantity is written off after this
+HEDGE_FALLBACK_BETA = float(os.getenv("HEDGE_FALLBACK_BETA", 1.0))  # Cross-hedge ratio for underlyings the risk engine has no covariance for
+HEDGE_EXECUTION_CHANNEL = os.getenv("HEDGE_EXECUTION_CHANNEL", "titan:prod:hedge_requests")  # Only futures_execution_engine consumes it
 
+# Redis connection
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
 REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
-redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
 
+# Logging setup
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
-async def get_current_delta(symbol: str) -> float:
-    # TODO: Implement logic to retrieve current delta from Redis or other module
-    return 0.8
-
-async def get_asset_correlation(symbol1: str, symbol2: str) -> float:
-    # TODO: Implement logic to retrieve asset correlation from Redis or other module
-    return 0.7
-
-async def calculate_hedge_quantity(symbol: str, current_delta: float, asset_correlation: float) -> float:
-    hedge_quantity = (TARGET_DELTA - current_delta) / asset_correlation
-    return hedge_quantity
-
-async def execute_hedge_order(symbol: str, hedge_quantity: float):
-    logging.info(json.dumps({
-        "module": MODULE_NAME,
-        "action": "hedge_order_executed",
-        "symbol": symbol,
-        "hedge_quantity": hedge_quantity,
-        "message": "Hedge order executed to adjust delta."
-    }))
-
-    message = {
-        "action": "hedge",
-        "symbol": symbol,
-        "quantity": hedge_quantity
-    try:
-        tracked_symbols = ["BTCUSDT"]
-
-        for symbol in tracked_symbols:
-            current_delta = await get_current_delta(symbol)
-            asset_correlation = await get_asset_correlation(symbol, HEDGING_ASSET)
-            hedge_quantity = await calculate_hedge_quantity(symbol, current_delta, asset_correlation)
-            await execute_hedge_order(symbol, hedge_quantity)
-
-        await asyncio.sleep(60 * 60)
-
-    except Exception as e:
-        logging.error(json.dumps({
-            "module": MODULE_NAME,
-            "action": "error",
-            "message": str(e)
-        }))
+# Module name
+MODULE_NAME = "delta_hedger"
+
+# Prometheus metrics
+hedge_orders_total = Counter('delta_hedger_orders_total', 'Hedge orders sent')
+hedge_cycles_total = Counter('delta_hedger_cycles_total', 'Hedge cycles run')
+hedge_cycle_seconds = Histogram('delta_hedger_cycle_seconds', 'Time to net all hedge demands in one cycle')
+hedge_fallback_beta_total = Counter('delta_hedger_fallback_beta_total', 'Cross-hedges sized with the fallback beta for lack of a covariance', ['underlying'])
+unhedged_notional = Gauge('delta_hedger_unhedged_notional', 'Cross-hedge demand left unhedged because it could not be priced (quote currency)')
+
+class DeltaHedger:
+    """
+    Net delta per underlying, kept current fill by fill, and the netted hedge order set for a cycle.
+
+    Every ledger symbol maps to an underlying through Crypto_Futures_Adapter.contract_spec.
+    Each underlying has one slot in arrays of linear delta (spot and linear contracts,
+    units of the underlying), inverse-contract notional (delta = notional / price),
+    the hedger's own perpetual position and hedge quantity sent but not yet filled.
+    A fill moves one entry, so the cost does not depend on the size of the book.
+
+    ``orders`` evaluates the whole book at once.  The hedge target for an underlying
+    is -(1 - target_delta) x its unhedged delta.  Underlyings without a perpetual are
+    cross-hedged into ``hedging_asset``: the beta comes from the risk engine's EWMA
+    covariance, replacing a fixed correlation, and is ``fallback_beta`` (logged) for
+    underlyings it has no covariance for.  Demands that land on the same
+    perpetual net into one order.  Hysteresis: an underlying is only traded once its
+    hedge error exceeds ``band`` (quote currency), and then only back to within
+    ``inner_band``, so the hedge does not chase every fill.
+    """
+
+    def __init__(self, target_delta: float = TARGET_DELTA, hedging_asset: str = HEDGING_ASSET, perps=None,
+                 band: float = HEDGE_BAND_NOTIONAL, inner_band: float = HEDGE_INNER_BAND_NOTIONAL,
+                 risk_engine=default_engine, fallback_beta: float = HEDGE_FALLBACK_BETA, capacity: int = 64):
+        self.target_delta = target_delta
+        self.hedging_asset = hedging_asset
+        self.perps = set(perps if perps is not None else (s.strip() for s in HEDGE_PERPS.split(",") if s.strip()))
+        self.band = band
+        self.inner_band = inner_band
+        self.risk_engine = risk_engine
+        self.fallback_beta = fallback_beta
+        self.on_fallback = set()  # Underlyings currently cross-hedged with the fallback beta (logged once each)
+        self.underlyings = []
+        self.index = {}
+        self._allocate(capacity)
+        self._risk_columns = None  # Risk engine column per slot, rebuilt when either side adds symbols
+        self.dirty = asyncio.Event()
+        self.cycles = 0
+        self.fills = 0
+        for underlying in self.perps:
+            self.slot(underlying)
+        self.slot(hedging_asset)
+
+    def _allocate(self, capacity: int):
+        self.capacity = capacity
+        self.linear = np.zeros(capacity)  # Units of the underlying
+        self.inverse_notional = np.zeros(capacity)  # Quote currency
+        self.hedge = np.zeros(capacity)  # The hedger's perpetual position
+        self.pending = np.zeros(capacity)  # Sent, not yet filled
+        self.pending_at = np.zeros(capacity)
+        self.price = np.zeros(capacity)
+        self.direct = np.zeros(capacity, dtype=bool)  # Has its own perpetual
+
+    def _grow(self):
+        old = self.capacity
+        arrays = (self.linear, self.inverse_notional, self.hedge, self.pending, self.pending_at, self.price, self.direct)
+        self._allocate(old * 2)
+        for new, previous in zip((self.linear, self.inverse_notional, self.hedge, self.pending, self.pending_at, self.price, self.direct), arrays):
+            new[:old] = previous
+
+    def slot(self, underlying: str) -> int:
+        i = self.index.get(underlying)
+        if i is None:
+            if len(self.underlyings) == self.capacity:
+                self._grow()
+            i = self.index[underlying] = len(self.underlyings)
+            self.underlyings.append(underlying)
+            self.direct[i] = underlying in self.perps
+            self._risk_columns = None
+        return i
+
+    # Positions
+
+    def _add(self, strategy: str, symbol: str, quantity: float, price: float = None):
+        underlying, multiplier, inverse = contract_spec(symbol)
+        i = self.slot(underlying)
+        if price:
+            self.price[i] = price  # Fill prices of spot and perpetual both quote the underlying
+        if inverse:
+            self.inverse_notional[i] += quantity * multiplier
+        elif strategy == MODULE_NAME and symbol == perp_symbol(underlying):
+            filled = quantity * multiplier
+            self.hedge[i] += filled
+            pending = self.pending[i]
+            if pending and (pending > 0) == (filled > 0):
+                self.pending[i] = max(pending - filled, 0.0) if pending > 0 else min(pending - filled, 0.0)
+        else:
+            self.linear[i] += quantity * multiplier
+
+    def load(self, state):
+        """Rebuilds every slot from a pnl_ledger LedgerState (positions and last fill prices)."""
+        self.linear[:] = self.inverse_notional[:] = self.hedge[:] = self.pending[:] = 0.0
+        for symbol, price in state.marks.items():
+            self.price[self.slot(contract_spec(symbol)[0])] = price
+        for (strategy, symbol), (quantity, _) in state.positions.items():
+            if quantity:
+                self._add(strategy, symbol, quantity)
+        self.dirty.set()
+
+    def on_fill(self, fill: dict):
+        """pnl_ledger listener: applies one fill and wakes the cycle."""
+        self._add(fill.get("strategy", "unknown"), fill["symbol"], pnl_ledger.signed_quantity(fill), float(fill["price"]))
+        self.fills += 1
+        self.dirty.set()
+
+    def on_price(self, underlying: str, price: float):
+        self.price[self.slot(underlying)] = price
+        self.dirty.set()
+
+    def _refresh_prices(self):
+        """Takes live prices from the risk engine's trade feed wherever it has one."""
+        engine = self.risk_engine
+        n = len(self.underlyings)
+        if self._risk_columns is None or len(self._risk_columns) != n or self._risk_columns_seen != len(engine.symbols):
+            self._risk_columns = np.array([engine.index.get(u, -1) for u in self.underlyings], dtype=np.int64)
+            self._risk_columns_seen = len(engine.symbols)
+        known = self._risk_columns >= 0
+        live = np.zeros(n)
+        live[known] = engine.price[self._risk_columns[known]]
+        self.price[:n] = np.where(live > 0, live, self.price[:n])
+
+    def _betas(self, n: int, h: int):
+        """
+        Minimum-variance hedge ratio of each underlying on the hedging asset, Cov(u, h) / Var(h), and the
+        mask of those estimated; ``fallback_beta`` where the risk engine has no covariance for the pair.
+        """
+        columns = self._risk_columns if self._risk_columns is not None else np.full(n, -1)
+        betas = np.full(n, self.fallback_beta)
+        known = np.zeros(n, dtype=bool)
+        j = columns[h]
+        if j < 0:
+            return betas, known
+        variance = self.risk_engine.covariance[j, j]
+        if variance <= 0:
+            return betas, known
+        known = columns >= 0
+        known[known] = self.risk_engine.covariance[columns[known], columns[known]] > 0
+        betas[known] = self.risk_engine.covariance[columns[known], j] / variance
+        return betas, known
+
+    def deltas(self) -> dict:
+        """Unhedged and hedged net delta per underlying, in units of the underlying."""
+        n = len(self.underlyings)
+        price = self.price[:n]
+        unhedged = self.linear[:n] + np.divide(self.inverse_notional[:n], price, out=np.zeros(n), where=price > 0)
+        return {u: {"unhedged": float(d), "net": float(d + h)} for u, d, h in zip(self.underlyings, unhedged, self.hedge[:n])}
+
+    def orders(self, now: float = None) -> list:
+        """
+        The netted hedge order set for the book as it stands: at most one order per perpetual.
+        Orders are recorded as pending so the next cycle does not send them again.
+        """
+        now = time.monotonic() if now is None else now
+        n = len(self.underlyings)
+        price = self.price[:n]
+        priced = price > 0
+        expired = (self.pending[:n] != 0) & (now - self.pending_at[:n] > HEDGE_PENDING_TIMEOUT)
+        self.pending[:n][expired] = 0.0
+
+        unhedged = self.linear[:n] + np.divide(self.inverse_notional[:n], price, out=np.zeros(n), where=priced)
+        desired = -(1.0 - self.target_delta) * unhedged
+        direct = self.direct[:n]
+        target = np.where(direct, desired, 0.0)
+        h = self.index[self.hedging_asset]
+        cross = ~direct & priced & (desired != 0)
+        if cross.any() and price[h] > 0:
+            # Cross-hedge notional β · desired · price_u, expressed in units of the hedging asset
+            betas, estimated = self._betas(n, h)
+            target[h] += float((betas[cross] * desired[cross] * price[cross]).sum()) / price[h]
+            self._track_fallbacks(np.flatnonzero(cross & ~estimated), desired, price)
+            unhedged_notional.set(0.0)
+        elif cross.any():
+            missing = float(np.abs(desired[cross] * price[cross]).sum())
+            unhedged_notional.set(missing)
+            logging.warning(json.dumps({
+                "module": MODULE_NAME,
+                "action": "cross_hedge_skipped",
+                "hedging_asset": self.hedging_asset,
+                "underlyings": [self.underlyings[i] for i in np.flatnonzero(cross).tolist()],
+                "notional": missing,
+                "message": "Hedging asset has no price; cross-hedged exposure left unhedged."
+            }))
+
+        demand = target - self.hedge[:n] - self.pending[:n]
+        error = np.abs(demand) * price
+        trade = direct & priced & (error > self.band)
+        if not trade.any():
+            return []
+        quantity = demand[trade] - np.sign(demand[trade]) * (self.inner_band / price[trade])  # Back to the inner band edge
+        rows = np.flatnonzero(trade)
+        self.pending[rows] += quantity
+        self.pending_at[rows] = now
+        return [{"symbol": perp_symbol(self.underlyings[i]), "underlying": self.underlyings[i], "side": "BUY" if q > 0 else "SELL",
+                 "quantity": abs(q), "price": float(price[i]), "strategy": MODULE_NAME}
+                for i, q in zip(rows.tolist(), quantity.tolist())]
+
+    def _track_fallbacks(self, rows, desired, price):
+        fallback = {self.underlyings[i] for i in rows.tolist()}
+        for i in rows.tolist():
+            hedge_fallback_beta_total.labels(underlying=self.underlyings[i]).inc()
+            if self.underlyings[i] in self.on_fallback:
+                continue
+            logging.warning(json.dumps({
+                "module": MODULE_NAME,
+                "action": "fallback_beta",
+                "underlying": self.underlyings[i],
+                "hedging_asset": self.hedging_asset,
+                "beta": self.fallback_beta,
+                "notional": float(desired[i] * price[i]),
+                "message": "No covariance for this underlying; cross-hedged with the fallback beta."
+            }))
+        self.on_fallback = fallback
+
+    async def run(self, redis, interval: float = HEDGE_CYCLE_INTERVAL):
+        """
+        Seeds from the shared ledger, follows its fills and publishes one order set per cycle while
+        anything changed.  Seeding and subscribing happen without an await in between, so no fill is
+        counted twice or missed.
+        """
+        ledger = pnl_ledger.ensure_feed()
+        state = await pnl_ledger.ready_state()
+        self.load(state)
+        ledger.listeners.append(self.on_fill)
+        try:
+            while True:
+                await self.dirty.wait()
+                await asyncio.sleep(interval)  # Let the cycle's fills arrive, then net them together
+                self.dirty.clear()
+                try:
+                    with hedge_cycle_seconds.time():
+                        self._refresh_prices()
+                        orders = self.orders()
+                    self.cycles += 1
+                    hedge_cycles_total.inc()
+                    if orders:
+                        await redis.publish(HEDGE_EXECUTION_CHANNEL, json.dumps({"action": "hedge", "cycle": self.cycles, "orders": orders}))
+                        hedge_orders_total.inc(len(orders))
+                        logging.info(json.dumps({
+                            "module": MODULE_NAME,
+                            "action": "hedge_orders_sent",
+                            "cycle": self.cycles,
+                            "orders": len(orders),
+                            "message": "Netted hedge order set published."
+                        }))
+                except Exception as e:
+                    logging.error(json.dumps({
+                        "module": MODULE_NAME,
+                        "action": "error",
+                        "message": str(e)
+                    }))
+        finally:
+            ledger.listeners.remove(self.on_fill)
+
+def benchmark(underlyings: int = 500, fills: int = 100000, cycles: int = 2000, seed: int = 4) -> dict:
+    """
+    Random book over 500 underlyings (a tenth of them cross-hedged): microseconds per fill and per cycle, and
+    the orders sent over ``cycles`` of random-walk fills, with and without the hysteresis band, when every
+    hedge order fills before the next cycle.
+    """
+    from portfolio_risk_engine import PortfolioRiskEngine
+    rng = np.random.default_rng(seed)
+    names = [f"U{n}USDT" for n in range(underlyings)]
+    perps = names[:underlyings - underlyings // 10]
+    engine = PortfolioRiskEngine(names, window=100)
+    closes = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, (101, 1)) + rng.normal(0, 0.01, (101, underlyings)), axis=0))
+    engine.load_history(closes, names)
+    prices = closes[-1]
+
+    def tape(count):
+        which = rng.integers(0, underlyings, count)
+        perp = rng.random(count) < 0.3
+        return [{"strategy": "momentum", "symbol": perp_symbol(names[i]) if p else names[i], "side": "BUY" if q > 0 else "SELL",
+                 "quantity": abs(q), "price": float(prices[i])} for i, p, q in zip(which.tolist(), perp.tolist(), rng.normal(0, 5, count).tolist())]
+
+    result = {"underlyings": underlyings}
+    for label, band, inner in (("band", HEDGE_BAND_NOTIONAL, HEDGE_INNER_BAND_NOTIONAL), ("no_band", 0.0, 0.0)):
+        hedger = DeltaHedger(perps=perps, hedging_asset=names[0], band=band, inner_band=inner, risk_engine=engine)
+        warmup = tape(fills)
+        started = time.perf_counter()
+        for fill in warmup:
+            hedger.on_fill(fill)
+        fill_us = (time.perf_counter() - started) / fills * 1e6
+        sent, cycle_time, per_cycle = 0, 0.0, tape(cycles * 20)
+        for c in range(cycles):
+            for fill in per_cycle[c * 20:(c + 1) * 20]:
+                hedger.on_fill(fill)
+            started = time.perf_counter()
+            hedger._refresh_prices()
+            orders = hedger.orders(now=float(c))
+            cycle_time += time.perf_counter() - started
+            sent += len(orders)
+            for order in orders:  # Immediate fills at the reference price
+                hedger.on_fill({"strategy": MODULE_NAME, "symbol": order["symbol"], "side": order["side"], "quantity": order["quantity"], "price": order["price"]})
+        n = len(hedger.underlyings)
+        residual = (hedger.linear[:n] * (1 - hedger.target_delta) + hedger.hedge[:n]) * hedger.price[:n]
+        residual[hedger.index[hedger.hedging_asset]] = 0.0  # Also carries the cross-hedges
+        result[label] = {"fill_us": round(fill_us, 2), "cycle_us": round(cycle_time / cycles * 1e6, 1), "orders": sent,
+                         "orders_per_cycle": round(sent / cycles, 2),
+                         "max_direct_error": round(float(np.abs(residual[hedger.direct[:n]]).max()), 2)}
+    return result
+
+async def main():
+    """Main function: delta-hedge the live ledger book until cancelled."""
+    from portfolio_risk_engine import ensure_feed as ensure_risk_feed
+    ensure_risk_feed()  # Live prices and the covariance behind cross-hedge betas
+    await DeltaHedger().run(redis)
+
 async def is_esg_compliant(symbol: str, side: str) -> bool:
     # Deferred to: esg_mode.py
     # TODO: Implement ESG compliance logic
@@ -76,16 +364,14 @@ morphic_mode = os.getenv("MORPHIC_MODE", "default")
 
 # Test entry
 if __name__ == "__main__":
-    import os
-    os.environ["SYMBOL"] = "BTCUSDT"
-    asyncio.run(main())
+    import sys
+    if sys.argv[1:] == ["benchmark"]:
+        logging.info(json.dumps({"module": MODULE_NAME, "action": "benchmark", **benchmark()}))
+    else:
+        asyncio.run(main())
 
 # === Titan Module Footnotes ===
-# Implemented Features: redis-pub, async safety, delta hedging
-# Deferred Features: ESG logic -> esg_mode.py, delta retrieval, asset correlation retrieval
+# Implemented Features: redis-pub, async safety, per-fill net delta per underlying from the fill ledger (spot, linear and inverse contracts), beta cross-hedging from the risk engine covariance (fallback beta, logged, where it has none), one netted order set per cycle, hysteresis band, pending-order tracking
+# Deferred Features: ESG logic -> esg_mode.py, option greeks (no options book yet), lot-size rounding per exchange
 # Excluded Features: backtesting (in backtest_engine.py)
 # Quality Rating: 10/10 reviewed by [Grok|Gemini|Claude] on [YYYY-MM-DD]
-    }
-    await redis.publish(EXECUTION_ORCHESTRATOR_CHANNEL, json.dumps(message))
-MODULE_NAME = "delta_hedger"
-    pass
\ No newline at end of file
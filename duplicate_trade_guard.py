@@ -15,7 +15,8 @@ import asyncio
 import json
 import logging
 import os
-import aioredis
+from redis_connection_manager import get_async_redis
+from pubsub_dispatcher import PubSubDispatcher, decode_json
 import datetime
 
 # Config from config.json or ENV
@@ -25,7 +26,7 @@ EXECUTION_ORCHESTRATOR_CHANNEL = os.getenv("EXECUTION_ORCHESTRATOR_CHANNEL", "ti
 # Redis connection
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
 REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
-redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
 
 # Logging setup
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -79,59 +80,51 @@ async def is_duplicate_signal(signal: dict) -> bool:
 
     return False
 
+def remember_signal(signal: dict):
+    """Starts the duplicate window for a forwarded signal."""
+    signal_id = f"{signal['symbol']}:{signal['side']}:{signal['strategy']}"
+    recent_signals[signal_id] = datetime.datetime.utcnow()
+
+async def handle_signal(signal: dict):
+    """Forwards a strategy signal to the execution orchestrator unless it duplicates a recent one."""
+    if not isinstance(signal, dict):
+        logging.error(json.dumps({
+            "module": MODULE_NAME,
+            "action": "invalid_input",
+            "message": f"Invalid input type. Signal: {type(signal)}"
+        }))
+        return
+
+    symbol = signal.get("symbol")
+    side = signal.get("side")
+    strategy = signal.get("strategy")
+
+    if symbol is None or side is None or strategy is None:
+        logging.warning(json.dumps({
+            "module": MODULE_NAME,
+            "action": "missing_signal_data",
+            "message": "Signal missing symbol, side, or strategy."
+        }))
+        return
+
+    if not await is_duplicate_signal(signal):
+        await redis.publish(EXECUTION_ORCHESTRATOR_CHANNEL, json.dumps(signal))
+        remember_signal(signal)
+
+        logging.info(json.dumps({
+            "module": MODULE_NAME,
+            "action": "signal_processed",
+            "symbol": symbol,
+            "side": side,
+            "strategy": strategy,
+            "message": "Signal processed and forwarded to execution orchestrator."
+        }))
+
 async def main():
     """Main function to prevent the execution of duplicate trading signals."""
-    pubsub = redis.pubsub()
-    await pubsub.psubscribe("titan:prod:strategy_signals")
-
-    while True:
-        try:
-            message = await pubsub.get_message(ignore_subscribe_messages=True)
-            if message:
-                signal = json.loads(message["data"].decode("utf-8"))
-                symbol = signal.get("symbol")
-                side = signal.get("side")
-                strategy = signal.get("strategy")
-
-                if not isinstance(signal, dict):
-                    logging.error(json.dumps({
-                        "module": MODULE_NAME,
-                        "action": "invalid_input",
-                        "message": f"Invalid input type. Signal: {type(signal)}"
-                    }))
-                    continue
-
-                if symbol is None or side is None or strategy is None:
-                    logging.warning(json.dumps({
-                        "module": MODULE_NAME,
-                        "action": "missing_signal_data",
-                        "message": "Signal missing symbol, side, or strategy."
-                    }))
-                    continue
-
-                if not await is_duplicate_signal(signal):
-                    await redis.publish(EXECUTION_ORCHESTRATOR_CHANNEL, json.dumps(signal))
-
-                    signal_id = f"{symbol}:{side}:{strategy}"
-                    recent_signals[signal_id] = datetime.datetime.utcnow()
-
-                    logging.info(json.dumps({
-                        "module": MODULE_NAME,
-                        "action": "signal_processed",
-                        "symbol": symbol,
-                        "side": side,
-                        "strategy": strategy,
-                        "message": "Signal processed and forwarded to execution orchestrator."
-                    }))
-
-            await asyncio.sleep(0.01)
-
-        except Exception as e:
-            logging.error(json.dumps({
-                "module": MODULE_NAME,
-                "action": "error",
-                "message": str(e)
-            }))
+    dispatcher = PubSubDispatcher(redis, MODULE_NAME, patterns=["titan:prod:strategy_signals"])
+    dispatcher.add_handler(lambda message: handle_signal(decode_json(message)), name="handle_signal")
+    await dispatcher.run()
 
 async def is_esg_compliant(symbol: str, side: str) -> bool:
     """Placeholder for ESG compliance check."""
@@ -154,7 +147,7 @@ if __name__ == "__main__":
     asyncio.run(main())
 
 # === Titan Module Footnotes ===
-# Implemented Features: redis-pub, async safety, duplicate signal filtering
+# Implemented Features: redis-pub, event-driven subscription, async safety, duplicate signal filtering
 # Deferred Features: ESG logic -> esg_mode.py
 # Excluded Features: backtesting (in backtest_engine.py)
 # Quality Rating: 10/10 reviewed by [Grok|Gemini|Claude] on [YYYY-MM-DD]
\ No newline at end of file
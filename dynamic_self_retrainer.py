@@ -6,7 +6,7 @@ Purpose: Detects degrading modules and auto-repairs or rotates them based on per
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -33,7 +33,7 @@ RECOVERY_ACTIONS = config.get("RECOVERY_ACTIONS", ["disable", "reduce_capital",
 async def get_module_performance(module_name):
     '''Retrieves module performance data from Redis (placeholder).'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         # Placeholder: Replace with actual logic to fetch performance data
         win_loss_streak = random.randint(-5, 5)  # Simulate win/loss streak
         alpha_score = random.uniform(-0.5, 0.5)  # Simulate alpha score
@@ -53,7 +53,7 @@ async def get_module_performance(module_name):
 async def trigger_recovery_action(module_name, action):
     '''Triggers a recovery action for a module.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         channel = "titan:core:module_control"
         message = json.dumps({"module_name": module_name, "action": action})
         await redis.publish(channel, message)
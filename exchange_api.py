@@ -1,8 +1,119 @@
+import asyncio
+import os
+import time
+import aiohttp
+from prometheus_client import Counter, Histogram
+import tenant_rate_limiter
+
+# Connection pool settings shared by every adapter
+HTTP_POOL_LIMIT = int(os.environ.get("HTTP_POOL_LIMIT", 100))  # Open connections across all hosts
+HTTP_POOL_LIMIT_PER_HOST = int(os.environ.get("HTTP_POOL_LIMIT_PER_HOST", 20))
+HTTP_DNS_CACHE_TTL = int(os.environ.get("HTTP_DNS_CACHE_TTL", 300))  # Seconds
+HTTP_KEEPALIVE_TIMEOUT = float(os.environ.get("HTTP_KEEPALIVE_TIMEOUT", 60))  # Seconds an idle connection stays open
+HTTP_REQUEST_TIMEOUT = float(os.environ.get("HTTP_REQUEST_TIMEOUT", 10))
+LATENCY_EWMA_ALPHA = float(os.environ.get("LATENCY_EWMA_ALPHA", 0.1))  # Weight of the newest sample in measured_latency
+
+exchange_api_latency_seconds = Histogram('exchange_api_latency_seconds', 'Exchange REST call latency', ['exchange', 'method', 'endpoint'],
+                                         buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10))
+exchange_api_errors_total = Counter('exchange_api_errors_total', 'Exchange REST calls that raised or returned an error status', ['exchange', 'endpoint'])
+exchange_api_coalesced_total = Counter('exchange_api_coalesced_total', 'GETs served by joining an identical in-flight request', ['exchange', 'endpoint'])
+
+# Exponentially weighted round-trip seconds per exchange, for latency-aware routing
+latency_ewma = {}
+
+def measured_latency(exchange, default=None):
+    '''Smoothed REST round trip to ``exchange`` in seconds, or ``default`` before the first call.'''
+    return latency_ewma.get(exchange, default)
+
 class ExchangeAPI:
     """
     A generic interface for interacting with different exchange APIs.
+
+    Adapters send REST calls through ``request`` / ``get``, which share one
+    long-lived session per adapter instance: keep-alive connections, a
+    per-host connection limit and a DNS cache, so only the first call to a
+    host pays DNS, TCP and TLS setup.  Concurrent identical GETs are
+    coalesced into one in-flight request whose result every caller shares
+    (treat it as read-only).  With a ``rate_limiter.RateLimiter`` attached,
+    every call first waits for its endpoint's weight in the shared budget.
+    With a ``tenant``, every call that reaches the exchange also counts
+    against that tenant's budget in tenant_rate_limiter and is refused with
+    TenantLimitExceeded once the tenant is over it.
     """
 
+    name = "exchange"
+    base_url = ""
+    api_key = None  # Selects the per-key rate-limit bucket
+
+    def __init__(self, base_url=None, rate_limiter=None, tenant=None):
+        if base_url is not None:
+            self.base_url = base_url
+        self.rate_limiter = rate_limiter
+        self.tenant = tenant
+        self._session = None
+        self._inflight = {}
+
+    def session(self) -> aiohttp.ClientSession:
+        '''The adapter's persistent session, created on first use inside the running loop.'''
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=HTTP_POOL_LIMIT,
+                limit_per_host=HTTP_POOL_LIMIT_PER_HOST,
+                ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+                keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+            )
+            self._session = aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=HTTP_REQUEST_TIMEOUT))
+        return self._session
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def request(self, method, endpoint, params=None, headers=None, json=None, data=None):
+        '''Sends one call on the pooled session and returns the decoded JSON body; raises on HTTP error status.'''
+        path = endpoint.split("?", 1)[0]  # Signed GETs carry their query string; metrics are per path
+        if self.tenant is not None and not await tenant_rate_limiter.allow_api_call(self.tenant):
+            raise tenant_rate_limiter.TenantLimitExceeded(f"Tenant {self.tenant} is over its API call limit")
+        if self.rate_limiter is not None:
+            await self.rate_limiter.throttle(self.name, endpoint, self.api_key)
+        started = time.perf_counter()
+        try:
+            async with self.session().request(method, f"{self.base_url}{endpoint}", params=params, headers=headers, json=json, data=data) as response:
+                response.raise_for_status()
+                return await response.json(content_type=None)
+        except Exception:
+            exchange_api_errors_total.labels(exchange=self.name, endpoint=path).inc()
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            exchange_api_latency_seconds.labels(exchange=self.name, method=method, endpoint=path).observe(elapsed)
+            previous = latency_ewma.get(self.name)
+            latency_ewma[self.name] = elapsed if previous is None else previous + LATENCY_EWMA_ALPHA * (elapsed - previous)
+
+    async def get(self, endpoint, params=None, headers=None):
+        '''GET with request coalescing: callers asking for the same URL while it is in flight share one response.'''
+        key = (endpoint, tuple(sorted((params or {}).items())), tuple(sorted((headers or {}).items())))
+        future = self._inflight.get(key)
+        if future is not None:
+            exchange_api_coalesced_total.labels(exchange=self.name, endpoint=endpoint).inc()
+            return await asyncio.shield(future)  # A cancelled waiter must not cancel the shared request
+        future = asyncio.ensure_future(self.request("GET", endpoint, params=params, headers=headers))
+        self._inflight[key] = future
+        future.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(future)
+
+    def _forget(self, key, future):
+        self._inflight.pop(key, None)
+        if not future.cancelled():
+            future.exception()  # Marks the error retrieved even if every waiter was cancelled
+
     async def fetch_market_data(self, asset, endpoint):
         '''Fetches market data from the exchange API.'''
         raise NotImplementedError
@@ -17,4 +128,4 @@ class ExchangeAPI:
 
     async def fetch_order_book(self, asset, limit=100):
         '''Fetches the order book for the specified asset.'''
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
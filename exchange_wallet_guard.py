@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -63,7 +63,7 @@ async def check_exchange_wallet_status():
 async def prevent_trading_if_wallet_inaccessible():
     '''Prevents trading when exchange wallet is inaccessible.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         wallet_healthy = await check_exchange_wallet_status()
 
         if not wallet_healthy:
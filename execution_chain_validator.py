@@ -8,7 +8,8 @@ import json
 import logging
 import os
 
-import aioredis
+import aioredis
+from redis_connection_manager import get_async_redis
 
 # Configuration (replace with config.json or ENV vars)
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
@@ -60,7 +61,7 @@ async def main():
     Main function to subscribe to Redis channel and process messages.
     """
     try:
-        r = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        r = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         pubsub = r.pubsub()
         await pubsub.subscribe(f"{NAMESPACE}:signals")
 
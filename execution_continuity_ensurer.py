@@ -9,7 +9,8 @@ import logging
 import os
 import random
 
-import aioredis
+import aioredis
+from redis_connection_manager import get_async_redis
 
 # Configuration (replace with config.json or ENV vars)
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
@@ -63,7 +64,7 @@ async def main():
     Main function to run execution continuity checks periodically.
     """
     try:
-        r = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        r = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         while True:
             await ensure_execution_continuity(r)
             await asyncio.sleep(CONTINUITY_CHECK_INTERVAL)  # Run continuity check every CONTINUITY_CHECK_INTERVAL seconds
@@ -9,7 +9,8 @@ import logging
 import os
 import time
 
-import aioredis
+import aioredis
+from redis_connection_manager import get_async_redis
 
 # Configuration (replace with config.json or ENV vars)
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
@@ -54,7 +55,7 @@ async def main():
     Main function to run execution latency reduction periodically.
     """
     try:
-        r = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        r = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         while True:
             await reduce_execution_latency(r)
             await asyncio.sleep(REDUCTION_INTERVAL)  # Run reduction every REDUCTION_INTERVAL seconds
@@ -3,23 +3,73 @@ execution_orchestrator.py
 Validates and routes signals to the executor
 """
 
-from signal_age_filter import SignalAgeFilter
-from redundant_signal_filter import RedundantSignalFilter
-from execution_throttle_controller import ExecutionThrottleController
-from mock_order_executor import MockOrderExecutor
+import asyncio
+import json
+import logging
+import os
+
+import signal_age_filter
+import redundant_signal_filter
+import execution_throttle_controller
+import duplicate_trade_guard
+import Signal_Pipeline_Controller
+import pre_trade_gate
+from mock_order_executor import simulate_order_execution
+from redis_connection_manager import get_async_redis
+from signal_pipeline import PipelineStage, SignalPipeline
+from signal_stream_bus import STRATEGY_SIGNALS_STREAM, StreamConsumer
+
+REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
+REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
+
+MODULE_NAME = "execution_orchestrator"
+
+async def not_throttled(signal):
+    return not await execution_throttle_controller.is_throttled()
+
+async def not_redundant(signal):
+    return not await redundant_signal_filter.is_redundant(signal)
+
+async def not_duplicate(signal):
+    return not await duplicate_trade_guard.is_duplicate_signal(signal)
+
+async def pre_trade_allowed(signal):
+    return pre_trade_gate.ensure_refresh().allows(signal)
+
+def build_default_pipeline():
+    """Every pre-execution filter as an in-process stage; costs are initial ordering hints."""
+    return SignalPipeline([
+        PipelineStage("schema_check", Signal_Pipeline_Controller.schema_check, cost=1, pinned=True),
+        PipelineStage("confidence_validator", Signal_Pipeline_Controller.confidence_validator, cost=1),
+        PipelineStage("pre_trade_gate", pre_trade_allowed, cost=1),
+        PipelineStage("duplicate_trade_guard", not_duplicate, cost=2, on_accept=duplicate_trade_guard.remember_signal),
+        PipelineStage("redundant_signal_filter", not_redundant, cost=2, on_accept=redundant_signal_filter.remember_signal),
+        PipelineStage("signal_age_filter", signal_age_filter.is_signal_fresh, cost=3),
+        PipelineStage("execution_throttle_controller", not_throttled, cost=4,
+                      on_accept=lambda signal: execution_throttle_controller.record_order()),
+    ])
 
 class ExecutionOrchestrator:
-    def __init__(self):
-        self.age_filter = SignalAgeFilter()
-        self.dup_filter = RedundantSignalFilter()
-        self.throttle = ExecutionThrottleController()
-        self.executor = MockOrderExecutor()
-
-    def handle_signal(self, signal):
-        if not self.age_filter.is_fresh(signal):
-            return
-        if self.dup_filter.is_duplicate(signal):
-            return
-        if not self.throttle.allow(signal['symbol']):
-            return
-        self.executor.execute(signal)
+    def __init__(self, pipeline=None, executor=simulate_order_execution):
+        self.pipeline = pipeline or build_default_pipeline()
+        self.executor = executor
+
+    async def handle_signal(self, signal):
+        accepted, rejected_by = await self.pipeline.run(signal)
+        if not accepted:
+            return None
+        return await self.executor(signal)
+
+async def main():
+    """Consumes strategy signals and runs the whole filter chain in this process."""
+    orchestrator = ExecutionOrchestrator()
+    redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+    await pre_trade_gate.start_refresh(redis)  # Otherwise the first signals meet a stale gate and are rejected
+    consumer = StreamConsumer(redis, STRATEGY_SIGNALS_STREAM, MODULE_NAME, orchestrator.handle_signal)
+    try:
+        await consumer.run()
+    finally:
+        logging.info(json.dumps({"module": MODULE_NAME, "action": "pipeline_stats", "stages": orchestrator.pipeline.stats()}))
+
+if __name__ == "__main__":
+    asyncio.run(main())
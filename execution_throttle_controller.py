@@ -15,7 +15,10 @@ import asyncio
 import json
 import logging
 import os
-import aioredis
+from redis_connection_manager import get_async_redis
+from rate_limiter import RateLimiter
+from signal_stream_bus import SIGNAL_TRANSPORT, STRATEGY_SIGNALS_STREAM, StreamConsumer
+from pubsub_dispatcher import PubSubDispatcher, decode_signal
 
 # Config from config.json or ENV
 MAX_ORDERS_PER_MINUTE = int(os.getenv("MAX_ORDERS_PER_MINUTE", 10))
@@ -24,7 +27,7 @@ EXECUTION_ORCHESTRATOR_CHANNEL = os.getenv("EXECUTION_ORCHESTRATOR_CHANNEL", "ti
 # Redis connection
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
 REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
-redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
 
 # Logging setup
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -32,74 +35,70 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 # Module name
 MODULE_NAME = "execution_throttle_controller"
 
-# In-memory store for order timestamps
-order_timestamps = []
+# Orders-per-minute budget shared by every throttle process through Redis
+THROTTLE_BUCKET = ("titan", "forwarded_orders")
+limiter = RateLimiter(redis, {THROTTLE_BUCKET: (MAX_ORDERS_PER_MINUTE, 60)})
 
 async def is_throttled() -> bool:
-    """Checks if the order rate exceeds the defined limit."""
-    now = datetime.datetime.utcnow()
-    # Remove old timestamps
-    order_timestamps[:] = [ts for ts in order_timestamps if (now - ts).total_seconds() < 60]
-
-    if len(order_timestamps) >= MAX_ORDERS_PER_MINUTE:
+    """Checks the order rate against the limit without counting anything against it."""
+    allowed, retry_after = await limiter.check(*THROTTLE_BUCKET)
+    if not allowed:
         logging.warning(json.dumps({
             "module": MODULE_NAME,
             "action": "throttled",
+            "retry_after": retry_after,
             "message": "Order rate exceeded - signal blocked."
         }))
         return True
     else:
         return False
 
+async def record_order() -> bool:
+    """Counts a forwarded order against the limit; False if the budget ran out since ``is_throttled``."""
+    allowed, _ = await limiter.acquire(*THROTTLE_BUCKET)
+    return allowed
+
+async def handle_signal(signal: dict):
+    """Forwards a strategy signal to the execution orchestrator unless throttled."""
+    strategy = signal.get("strategy")
+
+    if strategy is None:
+        logging.warning(json.dumps({
+            "module": MODULE_NAME,
+            "action": "missing_strategy",
+            "message": "Signal missing strategy information."
+        }))
+        return
+
+    # Check if throttled
+    if not await is_throttled() and await record_order():
+        # Allow the signal if not throttled
+        await redis.publish(EXECUTION_ORCHESTRATOR_CHANNEL, json.dumps(signal))  # Pub/sub subscribers include JSON-only modules
+
+        logging.info(json.dumps({
+            "module": MODULE_NAME,
+            "action": "signal_allowed",
+            "strategy": strategy,
+            "message": "Signal allowed - not throttled."
+        }))
+    else:
+        logging.warning(json.dumps({
+            "module": MODULE_NAME,
+            "action": "signal_blocked",
+            "strategy": strategy,
+            "message": "Signal blocked - throttling active."
+        }))
+
 async def main():
     """Main function to throttle trade execution."""
-    pubsub = redis.pubsub()
-    await pubsub.psubscribe("titan:prod:strategy_signals")  # Subscribe to strategy signals channel
-
-    while True:
-        try:
-            message = await pubsub.get_message(ignore_subscribe_messages=True)
-            if message:
-                signal = json.loads(message["data"].decode("utf-8"))
-                strategy = signal.get("strategy")
-
-                if strategy is None:
-                    logging.warning(json.dumps({
-                        "module": MODULE_NAME,
-                        "action": "missing_strategy",
-                        "message": "Signal missing strategy information."
-                    }))
-                    continue
-
-                # Check if throttled
-                if not await is_throttled():
-                    # Allow the signal if not throttled
-                    now = datetime.datetime.utcnow()
-                    order_timestamps.append(now)
-                    await redis.publish(EXECUTION_ORCHESTRATOR_CHANNEL, json.dumps(signal))
-
-                    logging.info(json.dumps({
-                        "module": MODULE_NAME,
-                        "action": "signal_allowed",
-                        "strategy": strategy,
-                        "message": "Signal allowed - not throttled."
-                    }))
-                else:
-                    logging.warning(json.dumps({
-                        "module": MODULE_NAME,
-                        "action": "signal_blocked",
-                        "strategy": strategy,
-                        "message": "Signal blocked - throttling active."
-                    }))
-
-            await asyncio.sleep(0.01)  # Prevent CPU overuse
-
-        except Exception as e:
-            logging.error(json.dumps({
-                "module": MODULE_NAME,
-                "action": "error",
-                "message": str(e)
-            }))
+    if SIGNAL_TRANSPORT == "streams":
+        # One consumer group per filter stage; extra processes join the same group
+        await StreamConsumer(redis, STRATEGY_SIGNALS_STREAM, MODULE_NAME, handle_signal).run()
+        return
+
+    dispatcher = PubSubDispatcher(redis, MODULE_NAME, patterns=["titan:prod:strategy_signals"])  # Subscribe to strategy signals channel
+    dispatcher.add_handler(lambda message: handle_signal(decode_signal(message)), name="handle_signal")
+    await dispatcher.run()
 
 async def is_esg_compliant(symbol: str, side: str) -> bool:
     """Placeholder for ESG compliance check."""
@@ -122,7 +121,7 @@ if __name__ == "__main__":
     asyncio.run(main())
 
 # === Titan Module Footnotes ===
-# Implemented Features: redis-pub, async safety, execution throttling
+# Implemented Features: redis-pub, redis-streams consumer group, event-driven pub/sub fallback, async safety, execution throttling via the shared GCRA rate limiter
 # Deferred Features: ESG logic -> esg_mode.py
 # Excluded Features: backtesting (in backtest_engine.py)
 # Quality Rating: 10/10 reviewed by [Grok|Gemini|Claude] on [YYYY-MM-DD]
\ No newline at end of file
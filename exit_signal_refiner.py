@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -39,7 +39,7 @@ exit_signal_adjustment = Gauge('exit_signal_adjustment', 'Adjustment applied to
 async def fetch_past_trades(strategy):
     '''Analyzes past exit behavior (SL/TP) to determine if signals exited too early or too late.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         past_trades = []
         for i in range(ANALYSIS_WINDOW):
             trade_data = await redis.get(f"titan:trade:{strategy}:outcome:{i}")
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -36,7 +36,7 @@ config_loading_latency_seconds = Histogram('config_loading_latency_seconds', 'La
 async def load_expansion_config():
     '''Defines compatibility with stocks, FX, commodities.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         config_json = await redis.get(EXPANSION_CONFIG_KEY)
         if config_json:
             config = json.loads(config_json)
@@ -6,7 +6,7 @@ Purpose: Detects fast-failed signals and attempts limited, logic-based reversal
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -47,7 +47,7 @@ async def check_reversal_pattern(symbol):
 async def execute_reversal_trade(original_signal):
     '''Executes a reversal trade with half size.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         channel = "titan:core:signal"
 
         reversal_signal = original_signal.copy()
@@ -15,7 +15,7 @@ import asyncio
 import json
 import logging
 import os
-import aioredis
+from redis_connection_manager import get_async_redis
 
 # Config from config.json or ENV
 FAILOVER_EVENT_CHANNEL = os.getenv("FAILOVER_EVENT_CHANNEL", "titan:prod:failover_events")
@@ -24,7 +24,7 @@ ANNOUNCEMENT_TARGET = os.getenv("ANNOUNCEMENT_TARGET", "all") # all, specific_mo
 # Redis connection
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
 REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
-redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
 
 # Logging setup
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -15,8 +15,10 @@ import asyncio
 import json
 import logging
 import os
-import aioredis
-# TODO: Import futures exchange-specific library (e.g., ccxt)
+from redis_connection_manager import get_async_redis
+import pnl_ledger
+from Bybit_API_Integration import bybit_api, order_body
+from pubsub_dispatcher import PubSubDispatcher, decode_json, decode_signal
 
 # Config from config.json or ENV
 EXCHANGE = os.getenv("EXCHANGE", "Binance")
@@ -25,11 +27,15 @@ API_SECRET = os.getenv("API_SECRET")
 LEVERAGE = int(os.getenv("LEVERAGE", 1))
 POSITION_SIZE = float(os.getenv("POSITION_SIZE", 0.1))
 EXECUTION_ORCHESTRATOR_CHANNEL = os.getenv("EXECUTION_ORCHESTRATOR_CHANNEL", "titan:prod:execution_orchestrator")
+HEDGE_EXECUTION_CHANNEL = os.getenv("HEDGE_EXECUTION_CHANNEL", "titan:prod:hedge_requests")  # Netted hedge order sets from delta_hedger
+FUTURES_ORDER_CATEGORY = os.getenv("FUTURES_ORDER_CATEGORY", "linear")  # Bybit v5 product the hedge perpetuals trade in
+HEDGE_FILL_POLLS = int(os.getenv("HEDGE_FILL_POLLS", 5))  # Execution-report polls per hedge order; anything unfilled after them is left to the hedger's pending timeout
+HEDGE_FILL_POLL_INTERVAL = float(os.getenv("HEDGE_FILL_POLL_INTERVAL", 0.2))  # Seconds between polls
 
 # Redis connection
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
 REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
-redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
 
 # Logging setup
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -72,28 +78,87 @@ async def execute_order(signal: dict):
         "message": "Futures order executed (simulated)."
     }))
 
-async def main():
-    """Main function to execute trading orders on futures exchanges."""
-    pubsub = redis.pubsub()
-    await pubsub.psubscribe("titan:prod:execution_requests")  # Subscribe to execution requests channel
-
-    while True:
+async def place_hedge_order(batch: dict, order: dict):
+    """Sends one hedge order to the futures venue as a market order; returns the venue order id, or None when it is rejected."""
+    data = await bybit_api.signed_request("POST", "/v5/order/create", body=order_body(
+        {"asset": order["underlying"], "side": order["side"], "quantity": order["quantity"]}, FUTURES_ORDER_CATEGORY))
+    order_id = data.get("result", {}).get("orderId") if data.get("retCode") == 0 else None
+    logging.log(logging.INFO if order_id else logging.WARNING, json.dumps({
+        "module": MODULE_NAME,
+        "action": "hedge_order_placed" if order_id else "hedge_order_rejected",
+        "exchange": "Bybit",
+        "cycle": batch.get("cycle"),
+        "symbol": order["symbol"],
+        "side": order["side"],
+        "quantity": order["quantity"],
+        "order_id": order_id,
+        "message": data.get("retMsg")
+    }))
+    return order_id
+
+async def execution_fills(order: dict, order_id: str) -> list:
+    """Ledger fills for ``order`` built from the venue's execution reports, polled until they cover its quantity or HEDGE_FILL_POLLS run out."""
+    fills = {}
+    for attempt in range(HEDGE_FILL_POLLS):
+        if attempt:
+            await asyncio.sleep(HEDGE_FILL_POLL_INTERVAL)
         try:
-            message = await pubsub.get_message(ignore_subscribe_messages=True)
-            if message:
-                signal = json.loads(message["data"].decode("utf-8"))
-
-                # Execute order
-                await execute_order(signal)
-
-            await asyncio.sleep(0.01)  # Prevent CPU overuse
-
+            data = await bybit_api.signed_request("GET", "/v5/execution/list", params={"category": FUTURES_ORDER_CATEGORY, "orderId": order_id})
         except Exception as e:
-            logging.error(json.dumps({
-                "module": MODULE_NAME,
-                "action": "error",
-                "message": str(e)
-            }))
+            logging.error(json.dumps({"module": MODULE_NAME, "action": "execution_report_error", "order_id": order_id, "message": str(e)}))
+            continue
+        for report in data.get("result", {}).get("list", []):
+            fills[report["execId"]] = {
+                "strategy": order.get("strategy", MODULE_NAME),
+                "symbol": order["symbol"],
+                "side": report["side"].upper(),
+                "quantity": float(report["execQty"]),
+                "price": float(report["execPrice"]),
+                "fee": float(report.get("execFee") or 0.0),
+                "timestamp_ns": int(report["execTime"]) * 1_000_000,
+                "order_id": order_id,
+                "execution_id": report["execId"]
+            }
+        if sum(fill["quantity"] for fill in fills.values()) >= order["quantity"] - 1e-12:
+            break
+    return list(fills.values())
+
+async def hedge_order_fills(batch: dict, order: dict) -> list:
+    """Places one hedge order and returns its reported executions; a rejected or failed order contributes none."""
+    try:
+        order_id = await place_hedge_order(batch, order)
+    except Exception as e:
+        logging.error(json.dumps({"module": MODULE_NAME, "action": "hedge_order_error", "cycle": batch.get("cycle"), "symbol": order.get("symbol"), "message": str(e)}))
+        return []
+    if order_id is None:
+        return []
+    return await execution_fills(order, order_id)
+
+async def execute_hedge_batch(batch: dict) -> list:
+    """
+    Sends one netted hedge order set (published by delta_hedger) to the futures venue and records the executions
+    the venue reports, and only those, in the ledger in one round trip; returns the fills recorded.
+    """
+    results = await asyncio.gather(*(hedge_order_fills(batch, order) for order in batch.get("orders", [])))
+    fills = [fill for order_fills in results for fill in order_fills]
+    if fills:
+        await pnl_ledger.record_fills(redis, fills)
+    return fills
+
+async def handle_message(message: dict):
+    """Dispatcher handler: a whole hedge batch from HEDGE_EXECUTION_CHANNEL, otherwise one execution request."""
+    channel = message["channel"].decode("utf-8") if isinstance(message["channel"], bytes) else message["channel"]
+    if channel == HEDGE_EXECUTION_CHANNEL:
+        await execute_hedge_batch(decode_json(message))
+    else:
+        await execute_order(decode_signal(message))
+
+async def main():
+    """Main function to execute trading orders on futures exchanges."""
+    # Hedge batches have their own channel; spot executors never see them
+    dispatcher = PubSubDispatcher(redis, MODULE_NAME, channels=[HEDGE_EXECUTION_CHANNEL], patterns=["titan:prod:execution_requests"])
+    dispatcher.add_handler(handle_message)
+    await dispatcher.run()
 
 async def is_esg_compliant(symbol: str, side: str) -> bool:
     """Placeholder for ESG compliance check."""
@@ -116,7 +181,7 @@ if __name__ == "__main__":
     asyncio.run(main())
 
 # === Titan Module Footnotes ===
-# Implemented Features: redis-pub, async safety, futures order execution (simulated)
+# Implemented Features: redis-pub, event-driven pub/sub dispatch (pubsub_dispatcher), async safety, futures order execution (simulated), hedge batches on Bybit v5 linear perpetuals with ledger fills from execution reports
 # Deferred Features: ESG logic -> esg_mode.py, exchange integration
 # Excluded Features: backtesting (in backtest_engine.py)
 # Quality Rating: 10/10 reviewed by [Grok|Gemini|Claude] on [YYYY-MM-DD]
\ No newline at end of file
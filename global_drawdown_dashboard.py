@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -41,7 +41,7 @@ global_drawdown_level = Gauge('global_drawdown_level', 'Current level of global
 async def fetch_module_drawdowns():
     '''Monitors total system drawdown across all modules.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         total_drawdown = 0
         for module in ["MomentumStrategy", "ScalpingModule", "ArbitrageModule", "ReversalStrategy"]: # Example modules
             drawdown = await redis.get(f"titan:performance:{module}:drawdown")
@@ -65,7 +65,7 @@ async def halt_risky_modules(total_drawdown):
 
     try:
         if total_drawdown > DRAWDOWN_THRESHOLD:
-            redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+            redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
             for module in RISKY_MODULES:
                 await redis.set(f"titan:module:status:{module}", "halted")
                 logger.warning(json.dumps({"module": "global_drawdown_dashboard", "action": "Halt Risky Module", "status": "Halted", "module": module}))
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -39,7 +39,7 @@ voting_latency_seconds = Histogram('voting_latency_seconds', 'Latency of voting
 async def create_proposal(proposal_id, description, options):
     '''Vote on module upgrades, thresholds. Records proposals and ballots.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         proposal_data = {"description": description, "options": options, "votes": {option: 0 for option in options}}
         await redis.set(f"{PROPOSAL_KEY_PREFIX}{proposal_id}", json.dumps(proposal_data))
         logger.info(json.dumps({"module": "governance_vote_engine", "action": "Create Proposal", "status": "Success", "proposal_id": proposal_id}))
@@ -53,7 +53,7 @@ async def create_proposal(proposal_id, description, options):
 async def cast_vote(user_id, proposal_id, option):
     '''Vote on module upgrades, thresholds. Records proposals and ballots.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         proposal_data = await redis.get(f"{PROPOSAL_KEY_PREFIX}{proposal_id}")
         if not proposal_data:
             logger.warning(json.dumps({"module": "governance_vote_engine", "action": "Cast Vote", "status": "Invalid Proposal", "proposal_id": proposal_id}))
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -107,7 +107,7 @@ async def throttle_queue():
         bool: True if throttling was successful, False otherwise
     '''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         
         # Placeholder for throttling queue logic (replace with actual throttling)
         # Example: Set a flag in Redis to indicate throttling
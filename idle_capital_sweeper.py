@@ -15,7 +15,8 @@ import asyncio
 import json
 import logging
 import os
-import aioredis
+import aioredis
+from redis_connection_manager import get_async_redis
 
 # Config from config.json or ENV
 IDLE_CAPITAL_PERCENTAGE_THRESHOLD = float(os.getenv("IDLE_CAPITAL_PERCENTAGE_THRESHOLD", 30.0))
@@ -27,7 +28,7 @@ SCALPING_MODULES_CHANNEL = os.getenv("SCALPING_MODULES_CHANNEL", "titan:prod:sca
 # Redis connection
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
 REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
-redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
 
 # Logging setup
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
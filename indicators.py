@@ -0,0 +1,563 @@
+# Module: indicators.py
+# Version: 1.0.0
+# Last Updated: 2026-10-16
+# Purpose: Shared technical indicators (SMA, EMA, ATR, Bollinger, RSI, VWAP, rolling volatility, z-score) with O(1) streaming updates and matching vectorized batch functions.
+
+# Core Objectives:
+# - Profitability (50–100% daily ROI target)
+# - Risk reduction (50:1 profit:loss ratio)
+# - ESG-safe actions only
+# - Compliance with UAE financial law
+# - Clean async logic and Redis safety
+# - Prometheus metrics (if needed)
+
+import asyncio
+import json
+import logging
+import math
+import os
+import time
+from collections import deque
+import numpy as np
+
+from candle_store import load_candles
+from Market_Data_Gateway import KLINES_CHANNEL, PRIMARY_BOOK_EXCHANGE, KLINE_INTERVAL
+from pubsub_dispatcher import PubSubDispatcher, decode_json
+
+# Config from config.json or ENV
+INDICATOR_WARMUP_BARS = int(os.getenv("INDICATOR_WARMUP_BARS", 1000))  # Stored candles replayed before following the live stream
+INDICATOR_VWAP_PERIOD = int(os.getenv("INDICATOR_VWAP_PERIOD", 1440))  # Bars in the rolling VWAP (0 = cumulative)
+
+# Logging setup
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# Module name
+MODULE_NAME = "indicators"
+
+# Largest exponent the block-wise batch smoother lets its scale factors reach
+_SMOOTH_EXP_LIMIT = 300.0
+_WINDOW_CHUNK = 8192  # Windows materialized at once by the batch rolling moments
+
+# Conventions shared by both modes:
+# - Streaming ``update`` returns the current value (None until warm) and keeps it in ``.value``.
+# - Batch functions take 1-D arrays and return float arrays of the same length, NaN until warm.
+# - For the same input, streaming value i equals batch element i up to float rounding: the same
+#   seeds and recursions, with the running sums of the streaming side computed as cumulative
+#   sums on the batch side.
+# - EMA seeds with the SMA of its first ``period`` inputs; ATR and RSI use Wilder smoothing
+#   (alpha = 1 / period) seeded the same way.
+# - Rolling moments are summed relative to a value inside the window so long price series keep precision.
+
+class _RollingMoments:
+    """
+    Running sum and sum of squares over the last ``period`` values, taken
+    relative to an anchor.  Every ``period`` pushes the anchor moves to the
+    oldest value in the window and the sums are recomputed from it, which
+    keeps cancellation small on drifting price series at amortized O(1).
+    Pass ``anchor`` to pin it (for series already centred near zero).
+    """
+
+    def __init__(self, period: int, anchor: float = None):
+        self.period = period
+        self.window = deque()
+        self.pinned = anchor is not None
+        self.anchor = anchor
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.pushes = 0
+
+    def push(self, x: float) -> bool:
+        """Adds a value; True once the window is full."""
+        if self.anchor is None:
+            self.anchor = x
+        self.window.append(x)
+        d = x - self.anchor
+        self.total += d
+        self.total_sq += d * d
+        if len(self.window) > self.period:
+            old = self.window.popleft() - self.anchor
+            self.total -= old
+            self.total_sq -= old * old
+        self.pushes += 1
+        if not self.pinned and self.pushes % self.period == 0:
+            self.anchor = self.window[0]
+            deviations = [value - self.anchor for value in self.window]
+            self.total = math.fsum(deviations)
+            self.total_sq = math.fsum(d * d for d in deviations)
+        return len(self.window) == self.period
+
+    def mean(self) -> float:
+        return self.anchor + self.total / self.period
+
+    def variance(self, ddof: int = 0) -> float:
+        n = self.period
+        return max((self.total_sq - self.total * self.total / n) / (n - ddof), 0.0)
+
+class SMA:
+    def __init__(self, period: int):
+        self.period = period
+        self.window = deque()
+        self.total = 0.0
+        self.value = None
+
+    def update(self, x: float):
+        self.window.append(x)
+        self.total += x
+        if len(self.window) > self.period:
+            self.total -= self.window.popleft()
+        if len(self.window) == self.period:
+            self.value = self.total / self.period
+        return self.value
+
+class _Smoother:
+    """Exponential smoothing seeded with the mean of the first ``period`` inputs."""
+
+    def __init__(self, period: int, alpha: float):
+        self.period = period
+        self.alpha = alpha
+        self.seen = 0
+        self.seed_total = 0.0
+        self.value = None
+
+    def update(self, x: float):
+        if self.value is None:
+            self.seen += 1
+            self.seed_total += x
+            if self.seen == self.period:
+                self.value = self.seed_total / self.period
+            return self.value
+        self.value = (1 - self.alpha) * self.value + self.alpha * x
+        return self.value
+
+class EMA(_Smoother):
+    def __init__(self, period: int):
+        super().__init__(period, 2 / (period + 1))
+
+class ATR:
+    """Average true range, Wilder-smoothed; the first bar's true range is high - low."""
+
+    def __init__(self, period: int = 14):
+        self.smoother = _Smoother(period, 1 / period)
+        self.previous_close = None
+        self.value = None
+
+    def update(self, high: float, low: float, close: float):
+        if self.previous_close is None:
+            true_range = high - low
+        else:
+            true_range = max(high - low, abs(high - self.previous_close), abs(low - self.previous_close))
+        self.previous_close = close
+        self.value = self.smoother.update(true_range)
+        return self.value
+
+class Bollinger:
+    """``value`` is (middle, upper, lower); ``width`` is (upper - lower) / middle."""
+
+    def __init__(self, period: int = 20, k: float = 2.0):
+        self.k = k
+        self.moments = _RollingMoments(period)
+        self.value = None
+
+    def update(self, x: float):
+        if self.moments.push(x):
+            middle = self.moments.mean()
+            band = self.k * math.sqrt(self.moments.variance())
+            self.value = (middle, middle + band, middle - band)
+        return self.value
+
+    @property
+    def width(self):
+        if self.value is None or not self.value[0]:
+            return None
+        middle, upper, lower = self.value
+        return (upper - lower) / middle
+
+class RSI:
+    """Wilder RSI; 50 when the window had no movement at all."""
+
+    def __init__(self, period: int = 14):
+        self.gain = _Smoother(period, 1 / period)
+        self.loss = _Smoother(period, 1 / period)
+        self.previous = None
+        self.value = None
+
+    def update(self, x: float):
+        if self.previous is not None:
+            change = x - self.previous
+            gain = self.gain.update(max(change, 0.0))
+            loss = self.loss.update(max(-change, 0.0))
+            if gain is not None:
+                self.value = 100 * gain / (gain + loss) if gain + loss > 0 else 50.0
+        self.previous = x
+        return self.value
+
+class VWAP:
+    """Volume-weighted average price over the last ``period`` updates, or cumulative when ``period`` is 0 / None."""
+
+    def __init__(self, period: int = INDICATOR_VWAP_PERIOD):
+        self.period = period or None
+        self.window = deque()
+        self.notional = 0.0
+        self.volume = 0.0
+        self.value = None
+
+    def update(self, price: float, volume: float):
+        self.notional += price * volume
+        self.volume += volume
+        if self.period is not None:
+            self.window.append((price * volume, volume))
+            if len(self.window) > self.period:
+                old_notional, old_volume = self.window.popleft()
+                self.notional -= old_notional
+                self.volume -= old_volume
+        self.value = self.notional / self.volume if self.volume > 0 else None
+        return self.value
+
+class RollingVolatility:
+    """Sample standard deviation of log returns over the last ``period`` returns, per bar."""
+
+    def __init__(self, period: int = 20):
+        self.moments = _RollingMoments(period, anchor=0.0)  # Returns are already centred near zero
+        self.previous = None
+        self.value = None
+
+    def update(self, x: float):
+        if self.previous is not None and self.moments.push(math.log(x / self.previous)):
+            self.value = math.sqrt(self.moments.variance(ddof=1))
+        self.previous = x
+        return self.value
+
+class ZScore:
+    """(x - mean) / population standard deviation over the last ``period`` values including x; 0 on a flat window."""
+
+    def __init__(self, period: int = 20):
+        self.moments = _RollingMoments(period)
+        self.value = None
+
+    def update(self, x: float):
+        if self.moments.push(x):
+            std = math.sqrt(self.moments.variance())
+            self.value = (x - self.moments.mean()) / std if std > 0 else 0.0
+        return self.value
+
+# Batch mode
+
+def _nan(n: int) -> np.ndarray:
+    return np.full(n, np.nan)
+
+def _window_sums(values: np.ndarray, period: int) -> np.ndarray:
+    """Sums of each full window; element i covers values[i : i + period]."""
+    totals = np.concatenate(([0.0], np.cumsum(values)))
+    return totals[period:] - totals[:-period]
+
+def _smooth(values: np.ndarray, alpha: float, initial: float) -> np.ndarray:
+    """
+    y[j] = (1 - alpha) * y[j - 1] + alpha * values[j] with y[-1] = initial, without a Python loop per element.
+
+    Within a block y[j] = d^(j+1) * (initial + alpha * sum_k<=j values[k] * d^-(k+1)) with d = 1 - alpha, so
+    each block is one cumulative sum; blocks are sized so d^-(j+1) stays representable.
+    """
+    decay = 1 - alpha
+    out = np.empty(len(values))
+    if decay <= 0:
+        out[:] = values
+        return out
+    block = max(1, int(_SMOOTH_EXP_LIMIT / -math.log(decay))) if decay < 1 else len(values)
+    previous = initial
+    for start in range(0, len(values), block):
+        chunk = values[start:start + block]
+        growth = decay ** -np.arange(1, len(chunk) + 1, dtype=float)
+        smoothed = (previous + alpha * np.cumsum(chunk * growth)) / growth
+        out[start:start + len(chunk)] = smoothed
+        previous = smoothed[-1]
+    return out
+
+def _seeded_smooth(values: np.ndarray, period: int, alpha: float) -> np.ndarray:
+    out = _nan(len(values))
+    if len(values) >= period:
+        seed = values[:period].sum() / period
+        out[period - 1] = seed
+        out[period:] = _smooth(values[period:], alpha, seed)
+    return out
+
+def _rolling_moments(values: np.ndarray, period: int, ddof: int = 0, centred: bool = False):
+    """
+    (mean, variance) arrays aligned to each window's last element, NaN before the first full window.
+
+    Each window is summed relative to its own first value (or zero when ``centred``), in chunks of
+    _WINDOW_CHUNK windows, so precision does not depend on the length of the series.
+    """
+    mean, variance = _nan(len(values)), _nan(len(values))
+    if len(values) < period:
+        return mean, variance
+    windows = np.lib.stride_tricks.sliding_window_view(values, period)
+    for start in range(0, len(windows), _WINDOW_CHUNK):
+        chunk = windows[start:start + _WINDOW_CHUNK]
+        anchor = 0.0 if centred else chunk[:, 0]
+        d = chunk - (anchor if centred else anchor[:, None])
+        total = d.sum(axis=1)
+        total_sq = (d * d).sum(axis=1)
+        rows = slice(period - 1 + start, period - 1 + start + len(chunk))
+        mean[rows] = anchor + total / period
+        variance[rows] = np.maximum((total_sq - total * total / period) / (period - ddof), 0.0)
+    return mean, variance
+
+def sma(values, period: int) -> np.ndarray:
+    values = np.asarray(values, dtype=float)
+    out = _nan(len(values))
+    if len(values) >= period:
+        out[period - 1:] = _window_sums(values, period) / period
+    return out
+
+def ema(values, period: int) -> np.ndarray:
+    return _seeded_smooth(np.asarray(values, dtype=float), period, 2 / (period + 1))
+
+def true_range(high, low, close) -> np.ndarray:
+    high, low, close = (np.asarray(a, dtype=float) for a in (high, low, close))
+    tr = high - low
+    if len(tr) > 1:
+        previous = close[:-1]
+        tr[1:] = np.maximum(tr[1:], np.maximum(np.abs(high[1:] - previous), np.abs(low[1:] - previous)))
+    return tr
+
+def atr(high, low, close, period: int = 14) -> np.ndarray:
+    return _seeded_smooth(true_range(high, low, close), period, 1 / period)
+
+def bollinger(values, period: int = 20, k: float = 2.0):
+    """(middle, upper, lower) arrays."""
+    middle, variance = _rolling_moments(np.asarray(values, dtype=float), period)
+    band = k * np.sqrt(variance)
+    return middle, middle + band, middle - band
+
+def rsi(values, period: int = 14) -> np.ndarray:
+    values = np.asarray(values, dtype=float)
+    out = _nan(len(values))
+    if len(values) > period:
+        change = np.diff(values)
+        gain = _seeded_smooth(np.maximum(change, 0.0), period, 1 / period)[period - 1:]
+        loss = _seeded_smooth(np.maximum(-change, 0.0), period, 1 / period)[period - 1:]
+        total = gain + loss
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out[period:] = np.where(total > 0, 100 * gain / total, 50.0)
+    return out
+
+def vwap(price, volume, period: int = INDICATOR_VWAP_PERIOD) -> np.ndarray:
+    price, volume = np.asarray(price, dtype=float), np.asarray(volume, dtype=float)
+    notional = np.cumsum(price * volume)
+    traded = np.cumsum(volume)
+    if period and len(price) > period:
+        notional[period:] -= notional[:-period].copy()
+        traded[period:] -= traded[:-period].copy()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(traded > 0, notional / traded, np.nan)
+
+def rolling_volatility(values, period: int = 20) -> np.ndarray:
+    values = np.asarray(values, dtype=float)
+    out = _nan(len(values))
+    if len(values) > period:
+        _, variance = _rolling_moments(np.diff(np.log(values)), period, ddof=1, centred=True)
+        out[1:] = np.sqrt(variance)
+    return out
+
+def zscore(values, period: int = 20) -> np.ndarray:
+    values = np.asarray(values, dtype=float)
+    mean, variance = _rolling_moments(values, period)
+    std = np.sqrt(variance)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(std > 0, (values - mean) / std, np.where(np.isnan(std), np.nan, 0.0))
+
+# Per-symbol bundle fed with OHLCV bars
+
+DEFAULT_PERIODS = {
+    "sma_fast": 50, "sma_slow": 200, "ema_fast": 12, "ema_slow": 26, "atr": 14, "bollinger": 20,
+    "rsi": 14, "vwap": INDICATOR_VWAP_PERIOD, "volatility": 20, "volatility_long": 200, "zscore": 20, "volume_sma": 20,
+}
+
+class BarIndicators:
+    """
+    Every indicator for one symbol, updated per closed bar in O(1).
+
+    ``update`` takes a bar with open/high/low/close/volume (the gateway's
+    kline events qualify) and returns ``snapshot()``: a flat dict of the
+    current values, None while an indicator is warming up.  ``batch_indicators``
+    returns the same keys as arrays over a whole history.
+    """
+
+    def __init__(self, bollinger_k: float = 2.0, **periods):
+        self.periods = {**DEFAULT_PERIODS, **periods}
+        p = self.periods
+        self.sma_fast, self.sma_slow = SMA(p["sma_fast"]), SMA(p["sma_slow"])
+        self.ema_fast, self.ema_slow = EMA(p["ema_fast"]), EMA(p["ema_slow"])
+        self.atr = ATR(p["atr"])
+        self.bollinger = Bollinger(p["bollinger"], bollinger_k)
+        self.rsi = RSI(p["rsi"])
+        self.vwap = VWAP(p["vwap"])
+        self.volatility = RollingVolatility(p["volatility"])
+        self.volatility_long = RollingVolatility(p["volatility_long"])
+        self.zscore = ZScore(p["zscore"])
+        self.volume_sma = SMA(p["volume_sma"])
+        self.bars = 0
+        self.close = None
+        self.volume = None
+        self.last_open_time = None
+
+    def update(self, bar: dict) -> dict:
+        high, low, close, volume = float(bar["high"]), float(bar["low"]), float(bar["close"]), float(bar["volume"])
+        self.sma_fast.update(close)
+        self.sma_slow.update(close)
+        self.ema_fast.update(close)
+        self.ema_slow.update(close)
+        self.atr.update(high, low, close)
+        self.bollinger.update(close)
+        self.rsi.update(close)
+        self.vwap.update((high + low + close) / 3, volume)
+        self.volatility.update(close)
+        self.volatility_long.update(close)
+        self.zscore.update(close)
+        self.volume_sma.update(volume)
+        self.bars += 1
+        self.close, self.volume = close, volume
+        return self.snapshot()
+
+    def snapshot(self) -> dict:
+        bands = self.bollinger.value or (None, None, None)
+        return {
+            "close": self.close,
+            "volume": self.volume,
+            "sma_fast": self.sma_fast.value,
+            "sma_slow": self.sma_slow.value,
+            "ema_fast": self.ema_fast.value,
+            "ema_slow": self.ema_slow.value,
+            "atr": self.atr.value,
+            "bollinger_middle": bands[0],
+            "bollinger_upper": bands[1],
+            "bollinger_lower": bands[2],
+            "bollinger_width": self.bollinger.width,
+            "rsi": self.rsi.value,
+            "vwap": self.vwap.value,
+            "volatility": self.volatility.value,
+            "volatility_long": self.volatility_long.value,
+            "zscore": self.zscore.value,
+            "volume_sma": self.volume_sma.value,
+        }
+
+    def warm(self, frame, last: int = INDICATOR_WARMUP_BARS) -> int:
+        """Replays the newest ``last`` bars of a candle_store.CandleFrame not yet applied, oldest first; returns how many were applied."""
+        start = max(len(frame) - last, 0)
+        if self.last_open_time is not None:
+            start = max(start, int(np.searchsorted(frame.timestamp, self.last_open_time, side="right")))
+        columns = [frame[column][start:].tolist() for column in ("high", "low", "close", "volume")]
+        for high, low, close, volume in zip(*columns):
+            self.update({"high": high, "low": low, "close": close, "volume": volume})
+        if len(frame) > start:
+            self.last_open_time = int(frame.timestamp[-1])
+        return len(frame) - start
+
+def batch_indicators(high, low, close, volume, bollinger_k: float = 2.0, **periods) -> dict:
+    """Vectorized BarIndicators over whole arrays, for backtests; same keys as ``BarIndicators.snapshot``."""
+    p = {**DEFAULT_PERIODS, **periods}
+    high, low, close, volume = (np.asarray(a, dtype=float) for a in (high, low, close, volume))
+    middle, upper, lower = bollinger(close, p["bollinger"], bollinger_k)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        width = (upper - lower) / middle
+    return {
+        "close": close,
+        "volume": volume,
+        "sma_fast": sma(close, p["sma_fast"]),
+        "sma_slow": sma(close, p["sma_slow"]),
+        "ema_fast": ema(close, p["ema_fast"]),
+        "ema_slow": ema(close, p["ema_slow"]),
+        "atr": atr(high, low, close, p["atr"]),
+        "bollinger_middle": middle,
+        "bollinger_upper": upper,
+        "bollinger_lower": lower,
+        "bollinger_width": width,
+        "rsi": rsi(close, p["rsi"]),
+        "vwap": vwap((high + low + close) / 3, volume, p["vwap"]),
+        "volatility": rolling_volatility(close, p["volatility"]),
+        "volatility_long": rolling_volatility(close, p["volatility_long"]),
+        "zscore": zscore(close, p["zscore"]),
+        "volume_sma": sma(volume, p["volume_sma"]),
+    }
+
+async def follow_klines(redis, symbol: str, indicators: BarIndicators, on_bar=None, exchange: str = PRIMARY_BOOK_EXCHANGE, interval: str = KLINE_INTERVAL):
+    """
+    Keeps ``indicators`` current in-process: replays up to INDICATOR_WARMUP_BARS stored candles, then
+    applies each closed kline the gateway publishes for ``symbol`` on ``exchange``.  ``on_bar(bar, snapshot)``
+    (sync or async) runs after every applied bar.  Runs until cancelled.
+    """
+    try:
+        indicators.warm(load_candles(symbol, interval))
+    except Exception as e:
+        logging.warning(json.dumps({"module": MODULE_NAME, "action": "warmup_failed", "symbol": symbol, "error": str(e)}))
+
+    async def apply(message):
+        bar = decode_json(message)
+        if not bar.get("closed") or bar.get("exchange") != exchange or bar.get("interval") != interval:
+            return
+        if indicators.last_open_time is not None and bar["open_time_ns"] <= indicators.last_open_time:
+            return  # Already applied (replayed from the store or redelivered)
+        indicators.last_open_time = bar["open_time_ns"]
+        snapshot = indicators.update(bar)
+        if on_bar is not None:
+            result = on_bar(bar, snapshot)
+            if asyncio.iscoroutine(result):
+                await result
+
+    dispatcher = PubSubDispatcher(redis, f"indicators:{symbol}", channels=[KLINES_CHANNEL.format(symbol=symbol)])
+    dispatcher.add_handler(apply, name="apply_bar")
+    await dispatcher.run()
+
+def benchmark(bars: int = 200000, seed: int = 7) -> dict:
+    """Streams a random-walk OHLCV series bar by bar and in batch; per-bar cost, batch cost and the largest relative disagreement."""
+    rng = np.random.default_rng(seed)
+    close = 30000 * np.exp(np.cumsum(rng.normal(0, 0.001, bars)))
+    spread = close * np.abs(rng.normal(0, 0.0005, bars))
+    high, low = close + spread, close - spread
+    volume = rng.uniform(0.1, 10, bars)
+
+    streaming = BarIndicators()
+    rows = []
+    started = time.perf_counter()
+    for h, l, c, v in zip(high.tolist(), low.tolist(), close.tolist(), volume.tolist()):
+        rows.append(streaming.update({"high": h, "low": l, "close": c, "volume": v}))
+    stream_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    batch = batch_indicators(high, low, close, volume)
+    batch_seconds = time.perf_counter() - started
+
+    worst = {}
+    for key, expected in batch.items():
+        actual = np.array([np.nan if row[key] is None else row[key] for row in rows])
+        if not np.array_equal(np.isnan(actual), np.isnan(expected)):
+            worst[key] = "warm-up mismatch"
+            continue
+        ok = ~np.isnan(expected)
+        scale = np.maximum(np.abs(expected[ok]), 1.0)
+        worst[key] = float(np.max(np.abs(actual[ok] - expected[ok]) / scale)) if ok.any() else 0.0
+    return {
+        "bars": bars,
+        "stream_us_per_bar": round(stream_seconds / bars * 1e6, 2),
+        "batch_ms": round(batch_seconds * 1e3, 2),
+        "max_relative_difference": max(v for v in worst.values() if isinstance(v, float)),
+        "mismatches": [key for key, v in worst.items() if not isinstance(v, float)],
+    }
+
+# Chaos hook example
+if os.getenv("CHAOS_MODE", "off") == "on":
+    raise Exception("Simulated failure - chaos mode")
+
+# Morphic mode control
+morphic_mode = os.getenv("MORPHIC_MODE", "default")
+# No morphic mode control specified for this module
+
+# Test entry
+if __name__ == "__main__":
+    logging.info(json.dumps({"module": MODULE_NAME, "action": "benchmark", **benchmark()}))
+
+# === Titan Module Footnotes ===
+# Implemented Features: O(1) streaming SMA/EMA/ATR/Bollinger/RSI/VWAP/rolling volatility/z-score, vectorized batch equivalents, per-symbol bar bundle, candle-store warm-up, in-process kline following
+# Deferred Features: multi-timeframe bars (one bundle per interval for now)
+# Excluded Features: signal generation (in the strategy modules)
+# Quality Rating: 10/10 reviewed by [Grok|Gemini|Claude] on [YYYY-MM-DD]
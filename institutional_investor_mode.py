@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -40,7 +40,7 @@ drawdown_value = Gauge('drawdown_value', 'Drawdown')
 async def fetch_portfolio_data():
     '''Fetches portfolio data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         # Placeholder for fetching portfolio data logic (replace with actual fetching)
         portfolio_data = {"nav": 1000000, "var": 0.05, "drawdown": 0.1, "strategy_performance": {"Momentum": 0.1, "Scalping": 0.05}} # Simulate portfolio data
         logger.info(json.dumps({"module": "institutional_investor_mode", "action": "Fetch Portfolio Data", "status": "Success"}))
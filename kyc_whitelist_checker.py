@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -38,7 +38,7 @@ user_kyc_tier = Gauge('user_kyc_tier', 'KYC tier of each user', ['user_id'])
 async def fetch_user_kyc_tier(user_id):
     '''Checks titan:kyc:<userid>:tier.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         kyc_tier = await redis.get(f"titan:kyc:{user_id}:tier")
         if kyc_tier:
             return int(kyc_tier)
@@ -51,18 +51,16 @@ async def fetch_user_kyc_tier(user_id):
 
 async def is_trade_allowed(user_id, symbol):
     '''Denies execution if tier < required level.'''
+    global trades_denied_total, user_kyc_tier
     try:
         kyc_tier = await fetch_user_kyc_tier(user_id)
         if symbol in RESTRICTED_ASSETS and kyc_tier < REQUIRED_KYC_TIER:
             logger.warning(json.dumps({"module": "kyc_whitelist_checker", "action": "Deny Trade Execution", "status": "Denied", "user_id": user_id, "symbol": symbol, "kyc_tier": kyc_tier}))
-            global trades_denied_total
             trades_denied_total.inc()
-            global user_kyc_tier
             user_kyc_tier.labels(user_id=user_id).set(kyc_tier)
             return False
         else:
             logger.info(json.dumps({"module": "kyc_whitelist_checker", "action": "Allow Trade Execution", "status": "Allowed", "user_id": user_id, "symbol": symbol, "kyc_tier": kyc_tier}))
-            global user_kyc_tier
             user_kyc_tier.labels(user_id=user_id).set(kyc_tier)
             return True
     except Exception as e:
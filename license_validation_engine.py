@@ -6,7 +6,7 @@ Purpose: Enforces valid license.
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -42,7 +42,7 @@ async def is_license_valid():
 async def validate_license():
     '''Validates the license and publishes a message to Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         channel = "titan:core:license"
 
         if await is_license_valid():
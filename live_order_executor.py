@@ -15,7 +15,9 @@ import asyncio
 import json
 import logging
 import os
-import aioredis
+import time
+from redis_connection_manager import get_async_redis
+import pnl_ledger
 # TODO: Import exchange-specific library (e.g., ccxt)
 
 # Config from config.json or ENV
@@ -26,7 +28,7 @@ API_SECRET = os.getenv("API_SECRET")
 # Redis connection
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
 REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
-redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
 
 # Logging setup
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -70,6 +72,17 @@ async def execute_order(signal: dict):
         "message": "Order executed on the live exchange (simulated)."
     }))
 
+    # The ledger is the source of positions and PnL for every reader downstream
+    await pnl_ledger.record_fill(redis, {
+        "strategy": signal.get("strategy", "unknown"),
+        "symbol": symbol,
+        "side": side,
+        "quantity": quantity,
+        "price": price,
+        "timestamp_ns": time.time_ns(),
+        "signal_id": signal.get("signal_id", "unknown")
+    })
+
 async def main():
     """Main function to execute trading orders on live exchanges."""
     pubsub = redis.pubsub()
@@ -114,7 +127,7 @@ if __name__ == "__main__":
     asyncio.run(main())
 
 # === Titan Module Footnotes ===
-# Implemented Features: redis-pub, async safety, live order execution (simulated)
+# Implemented Features: redis-pub, async safety, live order execution (simulated), fills recorded to pnl_ledger
 # Deferred Features: ESG logic -> esg_mode.py, exchange integration
 # Excluded Features: backtesting (in backtest_engine.py)
 # Quality Rating: 10/10 reviewed by [Grok|Gemini|Claude] on [YYYY-MM-DD]
\ No newline at end of file
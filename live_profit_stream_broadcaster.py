@@ -15,7 +15,7 @@ import asyncio
 import json
 import logging
 import os
-import aioredis
+from redis_connection_manager import get_async_redis
 
 # Config from config.json or ENV
 STREAMING_SERVICE_URL = os.getenv("STREAMING_SERVICE_URL", "http://localhost:8002/pnl_stream")
@@ -24,7 +24,7 @@ PNL_TRACKER_CHANNEL = os.getenv("PNL_TRACKER_CHANNEL", "titan:prod:pnl_updates")
 # Redis connection
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
 REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
-redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
 
 # Logging setup
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
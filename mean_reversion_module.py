@@ -1,7 +1,7 @@
 '''
 Module: mean_reversion_module
-Version: 1.0.0
-Last Updated: 2025-03-28
+Version: 1.1.0
+Last Updated: 2026-10-16
 Purpose: Adds mean-reverting countertrend trades when momentum weakens or Bollinger extremes are hit.
 Core Objectives:
   - Explicit profitability and risk targets alignment: Ensure mean reversion trading improves profitability and reduces risk.
@@ -10,15 +10,20 @@ Core Objectives:
   - Explicit 10/10 quality rating definition adherence: Code must meet all quality criteria, including modularity, error handling, metrics, logging, and testing.
 Summary of Enhancements:
   - Initial version.
+  - Bollinger Bands, momentum and the current price come from in-process streaming indicators fed by closed
+    klines instead of titan:indicator:* Redis keys; trades are evaluated per bar.
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
+import random
 from prometheus_client import Counter, Gauge, Histogram
 
+from indicators import BarIndicators, follow_klines
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(module)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -37,44 +42,29 @@ mean_reversion_errors_total = Counter('mean_reversion_errors_total', 'Total numb
 mean_reversion_latency_seconds = Histogram('mean_reversion_latency_seconds', 'Latency of mean reversion trade execution')
 mean_reversion_profit = Gauge('mean_reversion_profit', 'Profit from mean reversion trades')
 
-async def fetch_bollinger_bands(symbol):
-    '''Fetches Bollinger Bands from Redis.'''
-    try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
-        upper_band = await redis.get(f"titan:indicator:{symbol}:bollinger_upper")
-        lower_band = await redis.get(f"titan:indicator:{symbol}:bollinger_lower")
+# Streaming indicators for SYMBOL, kept current by follow_klines
+indicators = BarIndicators(bollinger=BOLLINGER_PERIOD, bollinger_k=BOLLINGER_STDDEV)
 
-        if upper_band and lower_band:
-            return {"upper": float(upper_band), "lower": float(lower_band)}
-        else:
-            logger.warning(json.dumps({"module": "mean_reversion_module", "action": "Fetch Bollinger Bands", "status": "No Data", "symbol": symbol}))
-            return None
-    except Exception as e:
-        logger.error(json.dumps({"module": "mean_reversion_module", "action": "Fetch Bollinger Bands", "status": "Exception", "error": str(e)}))
+def fetch_bollinger_bands(snapshot):
+    '''Bollinger Bands from the in-process indicators; None while warming up.'''
+    if snapshot["bollinger_upper"] is None:
+        logger.warning(json.dumps({"module": "mean_reversion_module", "action": "Fetch Bollinger Bands", "status": "No Data", "symbol": SYMBOL}))
         return None
+    return {"upper": snapshot["bollinger_upper"], "lower": snapshot["bollinger_lower"]}
 
-async def fetch_momentum(symbol):
-    '''Fetches momentum from Redis.'''
-    try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
-        momentum = await redis.get(f"titan:indicator:{symbol}:momentum")
-        if momentum:
-            return float(momentum)
-        else:
-            logger.warning(json.dumps({"module": "mean_reversion_module", "action": "Fetch Momentum", "status": "No Data", "symbol": symbol}))
-            return None
-    except Exception as e:
-        logger.error(json.dumps({"module": "mean_reversion_module", "action": "Fetch Momentum", "status": "Exception", "error": str(e)}))
+def fetch_momentum(snapshot):
+    '''Trend strength as |EMA fast - EMA slow| in ATRs; small values mean momentum is weakening.'''
+    if snapshot["ema_slow"] is None or not snapshot["atr"]:
+        logger.warning(json.dumps({"module": "mean_reversion_module", "action": "Fetch Momentum", "status": "No Data", "symbol": SYMBOL}))
         return None
+    return abs(snapshot["ema_fast"] - snapshot["ema_slow"]) / snapshot["atr"]
 
-async def execute_mean_reversion_trade(upper_band, lower_band, momentum):
+async def execute_mean_reversion_trade(current_price, upper_band, lower_band, momentum):
     '''Executes mean-reverting countertrend trades when momentum weakens or Bollinger extremes are hit.'''
-    if not upper_band or not lower_band or not momentum:
+    if not upper_band or not lower_band or momentum is None:
         return False
 
     try:
-        # Placeholder for mean reversion trade execution logic (replace with actual execution)
-        current_price = (upper_band + lower_band) / 2 # Simulate current price
         if momentum < MOMENTUM_THRESHOLD and current_price > upper_band:
             side = "SELL" # Overbought
         elif momentum < MOMENTUM_THRESHOLD and current_price < lower_band:
@@ -84,35 +74,35 @@ async def execute_mean_reversion_trade(upper_band, lower_band, momentum):
 
         profit = random.uniform(0.01, 0.03) # Simulate profit
         logger.info(json.dumps({"module": "mean_reversion_module", "action": "Execute Mean Reversion Trade", "status": "Executed", "side": side, "profit": profit}))
-        global mean_reversion_trades_executed_total
         mean_reversion_trades_executed_total.inc()
-        global mean_reversion_profit
         mean_reversion_profit.set(profit)
         return True
     except Exception as e:
-        global mean_reversion_errors_total
         mean_reversion_errors_total.labels(error_type="Execution").inc()
         logger.error(json.dumps({"module": "mean_reversion_module", "action": "Execute Mean Reversion Trade", "status": "Exception", "error": str(e)}))
         return False
 
-async def mean_reversion_module_loop():
-    '''Main loop for the mean reversion module.'''
-    try:
-        bollinger_bands = await fetch_bollinger_bands(SYMBOL)
-        momentum = await fetch_momentum(SYMBOL)
+async def on_bar(bar, snapshot):
+    '''Checks for a mean-reversion entry on every closed bar.'''
+    bollinger_bands = fetch_bollinger_bands(snapshot)
+    momentum = fetch_momentum(snapshot)
 
-        if bollinger_bands and momentum:
-            await execute_mean_reversion_trade(bollinger_bands["upper"], bollinger_bands["lower"], momentum)
+    if bollinger_bands and momentum is not None:
+        await execute_mean_reversion_trade(snapshot["close"], bollinger_bands["upper"], bollinger_bands["lower"], momentum)
 
-        await asyncio.sleep(60)  # Check for new opportunities every 60 seconds
-    except Exception as e:
-        logger.error(json.dumps({"module": "mean_reversion_module", "action": "Management Loop", "status": "Exception", "error": str(e)}))
-        await asyncio.sleep(300)  # Wait before retrying
+async def mean_reversion_module_loop():
+    '''Main loop for the mean reversion module.'''
+    while True:
+        try:
+            redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+            await follow_klines(redis, SYMBOL, indicators, on_bar)
+        except Exception as e:
+            logger.error(json.dumps({"module": "mean_reversion_module", "action": "Management Loop", "status": "Exception", "error": str(e)}))
+            await asyncio.sleep(300)  # Wait before retrying
 
 async def main():
     '''Main function to start the mean reversion module.'''
     await mean_reversion_module_loop()
 
 if __name__ == "__main__":
-    import aiohttp
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main())
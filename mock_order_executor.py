@@ -15,9 +15,12 @@ import asyncio
 import json
 import logging
 import os
-import aioredis
+from redis_connection_manager import get_async_redis
+from pubsub_dispatcher import PubSubDispatcher, decode_signal
 import datetime
 import random
+import time
+import pnl_ledger
 
 # Config from config.json or ENV
 EXECUTION_LATENCY = float(os.getenv("EXECUTION_LATENCY", 0.1))  # 100ms latency
@@ -27,7 +30,7 @@ EXECUTION_EVENTS_CHANNEL = os.getenv("EXECUTION_EVENTS_CHANNEL", "titan:prod:exe
 # Redis connection
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
 REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
-redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
 
 # Logging setup
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -74,41 +77,42 @@ async def simulate_order_execution(signal: dict) -> dict:
         "signal_id": signal.get("signal_id", "unknown")
     }
 
+    # The ledger is the source of positions and PnL for every reader downstream
+    await pnl_ledger.record_fill(redis, {
+        "strategy": signal.get("strategy", "unknown"),
+        "symbol": symbol,
+        "side": side,
+        "quantity": quantity,
+        "price": price,
+        "timestamp_ns": time.time_ns(),
+        "signal_id": trade_result["signal_id"]
+    })
+
     return trade_result
 
+async def handle_execution_request(message: dict):
+    """Simulates one execution request and publishes the resulting execution event."""
+    signal = decode_signal(message)
+
+    # Simulate order execution
+    trade_result = await simulate_order_execution(signal)
+
+    # Publish execution event
+    await redis.publish(EXECUTION_EVENTS_CHANNEL, json.dumps(trade_result))
+
+    logging.info(json.dumps({
+        "module": MODULE_NAME,
+        "action": "order_executed",
+        "symbol": signal["symbol"],
+        "side": signal["side"],
+        "message": "Order execution simulated."
+    }))
+
 async def main():
     """Main function to simulate order execution."""
-    pubsub = redis.pubsub()
-    await pubsub.psubscribe("titan:prod:execution_requests")  # Subscribe to execution requests channel
-
-    while True:
-        try:
-            message = await pubsub.get_message(ignore_subscribe_messages=True)
-            if message:
-                signal = json.loads(message["data"].decode("utf-8"))
-
-                # Simulate order execution
-                trade_result = await simulate_order_execution(signal)
-
-                # Publish execution event
-                await redis.publish(EXECUTION_EVENTS_CHANNEL, json.dumps(trade_result))
-
-                logging.info(json.dumps({
-                    "module": MODULE_NAME,
-                    "action": "order_executed",
-                    "symbol": signal["symbol"],
-                    "side": signal["side"],
-                    "message": "Order execution simulated."
-                }))
-
-            await asyncio.sleep(0.01)  # Prevent CPU overuse
-
-        except Exception as e:
-            logging.error(json.dumps({
-                "module": MODULE_NAME,
-                "action": "error",
-                "message": str(e)
-            }))
+    dispatcher = PubSubDispatcher(redis, MODULE_NAME, patterns=["titan:prod:execution_requests"])  # Subscribe to execution requests channel
+    dispatcher.add_handler(handle_execution_request)
+    await dispatcher.run()
 
 async def is_esg_compliant(symbol: str, side: str) -> bool:
     """Placeholder for ESG compliance check."""
@@ -131,7 +135,7 @@ if __name__ == "__main__":
     asyncio.run(main())
 
 # === Titan Module Footnotes ===
-# Implemented Features: redis-pub, async safety, mock order execution
+# Implemented Features: redis-pub, event-driven subscription, async safety, mock order execution, fills recorded to pnl_ledger
 # Deferred Features: ESG logic -> esg_mode.py
 # Excluded Features: backtesting (in backtest_engine.py)
 # Quality Rating: 10/10 reviewed by [Grok|Gemini|Claude] on [YYYY-MM-DD]
\ No newline at end of file
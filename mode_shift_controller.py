@@ -6,7 +6,7 @@ Purpose: Switches Titan's overall execution persona based on the context state.
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -31,7 +31,7 @@ DEFAULT_MODE = config.get("DEFAULT_MODE", "conservative_buffer_mode")
 async def get_current_context():
     '''Retrieves the current market context from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         key = "titan:prod:titan_context_engine:current_context"
         context = await redis.get(key)
         if context:
@@ -46,7 +46,7 @@ async def get_current_context():
 async def set_active_titan_mode(mode):
     '''Sets the active Titan mode in Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         key = "titan:core:active_titan_mode"
         await redis.set(key, mode)
         logger.info(json.dumps({"module": "mode_shift_controller", "action": "set_active_titan_mode", "status": "success", "mode": mode}))
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -36,7 +36,7 @@ resolution_latency_seconds = Histogram('resolution_latency_seconds', 'Latency of
 async def fetch_module_metadata(module):
     '''Fetches module metadata from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         metadata = await redis.get(f"titan:module:{module}:metadata")
         if metadata:
             return json.loads(metadata)
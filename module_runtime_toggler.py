@@ -6,7 +6,7 @@ Purpose: Turns modules on/off.
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -29,7 +29,7 @@ REDIS_PORT = config.get("REDIS_PORT", 6379)
 async def toggle_module(module_name, status):
     '''Toggles a module on or off in Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         key = f"titan:prod:module:{module_name}:status"
         await redis.set(key, status)
         logger.info(json.dumps({"module": "module_runtime_toggler", "action": "toggle_module", "status": "success", "module_name": module_name, "new_status": status}))
@@ -41,7 +41,7 @@ async def toggle_module(module_name, status):
 async def get_module_status(module_name):
     '''Gets the status of a module from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         key = f"titan:prod:module:{module_name}:status"
         status = await redis.get(key)
         if status:
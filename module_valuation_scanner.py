@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -37,7 +37,7 @@ module_performance_score = Gauge('module_performance_score', 'Performance score
 async def fetch_module_performance(module, valuation_window):
     '''Scores each module. ROI, uptime, risk-to-profit ratio.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         # Placeholder for fetching module performance logic (replace with actual fetching)
         roi = random.uniform(-0.01, 0.05) # Simulate ROI
         uptime = random.uniform(0.95, 1.0) # Simulate uptime
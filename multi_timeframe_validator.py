@@ -1,6 +1,6 @@
 # Module: multi_timeframe_validator.py
-# Version: 1.0.0
-# Last Updated: 2024-07-24
+# Version: 1.1.0
+# Last Updated: 2026-10-16
 # Purpose: Validates trading signals across multiple timeframes to improve signal accuracy and reduce false positives.
 
 # Core Objectives:
@@ -15,17 +15,20 @@ import asyncio
 import json
 import logging
 import os
-import aioredis
+from redis_connection_manager import get_async_redis
+from bar_aggregator import BarAggregator, run_bar_aggregator
 
 # Config from config.json or ENV
 TIME_FRAMES = os.getenv("TIME_FRAMES", "1m,5m,15m")  # Comma-separated list of timeframes
 CONFIRMATION_THRESHOLD = float(os.getenv("CONFIRMATION_THRESHOLD", 0.7))  # Percentage of timeframes that must confirm the signal
 EXECUTION_ORCHESTRATOR_CHANNEL = os.getenv("EXECUTION_ORCHESTRATOR_CHANNEL", "titan:prod:execution_orchestrator")
+CONFIRMATION_BARS = int(os.getenv("CONFIRMATION_BARS", 5))  # Recent bars per timeframe whose direction is compared with the signal
+VALIDATOR_SYMBOLS = os.getenv("VALIDATOR_SYMBOLS", "BTCUSDT,ETHUSDT")  # Symbols whose bars are built in-process
 
 # Redis connection
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
 REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
-redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
 
 # Logging setup
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -33,14 +36,17 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 # Module name
 MODULE_NAME = "multi_timeframe_validator"
 
+# Bars for every timeframe, built in-process from the trade stream (see bar_aggregator.py)
+aggregator = BarAggregator()
+
 async def get_signal_confirmation(symbol: str, timeframe: str, side: str) -> float:
-    """Retrieves signal confirmation data for a given symbol and timeframe."""
-    # TODO: Implement logic to retrieve signal confirmation from Redis or other module
-    # Placeholder: Return a sample confirmation value
-    if side == "buy":
-        return 0.8
-    else:
-        return 0.6
+    """Fraction of the last CONFIRMATION_BARS closed bars at ``timeframe`` moving in the signal's direction; 0 without bars."""
+    frame = aggregator.frame(symbol, timeframe, CONFIRMATION_BARS)
+    if not len(frame):
+        return 0.0
+    moves = frame.close - frame.open
+    agreeing = (moves > 0) if str(side).lower() == "buy" else (moves < 0)
+    return float(agreeing.mean())
 
 async def validate_signal(signal: dict) -> bool:
     """Validates the trading signal across multiple timeframes."""
@@ -76,6 +82,8 @@ async def validate_signal(signal: dict) -> bool:
 
 async def main():
     """Main function to validate trading signals across multiple timeframes."""
+    symbols = [symbol.strip() for symbol in VALIDATOR_SYMBOLS.split(",")]
+    aggregator_task = asyncio.create_task(run_bar_aggregator(redis, symbols, aggregator, persist_bars=False, publish=False))  # Held so it is not garbage collected
     pubsub = redis.pubsub()
     await pubsub.psubscribe("titan:prod:strategy_signals")  # Subscribe to strategy signals channel
 
@@ -125,7 +133,7 @@ if __name__ == "__main__":
     asyncio.run(main())
 
 # === Titan Module Footnotes ===
-# Implemented Features: redis-pub, async safety, multi-timeframe validation
-# Deferred Features: ESG logic -> esg_mode.py, signal confirmation retrieval
+# Implemented Features: redis-pub, async safety, multi-timeframe validation, bar-direction confirmation from in-process trade-built bars
+# Deferred Features: ESG logic -> esg_mode.py
 # Excluded Features: backtesting (in backtest_engine.py)
 # Quality Rating: 10/10 reviewed by [Grok|Gemini|Claude] on [YYYY-MM-DD]
\ No newline at end of file
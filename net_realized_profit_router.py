@@ -6,7 +6,7 @@ Purpose: At session end, distributes realized profits into different strategic b
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -32,7 +32,7 @@ COMMANDER_POOL_PCT = config.get("COMMANDER_POOL_PCT", 0.2)  # Percentage for com
 async def distribute_profits(daily_profit):
     '''Distributes the daily profit into different strategic buckets.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
 
         reserve_buffer_amount = daily_profit * RESERVE_BUFFER_PCT
         commander_pool_amount = daily_profit * COMMANDER_POOL_PCT
@@ -15,7 +15,8 @@ import asyncio
 import json
 import logging
 import os
-import aioredis
+from redis_connection_manager import get_async_redis
+from pubsub_dispatcher import PubSubDispatcher, decode_json
 import time
 import datetime
 from collections import deque
@@ -28,7 +29,7 @@ HOTPATH_CACHE_MONITOR = os.getenv("HOTPATH_CACHE_MONITOR", "orchestrator_cache_m
 # Redis connection
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
 REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
-redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
 
 # Logging setup
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -117,34 +118,24 @@ async def main():
     # Update top modules cache periodically
     asyncio.create_task(update_top_modules_cache_periodically())
 
-    pubsub = redis.pubsub()
-    await pubsub.psubscribe("titan:prod:signals:*")  # Subscribe to all signal channels
+    dispatcher = PubSubDispatcher(redis, MODULE_NAME, patterns=["titan:prod:signals:*"])  # Subscribe to all signal channels
+    dispatcher.add_handler(handle_signal_message)
+    await dispatcher.run()
 
-    while True:
-        try:
-            message = await pubsub.get_message(ignore_subscribe_messages=True)
-            if message:
-                channel = message["channel"].decode("utf-8")
-                signal = json.loads(message["data"].decode("utf-8"))
-
-                # Process signal
-                await process_signal(signal)
-
-                logging.info(json.dumps({
-                    "module": MODULE_NAME,
-                    "action": "signal_processed",
-                    "channel": channel,
-                    "signal": signal
-                }))
-
-            await asyncio.sleep(0.01)  # Prevent CPU overuse
-
-        except Exception as e:
-            logging.error(json.dumps({
-                "module": MODULE_NAME,
-                "action": "error",
-                "message": str(e)
-            }))
+async def handle_signal_message(message: dict):
+    """Processes one signal received on a signal channel."""
+    channel = message["channel"].decode("utf-8")
+    signal = decode_json(message)
+
+    # Process signal
+    await process_signal(signal)
+
+    logging.info(json.dumps({
+        "module": MODULE_NAME,
+        "action": "signal_processed",
+        "channel": channel,
+        "signal": signal
+    }))
 
 async def update_top_modules_cache_periodically():
     """Updates top modules cache periodically."""
@@ -173,7 +164,7 @@ if __name__ == "__main__":
     asyncio.run(main())
 
 # === Titan Module Footnotes ===
-# Implemented Features: redis-pub, async safety, hotpath tracking
+# Implemented Features: redis-pub, event-driven subscription, async safety, hotpath tracking
 # Deferred Features: ESG logic -> esg_mode.py, module call frequency and alpha performance retrieval
 # Excluded Features: backtesting (in backtest_engine.py)
 # Quality Rating: 10/10 reviewed by [Grok|Gemini|Claude] on [YYYY-MM-DD]
\ No newline at end of file
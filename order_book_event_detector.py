@@ -1,6 +1,8 @@
 import logging
 import asyncio
 
+from Data_Normalization_Module import book_levels
+
 # Initialize logging
 logger = logging.getLogger(__name__)
 
@@ -13,11 +15,14 @@ class OrderBookEventDetector:
         Detects significant events in the order book.
         """
         try:
+            # Bids / asks as columnar level arrays, whatever shape the adapter produced
+            bids, asks = book_levels(order_book_data)
+
             # 1. Detect large order placements
-            large_orders = self._detect_large_orders(order_book_data)
+            large_orders = self._detect_large_orders(bids)
 
             # 2. Detect sudden order cancellations
-            order_cancellations = self._detect_order_cancellations(order_book_data)
+            order_cancellations = self._detect_order_cancellations(asks)
 
             # 3. Combine and return detected events
             events = {
@@ -32,25 +37,25 @@ class OrderBookEventDetector:
             logger.exception(f"Error detecting order book events: {e}")
             return None
 
-    def _detect_large_orders(self, order_book_data, threshold=100):
+    def _detect_large_orders(self, bids, threshold=100):
         """
         Detects large order placements in the order book.
         This is a stub implementation. Replace with actual detection logic.
         """
         # Placeholder: Replace with actual detection logic
-        logger.info(f"Detecting large orders from order book data: {order_book_data}")
-        large_orders = [order for order in order_book_data["bids"] if order["size"] > threshold]  # Example
-        return large_orders
+        logger.debug(f"Detecting large orders across {len(bids)} bid levels")
+        large_orders = bids[bids["size"] > threshold]  # Example
+        return [{"price": float(price), "size": float(size)} for price, size in large_orders.tolist()]
 
-    def _detect_order_cancellations(self, order_book_data, threshold=50):
+    def _detect_order_cancellations(self, asks, threshold=50):
         """
         Detects sudden order cancellations in the order book.
         This is a stub implementation. Replace with actual detection logic.
         """
         # Placeholder: Replace with actual detection logic
-        logger.info(f"Detecting order cancellations from order book data: {order_book_data}")
-        order_cancellations = [order for order in order_book_data["asks"] if order["size"] < threshold]  # Example
-        return order_cancellations
+        logger.debug(f"Detecting order cancellations across {len(asks)} ask levels")
+        order_cancellations = asks[asks["size"] < threshold]  # Example
+        return [{"price": float(price), "size": float(size)} for price, size in order_cancellations.tolist()]
 
 # Example usage:
 if __name__ == "__main__":
@@ -85,10 +90,10 @@ if __name__ == "__main__":
 # - Order book event detection
 # - Large order detection stub
 # - Order cancellation detection stub
+# - Any adapter's book shape accepted via Data_Normalization_Module.book_levels
 
 # Deferred Features:
 # - Actual detection logic
-# - Support for different order book formats
 # - More sophisticated event detection algorithms
 
 # Excluded Features:
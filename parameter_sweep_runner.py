@@ -1,7 +1,7 @@
 # Module: parameter_sweep_runner.py
-# Version: 1.0.0
-# Last Updated: 2024-07-24
-# Purpose: Automates the process of running backtests with different parameter combinations to identify optimal strategy configurations.
+# Version: 1.1.0
+# Last Updated: 2026-10-16
+# Purpose: Automates the process of running backtests with different parameter combinations.
 
 # Core Objectives:
 # - Profitability (50–100% daily ROI target)
@@ -12,21 +12,35 @@
 # - Prometheus metrics (if needed)
 
 import asyncio
+import hashlib
 import json
 import logging
+import math
 import os
-import aioredis
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from redis_connection_manager import get_async_redis
 import itertools
+import backtest_engine
+from candle_store import CANDLE_INTERVAL, default_store
 
 # Config from config.json or ENV
 STRATEGY_CONFIG_FILE = os.getenv("STRATEGY_CONFIG_FILE", "config/strategy_config.json")
 BACKTEST_DATA_CHANNEL = os.getenv("BACKTEST_DATA_CHANNEL", "titan:prod:backtest_data")
 BACKTEST_RESULTS_CHANNEL = os.getenv("BACKTEST_RESULTS_CHANNEL", "titan:prod:backtest_results")
+SWEEP_MODE = os.getenv("SWEEP_MODE", "grid")  # grid | random | lhs | halving
+SWEEP_SAMPLES = int(os.getenv("SWEEP_SAMPLES", 64))  # Parameter sets drawn by random / lhs / halving
+SWEEP_WORKERS = int(os.getenv("SWEEP_WORKERS", os.cpu_count() or 1))
+SWEEP_METRIC = os.getenv("SWEEP_METRIC", "sharpe_ratio")  # Result field maximized by successive halving
+SWEEP_HALVING_ETA = int(os.getenv("SWEEP_HALVING_ETA", 3))  # Keep the top 1/eta each round, grow the data budget eta-fold
+SWEEP_HALVING_MIN_BARS = int(os.getenv("SWEEP_HALVING_MIN_BARS", 10000))
+SWEEP_CACHE_DIR = os.getenv("SWEEP_CACHE_DIR", "data/sweep_cache")
 
 # Redis connection
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
 REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
-redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
 
 # Logging setup
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -34,6 +48,11 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 # Module name
 MODULE_NAME = "parameter_sweep_runner"
 
+# Signal-array strategies the sweep can evaluate: name -> fn(close, **params) returning target positions
+STRATEGIES = {
+    "momentum_strategy": backtest_engine.momentum_signals,
+}
+
 async def load_strategy_config(config_file: str) -> dict:
     """Loads trading strategy configurations with parameter ranges from a file."""
     # TODO: Implement logic to load strategy config from a file
@@ -48,61 +67,170 @@ async def load_strategy_config(config_file: str) -> dict:
     }
     return strategy_config
 
-async def generate_parameter_combinations(strategy_config: dict) -> list:
-    """Generates different parameter combinations based on the strategy configuration."""
+async def generate_parameter_combinations(strategy_config: dict, mode: str = "grid", samples: int = SWEEP_SAMPLES, seed: int = None) -> list:
+    """Generates parameter sets: the full grid, a random subset of it, or a Latin-hypercube sample."""
     parameters = strategy_config["parameters"]
-    parameter_names = parameters.keys()
-    parameter_values = parameters.values()
+    parameter_names = list(parameters.keys())
+    parameter_values = list(parameters.values())
+    rng = random.Random(seed)
 
-    # Generate all combinations of parameter values
-    combinations = list(itertools.product(*parameter_values))
+    if mode == "lhs":
+        # One stratum per sample along every axis, strata shuffled independently per parameter
+        columns = []
+        for values in parameter_values:
+            strata = list(range(samples))
+            rng.shuffle(strata)
+            columns.append([values[min(int((stratum + rng.random()) / samples * len(values)), len(values) - 1)] for stratum in strata])
+        combinations = list(dict.fromkeys(zip(*columns)))  # Small grids repeat cells; keep each once
+    else:
+        # Generate all combinations of parameter values
+        combinations = list(itertools.product(*parameter_values))
+        if mode in ("random", "halving") and samples < len(combinations):
+            combinations = rng.sample(combinations, samples)
 
     # Create a list of parameter dictionaries
-    parameter_combinations = []
-    for combination in combinations:
-        parameter_set = dict(zip(parameter_names, combination))
-        parameter_combinations.append(parameter_set)
+    return [dict(zip(parameter_names, combination)) for combination in combinations]
+
+def cache_key(strategy_name: str, parameter_set: dict, data_fingerprint: str, bars: int = None) -> str:
+    payload = json.dumps({
+        "strategy": strategy_name,
+        "parameters": parameter_set,
+        "data": data_fingerprint,
+        "bars": bars,
+        "fees": [backtest_engine.TRADING_FEE, backtest_engine.SLIPPAGE_BPS],
+        # Every other engine setting a cell's metrics depend on
+        "initial_capital": backtest_engine.INITIAL_CAPITAL,
+        "bars_per_year": backtest_engine.BARS_PER_YEAR,
+        "order_quantity": backtest_engine.BACKTEST_ORDER_QUANTITY,
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def load_cached_result(key: str):
+    try:
+        with open(os.path.join(SWEEP_CACHE_DIR, f"{key}.json")) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+def store_cached_result(key: str, result: dict):
+    os.makedirs(SWEEP_CACHE_DIR, exist_ok=True)
+    path = os.path.join(SWEEP_CACHE_DIR, f"{key}.json")
+    with open(path + ".tmp", "w") as f:
+        json.dump(result, f)
+    os.replace(path + ".tmp", path)
 
-    return parameter_combinations
+def evaluate_cell(strategy_name: str, symbol: str, interval: str, parameter_set: dict, bars: int = None) -> dict:
+    """
+    One backtest, run inside a worker process.
+
+    Candles are memory-mapped from the candle store, so every worker shares
+    the same page-cache pages instead of receiving a pickled copy.
+    """
+    candles = default_store.load(symbol, interval)
+    close = candles.close if bars is None else candles.close[:bars]
+    columns = {column: candles[column][:len(close)] for column in ("open", "high", "low", "close", "volume")}
+    target = STRATEGIES[strategy_name](close, **parameter_set)
+    result = backtest_engine.run_vectorized(columns, target)
+    return {key: value for key, value in result.items() if key not in ("equity", "position")}
+
+async def run_backtest(strategy_config: dict, parameter_set: dict, bars: int = None, executor=None):
+    """Runs one backtest cell, from the disk cache when this (strategy, params, data) was already evaluated."""
+    symbol = strategy_config["symbol"]
+    interval = strategy_config.get("interval", CANDLE_INTERVAL)
+    key = cache_key(strategy_config["strategy_name"], parameter_set, default_store.fingerprint(symbol, interval), bars)
+    metrics = load_cached_result(key)
+    cached = metrics is not None
+    if not cached:
+        loop = asyncio.get_running_loop()
+        metrics = await loop.run_in_executor(executor, evaluate_cell, strategy_config["strategy_name"], symbol, interval, parameter_set, bars)
+        store_cached_result(key, metrics)
 
-async def run_backtest(strategy_config: dict, parameter_set: dict):
-    """Runs backtests with different parameter combinations."""
-    # TODO: Implement logic to run backtests with the given parameters
-    # Placeholder: Create a sample backtest result
     backtest_result = {
         "strategy": strategy_config["strategy_name"],
-        "symbol": strategy_config["symbol"],
+        "symbol": symbol,
         "parameters": parameter_set,
-        "total_profit": 1500.0,
-        "sharpe_ratio": 1.8
+        "bars_budget": bars,
+        "cached": cached,
+        **metrics
     }
     return backtest_result
 
+async def run_sweep(strategy_config: dict, parameter_sets: list, executor, bars: int = None) -> list:
+    """Fans parameter sets out over the pool and publishes each result as soon as it completes."""
+    tasks = [asyncio.ensure_future(run_backtest(strategy_config, parameter_set, bars, executor)) for parameter_set in parameter_sets]
+    results = []
+    for task in asyncio.as_completed(tasks):
+        try:
+            backtest_result = await task
+        except Exception as e:
+            logging.error(json.dumps({
+                "module": MODULE_NAME,
+                "action": "backtest_failed",
+                "message": str(e)
+            }))
+            continue
+
+        # Publish backtest result to Redis
+        await redis.publish(BACKTEST_RESULTS_CHANNEL, json.dumps(backtest_result))
+
+        logging.info(json.dumps({
+            "module": MODULE_NAME,
+            "action": "backtest_completed",
+            "strategy": strategy_config["strategy_name"],
+            "parameters": backtest_result["parameters"],
+            "cached": backtest_result["cached"],
+            "message": "Backtest completed for this parameter set."
+        }))
+        results.append(backtest_result)
+    return results
+
+def _score(result: dict) -> float:
+    value = result.get(SWEEP_METRIC)
+    return value if isinstance(value, (int, float)) and not math.isnan(value) else -math.inf
+
+async def successive_halving(strategy_config: dict, parameter_sets: list, executor) -> list:
+    """
+    Evaluates every set on a small prefix of the data, keeps the best
+    1/SWEEP_HALVING_ETA, and repeats with an eta-times larger prefix until the
+    survivors run on the full history.
+    """
+    total_bars = default_store.rows(strategy_config["symbol"], strategy_config.get("interval", CANDLE_INTERVAL))
+    rounds = max(1, math.ceil(math.log(max(len(parameter_sets), 1), SWEEP_HALVING_ETA) - 1e-9))
+    bars = max(SWEEP_HALVING_MIN_BARS, total_bars // SWEEP_HALVING_ETA ** (rounds - 1))
+    survivors = parameter_sets
+    results = []
+    while True:
+        budget = None if bars >= total_bars else bars
+        results = await run_sweep(strategy_config, survivors, executor, bars=budget)
+        if budget is None or len(results) <= 1:
+            return results
+        results.sort(key=_score, reverse=True)
+        survivors = [result["parameters"] for result in results[:max(1, len(results) // SWEEP_HALVING_ETA)]]
+        bars *= SWEEP_HALVING_ETA
+
 async def main():
     """Main function to automate the parameter sweep process."""
     try:
         strategy_config = await load_strategy_config(STRATEGY_CONFIG_FILE)
-        parameter_combinations = await generate_parameter_combinations(strategy_config)
-
-        for parameter_set in parameter_combinations:
-            # Run backtest
-            backtest_result = await run_backtest(strategy_config, parameter_set)
-
-            # Publish backtest result to Redis
-            await redis.publish(BACKTEST_RESULTS_CHANNEL, json.dumps(backtest_result))
+        parameter_combinations = await generate_parameter_combinations(strategy_config, SWEEP_MODE)
 
-            logging.info(json.dumps({
-                "module": MODULE_NAME,
-                "action": "backtest_completed",
-                "strategy": strategy_config["strategy_name"],
-                "parameters": parameter_set,
-                "message": "Backtest completed for this parameter set."
-            }))
+        started = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=SWEEP_WORKERS) as executor:
+            if SWEEP_MODE == "halving":
+                results = await successive_halving(strategy_config, parameter_combinations, executor)
+            else:
+                results = await run_sweep(strategy_config, parameter_combinations, executor)
 
+        best = max(results, key=_score) if results else None
         logging.info(json.dumps({
             "module": MODULE_NAME,
             "action": "parameter_sweep_completed",
             "strategy": strategy_config["strategy_name"],
+            "mode": SWEEP_MODE,
+            "cells": len(results),
+            "cached_cells": sum(result["cached"] for result in results),
+            "seconds": round(time.perf_counter() - started, 3),
+            "best_parameters": best["parameters"] if best else None,
             "message": "Parameter sweep completed."
         }))
 
@@ -134,7 +262,7 @@ if __name__ == "__main__":
     asyncio.run(main())
 
 # === Titan Module Footnotes ===
-# Implemented Features: redis-pub, async safety, parameter sweep automation
-# Deferred Features: ESG logic -> esg_mode.py, strategy configuration loading, backtest execution
+# Implemented Features: redis-pub, async safety, parameter sweep automation, process-pool fan-out over mmap'd candles, on-disk result memoization, grid / random / Latin-hypercube / successive-halving modes, streamed results
+# Deferred Features: ESG logic -> esg_mode.py, strategy configuration loading, event-driven strategies in the sweep
 # Excluded Features: live trading execution (in execution_handler.py)
-# Quality Rating: 10/10 reviewed by [Grok|Gemini|Claude] on [YYYY-MM-DD]
\ No newline at end of file
+# Quality Rating: 10/10 reviewed by [Grok|Gemini|Claude] on [YYYY-MM-DD]
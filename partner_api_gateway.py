@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -42,7 +42,7 @@ async def authenticate_request(request):
             logger.warning(json.dumps({"module": "partner_api_gateway", "action": "Authenticate Request", "status": "Unauthorized", "reason": "Missing API Key"}))
             return False
 
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         user_id = await redis.get(f"{API_TOKEN_KEY_PREFIX}{api_key}:user_id")
         if not user_id:
             logger.warning(json.dumps({"module": "partner_api_gateway", "action": "Authenticate Request", "status": "Invalid API Key", "api_key": api_key}))
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -37,7 +37,7 @@ fill_detection_latency_seconds = Histogram('fill_detection_latency_seconds', 'La
 async def monitor_executed_trades():
     '''Monitors executed trades in Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         # Placeholder for monitoring executed trades logic (replace with actual monitoring)
         executed_trades = [{"symbol": "BTCUSDT", "side": "BUY", "price": 30000, "quantity": 1}] # Simulate executed trades
         logger.info(json.dumps({"module": "phantom_fill_detector", "action": "Monitor Executed Trades", "status": "Success", "trade_count": len(executed_trades)}))
@@ -10,14 +10,16 @@ Core Objectives:
   - Explicit 10/10 quality rating definition adherence: Code must meet all quality criteria, including modularity, error handling, metrics, logging, and testing.
 Summary of Enhancements:
   - Initial version.
+  - Snapshot-vs-replay check: the previous pnl_ledger snapshot replayed up to the current one must reproduce it exactly.
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
 from prometheus_client import Counter, Gauge, Histogram
+import pnl_ledger
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(module)s - %(message)s')
@@ -27,6 +29,7 @@ logger = logging.getLogger(__name__)
 REDIS_HOST = os.environ.get("REDIS_HOST", "localhost")
 REDIS_PORT = os.environ.get("REDIS_PORT", 6379)
 PNL_DRIFT_THRESHOLD = 0.02 # PnL drift threshold (2%)
+LEDGER_REPLAY_TOLERANCE = 1e-6 # Absolute tolerance between a ledger snapshot and its replay
 
 # Prometheus metrics (example)
 pnl_discrepancies_flagged_total = Counter('pnl_discrepancies_flagged_total', 'Total number of PnL discrepancies flagged')
@@ -37,7 +40,7 @@ pnl_discrepancy_percentage = Gauge('pnl_discrepancy_percentage', 'Percentage of
 async def fetch_trade_logs(symbol):
     '''Pull historical trade logs from Redis (titan:trade:executed:<symbol>).'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         trade_logs = []
         i = 0
         while True:
@@ -55,7 +58,7 @@ async def fetch_trade_logs(symbol):
 async def fetch_pnl_log(symbol):
     '''Fetch PnL log from Redis (titan:trade:pnl:<symbol>).'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         pnl_log = await redis.get(f"titan:trade:pnl:{symbol}")
         if pnl_log:
             return json.loads(pnl_log)
@@ -114,6 +117,30 @@ async def validate_pnl_accuracy(trade_logs, pnl_log):
         pnl_accuracy_errors_total.labels(error_type="Validation").inc()
         logger.error(json.dumps({"module": "pnl_accuracy_validator", "action": "Validate PnL", "status": "Exception", "error": str(e)}))
 
+async def validate_ledger_replay():
+    '''Replay the ledger stream from the previous snapshot up to the current one and flag any position or PnL that differs.'''
+    try:
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        current = await pnl_ledger.load_snapshot(redis)
+        previous = await pnl_ledger.load_snapshot(redis, pnl_ledger.LEDGER_PREVIOUS_SNAPSHOT_KEY)
+        if current.fills == 0:
+            logger.warning(json.dumps({"module": "pnl_accuracy_validator", "action": "Validate Ledger Replay", "status": "No Data"}))
+            return None
+        previous_id, previous_fills = previous.last_id, previous.fills
+        replayed = await pnl_ledger.replay(redis, previous, until=current.last_id)
+        mismatches = current.difference(replayed, LEDGER_REPLAY_TOLERANCE)
+        for mismatch in mismatches:
+            pnl_discrepancies_flagged_total.inc()
+            logger.warning(json.dumps({"module": "pnl_accuracy_validator", "action": "Validate Ledger Replay", "status": "Discrepancy", **mismatch}))
+        checked = len(current.positions) + len(current.totals)
+        pnl_discrepancy_percentage.labels(symbol="ALL", module="pnl_ledger").set(len(mismatches) / checked if checked else 0)
+        logger.info(json.dumps({"module": "pnl_accuracy_validator", "action": "Validate Ledger Replay", "status": "Completed", "from_id": previous_id, "to_id": current.last_id, "fills_replayed": replayed.fills - previous_fills, "discrepancies": len(mismatches)}))
+        return mismatches
+    except Exception as e:
+        pnl_accuracy_errors_total.labels(error_type="LedgerReplay").inc()
+        logger.error(json.dumps({"module": "pnl_accuracy_validator", "action": "Validate Ledger Replay", "status": "Exception", "error": str(e)}))
+        return None
+
 async def pnl_accuracy_validator_loop():
     '''Main loop for the pnl accuracy validator module.'''
     try:
@@ -122,6 +149,8 @@ async def pnl_accuracy_validator_loop():
         pnl_log = await fetch_pnl_log(symbol)
         if trade_logs and pnl_log:
             await validate_pnl_accuracy(trade_logs, pnl_log)
+        with pnl_validation_latency_seconds.time():
+            await validate_ledger_replay()
 
         await asyncio.sleep(3600)  # Check for new signals every hour
     except Exception as e:
@@ -15,7 +15,8 @@ import asyncio
 import json
 import logging
 import os
-import aioredis
+from redis_connection_manager import get_async_redis
+import pnl_ledger
 
 # Config from config.json or ENV
 PNL_REPORTING_MODULES = os.getenv("PNL_REPORTING_MODULES", "session_based_pnl_tracker,strategy_effectiveness_dashboard")
@@ -25,7 +26,7 @@ ALERT_ENGINE_CHANNEL = os.getenv("ALERT_ENGINE_CHANNEL", "titan:prod:alert_engin
 # Redis connection
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
 REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
-redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
 
 # Logging setup
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -34,10 +35,19 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 MODULE_NAME = "pnl_inconsistency_checker"
 
 async def get_module_pnl(module: str) -> float:
-    """Retrieves the PnL reported by a given module."""
-    # TODO: Implement logic to retrieve PnL from Redis or other module
-    # Placeholder: Return a sample PnL value
-    return 1000.0
+    """Retrieves the PnL reported by a given module (titan:prod:<module>:session_pnl)."""
+    pnl = await redis.get(f"titan:prod:{module}:session_pnl")
+    return float(pnl) if pnl is not None else None
+
+async def get_module_pnls(modules: list) -> dict:
+    """Reported PnL for every module in one round trip; modules that have not reported are left out."""
+    values = await redis.mget([f"titan:prod:{module}:session_pnl" for module in modules])
+    return {module: float(value) for module, value in zip(modules, values) if value is not None}
+
+async def get_ledger_pnl() -> float:
+    """Current session's realized PnL net of fees from the fill ledger, the reference the modules are checked against."""
+    pnl = (await pnl_ledger.ready_state()).session()
+    return pnl["realized"] - pnl["fees"]
 
 async def check_pnl_consistency(pnl_values: dict) -> bool:
     """Checks if the PnL values reported by different modules are consistent."""
@@ -92,11 +102,8 @@ async def main():
 
     while True:
         try:
-            pnl_values = {}
-            for module in reporting_modules:
-                # Get module PnL
-                pnl = await get_module_pnl(module)
-                pnl_values[module] = pnl
+            pnl_values = await get_module_pnls(reporting_modules)
+            pnl_values["pnl_ledger"] = await get_ledger_pnl()
 
             # Check PnL consistency
             await check_pnl_consistency(pnl_values)
@@ -131,7 +138,7 @@ if __name__ == "__main__":
     asyncio.run(main())
 
 # === Titan Module Footnotes ===
-# Implemented Features: redis-pub, async safety, PnL inconsistency detection
-# Deferred Features: ESG logic -> esg_mode.py, PnL retrieval from modules
+# Implemented Features: redis-pub, async safety, PnL inconsistency detection against the fill ledger (pnl_ledger)
+# Deferred Features: ESG logic -> esg_mode.py
 # Excluded Features: backtesting (in backtest_engine.py)
 # Quality Rating: 10/10 reviewed by [Grok|Gemini|Claude] on [YYYY-MM-DD]
\ No newline at end of file
@@ -0,0 +1,420 @@
+# Module: pnl_ledger.py
+# Version: 1.0.0
+# Last Updated: 2026-10-16
+# Purpose: Append-only fill ledger with an in-memory position / PnL state machine, periodic snapshots and O(snapshot + tail) recovery.
+
+# Core Objectives:
+# - Profitability (50–100% daily ROI target)
+# - Risk reduction (50:1 profit:loss ratio)
+# - ESG-safe actions only
+# - Compliance with UAE financial law
+# - Clean async logic and Redis safety
+# - Prometheus metrics (if needed)
+
+import asyncio
+import datetime
+import json
+import logging
+import os
+import time
+from prometheus_client import Counter, Gauge
+from portfolio_risk_engine import FILLS_CHANNEL
+
+# Config from config.json or ENV
+LEDGER_STREAM = os.getenv("LEDGER_STREAM", "titan:prod:ledger:fills")  # Never trimmed: it is the source of truth
+LEDGER_SNAPSHOT_KEY = os.getenv("LEDGER_SNAPSHOT_KEY", "titan:prod:ledger:snapshot")
+LEDGER_PREVIOUS_SNAPSHOT_KEY = os.getenv("LEDGER_PREVIOUS_SNAPSHOT_KEY", "titan:prod:ledger:snapshot:previous")
+LEDGER_SNAPSHOT_EVERY = int(os.getenv("LEDGER_SNAPSHOT_EVERY", 5000))  # Fills between snapshots
+LEDGER_SNAPSHOT_INTERVAL = float(os.getenv("LEDGER_SNAPSHOT_INTERVAL", 300))  # ...or seconds, whichever comes first
+LEDGER_READ_COUNT = int(os.getenv("LEDGER_READ_COUNT", 1000))  # Entries per XREAD / XRANGE page
+LEDGER_BLOCK_MS = int(os.getenv("LEDGER_BLOCK_MS", 1000))
+LEDGER_READY_TIMEOUT = float(os.getenv("LEDGER_READY_TIMEOUT", 10))  # How long readers wait for the first recovery
+SESSION_START_HOUR = int(os.getenv("SESSION_START_HOUR", 0))  # Same session boundary as session_based_pnl_tracker
+
+# Logging setup
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# Module name
+MODULE_NAME = "pnl_ledger"
+
+# Prometheus metrics
+ledger_fills_total = Counter('pnl_ledger_fills_total', 'Fills applied to the PnL ledger')
+ledger_snapshots_total = Counter('pnl_ledger_snapshots_total', 'Ledger snapshots written')
+ledger_realized_pnl = Gauge('pnl_ledger_realized_pnl', 'Realized PnL net of fees, all time')
+ledger_unrealized_pnl = Gauge('pnl_ledger_unrealized_pnl', 'Unrealized PnL at the latest marks')
+
+STREAM_FIELD = "data"
+
+_session_names = {}
+
+def session_of(timestamp_ns: int) -> str:
+    """Trading session (YYYYMMDD, sessions start at SESSION_START_HOUR UTC) a fill timestamp falls in."""
+    day = (timestamp_ns // 1_000_000_000 - SESSION_START_HOUR * 3600) // 86400
+    name = _session_names.get(day)
+    if name is None:
+        name = _session_names[day] = (datetime.date(1970, 1, 1) + datetime.timedelta(days=day)).strftime("%Y%m%d")
+    return name
+
+def signed_quantity(fill: dict) -> float:
+    quantity = float(fill["quantity"])
+    return -abs(quantity) if fill.get("side", "buy").lower() == "sell" else quantity
+
+class LedgerState:
+    """
+    Positions and PnL rebuilt deterministically from the ordered fill stream.
+
+    Positions use average-cost accounting per (strategy, symbol).  Realized PnL
+    and fees are accumulated under every reporting key a fill touches (total,
+    strategy, symbol, session, session+strategy, session+symbol), and
+    unrealized PnL per strategy / symbol is kept current on fills and marks, so
+    every query is a dict lookup.  ``last_id`` is the stream id of the last
+    applied fill; replaying the stream after it onto a snapshot reproduces the
+    live state exactly.
+    """
+
+    def __init__(self):
+        self.positions = {}  # (strategy, symbol) -> [quantity, average price]
+        self.totals = {}  # reporting key -> [realized, fees]
+        self.marks = {}  # symbol -> price
+        self.holders = {}  # symbol -> set of strategies with an open position
+        self.unrealized = {}  # ("strategy", name) / ("symbol", name) / ("total",) -> unrealized PnL
+        self.last_id = "0-0"
+        self.fills = 0
+
+    # State machine
+
+    def _book(self, keys, realized: float, fee: float):
+        for key in keys:
+            entry = self.totals.get(key)
+            if entry is None:
+                entry = self.totals[key] = [0.0, 0.0]
+            entry[0] += realized
+            entry[1] += fee
+
+    def _shift_unrealized(self, strategy: str, symbol: str, delta: float):
+        if not delta:
+            return
+        for key in (("strategy", strategy), ("symbol", symbol), ("total",)):
+            self.unrealized[key] = self.unrealized.get(key, 0.0) + delta
+
+    def _position_unrealized(self, symbol: str, position) -> float:
+        mark = self.marks.get(symbol)
+        return position[0] * (mark - position[1]) if mark is not None else 0.0
+
+    def apply(self, fill: dict, entry_id: str = None):
+        """
+        Applies one fill: {"strategy", "symbol", "side", "quantity", "price", "fee", "timestamp_ns"}.  A fill
+        without ``timestamp_ns`` is dated by its stream entry id (milliseconds), so every replay puts it in the
+        same session.
+        """
+        strategy = fill.get("strategy", "unknown")
+        symbol = fill["symbol"]
+        quantity = signed_quantity(fill)
+        price = float(fill["price"])
+        fee = float(fill.get("fee", 0.0))
+        timestamp_ns = fill.get("timestamp_ns")
+        if timestamp_ns is None:
+            timestamp_ns = int(entry_id.split("-", 1)[0]) * 1_000_000 if entry_id else time.time_ns()
+        session = session_of(int(timestamp_ns))
+
+        self.mark(symbol, price)  # A fill is the freshest price for every holder of the symbol
+        position = self.positions.get((strategy, symbol))
+        if position is None:
+            position = self.positions[(strategy, symbol)] = [0.0, 0.0]
+        before = self._position_unrealized(symbol, position)
+
+        held, average = position
+        realized = 0.0
+        if held and (held > 0) != (quantity > 0):
+            closed = min(abs(quantity), abs(held))
+            realized = closed * (price - average) * (1 if held > 0 else -1)
+        remaining = held + quantity
+        if not remaining or abs(remaining) < 1e-12:
+            position[0], position[1] = 0.0, 0.0
+        elif held == 0 or (held > 0) != (remaining > 0):
+            position[0], position[1] = remaining, price  # Opened, or flipped through flat at the fill price
+        elif (held > 0) == (quantity > 0):
+            position[0], position[1] = remaining, (held * average + quantity * price) / remaining
+        else:
+            position[0] = remaining  # Partial close keeps the average
+
+        holders = self.holders.setdefault(symbol, set())
+        if position[0]:
+            holders.add(strategy)
+        else:
+            holders.discard(strategy)
+        self._shift_unrealized(strategy, symbol, self._position_unrealized(symbol, position) - before)
+        self._book((("total",), ("strategy", strategy), ("symbol", symbol), ("session", session),
+                    ("session_strategy", session, strategy), ("session_symbol", session, symbol)), realized, fee)
+        self.fills += 1
+        if entry_id is not None:
+            self.last_id = entry_id
+
+    def mark(self, symbol: str, price: float):
+        """Moves the mark for ``symbol``; unrealized PnL of every holder follows."""
+        previous = self.marks.get(symbol)
+        self.marks[symbol] = price
+        if previous is None:
+            previous = price
+        move = price - previous
+        if not move:
+            return
+        unrealized, positions = self.unrealized, self.positions
+        net = 0.0
+        for strategy in self.holders.get(symbol, ()):
+            quantity = positions[(strategy, symbol)][0]
+            unrealized[("strategy", strategy)] = unrealized.get(("strategy", strategy), 0.0) + quantity * move
+            net += quantity
+        if net:
+            for key in (("symbol", symbol), ("total",)):
+                unrealized[key] = unrealized.get(key, 0.0) + net * move
+
+    # Queries (all O(1))
+
+    def _pnl(self, key) -> dict:
+        realized, fees = self.totals.get(key, (0.0, 0.0))
+        unrealized = self.unrealized.get(key, 0.0) if key[0] in ("total", "strategy", "symbol") else 0.0
+        return {"realized": realized, "fees": fees, "unrealized": unrealized, "net": realized - fees + unrealized}
+
+    def total(self) -> dict:
+        return self._pnl(("total",))
+
+    def strategy(self, name: str) -> dict:
+        return self._pnl(("strategy", name))
+
+    def symbol(self, name: str) -> dict:
+        return self._pnl(("symbol", name))
+
+    def session(self, session: str = None, strategy: str = None, symbol: str = None) -> dict:
+        """Realized PnL and fees for one session (default: the current one), optionally for one strategy or symbol."""
+        session = session or session_of(time.time_ns())
+        if strategy is not None:
+            return self._pnl(("session_strategy", session, strategy))
+        if symbol is not None:
+            return self._pnl(("session_symbol", session, symbol))
+        return self._pnl(("session", session))
+
+    def position(self, strategy: str, symbol: str) -> dict:
+        quantity, average = self.positions.get((strategy, symbol), (0.0, 0.0))
+        return {"quantity": quantity, "average_price": average}
+
+    def net_position(self, symbol: str) -> float:
+        """Quantity of ``symbol`` across every strategy; O(strategies holding it)."""
+        return sum(self.positions[(strategy, symbol)][0] for strategy in self.holders.get(symbol, ()))
+
+    # Snapshots
+
+    def to_snapshot(self) -> dict:
+        return {
+            "last_id": self.last_id,
+            "fills": self.fills,
+            "positions": [[strategy, symbol, quantity, average] for (strategy, symbol), (quantity, average) in self.positions.items() if quantity],
+            "totals": [[list(key), realized, fees] for key, (realized, fees) in self.totals.items()],
+            "marks": self.marks,
+        }
+
+    @classmethod
+    def from_snapshot(cls, snapshot: dict) -> "LedgerState":
+        state = cls()
+        state.last_id = snapshot.get("last_id", "0-0")
+        state.fills = snapshot.get("fills", 0)
+        state.marks = dict(snapshot.get("marks", {}))
+        state.totals = {tuple(key): [realized, fees] for key, realized, fees in snapshot.get("totals", [])}
+        for strategy, symbol, quantity, average in snapshot.get("positions", []):
+            position = state.positions[(strategy, symbol)] = [quantity, average]
+            state.holders.setdefault(symbol, set()).add(strategy)
+            state._shift_unrealized(strategy, symbol, state._position_unrealized(symbol, position))
+        return state
+
+    def difference(self, other: "LedgerState", tolerance: float = 1e-6) -> list:
+        """Positions and realized / fee totals that disagree with ``other`` beyond ``tolerance``; [] when identical."""
+        mismatches = []
+        for key in set(self.positions) | set(other.positions):
+            mine, theirs = self.positions.get(key, (0.0, 0.0)), other.positions.get(key, (0.0, 0.0))
+            if abs(mine[0] - theirs[0]) > tolerance or (mine[0] and abs(mine[1] - theirs[1]) > tolerance):
+                mismatches.append({"key": list(key), "kind": "position", "ledger": list(mine), "replay": list(theirs)})
+        for key in set(self.totals) | set(other.totals):
+            mine, theirs = self.totals.get(key, (0.0, 0.0)), other.totals.get(key, (0.0, 0.0))
+            if abs(mine[0] - theirs[0]) > tolerance or abs(mine[1] - theirs[1]) > tolerance:
+                mismatches.append({"key": list(key), "kind": "totals", "ledger": list(mine), "replay": list(theirs)})
+        return mismatches
+
+# Stream I/O
+
+def _decode(fields) -> dict:
+    raw = fields.get(STREAM_FIELD.encode()) or fields.get(STREAM_FIELD)
+    return json.loads(raw.decode() if isinstance(raw, bytes) else raw)
+
+def _id(entry_id) -> str:
+    return entry_id.decode() if isinstance(entry_id, bytes) else entry_id
+
+def stamped(fill: dict) -> dict:
+    """``fill`` with ``timestamp_ns`` set, to now when the producer left it out, so its session is fixed before it is written."""
+    return fill if fill.get("timestamp_ns") is not None else {**fill, "timestamp_ns": time.time_ns()}
+
+async def record_fill(redis, fill: dict):
+    """Appends a fill to the ledger and publishes it on FILLS_CHANNEL (for pub/sub readers) in one round trip; returns the entry id."""
+    payload = json.dumps(stamped(fill))
+    pipe = redis.pipeline(transaction=False)
+    pipe.xadd(LEDGER_STREAM, {STREAM_FIELD: payload})
+    pipe.publish(FILLS_CHANNEL, payload)
+    entry_id, _ = await pipe.execute()
+    return _id(entry_id)
+
+async def record_fills(redis, fills: list) -> list:
+    """``record_fill`` for a batch (e.g. one hedge cycle's executions) in a single round trip; returns the entry ids in order."""
+    pipe = redis.pipeline(transaction=False)
+    for fill in fills:
+        payload = json.dumps(stamped(fill))
+        pipe.xadd(LEDGER_STREAM, {STREAM_FIELD: payload})
+        pipe.publish(FILLS_CHANNEL, payload)
+    results = await pipe.execute()
+    return [_id(entry_id) for entry_id in results[::2]]
+
+async def replay(redis, state: LedgerState, until: str = "+") -> LedgerState:
+    """Applies every fill after ``state.last_id`` up to ``until`` (inclusive), paging through XRANGE."""
+    while True:
+        entries = await redis.xrange(LEDGER_STREAM, min=f"({state.last_id}", max=until, count=LEDGER_READ_COUNT)
+        for entry_id, fields in entries:
+            state.apply(_decode(fields), _id(entry_id))
+        if len(entries) < LEDGER_READ_COUNT:
+            return state
+
+async def load_snapshot(redis, key: str = LEDGER_SNAPSHOT_KEY) -> LedgerState:
+    raw = await redis.get(key)
+    return LedgerState.from_snapshot(json.loads(raw)) if raw else LedgerState()
+
+async def write_snapshot(redis, state: LedgerState):
+    """Stores a snapshot, keeping the one it replaces for pnl_accuracy_validator's snapshot-vs-replay check."""
+    pipe = redis.pipeline(transaction=True)
+    pipe.rename(LEDGER_SNAPSHOT_KEY, LEDGER_PREVIOUS_SNAPSHOT_KEY)
+    pipe.set(LEDGER_SNAPSHOT_KEY, json.dumps(state.to_snapshot()))
+    try:
+        await pipe.execute()
+    except Exception:
+        await redis.set(LEDGER_SNAPSHOT_KEY, json.dumps(state.to_snapshot()))  # First snapshot: nothing to rename
+    ledger_snapshots_total.inc()
+
+async def recover(redis) -> LedgerState:
+    """Latest snapshot plus the stream tail after it."""
+    state = await replay(redis, await load_snapshot(redis))
+    logging.info(json.dumps({"module": MODULE_NAME, "action": "recovered", "fills": state.fills, "last_id": state.last_id}))
+    return state
+
+class PnLLedger:
+    """Holds the live LedgerState for a process and keeps it current from the ledger stream."""
+
+    def __init__(self, state: LedgerState = None):
+        self.state = state or LedgerState()
+        self.ready = asyncio.Event()
+        self.listeners = []  # Called with each tailed fill right after it is applied, e.g. delta_hedger
+
+    async def run(self, redis, snapshots: bool = False):
+        """
+        Recovers, then tails the stream until cancelled.  Only one process (the ledger service) should
+        run with ``snapshots`` set; every other reader just follows the stream.
+        """
+        self.state = await recover(redis)
+        self.ready.set()
+        since_snapshot, snapshot_at = 0, time.monotonic()
+        while True:
+            try:
+                response = await redis.xread({LEDGER_STREAM: self.state.last_id}, count=LEDGER_READ_COUNT, block=LEDGER_BLOCK_MS)
+                for _, entries in response or ():
+                    for entry_id, fields in entries:
+                        fill = _decode(fields)
+                        self.state.apply(fill, _id(entry_id))
+                        ledger_fills_total.inc()
+                        for listener in self.listeners:
+                            try:
+                                listener(fill)
+                            except Exception as e:  # A failing reader must not stall the ledger
+                                logging.error(json.dumps({"module": MODULE_NAME, "action": "listener_error", "message": repr(e)}))
+                        since_snapshot += 1
+                if snapshots and since_snapshot and (since_snapshot >= LEDGER_SNAPSHOT_EVERY or time.monotonic() - snapshot_at >= LEDGER_SNAPSHOT_INTERVAL):
+                    await write_snapshot(redis, self.state)
+                    since_snapshot, snapshot_at = 0, time.monotonic()
+                total = self.state.total()
+                ledger_realized_pnl.set(total["realized"] - total["fees"])
+                ledger_unrealized_pnl.set(total["unrealized"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logging.error(json.dumps({"module": MODULE_NAME, "action": "error", "message": str(e)}))
+                await asyncio.sleep(1)
+
+# Process-wide ledger, shared by every module that imports this one
+default_ledger = PnLLedger()
+_feed = None
+
+def ensure_feed(redis=None) -> PnLLedger:
+    """Starts following the ledger stream once per process (needs a running loop) and returns the shared ledger."""
+    global _feed
+    if _feed is None or _feed.done():
+        if redis is None:
+            from redis_connection_manager import get_async_redis
+            redis = get_async_redis(f"redis://{os.getenv('REDIS_HOST', 'localhost')}:{int(os.getenv('REDIS_PORT', 6379))}")
+        _feed = asyncio.ensure_future(default_ledger.run(redis))
+    return default_ledger
+
+async def ready_state(timeout: float = LEDGER_READY_TIMEOUT) -> LedgerState:
+    """The shared ledger's state once it has recovered; raises asyncio.TimeoutError if recovery takes longer than ``timeout``."""
+    ledger = ensure_feed()
+    await asyncio.wait_for(ledger.ready.wait(), timeout)
+    return ledger.state
+
+def benchmark(fills: int = 200000, strategies: int = 20, symbols: int = 50, seed: int = 9) -> dict:
+    """Random fills and marks through one state: microseconds per fill / mark / query, and snapshot + tail recovery agreeing with a full replay."""
+    import random
+    rng = random.Random(seed)
+    now = time.time_ns()
+    tape = [{"strategy": f"S{rng.randrange(strategies)}", "symbol": f"X{rng.randrange(symbols)}", "side": rng.choice(("buy", "sell")),
+             "quantity": rng.uniform(0.1, 5), "price": 100 + rng.uniform(-5, 5), "fee": 0.01, "timestamp_ns": now + n * 1_000_000}
+            for n in range(fills)]
+    state = LedgerState()
+    started = time.perf_counter()
+    for n, fill in enumerate(tape):
+        state.apply(fill, f"{n + 1}-0")
+    fill_us = (time.perf_counter() - started) / fills * 1e6
+    started = time.perf_counter()
+    for n in range(fills):
+        state.mark(f"X{n % symbols}", 100 + rng.uniform(-5, 5))
+    mark_us = (time.perf_counter() - started) / fills * 1e6
+    started = time.perf_counter()
+    for n in range(fills):
+        state.strategy(f"S{n % strategies}")
+        state.session()
+    query_us = (time.perf_counter() - started) / (2 * fills) * 1e6
+
+    # Snapshot two thirds in, recover from it plus the tail, compare with a full replay
+    cut = fills * 2 // 3
+    partial = LedgerState()
+    for n, fill in enumerate(tape[:cut]):
+        partial.apply(fill, f"{n + 1}-0")
+    started = time.perf_counter()
+    recovered = LedgerState.from_snapshot(json.loads(json.dumps(partial.to_snapshot())))
+    for n, fill in enumerate(tape[cut:], start=cut):
+        recovered.apply(fill, f"{n + 1}-0")
+    recover_ms = (time.perf_counter() - started) * 1e3
+    full = LedgerState()
+    started = time.perf_counter()
+    for n, fill in enumerate(tape):
+        full.apply(fill, f"{n + 1}-0")
+    replay_ms = (time.perf_counter() - started) * 1e3
+    return {"fills": fills, "fill_us": round(fill_us, 2), "mark_us": round(mark_us, 2), "query_us": round(query_us, 2),
+            "recover_ms": round(recover_ms, 1), "full_replay_ms": round(replay_ms, 1), "mismatches": len(recovered.difference(full))}
+
+if __name__ == "__main__":
+    import sys
+    if sys.argv[1:] == ["benchmark"]:
+        logging.info(json.dumps({"module": MODULE_NAME, "action": "benchmark", **benchmark()}))
+    else:
+        from redis_connection_manager import get_async_redis
+        redis = get_async_redis(f"redis://{os.getenv('REDIS_HOST', 'localhost')}:{int(os.getenv('REDIS_PORT', 6379))}")
+        asyncio.run(default_ledger.run(redis, snapshots=True))
+
+# === Titan Module Footnotes ===
+# Implemented Features: append-only Redis Stream fill log, average-cost position / realized / unrealized / fee state machine per strategy, symbol and session, O(1) queries, periodic snapshots with previous-snapshot retention, snapshot + tail recovery
+# Deferred Features: FIFO lot accounting, funding payments
+# Excluded Features: risk metrics (see portfolio_risk_engine.py)
+# Quality Rating: 10/10 reviewed by [Grok|Gemini|Claude] on [YYYY-MM-DD]
@@ -6,7 +6,7 @@ Purpose: Converts profit to tokens.
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -32,7 +32,7 @@ TOKEN_NAME = config.get("TOKEN_NAME", "TITAN")
 async def mint_tokens(profit_amount):
     '''Mints tokens based on a preset ratio and publishes a message to Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         tokens_to_mint = profit_amount * TOKEN_MINT_RATIO
         key = f"titan:mint_tx:{TOKEN_NAME}"
         message = json.dumps({"amount": tokens_to_mint, "profit_amount": profit_amount})
@@ -0,0 +1,451 @@
+# Module: portfolio_risk_engine.py
+# Version: 1.0.0
+# Last Updated: 2026-10-16
+# Purpose: In-process portfolio risk; keeps positions and an EWMA covariance in NumPy arrays and updates exposure, VaR/ES and margin incrementally on every fill and price tick.
+
+# Core Objectives:
+# - Profitability (50–100% daily ROI target)
+# - Risk reduction (50:1 profit:loss ratio)
+# - ESG-safe actions only
+# - Compliance with UAE financial law
+# - Clean async logic and Redis safety
+# - Prometheus metrics (if needed)
+
+import asyncio
+import json
+import logging
+import math
+import os
+import time
+from statistics import NormalDist
+import numpy as np
+from prometheus_client import Counter, Gauge
+from pubsub_dispatcher import PubSubDispatcher, decode_json
+from Market_Data_Gateway import TRADES_CHANNEL, PRIMARY_BOOK_EXCHANGE
+
+# Config from config.json or ENV
+RISK_VAR_CONFIDENCE = float(os.getenv("RISK_VAR_CONFIDENCE", 0.99))
+RISK_HISTORY_WINDOW = int(os.getenv("RISK_HISTORY_WINDOW", 500))  # Return scenarios kept for historical VaR / ES
+RISK_EWMA_LAMBDA = float(os.getenv("RISK_EWMA_LAMBDA", 0.97))  # RiskMetrics-style covariance decay per return interval
+RISK_RETURN_INTERVAL = float(os.getenv("RISK_RETURN_INTERVAL", 60))  # Seconds between return marks; VaR horizon is one interval
+RISK_ACCOUNT_EQUITY = float(os.getenv("RISK_ACCOUNT_EQUITY", 100000))
+RISK_DEFAULT_LEVERAGE = float(os.getenv("RISK_DEFAULT_LEVERAGE", 5))  # Initial margin is |exposure| / leverage
+RISK_EXCHANGE = os.getenv("RISK_EXCHANGE", PRIMARY_BOOK_EXCHANGE)  # Trades from this venue mark positions
+RISK_SYMBOLS = os.getenv("RISK_SYMBOLS", "BTCUSDT,ETHUSDT")
+RISK_HISTORY_INTERVAL = os.getenv("RISK_HISTORY_INTERVAL", "1m")  # candle_store bars seeding the history; should match RISK_RETURN_INTERVAL
+RISK_MIN_SCENARIOS = int(os.getenv("RISK_MIN_SCENARIOS", 30))  # Return vectors needed before VaR is trusted
+FILLS_CHANNEL = os.getenv("FILLS_CHANNEL", "titan:prod:execution:fills")
+
+# Logging setup
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# Module name
+MODULE_NAME = "portfolio_risk_engine"
+
+# Prometheus metrics
+risk_fills_total = Counter('risk_engine_fills_total', 'Fills applied to the portfolio risk engine')
+risk_gross_exposure = Gauge('risk_engine_gross_exposure', 'Gross notional exposure')
+risk_net_exposure = Gauge('risk_engine_net_exposure', 'Net notional exposure')
+risk_var = Gauge('risk_engine_var', 'Value at risk over one return interval', ['method'])
+risk_margin_usage = Gauge('risk_engine_margin_usage', 'Initial margin as a fraction of equity')
+
+def parse_fill(fill: dict):
+    """A fill message -> (symbol, signed quantity, price).  Quantity is signed already or unsigned with side buy/sell."""
+    quantity = float(fill["quantity"])
+    if fill.get("side", "buy").lower() == "sell":
+        quantity = -abs(quantity)
+    return fill["symbol"], quantity, float(fill["price"])
+
+class PortfolioRiskEngine:
+    """
+    Positions, prices and risk state for one account, column per symbol.
+
+    Exposure is quantity * price in quote currency.  Parametric VaR uses the
+    EWMA covariance of log returns sampled once per return interval
+    (``mark``); historical VaR replays the last ``window`` return vectors
+    against today's exposure.  A fill or tick moves one exposure entry by d,
+    so the cached quantities follow in O(symbols + window):
+
+        Σw   += d * Σ[:, i]
+        w'Σw += d * (2 (Σw)_i + d Σ_ii)
+        R w  += d * R[:, i]
+
+    ``mark`` folds a new return vector into Σ and recomputes the caches from
+    scratch, which also removes floating-point drift.  Every query is O(1)
+    except the historical ones, which are a partial sort of ``window`` values.
+
+    An empty engine reports zero risk, so callers sizing leverage must check
+    ``is_warm`` first: positions seeded (from the ledger, see ``warm_up``) and
+    at least RISK_MIN_SCENARIOS return vectors behind the VaR.
+    """
+
+    def __init__(self, symbols=(), equity: float = RISK_ACCOUNT_EQUITY, confidence: float = RISK_VAR_CONFIDENCE,
+                 window: int = RISK_HISTORY_WINDOW, ewma_lambda: float = RISK_EWMA_LAMBDA, capacity: int = 64):
+        self.equity = equity
+        self.confidence = confidence
+        self.z = NormalDist().inv_cdf(confidence)
+        self.es_factor = math.exp(-self.z * self.z / 2) / math.sqrt(2 * math.pi) / (1 - confidence)
+        self.window = window
+        self.ewma_lambda = ewma_lambda
+        self.symbols = []
+        self.index = {}
+        self._allocate(capacity)
+        self.gross = 0.0
+        self.net = 0.0
+        self.margin = 0.0
+        self.variance = 0.0
+        self.scenarios = 0  # Return vectors ever marked
+        self.seeded = False  # Positions loaded from the ledger
+        for symbol in symbols:
+            self.slot(symbol)
+
+    def _allocate(self, capacity: int):
+        self.capacity = capacity
+        self.quantity = np.zeros(capacity)
+        self.price = np.zeros(capacity)
+        self.exposure = np.zeros(capacity)
+        self.margin_rate = np.zeros(capacity)
+        self.mark_price = np.zeros(capacity)
+        self.covariance = np.zeros((capacity, capacity))
+        self.cov_exposure = np.zeros(capacity)  # Σw
+        self.returns = np.zeros((self.window, capacity))  # Ring of return vectors
+        self.scenario_pnl = np.zeros(self.window)  # R w
+
+    def _grow(self):
+        old = self.capacity
+        arrays = (self.quantity, self.price, self.exposure, self.margin_rate, self.mark_price, self.cov_exposure)
+        covariance, returns, scenario_pnl = self.covariance, self.returns, self.scenario_pnl
+        self._allocate(old * 2)
+        for new, previous in zip((self.quantity, self.price, self.exposure, self.margin_rate, self.mark_price, self.cov_exposure), arrays):
+            new[:old] = previous
+        self.covariance[:old, :old] = covariance
+        self.returns[:, :old] = returns
+        self.scenario_pnl[:] = scenario_pnl
+
+    def slot(self, symbol: str, leverage: float = RISK_DEFAULT_LEVERAGE) -> int:
+        """Column of ``symbol``, added flat with no return history on first use."""
+        i = self.index.get(symbol)
+        if i is None:
+            if len(self.symbols) == self.capacity:
+                self._grow()
+            i = self.index[symbol] = len(self.symbols)
+            self.symbols.append(symbol)
+            self.margin_rate[i] = 1.0 / leverage
+        return i
+
+    def set_leverage(self, symbol: str, leverage: float):
+        i = self.slot(symbol)
+        self.margin += abs(self.exposure[i]) * (1.0 / leverage - self.margin_rate[i])
+        self.margin_rate[i] = 1.0 / leverage
+
+    def _move(self, i: int, exposure: float):
+        d = exposure - self.exposure[i]
+        if not d:
+            return
+        old = abs(self.exposure[i])
+        self.variance += d * (2 * self.cov_exposure[i] + d * self.covariance[i, i])
+        self.cov_exposure += d * self.covariance[:, i]
+        self.scenario_pnl += d * self.returns[:, i]
+        self.gross += abs(exposure) - old
+        self.net += d
+        self.margin += (abs(exposure) - old) * self.margin_rate[i]
+        self.exposure[i] = exposure
+
+    def on_fill(self, symbol: str, quantity: float, price: float):
+        """Applies a signed fill (positive buys) and marks the symbol at the fill price."""
+        i = self.slot(symbol)
+        self.quantity[i] += quantity
+        self.price[i] = price
+        if not self.mark_price[i]:
+            self.mark_price[i] = price
+        self._move(i, self.quantity[i] * price)
+
+    def on_price(self, symbol: str, price: float):
+        """Marks ``symbol`` at ``price``; symbols never seen before are tracked from here on."""
+        i = self.slot(symbol)
+        self.price[i] = price
+        if not self.mark_price[i]:
+            self.mark_price[i] = price
+        if self.quantity[i]:
+            self._move(i, self.quantity[i] * price)
+
+    def set_equity(self, equity: float):
+        self.equity = equity
+
+    def _refresh(self):
+        n = len(self.symbols)
+        w = self.exposure[:n]
+        self.cov_exposure[:n] = self.covariance[:n, :n] @ w
+        self.variance = float(w @ self.cov_exposure[:n])
+        self.scenario_pnl[:] = self.returns[:, :n] @ w
+        self.gross = float(np.abs(w).sum())
+        self.net = float(w.sum())
+        self.margin = float(np.abs(w) @ self.margin_rate[:n])
+
+    def add_returns(self, returns):
+        """Folds one return vector (aligned with ``symbols``; shorter vectors are zero-padded) into Σ and the scenario ring."""
+        n = len(self.symbols)
+        r = np.zeros(n)
+        r[:len(returns)] = returns
+        lam = self.ewma_lambda
+        self.covariance[:n, :n] *= lam
+        self.covariance[:n, :n] += (1 - lam) * np.outer(r, r)
+        self.returns[self.scenarios % self.window, :n] = r
+        self.returns[self.scenarios % self.window, n:] = 0
+        self.scenarios += 1
+        self._refresh()
+
+    def mark(self):
+        """Log returns since the previous mark for every priced symbol -> add_returns; called once per return interval."""
+        n = len(self.symbols)
+        price, previous = self.price[:n], self.mark_price[:n]
+        priced = (price > 0) & (previous > 0)
+        r = np.zeros(n)
+        r[priced] = np.log(price[priced] / previous[priced])
+        self.mark_price[:n] = np.where(price > 0, price, previous)
+        self.add_returns(r)
+
+    def load_history(self, closes, symbols):
+        """Seeds Σ and the scenario ring from a (bars, symbols) close matrix, e.g. candle_store 1m closes, oldest first."""
+        closes = np.asarray(closes, dtype=np.float64)
+        columns = [self.slot(symbol) for symbol in symbols]
+        n = len(self.symbols)
+        for row in np.diff(np.log(closes), axis=0)[-self.window:]:
+            r = np.zeros(n)
+            r[columns] = row
+            self.add_returns(r)
+        for column, close in zip(columns, closes[-1]):
+            if not self.price[column]:
+                self.price[column] = self.mark_price[column] = close
+
+    def seed_positions(self, positions: dict, prices: dict = None):
+        """Replaces every position with ``positions`` (symbol -> signed quantity), marked at ``prices`` where the engine has no price yet."""
+        for symbol in self.symbols:
+            self.quantity[self.index[symbol]] = 0.0
+        for symbol, quantity in positions.items():
+            i = self.slot(symbol)
+            self.quantity[i] = quantity
+            if not self.price[i] and prices and prices.get(symbol):
+                self.price[i] = self.mark_price[i] = prices[symbol]
+        n = len(self.symbols)
+        self.exposure[:n] = self.quantity[:n] * self.price[:n]
+        self._refresh()
+        self.seeded = True
+
+    # Queries
+
+    def is_warm(self) -> bool:
+        """True once positions are seeded and enough return history backs the VaR; until then leverage must stay minimal."""
+        return self.seeded and self.scenarios >= RISK_MIN_SCENARIOS
+
+    def position(self, symbol: str) -> dict:
+        i = self.index.get(symbol)
+        if i is None:
+            return {"quantity": 0.0, "price": 0.0, "exposure": 0.0}
+        return {"quantity": float(self.quantity[i]), "price": float(self.price[i]), "exposure": float(self.exposure[i])}
+
+    def exposures(self) -> dict:
+        n = len(self.symbols)
+        return dict(zip(self.symbols, self.exposure[:n].tolist()))
+
+    def volatility(self) -> float:
+        """Portfolio P&L standard deviation over one return interval, quote currency."""
+        return math.sqrt(max(self.variance, 0.0))
+
+    def parametric_var(self) -> float:
+        return self.z * self.volatility()
+
+    def parametric_es(self) -> float:
+        return self.es_factor * self.volatility()
+
+    def _tail(self):
+        count = min(self.scenarios, self.window)
+        if not count:
+            return None
+        losses = -self.scenario_pnl[:count]
+        tail = max(1, math.ceil((1 - self.confidence) * count))
+        return np.partition(losses, count - tail)[count - tail:]
+
+    def historical_var(self) -> float:
+        tail = self._tail()
+        return max(float(tail.min()), 0.0) if tail is not None else 0.0
+
+    def historical_es(self) -> float:
+        tail = self._tail()
+        return max(float(tail.mean()), 0.0) if tail is not None else 0.0
+
+    def margin_usage(self) -> float:
+        return self.margin / self.equity if self.equity > 0 else math.inf
+
+    def risk_fraction(self) -> float:
+        """The larger of parametric and historical VaR as a fraction of equity: the figure leverage decisions are sized on."""
+        if self.equity <= 0:
+            return math.inf
+        return max(self.parametric_var(), self.historical_var()) / self.equity
+
+    def snapshot(self) -> dict:
+        return {
+            "equity": self.equity,
+            "gross_exposure": self.gross,
+            "net_exposure": self.net,
+            "leverage": self.gross / self.equity if self.equity > 0 else math.inf,
+            "margin": self.margin,
+            "margin_usage": self.margin_usage(),
+            "var_parametric": self.parametric_var(),
+            "es_parametric": self.parametric_es(),
+            "var_historical": self.historical_var(),
+            "es_historical": self.historical_es(),
+            "scenarios": min(self.scenarios, self.window),
+            "confidence": self.confidence,
+            "warm": self.is_warm(),
+        }
+
+    def publish_metrics(self):
+        risk_gross_exposure.set(self.gross)
+        risk_net_exposure.set(self.net)
+        risk_var.labels(method="parametric").set(self.parametric_var())
+        risk_var.labels(method="historical").set(self.historical_var())
+        risk_margin_usage.set(self.margin_usage())
+
+# Process-wide engine, shared by every module that imports this one
+default_engine = PortfolioRiskEngine()
+_feed = None
+
+def closes_from_store(symbols, store=None, interval: str = RISK_HISTORY_INTERVAL, bars: int = RISK_HISTORY_WINDOW + 1):
+    """(symbols with history, (bars, symbols) close matrix) over the newest timestamps every one of them has in ``store``."""
+    if store is None:
+        from candle_store import default_store as store
+    frames = [(symbol, store.load(symbol, interval)) for symbol in symbols]
+    frames = [(symbol, frame) for symbol, frame in frames if len(frame)]
+    if not frames:
+        return [], np.empty((0, 0))
+    common = frames[0][1].timestamp
+    for _, frame in frames[1:]:
+        common = np.intersect1d(common, frame.timestamp)
+    common = common[-bars:]
+    closes = np.column_stack([frame.close[np.searchsorted(frame.timestamp, common)] for _, frame in frames])
+    return [symbol for symbol, _ in frames], closes
+
+async def warm_up(redis, symbols, engine: PortfolioRiskEngine = default_engine, store=None, on_fill=None):
+    """
+    Seeds ``engine`` before it serves queries: return history from the candle store, then net positions
+    from the recovered ledger.  ``on_fill`` is added to the ledger's listeners in the same step as the
+    seed (no await between them), so it sees exactly the fills after it.  Returns the ledger.
+    """
+    import pnl_ledger  # pnl_ledger imports this module
+    with_history, closes = await asyncio.to_thread(closes_from_store, symbols, store)
+    if len(closes) > 1 and not engine.scenarios:  # A restarted feed keeps the history it already has
+        engine.load_history(closes, with_history)
+    ledger = pnl_ledger.ensure_feed(redis)
+    await asyncio.wait_for(ledger.ready.wait(), pnl_ledger.LEDGER_READY_TIMEOUT)
+    state = ledger.state
+    engine.seed_positions({symbol: state.net_position(symbol) for symbol in state.holders if state.holders[symbol]}, state.marks)
+    if on_fill is not None:
+        ledger.listeners.append(on_fill)
+    logging.info(json.dumps({"module": MODULE_NAME, "action": "warmed_up", "scenarios": min(engine.scenarios, engine.window),
+                             "positions": int(np.count_nonzero(engine.quantity[:len(engine.symbols)])), "warm": engine.is_warm()}))
+    return ledger
+
+async def run_risk_feed(redis, symbols, engine: PortfolioRiskEngine = default_engine, exchange: str = RISK_EXCHANGE, store=None):
+    """
+    Warms ``engine`` up (``warm_up``), then keeps it current until cancelled: fills as the ledger tails them,
+    so none is missed or applied twice around the seed, and prices from the gateway's trade channels for ``symbols``.
+    """
+
+    def on_fill(fill):
+        engine.on_fill(*parse_fill(fill))
+        risk_fills_total.inc()
+
+    async def ingest(batch):
+        latest = {}
+        for message in batch:
+            event = decode_json(message)
+            if event.get("exchange") == exchange:
+                latest[event["symbol"]] = event["price"]  # Only the last tick per symbol in a batch matters
+        for symbol, price in latest.items():
+            engine.on_price(symbol, price)
+
+    async def tick():
+        while True:
+            await asyncio.sleep(RISK_RETURN_INTERVAL)
+            try:
+                engine.mark()
+                engine.publish_metrics()
+            except Exception as e:
+                logging.error(json.dumps({"module": MODULE_NAME, "action": "error", "message": str(e)}))
+
+    for symbol in symbols:
+        engine.slot(symbol)
+    ledger = await warm_up(redis, symbols, engine, store, on_fill)
+    channels = [TRADES_CHANNEL.format(symbol=symbol) for symbol in symbols]
+    dispatcher = PubSubDispatcher(redis, MODULE_NAME, channels=channels)
+    dispatcher.add_handler(ingest, name="apply_ticks", batch=True)
+    ticker = asyncio.create_task(tick())
+    try:
+        await dispatcher.run()
+    finally:
+        ticker.cancel()
+        ledger.listeners.remove(on_fill)
+
+def ensure_feed(symbols=None, redis=None) -> PortfolioRiskEngine:
+    """Starts the risk feed once per process (needs a running loop) and returns the shared engine, which is not warm until the feed has seeded it."""
+    global _feed
+    if _feed is None or _feed.done():
+        if redis is None:
+            from redis_connection_manager import get_async_redis
+            redis = get_async_redis(f"redis://{os.getenv('REDIS_HOST', 'localhost')}:{int(os.getenv('REDIS_PORT', 6379))}")
+        _feed = asyncio.ensure_future(run_risk_feed(redis, symbols or [s.strip() for s in RISK_SYMBOLS.split(",")]))
+    return default_engine
+
+def benchmark(assets: int = 200, window: int = RISK_HISTORY_WINDOW, updates: int = 20000, seed: int = 5) -> dict:
+    """Random 200-asset book: microseconds per fill, per tick, per full snapshot and per return mark, plus the largest drift from a full recompute."""
+    rng = np.random.default_rng(seed)
+    symbols = [f"A{n}" for n in range(assets)]
+    engine = PortfolioRiskEngine(symbols, equity=1e7, window=window)
+    factor = rng.normal(0, 0.01, (window + 1, 1))
+    closes = 100 * np.exp(np.cumsum(factor + rng.normal(0, 0.01, (window + 1, assets)), axis=0))
+    engine.load_history(closes, symbols)
+    for n, symbol in enumerate(symbols):
+        engine.on_fill(symbol, float(rng.normal(0, 100)), float(closes[-1, n]))
+
+    which = rng.integers(0, assets, updates).tolist()
+    sizes = rng.normal(0, 10, updates).tolist()
+    moves = np.exp(rng.normal(0, 0.001, updates)).tolist()
+    started = time.perf_counter()
+    for i, size in zip(which, sizes):
+        engine.on_fill(symbols[i], size, float(engine.price[i]))
+    fill_us = (time.perf_counter() - started) / updates * 1e6
+    started = time.perf_counter()
+    for i, move in zip(which, moves):
+        engine.on_price(symbols[i], float(engine.price[i]) * move)
+    tick_us = (time.perf_counter() - started) / updates * 1e6
+    started = time.perf_counter()
+    for _ in range(2000):
+        engine.snapshot()
+    snapshot_us = (time.perf_counter() - started) / 2000 * 1e6
+
+    incremental = (engine.variance, float(np.sort(engine.scenario_pnl)[0]))
+    engine._refresh()
+    drift = max(abs(incremental[0] - engine.variance) / max(engine.variance, 1e-12),
+                abs(incremental[1] - float(np.sort(engine.scenario_pnl)[0])) / max(abs(engine.scenario_pnl).max(), 1e-12))
+    started = time.perf_counter()
+    for _ in range(200):
+        engine.mark()
+    mark_us = (time.perf_counter() - started) / 200 * 1e6
+    return {"assets": assets, "window": window, "fill_us": round(fill_us, 2), "tick_us": round(tick_us, 2),
+            "snapshot_us": round(snapshot_us, 2), "mark_us": round(mark_us, 1), "max_relative_drift": float(drift)}
+
+if __name__ == "__main__":
+    import sys
+    if sys.argv[1:] == ["benchmark"]:
+        logging.info(json.dumps({"module": MODULE_NAME, "action": "benchmark", **benchmark()}))
+    else:
+        from redis_connection_manager import get_async_redis
+        redis = get_async_redis(f"redis://{os.getenv('REDIS_HOST', 'localhost')}:{int(os.getenv('REDIS_PORT', 6379))}")
+        asyncio.run(run_risk_feed(redis, [s.strip() for s in RISK_SYMBOLS.split(",")]))
+
+# === Titan Module Footnotes ===
+# Implemented Features: incremental exposure / parametric + historical VaR and ES / margin usage per fill and tick, EWMA covariance, candle-store and ledger warm-up with a not-warm state, in-process shared engine
+# Deferred Features: per-venue margin tiers, cross-margin offsets → Crypto_Futures_Adapter
+# Excluded Features: realized PnL accounting → position ledger
+# Quality Rating: 10/10 reviewed by [Grok|Gemini|Claude] on [YYYY-MM-DD]
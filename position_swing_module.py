@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -39,7 +39,7 @@ swing_trade_profit = Gauge('swing_trade_profit', 'Profit from swing trades')
 async def fetch_historical_data(symbol):
     '''Fetches historical data for trend detection.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         # Placeholder for fetching historical data logic (replace with actual fetching)
         historical_data = [{"date": "2025-03-20", "close": 30000}, {"date": "2025-03-21", "close": 30500}, {"date": "2025-03-22", "close": 31000}, {"date": "2025-03-23", "close": 31500}, {"date": "2025-03-24", "close": 32000}] # Simulate historical data
         logger.info(json.dumps({"module": "position_swing_module", "action": "Fetch Historical Data", "status": "Success", "symbol": symbol}))
@@ -6,7 +6,7 @@ Purpose: After a winning trade, re-enters lightly on same symbol to ride trend c
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -60,7 +60,7 @@ async def check_chaos_spike(symbol):
 async def enter_secondary_trade(original_signal):
     '''Enters a secondary trade with 50% size and tighter SL.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         channel = "titan:core:signal"
 
         secondary_signal = original_signal.copy()
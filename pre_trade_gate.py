@@ -0,0 +1,278 @@
+# Module: pre_trade_gate.py
+# Version: 1.0.0
+# Last Updated: 2026-10-16
+# Purpose: Single in-process pre-trade gate; compiles exchange, leverage, instance, KYC, jurisdiction and wallet rules into one flat table checked in one call.
+
+# Core Objectives:
+# - Profitability (50–100% daily ROI target)
+# - Risk reduction (50:1 profit:loss ratio)
+# - ESG-safe actions only
+# - Compliance with UAE financial law
+# - Clean async logic and Redis safety
+# - Prometheus metrics (if needed)
+
+import asyncio
+import json
+import logging
+import os
+import time
+import numpy as np
+from prometheus_client import Counter
+from redis_connection_manager import fetch_state
+import Exchange_Compliance_Engine
+import contextual_leverage_limiter
+import strategy_instance_limiter
+import kyc_whitelist_checker
+import jurisdiction_risk_map
+import portfolio_risk_engine
+
+# Config from config.json or ENV
+GATE_REFRESH_INTERVAL = float(os.getenv("GATE_REFRESH_INTERVAL", 1))  # Seconds between background state refreshes
+GATE_MAX_STALENESS = float(os.getenv("GATE_MAX_STALENESS", 10))  # Orders are rejected once state is older than this
+GATE_DEFAULT_USER = os.getenv("GATE_DEFAULT_USER", "titan")  # KYC subject for orders without a user_id
+GATE_JURISDICTION = os.getenv("GATE_JURISDICTION", "AE")  # Jurisdiction for orders without one
+TRADING_ENABLED_KEY = "titan:system:trading_enabled"  # Written by exchange_wallet_guard
+
+# Logging setup
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# Module name
+MODULE_NAME = "pre_trade_gate"
+
+# Prometheus metrics
+gate_checks_total = Counter('pre_trade_gate_checks_total', 'Orders evaluated by the pre-trade gate')
+gate_rejects_total = Counter('pre_trade_gate_rejects_total', 'Orders rejected per pre-trade rule', ['rule'])
+gate_refresh_errors_total = Counter('pre_trade_gate_refresh_errors_total', 'Failed background state refreshes')
+
+class GateState:
+    """
+    Everything the rules read, held in plain Python values.
+
+    Only the background refresh writes here; a check never awaits or touches
+    Redis.  Unset state (before the first refresh) is treated as stale.
+    """
+
+    def __init__(self):
+        self.refreshed_at = 0.0
+        self.trading_enabled = True
+        self.exchange_rules = None
+        self.leverage_cap = contextual_leverage_limiter.MAX_LEVERAGE
+        self.kyc_tiers = {}  # user_id -> tier; users seen by the gate are refreshed each cycle
+        self.instances = {}  # strategy -> running instances, from strategy_instance_limiter's shared hash
+        self.blocked = frozenset()  # (asset, jurisdiction) pairs with a "block" geo rule
+        self.geo_rules_mtime = None
+
+    def compile_geo_rules(self, geo_rules):
+        self.blocked = frozenset((rule["asset"], rule["jurisdiction"]) for rule in geo_rules or () if rule.get("action") == "block")
+
+def compile_rules(state: GateState, engine=None) -> list:
+    """
+    The flat rule table: (name, predicate(order) -> bool) in evaluation order, cheapest and most
+    often failing first.  Constants are bound here once so each predicate is a couple of lookups.
+    Open positions come from ``engine`` (default: the process's portfolio_risk_engine.default_engine).
+    """
+    max_order_size = Exchange_Compliance_Engine.MAX_ORDER_SIZE
+    max_open_positions = Exchange_Compliance_Engine.MAX_OPEN_POSITIONS
+    max_instances = strategy_instance_limiter.MAX_INSTANCES_PER_STRATEGY
+    restricted = frozenset(kyc_whitelist_checker.RESTRICTED_ASSETS)
+    required_tier = kyc_whitelist_checker.REQUIRED_KYC_TIER
+    if engine is None:
+        engine = portfolio_risk_engine.default_engine  # Its arrays are reallocated as symbols are added, so read them per call
+
+    def fresh(order):
+        return time.monotonic() - state.refreshed_at <= GATE_MAX_STALENESS
+
+    def wallet(order):
+        return state.trading_enabled
+
+    def exchange_rules_loaded(order):
+        return state.exchange_rules is not None  # Exchange_Compliance_Engine rejects when rules are missing
+
+    def order_size(order):
+        return order.get("quantity", 0) <= max_order_size
+
+    def leverage(order):
+        return (order.get("leverage") or 1) <= state.leverage_cap
+
+    def kyc(order):
+        if order.get("symbol") not in restricted:
+            return True
+        user = order.get("user_id", GATE_DEFAULT_USER)
+        tier = state.kyc_tiers.get(user)
+        if tier is None:
+            tier = state.kyc_tiers[user] = 0  # Unknown users start at tier 0 and are read on the next refresh
+        return tier >= required_tier
+
+    def jurisdiction(order):
+        return (order.get("symbol"), order.get("jurisdiction", GATE_JURISDICTION)) not in state.blocked
+
+    def instance_limit(order):
+        return state.instances.get(order.get("strategy"), 0) < max_instances  # As strategy_instance_limiter.check_instance_limit
+
+    def risk_engine_warm(order):
+        return engine.is_warm()  # Until the feed has seeded it, the engine holds no positions to count
+
+    def open_positions(order):
+        # Orders on a symbol already held never add a position
+        i = engine.index.get(order.get("symbol"))
+        if i is not None and engine.quantity[i]:
+            return True
+        return int(np.count_nonzero(engine.quantity[:len(engine.symbols)])) < max_open_positions
+
+    return [
+        ("state_fresh", fresh),
+        ("wallet_guard", wallet),
+        ("exchange_rules", exchange_rules_loaded),
+        ("max_order_size", order_size),
+        ("leverage_cap", leverage),
+        ("kyc_whitelist", kyc),
+        ("jurisdiction", jurisdiction),
+        ("strategy_instance_limit", instance_limit),
+        ("risk_engine_warm", risk_engine_warm),
+        ("max_open_positions", open_positions),
+    ]
+
+class PreTradeGate:
+    """Evaluates orders against the compiled rule table; ``run_refresh`` keeps the state current."""
+
+    def __init__(self, state: GateState = None, engine=None):
+        self.state = state or GateState()
+        self.rules = compile_rules(self.state, engine)
+        self.rejected = {name: 0 for name, _ in self.rules}
+        self.checked = 0
+
+    def check(self, order: dict):
+        """Returns (accepted, rejecting_rule_name); the first failing rule wins."""
+        self.checked += 1
+        gate_checks_total.inc()
+        for name, predicate in self.rules:
+            if not predicate(order):
+                self.rejected[name] += 1
+                gate_rejects_total.labels(rule=name).inc()
+                return False, name
+        return True, None
+
+    def allows(self, order: dict) -> bool:
+        """SignalPipeline stage form of ``check``; the rejecting rule is recorded on the order as ``rejected_rule``."""
+        accepted, rule = self.check(order)
+        if not accepted:
+            order["rejected_rule"] = rule
+        return accepted
+
+    async def refresh(self, redis):
+        """Reads every Redis-backed input in one round trip and reloads the geo rules file if it changed."""
+        state = self.state
+        users = list(state.kyc_tiers) or [GATE_DEFAULT_USER]
+        keys = {"trading_enabled": TRADING_ENABLED_KEY,
+                "exchange_rules": f"titan:prod::{Exchange_Compliance_Engine.EXCHANGE_NAME}_rules"}
+        keys.update({f"kyc:{user}": f"titan:kyc:{user}:tier" for user in users})
+        values = await fetch_state(redis, keys, {"instances": strategy_instance_limiter.INSTANCES_KEY})
+
+        enabled = values["trading_enabled"]
+        state.trading_enabled = enabled is None or (enabled.decode() if isinstance(enabled, bytes) else enabled) != "false"
+        state.exchange_rules = json.loads(values["exchange_rules"]) if values["exchange_rules"] else None
+        state.kyc_tiers = {user: int(values[f"kyc:{user}"] or 0) for user in users}
+        state.instances = {(strategy.decode() if isinstance(strategy, bytes) else strategy): int(count)
+                           for strategy, count in values["instances"].items()}
+
+        volatility = await contextual_leverage_limiter.get_market_volatility()
+        equity = await contextual_leverage_limiter.get_account_equity()
+        state.leverage_cap = contextual_leverage_limiter.MAX_LEVERAGE
+        if volatility > contextual_leverage_limiter.VOLATILITY_THRESHOLD or equity < contextual_leverage_limiter.EQUITY_THRESHOLD:
+            state.leverage_cap *= contextual_leverage_limiter.RISK_TOLERANCE
+
+        try:
+            mtime = os.path.getmtime(jurisdiction_risk_map.GEO_RULES_FILE)
+        except OSError:
+            mtime = None  # No geo rules file: nothing is blocked, as in jurisdiction_risk_map
+        if mtime != state.geo_rules_mtime:
+            state.compile_geo_rules(await jurisdiction_risk_map.load_geo_rules() if mtime is not None else None)
+            state.geo_rules_mtime = mtime
+        state.refreshed_at = time.monotonic()
+
+    async def run_refresh(self, redis, interval: float = GATE_REFRESH_INTERVAL, delay: float = 0):
+        """Refreshes the state every ``interval`` seconds, the first time after ``delay``, until cancelled."""
+        await asyncio.sleep(delay)
+        while True:
+            try:
+                await self.refresh(redis)
+            except Exception as e:
+                gate_refresh_errors_total.inc()
+                logging.error(json.dumps({"module": MODULE_NAME, "action": "refresh_failed", "message": str(e)}))
+            await asyncio.sleep(interval)
+
+    def stats(self) -> dict:
+        return {"checked": self.checked, "rejected": dict(self.rejected), "state_age_s": round(time.monotonic() - self.state.refreshed_at, 3)}
+
+# Process-wide gate, shared by every module that imports this one
+default_gate = PreTradeGate()
+_refresher = None
+
+def _default_redis():
+    from redis_connection_manager import get_async_redis
+    return get_async_redis(f"redis://{os.getenv('REDIS_HOST', 'localhost')}:{int(os.getenv('REDIS_PORT', 6379))}")
+
+def ensure_refresh(redis=None, delay: float = 0) -> PreTradeGate:
+    """Starts the background refresh once per process (needs a running loop) and returns the shared gate."""
+    global _refresher
+    if _refresher is None or _refresher.done():
+        _refresher = asyncio.ensure_future(default_gate.run_refresh(redis or _default_redis(), delay=delay))
+    return default_gate
+
+async def start_refresh(redis=None) -> PreTradeGate:
+    """
+    Loads the shared gate's state once, then starts the background refresh and the process's risk feed.
+    Await it at service start: until the first refresh lands every order fails ``state_fresh``, and until
+    the feed has warmed the risk engine every order fails ``risk_engine_warm``.  A failing first refresh raises.
+    """
+    redis = redis or _default_redis()
+    await default_gate.refresh(redis)
+    portfolio_risk_engine.ensure_feed(redis=redis)
+    return ensure_refresh(redis, delay=GATE_REFRESH_INTERVAL)
+
+def benchmark(orders: int = 200000) -> dict:
+    """Mixed passing / failing orders through a warm gate; mean microseconds per order and the reject breakdown."""
+    import random
+    rng = random.Random(3)
+    state = GateState()
+    state.refreshed_at = time.monotonic() + 3600  # Stays fresh for the run
+    state.exchange_rules = {}
+    state.kyc_tiers = {GATE_DEFAULT_USER: 1, "vip": 3}
+    state.compile_geo_rules([{"asset": "XRPUSDT", "jurisdiction": "US", "action": "block"}])
+    symbols = ["BTCUSDT", "ETHUSDT", "SOLUSDT", "XRPUSDT", "BNBUSDT"]
+    engine = portfolio_risk_engine.PortfolioRiskEngine(symbols)
+    closes = 100 * np.exp(np.cumsum(np.random.default_rng(3).normal(0, 0.001, (portfolio_risk_engine.RISK_MIN_SCENARIOS + 1, len(symbols))), axis=0))
+    engine.load_history(closes, symbols)
+    engine.seed_positions({"BTCUSDT": 1.0}, {"BTCUSDT": 30000.0})
+    gate = PreTradeGate(state, engine)
+    batch = [{"symbol": rng.choice(symbols), "side": rng.choice(("BUY", "SELL")), "quantity": rng.uniform(0, 120),
+              "leverage": rng.choice((1, 2, 3, 5)), "strategy": "momentum", "user_id": rng.choice((GATE_DEFAULT_USER, "vip")),
+              "jurisdiction": rng.choice(("AE", "US"))} for _ in range(1000)]
+    started = time.perf_counter()
+    for n in range(orders):
+        gate.check(batch[n % 1000])
+    per_order_us = (time.perf_counter() - started) / orders * 1e6
+    return {"orders": orders, "rules": len(gate.rules), "per_order_us": round(per_order_us, 3), "target_us": 50,
+            "rejected": {name: count for name, count in gate.rejected.items() if count}}
+
+async def main():
+    """One refresh against live Redis, logging the state the gate would check orders against."""
+    gate = PreTradeGate()
+    await gate.refresh(_default_redis())
+    state = gate.state
+    logging.info(json.dumps({"module": MODULE_NAME, "action": "state", "trading_enabled": state.trading_enabled,
+                             "exchange_rules_loaded": state.exchange_rules is not None, "leverage_cap": state.leverage_cap,
+                             "blocked": sorted(state.blocked), "instances": state.instances}))
+
+if __name__ == "__main__":
+    import sys
+    if sys.argv[1:] == ["benchmark"]:
+        logging.info(json.dumps({"module": MODULE_NAME, "action": "benchmark", **benchmark()}))
+    else:
+        asyncio.run(main())
+
+# === Titan Module Footnotes ===
+# Implemented Features: flat compiled rule table, single-call evaluation with rejecting rule name, one-round-trip background state refresh, fail-closed on stale state, per-rule reject counters
+# Deferred Features: per-exchange rule sets (one EXCHANGE_NAME for now), price-band checks from exchange rules
+# Excluded Features: leverage clamping (contextual_leverage_limiter still rewrites signals; the gate only rejects)
+# Quality Rating: 10/10 reviewed by [Grok|Gemini|Claude] on [YYYY-MM-DD]
@@ -6,7 +6,7 @@ Purpose: Routes profits dynamically.
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -30,7 +30,7 @@ REDIS_PORT = config.get("REDIS_PORT", 6379)
 async def route_profit(profit_amount):
     '''Routes profit to reinvestment, buffer, and withdrawal based on configuration.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
 
         reinvest_pct = float(await redis.get("titan:control:reinvest_pct") or config.get("DEFAULT_REINVEST_PCT", 0.5))
         buffer_pct = float(await redis.get("titan:control:buffer_pct") or config.get("DEFAULT_BUFFER_PCT", 0.3))
@@ -0,0 +1,232 @@
+# Module: rate_limiter.py
+# Version: 1.0.0
+# Last Updated: 2026-10-16
+# Purpose: Shared GCRA rate limiter keyed by (exchange, weight class, API key, tenant); state lives in Redis so every Titan process draws on one budget.
+
+# Core Objectives:
+# - Profitability (50–100% daily ROI target)
+# - Risk reduction (50:1 profit:loss ratio)
+# - ESG-safe actions only
+# - Compliance with UAE financial law
+# - Clean async logic and Redis safety
+# - Prometheus metrics (if needed)
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from prometheus_client import Counter
+
+# Config from config.json or ENV
+RATE_LIMIT_KEY = os.getenv("RATE_LIMIT_KEY", "titan:prod:rate_limit:{exchange}:{weight_class}:{api_key}:{tenant}")
+RATE_LEASE_FRACTION = float(os.getenv("RATE_LEASE_FRACTION", 0.02))  # Largest local lease, as a fraction of the limit
+RATE_LEASE_TTL = float(os.getenv("RATE_LEASE_TTL", 0.5))  # Seconds a lease may be spent locally (capped at 5% of the period)
+DEFAULT_TENANT = os.getenv("TENANT_ID", "default")
+
+# (exchange, weight class) -> (units, period seconds).  Set a little under the venues' published limits.
+# RATE_LIMITS overrides or extends them as JSON: {"binance:request_weight": [5000, 60], ...}
+DEFAULT_LIMITS = {
+    ("binance", "request_weight"): (5400, 60),
+    ("binance", "orders"): (90, 10),
+    ("bybit", "public"): (540, 5),
+    ("bybit", "orders"): (9, 1),
+    ("kucoin", "public"): (1800, 30),
+    ("kucoin", "orders"): (40, 3),
+}
+RATE_LIMITS = {tuple(name.split(":", 1)): tuple(value) for name, value in json.loads(os.getenv("RATE_LIMITS", "{}")).items()}
+
+# (exchange, endpoint) -> (weight class, cost); unlisted endpoints cost 1 unit of the exchange's public class
+ENDPOINT_WEIGHTS = {
+    ("binance", "/api/v3/depth"): ("request_weight", 5),
+    ("binance", "/api/v3/ticker/24hr"): ("request_weight", 2),
+    ("binance", "/api/v3/order"): ("orders", 1),
+    ("bybit", "/v5/order/create"): ("orders", 1),
+    ("kucoin", "/api/v1/orders"): ("orders", 1),
+}
+PUBLIC_CLASSES = {"binance": "request_weight", "bybit": "public", "kucoin": "public"}
+
+# Logging setup
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# Module name
+MODULE_NAME = "rate_limiter"
+
+# Prometheus metrics
+rate_limit_decisions_total = Counter('rate_limit_decisions_total', 'Rate limiter decisions', ['exchange', 'weight_class', 'decision'])
+
+# GCRA over Redis server time.  The key holds the bucket's theoretical arrival time (TAT, ms):
+# ``limit`` units per ``period`` means one unit every period/limit ms, with a full period of burst.
+# A request may also take up to ``lease`` extra units for the caller to spend locally, but only
+# out of headroom beyond a further ``lease`` units, so near the limit every request comes here.
+# With ARGV[5] = 0 the decision is made but nothing is taken.
+# Returns {allowed, granted, retry_after_ms, remaining}.
+GCRA_SCRIPT = """
+local period = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local lease = tonumber(ARGV[4])
+local spend = tonumber(ARGV[5] or 1)
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) * 1000 + tonumber(clock[2]) / 1000
+local interval = period / limit
+local tat = tonumber(redis.call('GET', KEYS[1]) or now)
+if tat < now then tat = now end
+local available = math.floor((now + period - tat) / interval + 1e-9)
+if available < cost then
+    return {0, 0, math.ceil(tat - period + cost * interval - now), available}
+end
+if spend == 0 then
+    return {1, 0, 0, available}
+end
+local granted = cost + math.min(lease, math.max(0, available - cost - lease))
+if granted > 0 then
+    tat = tat + granted * interval
+    redis.call('SET', KEYS[1], string.format('%.3f', tat), 'PX', math.ceil(tat - now) + 1)
+end
+return {1, granted, 0, available - granted}
+"""
+
+def endpoint_cost(exchange: str, endpoint: str):
+    """(weight class, cost) an exchange REST endpoint is charged; a signed GET's query string is ignored."""
+    return ENDPOINT_WEIGHTS.get((exchange, endpoint.split("?", 1)[0]), (PUBLIC_CLASSES.get(exchange, "public"), 1))
+
+class RateLimiter:
+    """
+    Token-bucket (GCRA) budgets shared through Redis.
+
+    Each decision is one atomic script call, O(1) in time and one key of
+    state per bucket.  When a bucket has ample headroom the script also
+    grants a small lease that ``acquire`` spends locally for up to
+    RATE_LEASE_TTL, so busy callers skip Redis on most requests.  Leased
+    units are already debited from the shared budget; a lease can at most
+    shift that many units' timing, which the margin in DEFAULT_LIMITS absorbs.
+    """
+
+    def __init__(self, redis, limits: dict = None):
+        self.redis = redis
+        self.limits = {**DEFAULT_LIMITS, **RATE_LIMITS, **(limits or {})}
+        self.script = redis.register_script(GCRA_SCRIPT)
+        self.leases = {}  # bucket key -> [units, monotonic expiry]
+
+    def bucket_key(self, exchange: str, weight_class: str, api_key: str = None, tenant: str = DEFAULT_TENANT) -> str:
+        # Key names are visible to anyone with Redis access; never embed the API key itself
+        key_id = hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16] if api_key else "public"
+        return RATE_LIMIT_KEY.format(exchange=exchange, weight_class=weight_class, api_key=key_id, tenant=tenant)
+
+    async def acquire(self, exchange: str, weight_class: str, api_key: str = None, tenant: str = DEFAULT_TENANT, cost: int = 1):
+        """Takes ``cost`` units if the budget allows; returns (allowed, retry_after_seconds)."""
+        limit, period = self.limits[(exchange, weight_class)]
+        if cost > limit:
+            raise ValueError(f"Cost {cost} exceeds the {exchange}:{weight_class} limit of {limit}")
+        key = self.bucket_key(exchange, weight_class, api_key, tenant)
+
+        now = time.monotonic()
+        lease = self.leases.get(key)
+        if lease is not None and lease[0] >= cost and now < lease[1]:
+            lease[0] -= cost
+            rate_limit_decisions_total.labels(exchange=exchange, weight_class=weight_class, decision="local").inc()
+            return True, 0.0
+
+        allowed, granted, retry_after_ms, _ = await self.script(keys=[key], args=[period * 1000, limit, cost, int(limit * RATE_LEASE_FRACTION)])
+        if not allowed:
+            self.leases.pop(key, None)
+            rate_limit_decisions_total.labels(exchange=exchange, weight_class=weight_class, decision="denied").inc()
+            return False, retry_after_ms / 1000
+        if granted > cost:
+            self.leases[key] = [granted - cost, now + min(RATE_LEASE_TTL, period * 0.05)]
+        else:
+            self.leases.pop(key, None)
+        rate_limit_decisions_total.labels(exchange=exchange, weight_class=weight_class, decision="allowed").inc()
+        return True, 0.0
+
+    async def check(self, exchange: str, weight_class: str, api_key: str = None, tenant: str = DEFAULT_TENANT, cost: int = 1):
+        """Whether ``acquire`` would take ``cost`` units right now; returns (allowed, retry_after_seconds) and consumes nothing."""
+        limit, period = self.limits[(exchange, weight_class)]
+        key = self.bucket_key(exchange, weight_class, api_key, tenant)
+        lease = self.leases.get(key)
+        if lease is not None and lease[0] >= cost and time.monotonic() < lease[1]:
+            return True, 0.0
+        allowed, _, retry_after_ms, _ = await self.script(keys=[key], args=[period * 1000, limit, cost, 0, 0])
+        return bool(allowed), retry_after_ms / 1000
+
+    async def wait(self, exchange: str, weight_class: str, api_key: str = None, tenant: str = DEFAULT_TENANT, cost: int = 1, timeout: float = None) -> bool:
+        """Acquires, sleeping out the retry hints; False if ``timeout`` seconds pass first."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            allowed, retry_after = await self.acquire(exchange, weight_class, api_key, tenant, cost)
+            if allowed:
+                return True
+            if deadline is not None and time.monotonic() + retry_after > deadline:
+                return False
+            await asyncio.sleep(retry_after)
+
+    async def throttle(self, exchange: str, endpoint: str, api_key: str = None, tenant: str = DEFAULT_TENANT, timeout: float = None) -> bool:
+        """``wait`` for a REST endpoint, charged per ENDPOINT_WEIGHTS."""
+        weight_class, cost = endpoint_cost(exchange, endpoint)
+        return await self.wait(exchange, weight_class, api_key, tenant, cost, timeout)
+
+    async def remaining(self, exchange: str, weight_class: str, api_key: str = None, tenant: str = DEFAULT_TENANT) -> int:
+        """Units available right now in the shared budget plus this process's unexpired lease; consumes nothing."""
+        limit, period = self.limits[(exchange, weight_class)]
+        key = self.bucket_key(exchange, weight_class, api_key, tenant)
+        _, _, _, available = await self.script(keys=[key], args=[period * 1000, limit, 0, 0])
+        lease = self.leases.get(key)
+        if lease is not None and time.monotonic() < lease[1]:
+            available += lease[0]
+        return int(available)
+
+    async def used(self, exchange: str, weight_class: str, api_key: str = None, tenant: str = DEFAULT_TENANT) -> int:
+        """Units consumed within the trailing period."""
+        limit, _ = self.limits[(exchange, weight_class)]
+        return limit - await self.remaining(exchange, weight_class, api_key, tenant)
+
+_default_limiter = None
+
+def default_limiter() -> RateLimiter:
+    """The process's limiter on the shared Redis pool, created on first use; every exchange adapter throttles through it."""
+    global _default_limiter
+    if _default_limiter is None:
+        from redis_connection_manager import get_async_redis
+        _default_limiter = RateLimiter(get_async_redis(f"redis://{os.getenv('REDIS_HOST', 'localhost')}:{int(os.getenv('REDIS_PORT', 6379))}"))
+    return _default_limiter
+
+async def benchmark(redis, requests: int = 20000) -> dict:
+    """Times acquire() against ``redis`` on a budget with ample headroom; reports how many calls reached Redis."""
+    limiter = RateLimiter(redis, {("bench", "weight"): (1_000_000, 60)})
+    await redis.delete(limiter.bucket_key("bench", "weight"))
+    script = limiter.script
+    calls = 0
+
+    async def counted(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        return await script(*args, **kwargs)
+
+    limiter.script = counted
+    started = time.perf_counter()
+    for _ in range(requests):
+        await limiter.acquire("bench", "weight")
+    elapsed = time.perf_counter() - started
+    return {"requests": requests, "redis_calls": calls, "us_per_acquire": round(elapsed / requests * 1e6, 2)}
+
+# Chaos hook example
+if os.getenv("CHAOS_MODE", "off") == "on":
+    raise Exception("Simulated failure - chaos mode")
+
+# Morphic mode control
+morphic_mode = os.getenv("MORPHIC_MODE", "default")
+# No morphic mode control specified for this module
+
+# Test entry
+if __name__ == "__main__":
+    from redis_connection_manager import get_async_redis
+    redis = get_async_redis(f"redis://{os.getenv('REDIS_HOST', 'localhost')}:{int(os.getenv('REDIS_PORT', 6379))}")
+    logging.info(json.dumps({"module": MODULE_NAME, "action": "benchmark", **asyncio.run(benchmark(redis))}))
+
+# === Titan Module Footnotes ===
+# Implemented Features: atomic Redis Lua GCRA, cross-process shared budgets, per-exchange weight classes, per-API-key and per-tenant buckets, local lease fast path, retry-after hints
+# Deferred Features: reading venue X-MBX-USED-WEIGHT style headers back into the budget
+# Excluded Features: order execution (in execution_handler.py)
+# Quality Rating: 10/10 reviewed by [Grok|Gemini|Claude] on [YYYY-MM-DD]
@@ -1,9 +1,26 @@
+import asyncio
+import os
+import random
 import redis
+import aioredis
 import logging
+from prometheus_client import Counter, Gauge
 
 # Initialize logging
 logger = logging.getLogger(__name__)
 
+# Async pool settings (per process)
+REDIS_POOL_MAX_CONNECTIONS = int(os.getenv("REDIS_POOL_MAX_CONNECTIONS", 64))
+REDIS_POOL_TIMEOUT = float(os.getenv("REDIS_POOL_TIMEOUT", 5))  # Seconds to wait for a free connection
+REDIS_HEALTH_CHECK_INTERVAL = int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", 30))  # Seconds between idle-connection PINGs
+REDIS_RECONNECT_ATTEMPTS = int(os.getenv("REDIS_RECONNECT_ATTEMPTS", 8))
+REDIS_RECONNECT_BACKOFF_BASE = float(os.getenv("REDIS_RECONNECT_BACKOFF_BASE", 0.1))
+REDIS_RECONNECT_BACKOFF_MAX = float(os.getenv("REDIS_RECONNECT_BACKOFF_MAX", 10))
+
+# Prometheus metrics
+redis_pool_connections = Gauge('redis_pool_connections', 'Connections created by the shared async Redis pool', ['url'])
+redis_reconnects_total = Counter('redis_reconnects_total', 'Reconnect attempts made by the shared async Redis pool', ['url', 'status'])
+
 class RedisConnectionManager:
     def __init__(self, host="localhost", port=6379, db=0):
         self.host = host
@@ -34,6 +51,12 @@ class RedisConnectionManager:
                 return None
         return self.redis_client
 
+    def get_async_client(self):
+        """
+        Returns a pooled async Redis client for this manager's host/port/db.
+        """
+        return get_async_redis(f"redis://{self.host}:{self.port}/{self.db}")
+
     def health_check(self):
         """
         Performs a health check on the Redis connection.
@@ -63,6 +86,182 @@ class RedisConnectionManager:
             finally:
                 self.redis_client = None
 
+class RegistryConnectionPool(aioredis.BlockingConnectionPool):
+    """
+    BlockingConnectionPool that starts its registry's health-check task the
+    first time a connection is taken inside an event loop.  Clients are mostly
+    created at import, before any loop runs, so the pool cannot start it then.
+    """
+
+    registry = None
+
+    async def get_connection(self, *args, **kwargs):
+        if self.registry is not None:
+            self.registry.ensure_health_check()
+        return await super().get_connection(*args, **kwargs)
+
+class AsyncRedisPoolRegistry:
+    """
+    Process-wide registry of pooled async Redis clients.
+
+    One BlockingConnectionPool is kept per (url, client options) pair, so every
+    module in the process shares the same sockets instead of opening a new
+    client on every call.  Pools detect fork() themselves and rebuild in the
+    child, so a registry inherited by a worker process is safe to use.  The
+    first command on any pool starts ``health_check_loop`` in that event loop.
+    """
+
+    def __init__(self, max_connections=REDIS_POOL_MAX_CONNECTIONS, pool_timeout=REDIS_POOL_TIMEOUT,
+                 health_check_interval=REDIS_HEALTH_CHECK_INTERVAL):
+        self.max_connections = max_connections
+        self.pool_timeout = pool_timeout
+        self.health_check_interval = health_check_interval
+        self._clients = {}
+        self._health_task = None
+
+    def get_client(self, url, **kwargs):
+        """
+        Returns the shared client for ``url``, creating its pool on first use.
+        ``kwargs`` are pool options and override the registry defaults.
+        """
+        key = (url, tuple(sorted(kwargs.items())))
+        client = self._clients.get(key)
+        if client is None:
+            options = {
+                "max_connections": self.max_connections,
+                "timeout": self.pool_timeout,
+                "health_check_interval": self.health_check_interval,
+                "socket_keepalive": True,
+                **kwargs,
+            }
+            pool = RegistryConnectionPool.from_url(url, **options)
+            pool.registry = self
+            client = aioredis.Redis(connection_pool=pool)
+            self._clients[key] = client
+            logger.info(f"Created async Redis pool for {url} (max_connections={self.max_connections})")
+        return client
+
+    async def reconnect(self, client, url):
+        """
+        Drops every connection in the client's pool and retries PING with
+        exponential backoff and jitter until Redis answers.
+        """
+        for attempt in range(REDIS_RECONNECT_ATTEMPTS):
+            try:
+                await client.connection_pool.disconnect()
+                await client.ping()
+                redis_reconnects_total.labels(url=url, status="success").inc()
+                logger.info(f"Reconnected to Redis at {url} after {attempt + 1} attempt(s)")
+                return True
+            except (aioredis.exceptions.ConnectionError, aioredis.exceptions.TimeoutError, OSError) as e:
+                redis_reconnects_total.labels(url=url, status="failure").inc()
+                delay = min(REDIS_RECONNECT_BACKOFF_MAX, REDIS_RECONNECT_BACKOFF_BASE * (2 ** attempt))
+                delay = random.uniform(delay / 2, delay)
+                logger.warning(f"Redis reconnect attempt {attempt + 1} to {url} failed: {e}; retrying in {delay:.2f}s")
+                await asyncio.sleep(delay)
+        logger.error(f"Giving up reconnecting to Redis at {url} after {REDIS_RECONNECT_ATTEMPTS} attempts")
+        return False
+
+    async def health_check(self):
+        """
+        PINGs every registered pool and reconnects the ones that fail.
+        Returns a dict of url -> healthy flag.
+        """
+        results = {}
+        for (url, _), client in list(self._clients.items()):
+            try:
+                await client.ping()
+                results[url] = True
+            except (aioredis.exceptions.ConnectionError, aioredis.exceptions.TimeoutError, OSError) as e:
+                logger.error(f"Async Redis health check failed for {url}: {e}")
+                results[url] = await self.reconnect(client, url)
+        return results
+
+    async def health_check_loop(self, interval=REDIS_HEALTH_CHECK_INTERVAL):
+        """
+        Runs health_check forever; ensure_health_check starts it on the first command through any pool.
+        """
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.health_check()
+                for (url, _), stats in self.stats().items():
+                    redis_pool_connections.labels(url=url).set(stats["created"])
+            except Exception as e:
+                logger.exception(f"Async Redis health check loop error: {e}")
+
+    def ensure_health_check(self):
+        """
+        Starts health_check_loop as a background task of the running event loop
+        unless it already runs there; disabled by a non-positive interval.
+        """
+        if self.health_check_interval <= 0:
+            return
+        loop = asyncio.get_running_loop()
+        task = self._health_task
+        if task is not None and not task.done() and task.get_loop() is loop:
+            return
+        self._health_task = loop.create_task(self.health_check_loop(self.health_check_interval))
+
+    def stats(self):
+        """
+        Returns created/max connection counts for every registered pool.
+        """
+        return {
+            key: {"created": len(getattr(client.connection_pool, "_connections", ())), "max": client.connection_pool.max_connections}
+            for key, client in self._clients.items()
+        }
+
+    async def close_all(self):
+        """
+        Stops the health-check task, disconnects every pool and forgets all clients.
+        """
+        if self._health_task is not None:
+            self._health_task.cancel()
+            self._health_task = None
+        for client in self._clients.values():
+            try:
+                await client.connection_pool.disconnect()
+            except Exception as e:
+                logger.exception(f"Error closing async Redis pool: {e}")
+        self._clients = {}
+
+async def fetch_state(redis, keys, hashes=None):
+    """
+    Reads a decision loop's state in a single round trip.
+
+    ``keys`` maps field name -> string key and is read with one MGET.  When
+    ``hashes`` (field name -> hash key) is given, the MGET and every HGETALL
+    are sent together in one non-transactional pipeline.  Returns a dict of
+    field name -> raw value (None / {} when missing).
+    """
+    names = list(keys)
+    hash_names = list(hashes or {})
+    if not hash_names:
+        values = await redis.mget([keys[name] for name in names]) if names else []
+        return dict(zip(names, values))
+
+    pipe = redis.pipeline(transaction=False)
+    if names:
+        pipe.mget([keys[name] for name in names])
+    for name in hash_names:
+        pipe.hgetall(hashes[name])
+    results = await pipe.execute()
+    values = results.pop(0) if names else []
+    state = dict(zip(names, values))
+    state.update(zip(hash_names, results))
+    return state
+
+# Process-wide registry used by all modules
+async_redis_registry = AsyncRedisPoolRegistry()
+
+def get_async_redis(url, **kwargs):
+    """
+    Drop-in replacement for ``aioredis.from_url`` that returns a client backed
+    by the process-wide connection pool for ``url``.
+    """
+    return async_redis_registry.get_client(url, **kwargs)
+
 # Example usage:
 if __name__ == "__main__":
     # Configure logging
@@ -83,10 +282,11 @@ if __name__ == "__main__":
 # Implemented Features:
 # - Connection management (connect, get_client, close)
 # - Health check
+# - Process-wide async connection pooling (get_async_redis) with health checks (started on first use) and reconnect backoff
+# - Single round-trip state fetches (fetch_state) via MGET / pipeline
 
 # Deferred Features:
-# - Connection pooling
-# - Asynchronous connection support
+# - Sentinel / cluster-aware pools
 
 # Excluded Features:
 # - [List any explicitly excluded features]
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -40,7 +40,7 @@ key_health_score = Gauge('key_health_score', 'Health score of each key', ['key']
 async def monitor_pubsub_channels():
     '''Monitors Redis pub/sub channels and key health.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         # Placeholder for monitoring pub/sub channels logic (replace with actual monitoring)
         channel_health = {"titan:signal:raw:BTCUSDT": 1.0, "titan:trade:executed:BTCUSDT": 0.95} # Simulate channel health
         logger.info(json.dumps({"module": "redis_integrity_guard", "action": "Monitor PubSub Channels", "status": "Success", "channel_count": len(channel_health)}))
@@ -52,7 +52,7 @@ async def monitor_pubsub_channels():
 async def check_key_health():
     '''Detects key loss, corruption, or desync.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         # Placeholder for checking key health logic (replace with actual checking)
         key_health = {"titan:signal:raw:BTCUSDT": 0.99, "titan:trade:executed:BTCUSDT": 0.85} # Simulate key health
         for key, health in key_health.items():
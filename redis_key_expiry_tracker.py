@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -48,7 +48,7 @@ TEST_KEYS = [
 async def create_test_keys():
     '''Create test keys in Titan Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         for key in TEST_KEYS:
             await redis.setex(key, random.randint(MIN_TTL, MAX_TTL), "test_value")
         logger.info(json.dumps({"module": "redis_key_expiry_tracker", "action": "Create Test Keys", "status": "Success"}))
@@ -60,7 +60,7 @@ async def create_test_keys():
 async def monitor_key_expiries():
     '''Monitor keys created in Titan (titan:*) and Sample TTLs across Signals, Blocks, Executions, SL/TP trails.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         start_time = time.time()
         while time.time() - start_time < MONITORING_DURATION:
             for key in TEST_KEYS:
@@ -15,7 +15,8 @@ import asyncio
 import json
 import logging
 import os
-import aioredis
+from redis_connection_manager import get_async_redis
+from pubsub_dispatcher import PubSubDispatcher, decode_json
 
 # Config from config.json or ENV
 NAMESPACE_PREFIX = os.getenv("NAMESPACE_PREFIX", "titan:prod:")
@@ -23,7 +24,7 @@ NAMESPACE_PREFIX = os.getenv("NAMESPACE_PREFIX", "titan:prod:")
 # Redis connection
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
 REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
-redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
 
 # Logging setup
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -64,27 +65,9 @@ async def route_message(channel: str, message: str):
 
 async def main():
     """Main function to route Redis messages based on the namespace."""
-    pubsub = redis.pubsub()
-    await pubsub.psubscribe(f"{NAMESPACE_PREFIX}*")  # Subscribe to all channels under the namespace
-
-    while True:
-        try:
-            message = await pubsub.get_message(ignore_subscribe_messages=True)
-            if message:
-                channel = message["channel"].decode("utf-8")
-                data = message["data"].decode("utf-8")
-
-                # Route the message
-                await route_message(channel, data)
-
-            await asyncio.sleep(0.01)  # Prevent CPU overuse
-
-        except Exception as e:
-            logging.error(json.dumps({
-                "module": MODULE_NAME,
-                "action": "error",
-                "message": str(e)
-            }))
+    dispatcher = PubSubDispatcher(redis, MODULE_NAME, patterns=[f"{NAMESPACE_PREFIX}*"])  # Subscribe to all channels under the namespace
+    dispatcher.add_handler(lambda message: route_message(message["channel"].decode("utf-8"), message["data"].decode("utf-8")), name="route_message")
+    await dispatcher.run()
 
 async def is_esg_compliant(symbol: str, side: str) -> bool:
     """Placeholder for ESG compliance check."""
@@ -107,7 +90,7 @@ if __name__ == "__main__":
     asyncio.run(main())
 
 # === Titan Module Footnotes ===
-# Implemented Features: redis-pub, async safety, redis namespace routing
+# Implemented Features: redis-pub, event-driven subscription, async safety, redis namespace routing
 # Deferred Features: ESG logic -> esg_mode.py
 # Excluded Features: backtesting (in backtest_engine.py)
 # Quality Rating: 10/10 reviewed by [Grok|Gemini|Claude] on [YYYY-MM-DD]
\ No newline at end of file
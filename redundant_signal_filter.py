@@ -15,18 +15,20 @@ import asyncio
 import json
 import logging
 import os
-import aioredis
-import datetime
+from redis_connection_manager import get_async_redis
+from signal_stream_bus import SIGNAL_TRANSPORT, STRATEGY_SIGNALS_STREAM, StreamConsumer
+from pubsub_dispatcher import PubSubDispatcher, decode_signal
 
 # Config from config.json or ENV
 SIGNAL_TIME_WINDOW = int(os.getenv("SIGNAL_TIME_WINDOW", 10))  # 10 seconds
 SIGNAL_SIMILARITY_THRESHOLD = float(os.getenv("SIGNAL_SIMILARITY_THRESHOLD", 0.9))
 EXECUTION_ORCHESTRATOR_CHANNEL = os.getenv("EXECUTION_ORCHESTRATOR_CHANNEL", "titan:prod:execution_orchestrator")
+RECENT_SIGNAL_KEY = os.getenv("RECENT_SIGNAL_KEY", "titan:prod:redundant_signal_filter:last:{symbol}")
 
 # Redis connection
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
 REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
-redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
 
 # Logging setup
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -34,8 +36,11 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 # Module name
 MODULE_NAME = "redundant_signal_filter"
 
-# In-memory store for recent signals
-recent_signals = {}
+# The last forwarded signal per symbol lives in Redis for SIGNAL_TIME_WINDOW, so every consumer in the
+# group (and the orchestrator's in-process stage) sees the same window
+
+def recent_key(symbol: str) -> str:
+    return RECENT_SIGNAL_KEY.format(symbol=symbol)
 
 async def are_signals_similar(signal1: dict, signal2: dict) -> bool:
     """Checks if two signals are similar based on a defined threshold."""
@@ -47,62 +52,72 @@ async def are_signals_similar(signal1: dict, signal2: dict) -> bool:
     else:
         return False
 
+async def is_redundant(signal: dict) -> bool:
+    """Checks if a signal repeats the last forwarded signal for its symbol within the time window."""
+    last_signal = await redis.get(recent_key(signal.get("symbol")))
+    if last_signal is None:
+        return False  # Nothing forwarded within the window: the key has expired
+    # Check if signals are similar
+    return await are_signals_similar(signal, json.loads(last_signal))
+
+async def remember_signal(signal: dict):
+    """Records a forwarded signal as the latest one for its symbol, for the next SIGNAL_TIME_WINDOW seconds."""
+    await redis.set(recent_key(signal["symbol"]), json.dumps(signal), px=int(SIGNAL_TIME_WINDOW * 1000))
+
+async def claim_signal(signal: dict) -> bool:
+    """
+    ``is_redundant`` and ``remember_signal`` in one step, for concurrent consumers: True when the signal may be
+    forwarded.  The first signal for a symbol in a window claims it with SET NX, so of two copies delivered to
+    different consumers at once only one passes.
+    """
+    if await redis.set(recent_key(signal["symbol"]), json.dumps(signal), px=int(SIGNAL_TIME_WINDOW * 1000), nx=True):
+        return True
+    if await is_redundant(signal):
+        return False
+    await remember_signal(signal)
+    return True
+
+async def handle_signal(signal: dict):
+    """Forwards a strategy signal to the execution orchestrator unless it is redundant."""
+    symbol = signal.get("symbol")
+
+    if symbol is None:
+        logging.warning(json.dumps({
+            "module": MODULE_NAME,
+            "action": "missing_symbol",
+            "message": "Signal missing symbol information."
+        }))
+        return
+
+    if not await claim_signal(signal):
+        logging.info(json.dumps({
+            "module": MODULE_NAME,
+            "action": "signal_redundant",
+            "symbol": symbol,
+            "message": "Redundant signal detected - signal blocked."
+        }))
+        return  # Block the signal
+
+    # Allow the signal if it's not redundant
+    await redis.publish(EXECUTION_ORCHESTRATOR_CHANNEL, json.dumps(signal))  # Pub/sub subscribers include JSON-only modules
+
+    logging.info(json.dumps({
+        "module": MODULE_NAME,
+        "action": "signal_allowed",
+        "symbol": symbol,
+        "message": "Signal allowed - not redundant."
+    }))
+
 async def main():
     """Main function to filter out redundant trading signals."""
-    pubsub = redis.pubsub()
-    await pubsub.psubscribe("titan:prod:strategy_signals")  # Subscribe to strategy signals channel
-
-    while True:
-        try:
-            message = await pubsub.get_message(ignore_subscribe_messages=True)
-            if message:
-                signal = json.loads(message["data"].decode("utf-8"))
-                symbol = signal.get("symbol")
-
-                if symbol is None:
-                    logging.warning(json.dumps({
-                        "module": MODULE_NAME,
-                        "action": "missing_symbol",
-                        "message": "Signal missing symbol information."
-                    }))
-                    continue
-
-                now = datetime.datetime.utcnow()
-                if symbol in recent_signals:
-                    last_signal = recent_signals[symbol]
-                    time_difference = (now - last_signal["timestamp"]).total_seconds()
-
-                    if time_difference < SIGNAL_TIME_WINDOW:
-                        # Check if signals are similar
-                        if await are_signals_similar(signal, last_signal):
-                            logging.info(json.dumps({
-                                "module": MODULE_NAME,
-                                "action": "signal_redundant",
-                                "symbol": symbol,
-                                "message": "Redundant signal detected - signal blocked."
-                            }))
-                            continue  # Block the signal
-
-                # Allow the signal if it's not redundant
-                signal["timestamp"] = now  # Store the timestamp
-                recent_signals[symbol] = signal
-                await redis.publish(EXECUTION_ORCHESTRATOR_CHANNEL, json.dumps(signal))
-
-                logging.info(json.dumps({
-                    "module": MODULE_NAME,
-                    "action": "signal_allowed",
-                    "symbol": symbol,
-                    "message": "Signal allowed - not redundant."
-                }))
-
-            await asyncio.sleep(0.01)  # Prevent CPU overuse
-
-        except Exception as e:
-            logging.error(json.dumps({
-                "module": MODULE_NAME,
-                "action": "error",
-                "message": str(e)
-            }))
+    if SIGNAL_TRANSPORT == "streams":
+        # One consumer group per filter stage; extra processes join the same group and share the window in Redis
+        await StreamConsumer(redis, STRATEGY_SIGNALS_STREAM, MODULE_NAME, handle_signal).run()
+        return
+
+    dispatcher = PubSubDispatcher(redis, MODULE_NAME, patterns=["titan:prod:strategy_signals"])  # Subscribe to strategy signals channel
+    dispatcher.add_handler(lambda message: handle_signal(decode_signal(message)), name="handle_signal")
+    await dispatcher.run()
 
 async def is_esg_compliant(symbol: str, side: str) -> bool:
     """Placeholder for ESG compliance check."""
@@ -125,7 +140,7 @@ if __name__ == "__main__":
     asyncio.run(main())
 
 # === Titan Module Footnotes ===
-# Implemented Features: redis-pub, async safety, redundant signal filtering
+# Implemented Features: redis-pub, redis-streams consumer group, event-driven pub/sub fallback, async safety, redundant signal filtering, dedupe window shared through Redis (SET NX PX)
 # Deferred Features: ESG logic -> esg_mode.py, signal similarity comparison
 # Excluded Features: backtesting (in backtest_engine.py)
 # Quality Rating: 10/10 reviewed by [Grok|Gemini|Claude] on [YYYY-MM-DD]
\ No newline at end of file
@@ -6,7 +6,7 @@ Purpose: Ensures Titan continues operating during datacenter outages.
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -33,7 +33,7 @@ SECONDARY_REDIS_PORT = config.get("SECONDARY_REDIS_PORT", 6380)
 async def check_redis_status(host, port):
     '''Checks the status of a Redis instance.'''
     try:
-        redis = aioredis.from_url(f"redis://{host}:{port}")
+        redis = get_async_redis(f"redis://{host}:{port}")
         await redis.ping()
         return True
     except Exception as e:
@@ -53,7 +53,7 @@ async def check_exchange_status(endpoint):
 async def perform_failover():
     '''Performs failover to secondary Redis and logs the event.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         failover_key = "titan:infra:failover_active"
         await redis.set(failover_key, "true")
         logger.warning(json.dumps({"module": "region_failover_manager", "action": "perform_failover", "status": "success", "message": "Failover activated"}))
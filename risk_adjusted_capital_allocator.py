@@ -1,11 +1,20 @@
 import logging
 import asyncio
+import numpy as np
+from capital_allocation_engine import CapitalAllocationEngine, shrunk_covariance, ALLOCATION_METHOD
 
 # Initialize logging
 logger = logging.getLogger(__name__)
 
 class RiskAdjustedCapitalAllocator:
-    def __init__(self):
+    def __init__(self, method=ALLOCATION_METHOD, **constraints):
+        """
+        ``method`` is mean_variance, risk_parity or kelly; ``constraints`` (reserve, max_weight,
+        min_weight, risk_aversion, kelly_fraction) are passed to the allocation engine.
+        """
+        self.method = method
+        self.constraints = constraints
+        self.engine = CapitalAllocationEngine(method=method, **constraints)
         logger.info("RiskAdjustedCapitalAllocator initialized.")
 
     async def allocate_capital(self, strategies, total_capital):
@@ -13,11 +22,11 @@ class RiskAdjustedCapitalAllocator:
         Allocates capital to different strategies based on their risk-adjusted performance.
         """
         try:
-            # 1. Calculate risk-adjusted returns for each strategy
-            risk_adjusted_returns = self._calculate_risk_adjusted_returns(strategies)
+            # 1. Estimate expected returns and their covariance for each strategy
+            mean, covariance = self._calculate_risk_adjusted_returns(strategies)
 
             # 2. Determine capital allocation weights
-            allocation_weights = self._determine_allocation_weights(risk_adjusted_returns)
+            allocation_weights = self._determine_allocation_weights(list(strategies), mean, covariance)
 
             # 3. Allocate capital based on weights
             capital_allocations = {}
@@ -33,35 +42,36 @@ class RiskAdjustedCapitalAllocator:
 
     def _calculate_risk_adjusted_returns(self, strategies):
         """
-        Calculates the risk-adjusted returns for each strategy.
-        This is a stub implementation. Replace with actual calculation logic.
+        Estimates (mean, covariance) of the strategies' returns, in the order of ``strategies``.
+        When every strategy carries a "returns" series (oldest first) the estimate is the sample mean
+        and the shrunk covariance of their common tail; otherwise each strategy's Sharpe ratio (given,
+        or computed from its returns) is its expected return at unit, uncorrelated risk.
         """
-        # Placeholder: Replace with actual calculation logic
-        logger.info(f"Calculating risk-adjusted returns for strategies: {strategies}")
-        risk_adjusted_returns = {}
-        for strategy, data in strategies.items():
-            # Example: Use Sharpe ratio as risk-adjusted return
-            risk_adjusted_returns[strategy] = data.get("sharpe_ratio", 0)
-        return risk_adjusted_returns
-
-    def _determine_allocation_weights(self, risk_adjusted_returns):
+        logger.info(f"Calculating risk-adjusted returns for strategies: {list(strategies)}")
+        series = [data.get("returns") for data in strategies.values()]
+        if all(returns is not None and len(returns) > 1 for returns in series):
+            length = min(len(returns) for returns in series)
+            matrix = np.column_stack([np.asarray(returns[-length:], dtype=np.float64) for returns in series])
+            mean, covariance, shrinkage = shrunk_covariance(matrix)
+            logger.info(f"Estimated covariance from {length} periods (shrinkage {shrinkage:.3f})")
+            return mean, covariance
+        scores = []
+        for data, returns in zip(strategies.values(), series):
+            if returns is not None and len(returns) > 1 and np.std(returns) > 0:
+                scores.append(float(np.mean(returns) / np.std(returns)))
+            else:
+                scores.append(data.get("sharpe_ratio", 0))
+        return np.array(scores, dtype=np.float64), np.eye(len(scores))
+
+    def _determine_allocation_weights(self, names, mean, covariance):
         """
-        Determines the capital allocation weights based on risk-adjusted returns.
-        This is a stub implementation. Replace with actual allocation logic.
+        Determines the capital allocation weights with the shared allocation engine.
+        The engine is kept while the strategy set is unchanged so re-solves start from the last weights.
         """
-        # Placeholder: Replace with actual allocation logic
-        logger.info(f"Determining allocation weights from risk-adjusted returns: {risk_adjusted_returns}")
-        # Example: Allocate capital proportionally to risk-adjusted returns
-        total_returns = sum(risk_adjusted_returns.values())
-        allocation_weights = {}
-        if total_returns > 0:
-            for strategy, returns in risk_adjusted_returns.items():
-                allocation_weights[strategy] = returns / total_returns
-        else:
-            # If total returns are zero or negative, allocate equally
-            num_strategies = len(risk_adjusted_returns)
-            for strategy in risk_adjusted_returns:
-                allocation_weights[strategy] = 1 / num_strategies if num_strategies > 0 else 0
+        if self.engine.strategies != names:
+            self.engine = CapitalAllocationEngine(names, method=self.method, **self.constraints)
+        allocation_weights = self.engine.solve(mean=mean, covariance=covariance)
+        logger.info(f"Allocation weights ({self.method}): {allocation_weights}")
         return allocation_weights
 
 # Example usage:
@@ -70,7 +80,7 @@ if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
 
     async def main():
-        allocator = RiskAdjustedCapitalAllocator()
+        allocator = RiskAdjustedCapitalAllocator(max_weight=0.6)
 
         # Simulate strategies
         strategies = {
@@ -91,13 +101,11 @@ if __name__ == "__main__":
 # Module Footer
 # Implemented Features:
 # - Risk-adjusted capital allocation
-# - Risk-adjusted return calculation stub
-# - Allocation weight determination stub
+# - Mean / shrunk covariance estimation from strategy return series, Sharpe fallback
+# - Mean-variance, risk-parity and fractional-Kelly weights via capital_allocation_engine
 
 # Deferred Features:
-# - Actual calculation and allocation logic
 # - Integration with strategy performance data
-# - More sophisticated allocation algorithms
 
 # Excluded Features:
 # - [List any explicitly excluded features]
@@ -15,7 +15,7 @@ import asyncio
 import json
 import logging
 import os
-import aioredis
+from redis_connection_manager import get_async_redis
 
 # Config from config.json or ENV
 DECISION_EXPLANATIONS_CHANNEL = os.getenv("DECISION_EXPLANATIONS_CHANNEL", "titan:prod:decision_explanations")
@@ -23,7 +23,7 @@ DECISION_EXPLANATIONS_CHANNEL = os.getenv("DECISION_EXPLANATIONS_CHANNEL", "tita
 # Redis connection
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
 REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
-redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
 
 # Logging setup
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
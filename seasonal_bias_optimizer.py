@@ -6,7 +6,7 @@ Purpose: Shifts Titan’s strategy weighting based on historical performance pat
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -31,7 +31,7 @@ REDIS_PORT = config.get("REDIS_PORT", 6379)
 async def get_historical_pnl_patterns():
     '''Retrieves historical PnL patterns from Redis (placeholder).'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         # Placeholder: Replace with actual logic to fetch historical PnL data
         # Simulate monthly and quarterly PnL patterns
         pnl_patterns = {
@@ -48,7 +48,7 @@ async def get_historical_pnl_patterns():
 async def adjust_strategy_weighting(strategy, weight_bias):
     '''Adjusts the strategy weighting in Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         key = f"titan:strategy_weight_bias:{strategy}"
         await redis.set(key, weight_bias)
         logger.info(json.dumps({"module": "seasonal_bias_optimizer", "action": "adjust_strategy_weighting", "status": "success", "strategy": strategy, "weight_bias": weight_bias, "redis_key": key}))
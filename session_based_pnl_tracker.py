@@ -15,17 +15,21 @@ import asyncio
 import json
 import logging
 import os
-import aioredis
+from redis_connection_manager import get_async_redis
 import datetime
+import time
+import pnl_ledger
 
 # Config from config.json or ENV
 SESSION_START_HOUR = int(os.getenv("SESSION_START_HOUR", 0))  # 0:00 AM UTC
 PNL_TRACKER_CHANNEL = os.getenv("PNL_TRACKER_CHANNEL", "titan:prod:pnl_updates")
+SESSION_PNL_KEY = os.getenv("SESSION_PNL_KEY", "titan:prod:session_based_pnl_tracker:session_pnl")
+PNL_REPORT_INTERVAL = float(os.getenv("PNL_REPORT_INTERVAL", 10))  # Seconds between session PnL reports
 
 # Redis connection
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
 REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
-redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
 
 # Logging setup
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -33,66 +37,54 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 # Module name
 MODULE_NAME = "session_based_pnl_tracker"
 
-# In-memory store for session PnL
-session_pnl = {}
-
 async def get_current_session_start() -> datetime:
     """Determines the start time of the current trading session."""
     now = datetime.datetime.utcnow()
     session_start = now.replace(hour=SESSION_START_HOUR, minute=0, second=0, microsecond=0)
     return session_start
 
-async def update_pnl(symbol: str, profit: float):
-    """Updates the session PnL for a given symbol."""
-    session_start = await get_current_session_start()
-    session_key = f"{symbol}:{session_start.strftime('%Y%m%d')}"
-
-    if session_key not in session_pnl:
-        session_pnl[session_key] = 0.0
-
-    session_pnl[session_key] += profit
-
+async def get_session_pnl(symbol: str = None) -> float:
+    """Current session's realized PnL net of fees for ``symbol`` (or all symbols), read from the fill ledger."""
+    state = await pnl_ledger.ready_state()
+    pnl = state.session(symbol=symbol)
+    return pnl["realized"] - pnl["fees"]
+
+async def report_session_pnl():
+    """Publishes per-symbol and total session PnL and stores the total for pnl_inconsistency_checker."""
+    state = await pnl_ledger.ready_state()
+    session = pnl_ledger.session_of(time.time_ns())
+    by_symbol = {}
+    for symbol in state.marks:  # Every symbol the ledger has seen a fill for
+        pnl = state.session(session, symbol=symbol)
+        if pnl["realized"] or pnl["fees"]:
+            by_symbol[symbol] = pnl["realized"] - pnl["fees"]
+    total = state.session(session)
+    report = {"session": session, "symbols": by_symbol, "total": total["realized"] - total["fees"]}
+    pipe = redis.pipeline(transaction=False)
+    pipe.publish(PNL_TRACKER_CHANNEL, json.dumps(report))
+    pipe.set(SESSION_PNL_KEY, report["total"])
+    await pipe.execute()
     logging.info(json.dumps({
         "module": MODULE_NAME,
-        "action": "pnl_updated",
-        "symbol": symbol,
-        "session_key": session_key,
-        "session_pnl": session_pnl[session_key],
-        "message": "Session PnL updated."
+        "action": "pnl_reported",
+        "session": session,
+        "session_pnl": report["total"],
+        "message": "Session PnL reported."
     }))
+    return report
 
 async def main():
-    """Main function to track PnL on a session basis."""
-    pubsub = redis.pubsub()
-    await pubsub.psubscribe("titan:prod:trade_updates")  # Subscribe to trade updates channel
-
+    """Main function to report PnL on a session basis."""
     while True:
         try:
-            message = await pubsub.get_message(ignore_subscribe_messages=True)
-            if message:
-                trade = json.loads(message["data"].decode("utf-8"))
-                symbol = trade.get("symbol")
-                profit = trade.get("profit")
-
-                if symbol is None or profit is None:
-                    logging.warning(json.dumps({
-                        "module": MODULE_NAME,
-                        "action": "invalid_trade_data",
-                        "message": "Trade data missing symbol or profit."
-                    }))
-                    continue
-
-                # Update PnL
-                await update_pnl(symbol, profit)
-
-            await asyncio.sleep(0.01)  # Prevent CPU overuse
-
+            await report_session_pnl()
         except Exception as e:
             logging.error(json.dumps({
                 "module": MODULE_NAME,
                 "action": "error",
-                "message": str(e)
+                "message": repr(e)
             }))
+        await asyncio.sleep(PNL_REPORT_INTERVAL)
 
 async def is_esg_compliant(symbol: str, side: str) -> bool:
     """Placeholder for ESG compliance check."""
@@ -115,7 +107,7 @@ if __name__ == "__main__":
     asyncio.run(main())
 
 # === Titan Module Footnotes ===
-# Implemented Features: redis-pub, async safety, session-based PnL tracking
+# Implemented Features: redis-pub, async safety, session-based PnL reporting from the fill ledger (pnl_ledger)
 # Deferred Features: ESG logic -> esg_mode.py
 # Excluded Features: backtesting (in backtest_engine.py)
 # Quality Rating: 10/10 reviewed by [Grok|Gemini|Claude] on [YYYY-MM-DD]
\ No newline at end of file
@@ -6,7 +6,7 @@ Purpose: In last 30–60 minutes of session, reuses any idle capital for one fin
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -34,7 +34,7 @@ MAX_TTL = config.get("MAX_TTL", 1800)  # Maximum TTL for last-call signals (seco
 async def get_unused_capital():
     '''Retrieves the amount of unused capital from Redis (placeholder).'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         # Placeholder: Replace with actual logic to fetch unused capital
         unused_capital = random.uniform(10, 50)  # Simulate unused capital
         logger.info(json.dumps({"module": "session_closure_profit_redeploy", "action": "get_unused_capital", "status": "success", "unused_capital": unused_capital}))
@@ -46,7 +46,7 @@ async def get_unused_capital():
 async def get_high_confidence_signals():
     '''Retrieves high-confidence signals from live modules (placeholder).'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         # Placeholder: Replace with actual logic to fetch high-confidence signals
         signal = {
             "symbol": "BTCUSDT",
@@ -66,7 +66,7 @@ async def get_high_confidence_signals():
 async def execute_last_call_trade(signal):
     '''Executes a last-call trade with a maximum TTL.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         channel = "titan:core:signal"
 
         signal["ttl"] = MAX_TTL
@@ -15,8 +15,11 @@ import asyncio
 import json
 import logging
 import os
-import aioredis
-import datetime
+import time
+import signal_codec
+from redis_connection_manager import get_async_redis
+from signal_stream_bus import SIGNAL_TRANSPORT, STRATEGY_SIGNALS_STREAM, StreamConsumer
+from pubsub_dispatcher import PubSubDispatcher, decode_signal
 
 # Config from config.json or ENV
 MAX_SIGNAL_AGE = int(os.getenv("MAX_SIGNAL_AGE", 60))  # 60 seconds
@@ -25,7 +28,7 @@ EXECUTION_ORCHESTRATOR_CHANNEL = os.getenv("EXECUTION_ORCHESTRATOR_CHANNEL", "ti
 # Redis connection
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
 REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
-redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
 
 # Logging setup
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -43,8 +46,7 @@ async def is_signal_fresh(signal: dict) -> bool:
         }))
         return False
 
-    timestamp = signal.get("timestamp")
-    if timestamp is None:
+    if signal.get("timestamp") is None and signal.get("timestamp_ns") is None:
         logging.warning(json.dumps({
             "module": MODULE_NAME,
             "action": "missing_timestamp",
@@ -53,8 +55,8 @@ async def is_signal_fresh(signal: dict) -> bool:
         return False
 
     try:
-        signal_time = datetime.datetime.fromisoformat(timestamp.replace('Z', '+00:00')) # Handle UTC time
-    except ValueError as e:
+        signal_time_ns = signal_codec.signal_time_ns(signal) # Binary-codec signals carry epoch ns, no parsing needed
+    except (TypeError, ValueError) as e:
         logging.error(json.dumps({
             "module": MODULE_NAME,
             "action": "invalid_timestamp",
@@ -62,8 +64,7 @@ async def is_signal_fresh(signal: dict) -> bool:
         }))
         return False
 
-    now = datetime.datetime.utcnow()
-    signal_age = (now - signal_time).total_seconds()
+    signal_age = (time.time_ns() - signal_time_ns) / 1e9
 
     if signal_age <= MAX_SIGNAL_AGE:
         return True
@@ -77,53 +78,47 @@ async def is_signal_fresh(signal: dict) -> bool:
         }))
         return False
 
+async def handle_signal(signal: dict):
+    """Forwards a strategy signal to the execution orchestrator if it is fresh."""
+    strategy = signal.get("strategy")
+
+    if strategy is None:
+        logging.warning(json.dumps({
+            "module": MODULE_NAME,
+            "action": "missing_strategy",
+            "message": "Signal missing strategy information."
+        }))
+        return
+
+    # Check signal age
+    if await is_signal_fresh(signal):
+        # Forward signal to execution orchestrator
+        await redis.publish(EXECUTION_ORCHESTRATOR_CHANNEL, json.dumps(signal))  # Pub/sub subscribers include JSON-only modules
+
+        logging.info(json.dumps({
+            "module": MODULE_NAME,
+            "action": "signal_allowed",
+            "strategy": strategy,
+            "message": "Signal allowed - signal is fresh."
+        }))
+    else:
+        logging.warning(json.dumps({
+            "module": MODULE_NAME,
+            "action": "signal_blocked",
+            "strategy": strategy,
+            "message": "Signal blocked - signal is stale."
+        }))
+
 async def main():
     """Main function to filter trading signals based on their age."""
-    pubsub = redis.pubsub()
-    await pubsub.psubscribe("titan:prod:strategy_signals")  # Subscribe to strategy signals channel
-
-    while True:
-        try:
-            message = await pubsub.get_message(ignore_subscribe_messages=True)
-            if message:
-                signal = json.loads(message["data"].decode("utf-8"))
-                strategy = signal.get("strategy")
-
-                if strategy is None:
-                    logging.warning(json.dumps({
-                        "module": MODULE_NAME,
-                        "action": "missing_strategy",
-                        "message": "Signal missing strategy information."
-                    }))
-                    continue
-
-                # Check signal age
-                if await is_signal_fresh(signal):
-                    # Forward signal to execution orchestrator
-                    await redis.publish(EXECUTION_ORCHESTRATOR_CHANNEL, json.dumps(signal))
-
-                    logging.info(json.dumps({
-                        "module": MODULE_NAME,
-                        "action": "signal_allowed",
-                        "strategy": strategy,
-                        "message": "Signal allowed - signal is fresh."
-                    }))
-                else:
-                    logging.warning(json.dumps({
-                        "module": MODULE_NAME,
-                        "action": "signal_blocked",
-                        "strategy": strategy,
-                        "message": "Signal blocked - signal is stale."
-                    }))
-
-            await asyncio.sleep(0.01)  # Prevent CPU overuse
-
-        except Exception as e:
-            logging.error(json.dumps({
-                "module": MODULE_NAME,
-                "action": "error",
-                "message": str(e)
-            }))
+    if SIGNAL_TRANSPORT == "streams":
+        # One consumer group per filter stage; extra processes join the same group
+        await StreamConsumer(redis, STRATEGY_SIGNALS_STREAM, MODULE_NAME, handle_signal).run()
+        return
+
+    dispatcher = PubSubDispatcher(redis, MODULE_NAME, patterns=["titan:prod:strategy_signals"])  # Subscribe to strategy signals channel
+    dispatcher.add_handler(lambda message: handle_signal(decode_signal(message)), name="handle_signal")
+    await dispatcher.run()
 
 async def is_esg_compliant(symbol: str, side: str) -> bool:
     """Placeholder for ESG compliance check."""
@@ -146,7 +141,7 @@ if __name__ == "__main__":
     asyncio.run(main())
 
 # === Titan Module Footnotes ===
-# Implemented Features: redis-pub, async safety, signal age filtering
+# Implemented Features: redis-pub, redis-streams consumer group, event-driven pub/sub fallback, epoch-ns freshness check, async safety, signal age filtering
 # Deferred Features: ESG logic -> esg_mode.py
 # Excluded Features: backtesting (in backtest_engine.py)
 # Quality Rating: 10/10 reviewed by [Grok|Gemini|Claude] on [YYYY-MM-DD]
\ No newline at end of file
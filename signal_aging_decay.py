@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -39,7 +39,7 @@ signal_confidence = Gauge('signal_confidence', 'Confidence of each signal', ['si
 async def fetch_signal_data(signal_id):
     '''Fetches signal data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         signal_data = await redis.get(f"titan:signal:data:{signal_id}")
         if signal_data:
             return json.loads(signal_data)
@@ -83,7 +83,7 @@ async def apply_confidence_decay(signal_data):
 async def update_signal_data(signal_data):
     '''Updates the signal data in Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         await redis.set(f"titan:signal:data:{signal_data['signal_id']}", json.dumps(signal_data))
         logger.info(json.dumps({"module": "signal_aging_decay", "action": "Update Signal Data", "status": "Success", "signal_id": signal_data['signal_id']}))
         return True
@@ -0,0 +1,241 @@
+# Module: signal_codec.py
+# Version: 1.0.0
+# Last Updated: 2026-10-16
+# Purpose: Schema-versioned binary wire format for trading signals, with JSON kept available for debugging.
+
+# Core Objectives:
+# - Profitability (50–100% daily ROI target)
+# - Risk reduction (50:1 profit:loss ratio)
+# - ESG-safe actions only
+# - Compliance with UAE financial law
+# - Clean async logic and Redis safety
+# - Prometheus metrics (if needed)
+
+import datetime
+import json
+import logging
+import math
+import os
+import struct
+import time
+
+# Config from config.json or ENV
+SIGNAL_CODEC = os.getenv("SIGNAL_CODEC", "json")  # "binary" lets stream publishers negotiate it; pub/sub channels always carry JSON
+CODEC_REGISTRY_KEY = os.getenv("CODEC_REGISTRY_KEY", "titan:prod:codec:versions")
+CODEC_NEGOTIATION_TTL = float(os.getenv("CODEC_NEGOTIATION_TTL", 10))  # Seconds a negotiated stream codec is reused
+
+# Logging setup
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# Module name
+MODULE_NAME = "signal_codec"
+
+# Wire layout, version 2 (little endian):
+#   magic:u8  version:u8  side:u8  flags:u8  timestamp_ns:i64  confidence:f64  price:f64  quantity:f64
+#   then symbol, strategy, signal_id as u8-length-prefixed UTF-8
+#   then, if FLAG_EXTRAS is set, a u16-length-prefixed JSON object with any fields outside the schema
+# A header slot is used only when the value round-trips exactly (lower-case side, str ids, float numbers,
+# int timestamp_ns); anything else rides in the extras, and the FLAG_HAS_* bits mark which slots are set.
+# Version 1 had no presence bits: strings were always set and empty meant absent.
+MAGIC = 0xB7
+WIRE_VERSION = 2
+SUPPORTED_VERSIONS = (1, 2)
+JSON_VERSION = 0  # Version advertised by consumers that only understand JSON
+
+HEADER = struct.Struct("<BBBBqddd")
+SHORT_STR = struct.Struct("<B")
+EXTRAS_LEN = struct.Struct("<H")
+FLAG_EXTRAS = 0x01
+FLAG_HAS_TIMESTAMP_NS = 0x02
+FLAG_HAS_SYMBOL = 0x04
+FLAG_HAS_STRATEGY = 0x08
+FLAG_HAS_SIGNAL_ID = 0x10
+
+SIDES = {"buy": 1, "sell": 2}
+SIDE_NAMES = {value: name for name, value in SIDES.items()}
+STRING_FIELDS = (("symbol", FLAG_HAS_SYMBOL), ("strategy", FLAG_HAS_STRATEGY), ("signal_id", FLAG_HAS_SIGNAL_ID))
+FLOAT_FIELDS = ("confidence", "price", "quantity")
+SCHEMA_FIELDS = ("timestamp_ns", "side", "symbol", "strategy", "signal_id") + FLOAT_FIELDS
+
+class CodecError(ValueError):
+    """Raised for payloads that are neither JSON nor a supported binary version."""
+
+def to_epoch_ns(timestamp) -> int:
+    """
+    Converts an ISO-8601 string, datetime or numeric epoch to epoch nanoseconds (naive times are UTC).
+    Numeric epochs may be in seconds, milliseconds, microseconds or nanoseconds; the magnitude tells them apart.
+    """
+    if timestamp is None:
+        return 0
+    if isinstance(timestamp, bool):
+        raise TypeError("Boolean is not a timestamp")
+    if isinstance(timestamp, (int, float)):
+        if isinstance(timestamp, float) and not math.isfinite(timestamp):
+            raise ValueError(f"Non-finite timestamp {timestamp}")
+        magnitude = abs(timestamp)
+        scale = 1_000_000_000 if magnitude < 1e11 else 1_000_000 if magnitude < 1e14 else 1_000 if magnitude < 1e17 else 1
+        return int(timestamp) * scale if isinstance(timestamp, int) else int(round(timestamp * scale))
+    if isinstance(timestamp, str):
+        timestamp = datetime.datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+    if not isinstance(timestamp, datetime.datetime):
+        raise TypeError(f"Unsupported timestamp type {type(timestamp).__name__}")
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=datetime.timezone.utc)
+    delta = timestamp - datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+    return (delta.days * 86400 + delta.seconds) * 1_000_000_000 + delta.microseconds * 1000
+
+def _pack_str(value) -> bytes:
+    raw = value.encode("utf-8") if value is not None else b""
+    if len(raw) > 255:
+        raise CodecError("String field longer than 255 bytes")
+    return SHORT_STR.pack(len(raw)) + raw
+
+def encode_binary(signal: dict) -> bytes:
+    """Packs a signal into the version-2 binary layout; raises CodecError for fields JSON cannot carry either."""
+    extras = {key: value for key, value in signal.items() if key not in SCHEMA_FIELDS}
+    flags = 0
+
+    timestamp_ns = signal.get("timestamp_ns")
+    if type(timestamp_ns) is int and -2**63 <= timestamp_ns < 2**63:
+        flags |= FLAG_HAS_TIMESTAMP_NS
+    else:
+        if "timestamp_ns" in signal:
+            extras["timestamp_ns"] = timestamp_ns
+        timestamp_ns = 0
+
+    side = signal.get("side")
+    side_code = SIDES.get(side, 0) if isinstance(side, str) else 0
+    if "side" in signal and side_code == 0:
+        extras["side"] = side  # Upper-case or unknown sides come back exactly as sent
+
+    strings = []
+    for field, flag in STRING_FIELDS:
+        value = signal.get(field)
+        if isinstance(value, str) and len(value.encode("utf-8")) <= 255:
+            flags |= flag
+            strings.append(value)
+        else:
+            if field in signal:
+                extras[field] = value  # e.g. an int signal_id stays an int
+            strings.append(None)
+
+    numbers = []
+    for field in FLOAT_FIELDS:
+        value = signal.get(field)
+        if type(value) is float and not math.isnan(value):
+            numbers.append(value)
+        else:
+            if field in signal:
+                extras[field] = value  # ints, None and NaN keep their type
+            numbers.append(math.nan)
+
+    tail = b""
+    if extras:
+        try:
+            raw = json.dumps(extras, separators=(",", ":")).encode("utf-8")
+        except (TypeError, ValueError) as e:
+            raise CodecError(f"Signal field cannot be encoded: {e}") from e
+        if len(raw) > 0xFFFF:
+            raise CodecError("Extra fields longer than 65535 bytes")
+        flags |= FLAG_EXTRAS
+        tail = EXTRAS_LEN.pack(len(raw)) + raw
+
+    return b"".join([HEADER.pack(MAGIC, WIRE_VERSION, side_code, flags, timestamp_ns, *numbers)]
+                    + [_pack_str(value) for value in strings] + [tail])
+
+def _unpack_str(payload, offset: int):
+    (length,) = SHORT_STR.unpack_from(payload, offset)
+    offset += 1
+    return bytes(payload[offset:offset + length]).decode("utf-8"), offset + length
+
+def decode_binary(payload) -> dict:
+    """Unpacks a binary signal into exactly the dict that was encoded."""
+    magic, version, side_code, flags, timestamp_ns, confidence, price, quantity = HEADER.unpack_from(payload, 0)
+    if magic != MAGIC or version not in SUPPORTED_VERSIONS:
+        raise CodecError(f"Unsupported signal wire version {version}")
+
+    offset = HEADER.size
+    signal = {}
+    if version == 1 or flags & FLAG_HAS_TIMESTAMP_NS:
+        signal["timestamp_ns"] = timestamp_ns
+    if side_code:
+        signal["side"] = SIDE_NAMES[side_code]
+    for field, flag in STRING_FIELDS:
+        value, offset = _unpack_str(payload, offset)
+        if (flags & flag) if version > 1 else (value or field != "signal_id"):
+            signal[field] = value
+    for field, value in zip(FLOAT_FIELDS, (confidence, price, quantity)):
+        if not math.isnan(value):
+            signal[field] = value
+    if flags & FLAG_EXTRAS:
+        (length,) = EXTRAS_LEN.unpack_from(payload, offset)
+        offset += EXTRAS_LEN.size
+        signal.update(json.loads(bytes(payload[offset:offset + length])))
+    return signal
+
+def encode(signal: dict, codec: str = "json"):
+    """
+    Encodes with ``codec``.  JSON output is a str for readability in redis-cli.  Pub/sub channels keep
+    the JSON default; stream publishers pass the result of ``stream_codec``.
+    """
+    if codec == "binary":
+        return encode_binary(signal)
+    return json.dumps(signal)
+
+def decode(payload) -> dict:
+    """Decodes either format; the first byte tells them apart (binary starts with MAGIC, JSON with '{')."""
+    if isinstance(payload, str):
+        return json.loads(payload)
+    if payload and payload[0] == MAGIC:
+        return decode_binary(payload)
+    return json.loads(payload)
+
+def stamp_time_ns(signal: dict) -> dict:
+    """
+    ``signal`` with an epoch-ns ``timestamp_ns`` added (from its ``timestamp`` when it has one, else now), so
+    consumers never parse the ISO string.  A signal that already carries ``timestamp_ns`` is returned as is.
+    """
+    if "timestamp_ns" in signal:
+        return signal
+    timestamp = signal.get("timestamp")
+    return {**signal, "timestamp_ns": time.time_ns() if timestamp is None else to_epoch_ns(timestamp)}
+
+def signal_time_ns(signal: dict) -> int:
+    """Signal creation time in epoch ns, without parsing when the binary codec supplied it."""
+    timestamp_ns = signal.get("timestamp_ns")
+    if timestamp_ns is not None:
+        return timestamp_ns
+    return to_epoch_ns(signal.get("timestamp"))
+
+async def advertise_version(redis, module: str, version: int = WIRE_VERSION):
+    """Records the newest wire version a consumer understands (JSON_VERSION for JSON-only consumers)."""
+    await redis.hset(CODEC_REGISTRY_KEY, module, version)
+
+async def negotiate_codec(redis) -> str:
+    """Picks binary only when every advertised consumer understands WIRE_VERSION; JSON otherwise."""
+    advertised = await redis.hgetall(CODEC_REGISTRY_KEY)
+    versions = [int(version) for version in advertised.values()]
+    if versions and min(versions) >= WIRE_VERSION:
+        return "binary"
+    return "json"
+
+_negotiated = {"codec": "json", "expires": 0.0}
+
+async def stream_codec(redis) -> str:
+    """
+    Codec for stream publishers: JSON unless SIGNAL_CODEC is "binary" and ``negotiate_codec`` agrees.
+    The answer is reused for CODEC_NEGOTIATION_TTL seconds so publishing does not pay an HGETALL per signal.
+    """
+    if SIGNAL_CODEC != "binary":
+        return "json"
+    now = time.monotonic()
+    if now >= _negotiated["expires"]:
+        _negotiated["codec"] = await negotiate_codec(redis)
+        _negotiated["expires"] = now + CODEC_NEGOTIATION_TTL
+    return _negotiated["codec"]
+
+# === Titan Module Footnotes ===
+# Implemented Features: struct-packed v2 schema with presence flags (v1 still decoded), epoch-ns timestamps, lossless extras tail, JSON/binary autodetect, consumer version negotiation for streams
+# Deferred Features: batched frames (many signals per message)
+# Excluded Features: msgpack (struct keeps the codec dependency-free)
+# Quality Rating: 10/10 reviewed by [Grok|Gemini|Claude] on [YYYY-MM-DD]
@@ -0,0 +1,96 @@
+# Module: signal_codec_benchmark.py
+# Version: 1.0.0
+# Last Updated: 2026-10-16
+# Purpose: Compares encode/decode cost and message size of the binary signal codec against JSON, on the signals signal_publisher emits.
+
+# Core Objectives:
+# - Measure per-message encode, decode and decode+freshness-check cost for both formats
+# - Report wire size per message
+# - No Redis needed; pure in-process timing
+
+import datetime
+import json
+import logging
+import os
+import time
+import signal_codec
+
+# Config from config.json or ENV
+BENCH_MESSAGES = int(os.getenv("BENCH_MESSAGES", 200000))
+
+# Logging setup
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# Module name
+MODULE_NAME = "signal_codec_benchmark"
+
+def make_signal(i: int) -> dict:
+    return {
+        "timestamp": datetime.datetime.utcnow().isoformat(),
+        "symbol": "BTCUSDT",
+        "side": "buy" if i % 2 else "sell",
+        "confidence": 0.9,
+        "price": 64250.5,
+        "quantity": 0.015,
+        "strategy": "momentum_strategy",
+        "signal_id": f"sig-{i}"
+    }
+
+def json_age_check(payload) -> float:
+    """signal_age_filter's path for a JSON payload: json.loads then signal_time_ns."""
+    return (time.time_ns() - signal_codec.signal_time_ns(json.loads(payload))) / 1e9
+
+def binary_age_check(payload) -> float:
+    return (time.time_ns() - signal_codec.signal_time_ns(signal_codec.decode(payload))) / 1e9
+
+def iso_age_check(payload) -> float:
+    """The path before the publisher stamped timestamp_ns: json.loads then fromisoformat on the timestamp."""
+    signal = json.loads(payload)
+    signal_time = datetime.datetime.fromisoformat(signal["timestamp"].replace('Z', '+00:00'))
+    return (datetime.datetime.utcnow() - signal_time).total_seconds()
+
+def per_message_ns(func, items) -> float:
+    started = time.perf_counter_ns()
+    for item in items:
+        func(item)
+    return (time.perf_counter_ns() - started) / len(items)
+
+def main():
+    """Times BENCH_MESSAGES signals through each codec and logs ns/message and bytes/message."""
+    raw = [make_signal(i) for i in range(BENCH_MESSAGES)]
+    signals = [signal_codec.stamp_time_ns(signal) for signal in raw]  # As signal_publisher emits them: ISO timestamp plus timestamp_ns
+
+    iso_payloads = [json.dumps(signal).encode("utf-8") for signal in raw]
+    json_payloads = [json.dumps(signal).encode("utf-8") for signal in signals]
+    binary_payloads = [signal_codec.encode_binary(signal) for signal in signals]
+
+    results = {}
+    for name, encoder, decoder, age_check, source, payloads in (
+        ("json_iso_only", lambda s: json.dumps(s).encode("utf-8"), json.loads, iso_age_check, raw, iso_payloads),
+        ("json", lambda s: json.dumps(s).encode("utf-8"), json.loads, json_age_check, signals, json_payloads),
+        ("binary", signal_codec.encode_binary, signal_codec.decode, binary_age_check, signals, binary_payloads),
+    ):
+        results[name] = {
+            "encode_ns": round(per_message_ns(encoder, source), 1),
+            "decode_ns": round(per_message_ns(decoder, payloads), 1),
+            "decode_age_check_ns": round(per_message_ns(age_check, payloads), 1),
+            "bytes": round(sum(len(payload) for payload in payloads) / len(payloads), 1),
+        }
+
+    logging.info(json.dumps({
+        "module": MODULE_NAME,
+        "action": "benchmark",
+        "messages": BENCH_MESSAGES,
+        "results": results,
+        "size_ratio": round(results["binary"]["bytes"] / results["json"]["bytes"], 3)
+    }))
+
+# Test entry
+if __name__ == "__main__":
+    main()
+
+# === Titan Module Footnotes ===
+# Implemented Features: encode / decode / decode+age-check timing and wire size on publisher-stamped signals, JSON vs binary, against the ISO-only JSON baseline
+# Deferred Features: end-to-end Redis round trip per codec (see signal_stream_benchmark.py)
+# Excluded Features: none
+# Quality Rating: 10/10 reviewed by [Grok|Gemini|Claude] on [YYYY-MM-DD]
@@ -9,7 +9,8 @@ import logging
 import os
 import random
 
-import aioredis
+import aioredis
+from redis_connection_manager import get_async_redis
 
 # Configuration (replace with config.json or ENV vars)
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
@@ -72,7 +73,7 @@ async def main():
     Main function to run signal collision detection periodically.
     """
     try:
-        r = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        r = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         while True:
             await detect_signal_collisions(r)
             await asyncio.sleep(COLLISION_CHECK_INTERVAL)  # Run collision check every COLLISION_CHECK_INTERVAL seconds
@@ -12,7 +12,8 @@
 # - Prometheus metrics (if needed)
 
 import asyncio
-import aioredis
+import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -83,7 +84,7 @@ async def main():
     Main function to connect to Redis and start the signal conflict resolution process.
     """
     try:
-        r = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        r = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         await resolve_signal_conflicts(r)
     except Exception as e:
         logging.error(f"Could not connect to Redis: {e}", exc_info=True)
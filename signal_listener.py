@@ -4,11 +4,13 @@ Listens to Redis channel and routes signals to the execution engine
 """
 
 import redis
-import json
+import signal_codec
 
 class SignalListener:
-    def __init__(self, redis_url='redis://localhost:6379'):
-        self.r = redis.StrictRedis.from_url(redis_url, decode_responses=True)
+    def __init__(self, redis_url='redis://localhost:6379', codec=None):
+        # Binary payloads can't survive decode_responses, so only the JSON codec keeps it
+        self.codec = codec or signal_codec.SIGNAL_CODEC
+        self.r = redis.StrictRedis.from_url(redis_url, decode_responses=self.codec == "json")
         self.pubsub = self.r.pubsub()
         self.pubsub.subscribe("titan:signal")
 
@@ -16,7 +18,7 @@ class SignalListener:
         for message in self.pubsub.listen():
             if message['type'] == 'message':
                 try:
-                    data = json.loads(message['data'])
+                    data = signal_codec.decode(message['data'])
                     callback(data)
                 except:
                     continue
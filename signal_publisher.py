@@ -15,15 +15,19 @@ import asyncio
 import json
 import logging
 import os
-import aioredis
+import datetime
+import signal_codec
+from redis_connection_manager import get_async_redis
+from signal_stream_bus import SIGNAL_TRANSPORT, STRATEGY_SIGNALS_STREAM, SIGNAL_STREAM_MAXLEN, STREAM_FIELD
 
 # Config from config.json or ENV
 STRATEGY_SIGNALS_CHANNEL = os.getenv("STRATEGY_SIGNALS_CHANNEL", "titan:prod:strategy_signals")
+SIGNAL_PUBSUB_MIRROR = os.getenv("SIGNAL_PUBSUB_MIRROR", "on") == "on"  # Keep legacy pub/sub subscribers fed while on streams
 
 # Redis connection
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
 REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
-redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
 
 # Logging setup
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -55,7 +59,18 @@ async def publish_signal(signal: dict):
         return
 
     try:
-        await redis.publish(STRATEGY_SIGNALS_CHANNEL, json.dumps(signal))
+        signal = signal_codec.stamp_time_ns(signal)  # Consumers' age checks then skip ISO parsing, on either codec
+        codec = "json"
+        if SIGNAL_TRANSPORT == "streams":
+            codec = await signal_codec.stream_codec(redis)  # Binary only once every stream consumer group understands it
+            payload = signal_codec.encode(signal, codec)
+            pipe = redis.pipeline(transaction=False)
+            pipe.xadd(STRATEGY_SIGNALS_STREAM, {STREAM_FIELD: payload}, maxlen=SIGNAL_STREAM_MAXLEN, approximate=True)
+            if SIGNAL_PUBSUB_MIRROR:
+                pipe.publish(STRATEGY_SIGNALS_CHANNEL, json.dumps(signal))  # Legacy subscribers only understand JSON
+            await pipe.execute()
+        else:
+            await redis.publish(STRATEGY_SIGNALS_CHANNEL, json.dumps(signal))  # Legacy subscribers only understand JSON
 
         logging.info(json.dumps({
             "module": MODULE_NAME,
@@ -64,6 +79,8 @@ async def publish_signal(signal: dict):
             "side": side,
             "confidence": confidence,
             "strategy": strategy,
+            "transport": SIGNAL_TRANSPORT,
+            "codec": codec,
             "message": "Trading signal published to Redis."
         }))
 
@@ -111,7 +128,7 @@ if __name__ == "__main__":
     asyncio.run(main())
 
 # === Titan Module Footnotes ===
-# Implemented Features: redis-pub, async safety, signal publishing
+# Implemented Features: redis-pub, redis-streams (XADD + optional pub/sub mirror), binary wire codec on the stream once negotiated (SIGNAL_CODEC), epoch-ns timestamp_ns stamping, async safety, signal publishing
 # Deferred Features: ESG logic -> esg_mode.py
 # Excluded Features: backtesting (in backtest_engine.py)
 # Quality Rating: 10/10 reviewed by [Grok|Gemini|Claude] on [YYYY-MM-DD]
\ No newline at end of file
@@ -0,0 +1,96 @@
+# Module: signal_stream_benchmark.py
+# Version: 1.0.0
+# Last Updated: 2026-10-16
+# Purpose: Measures signal throughput over the Redis Streams bus (pipelined XADD, consumer-group XREADGROUP + XACK).
+
+# Core Objectives:
+# - Verify the streams transport sustains 10k+ signals/sec end to end
+# - Run against a local redis-server (REDIS_HOST / REDIS_PORT)
+# - Clean async logic and Redis safety
+
+import asyncio
+import datetime
+import json
+import logging
+import os
+import time
+from redis_connection_manager import get_async_redis, async_redis_registry
+from signal_stream_bus import StreamConsumer, publish_batch_to_stream
+
+# Config from config.json or ENV
+BENCH_SIGNALS = int(os.getenv("BENCH_SIGNALS", 100000))
+BENCH_BATCH_SIZE = int(os.getenv("BENCH_BATCH_SIZE", 500))
+BENCH_CONSUMERS = int(os.getenv("BENCH_CONSUMERS", 4))
+BENCH_STREAM = os.getenv("BENCH_STREAM", "titan:bench:stream:strategy_signals")
+BENCH_GROUP = os.getenv("BENCH_GROUP", "signal_stream_benchmark")
+
+# Redis connection
+REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
+REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
+redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+
+# Logging setup
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# Module name
+MODULE_NAME = "signal_stream_benchmark"
+
+def make_signal(i: int) -> dict:
+    return {
+        "timestamp": datetime.datetime.utcnow().isoformat(),
+        "symbol": "BTCUSDT",
+        "side": "buy" if i % 2 else "sell",
+        "confidence": 0.9,
+        "strategy": "momentum_strategy",
+        "signal_id": i
+    }
+
+async def main():
+    """Publishes BENCH_SIGNALS signals and drains them with BENCH_CONSUMERS group members."""
+    await redis.delete(BENCH_STREAM)
+
+    async def handler(signal: dict):
+        pass
+
+    consumers = [
+        StreamConsumer(redis, BENCH_STREAM, BENCH_GROUP, handler, consumer=f"bench-{i}", block_ms=100)
+        for i in range(BENCH_CONSUMERS)
+    ]
+    tasks = [asyncio.create_task(consumer.run()) for consumer in consumers]
+
+    started = time.perf_counter()
+    for offset in range(0, BENCH_SIGNALS, BENCH_BATCH_SIZE):
+        batch = [make_signal(i) for i in range(offset, min(offset + BENCH_BATCH_SIZE, BENCH_SIGNALS))]
+        await publish_batch_to_stream(redis, BENCH_STREAM, batch, maxlen=BENCH_SIGNALS)
+    published = time.perf_counter() - started
+
+    while sum(consumer.processed for consumer in consumers) < BENCH_SIGNALS:
+        await asyncio.sleep(0.01)
+    drained = time.perf_counter() - started
+
+    for consumer in consumers:
+        consumer.stop()
+    await asyncio.gather(*tasks)
+
+    logging.info(json.dumps({
+        "module": MODULE_NAME,
+        "action": "benchmark",
+        "signals": BENCH_SIGNALS,
+        "consumers": BENCH_CONSUMERS,
+        "publish_per_sec": round(BENCH_SIGNALS / published, 1),
+        "end_to_end_per_sec": round(BENCH_SIGNALS / drained, 1),
+        "per_consumer": [consumer.processed for consumer in consumers]
+    }))
+
+    await redis.delete(BENCH_STREAM)
+    await async_redis_registry.close_all()
+
+# Test entry
+if __name__ == "__main__":
+    asyncio.run(main())
+
+# === Titan Module Footnotes ===
+# Implemented Features: pipelined publish + consumer-group drain throughput benchmark
+# Deferred Features: multi-process consumers
+# Excluded Features: latency percentiles (see redis_pool_benchmark.py)
+# Quality Rating: 10/10 reviewed by [Grok|Gemini|Claude] on [YYYY-MM-DD]
@@ -0,0 +1,205 @@
+# Module: signal_stream_bus.py
+# Version: 1.0.0
+# Last Updated: 2026-10-16
+# Purpose: Redis Streams transport for the signal path (XADD / XREADGROUP / XACK with consumer groups), replacing fire-and-forget pub/sub.
+
+# Core Objectives:
+# - Profitability (50–100% daily ROI target)
+# - Risk reduction (50:1 profit:loss ratio)
+# - ESG-safe actions only
+# - Compliance with UAE financial law
+# - Clean async logic and Redis safety
+# - Prometheus metrics (if needed)
+
+import asyncio
+import json
+import logging
+import os
+import socket
+import signal_codec
+
+# Config from config.json or ENV
+SIGNAL_TRANSPORT = os.getenv("SIGNAL_TRANSPORT", "streams")  # "streams" or "pubsub"
+STRATEGY_SIGNALS_STREAM = os.getenv("STRATEGY_SIGNALS_STREAM", "titan:prod:stream:strategy_signals")
+SIGNAL_STREAM_MAXLEN = int(os.getenv("SIGNAL_STREAM_MAXLEN", 100000))  # Approximate cap on retained entries
+STREAM_READ_COUNT = int(os.getenv("STREAM_READ_COUNT", 256))  # Entries per XREADGROUP
+STREAM_BLOCK_MS = int(os.getenv("STREAM_BLOCK_MS", 1000))  # How long XREADGROUP blocks when idle
+STREAM_CLAIM_IDLE_MS = int(os.getenv("STREAM_CLAIM_IDLE_MS", 30000))  # Pending entries idle this long are claimed from dead consumers
+STREAM_CLAIM_INTERVAL = float(os.getenv("STREAM_CLAIM_INTERVAL", 15))  # Seconds between stale-claim sweeps
+
+# Logging setup
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# Module name
+MODULE_NAME = "signal_stream_bus"
+
+STREAM_FIELD = "data"
+
+def default_consumer_name() -> str:
+    """Consumer name that is stable for a host/process pair."""
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+async def publish_to_stream(redis, stream: str, payload: dict, maxlen: int = SIGNAL_STREAM_MAXLEN):
+    """Appends one payload to a stream, trimming it to roughly ``maxlen`` entries."""
+    codec = await signal_codec.stream_codec(redis)
+    return await redis.xadd(stream, {STREAM_FIELD: signal_codec.encode(payload, codec)}, maxlen=maxlen, approximate=True)
+
+async def publish_batch_to_stream(redis, stream: str, payloads: list, maxlen: int = SIGNAL_STREAM_MAXLEN) -> list:
+    """Appends many payloads in a single pipelined round trip."""
+    codec = await signal_codec.stream_codec(redis)
+    pipe = redis.pipeline(transaction=False)
+    for payload in payloads:
+        pipe.xadd(stream, {STREAM_FIELD: signal_codec.encode(payload, codec)}, maxlen=maxlen, approximate=True)
+    return await pipe.execute()
+
+async def ensure_consumer_group(redis, stream: str, group: str):
+    """Creates the consumer group (and the stream) if it does not exist yet."""
+    try:
+        await redis.xgroup_create(stream, group, id="0", mkstream=True)
+        logging.info(json.dumps({
+            "module": MODULE_NAME,
+            "action": "group_created",
+            "stream": stream,
+            "group": group
+        }))
+    except Exception as e:
+        if "BUSYGROUP" not in str(e):
+            raise
+
+def decode_entry(fields) -> dict:
+    """Returns the signal carried by a stream entry, or None for trimmed/invalid entries."""
+    if not fields:
+        return None
+    raw = fields.get(STREAM_FIELD.encode()) or fields.get(STREAM_FIELD)
+    if raw is None:
+        return None
+    return signal_codec.decode(raw)
+
+class StreamConsumer:
+    """
+    Reads a stream as one member of a consumer group.
+
+    Every process running the same stage joins the same group, so entries are
+    load-balanced across processes.  An entry is acknowledged only after its
+    handler returns; entries whose handler raised stay pending and are retried
+    on restart (own pending list) or claimed by a peer once idle for
+    STREAM_CLAIM_IDLE_MS (crashed consumer).
+    """
+
+    def __init__(self, redis, stream: str, group: str, handler, consumer: str = None,
+                 count: int = STREAM_READ_COUNT, block_ms: int = STREAM_BLOCK_MS,
+                 claim_idle_ms: int = STREAM_CLAIM_IDLE_MS):
+        self.redis = redis
+        self.stream = stream
+        self.group = group
+        self.handler = handler
+        self.consumer = consumer or default_consumer_name()
+        self.count = count
+        self.block_ms = block_ms
+        self.claim_idle_ms = claim_idle_ms
+        self.processed = 0
+        self.failed = 0
+        self._running = False
+
+    async def _process(self, entries) -> int:
+        """Runs the handler over a batch of entries and acks the successful ones in one XACK."""
+        acked = []
+        for entry_id, fields in entries:
+            try:
+                signal = decode_entry(fields)
+                if signal is not None:
+                    await self.handler(signal)
+                acked.append(entry_id)
+            except Exception as e:
+                self.failed += 1
+                logging.error(json.dumps({
+                    "module": MODULE_NAME,
+                    "action": "handler_error",
+                    "stream": self.stream,
+                    "group": self.group,
+                    "entry_id": entry_id.decode() if isinstance(entry_id, bytes) else entry_id,
+                    "message": str(e)
+                }))
+        if acked:
+            await self.redis.xack(self.stream, self.group, *acked)
+            self.processed += len(acked)
+        return len(entries)
+
+    async def _read(self, start_id: str, block: int = None) -> list:
+        response = await self.redis.xreadgroup(self.group, self.consumer, {self.stream: start_id},
+                                               count=self.count, block=block)
+        if not response:
+            return []
+        return response[0][1]
+
+    async def recover_pending(self):
+        """Re-delivers entries this consumer read but never acked before a restart."""
+        last_id = "0"
+        while True:
+            entries = await self._read(last_id)
+            if not entries:
+                return
+            await self._process(entries)
+            # Walk forward so entries that fail again are not re-read in a loop
+            last_id = entries[-1][0]
+
+    async def claim_stale(self):
+        """
+        Takes over every entry pending longer than ``claim_idle_ms``, whichever consumer holds it (a crashed
+        peer, or this stage before a restart under another name), paging through the group with XAUTOCLAIM.
+        """
+        cursor, total = "0-0", 0
+        while True:
+            response = await self.redis.xautoclaim(self.stream, self.group, self.consumer, self.claim_idle_ms,
+                                                   start_id=cursor, count=self.count)
+            cursor, claimed = response[0], response[1]  # Trimmed entries come back without fields and are just acked
+            if claimed:
+                await self._process(claimed)
+                total += len(claimed)
+            if cursor in (b"0-0", "0-0"):
+                break
+        if total:
+            logging.info(json.dumps({
+                "module": MODULE_NAME,
+                "action": "stale_entries_claimed",
+                "stream": self.stream,
+                "group": self.group,
+                "count": total
+            }))
+        return total
+
+    async def run(self):
+        """Consumes the stream until stop() is called."""
+        await ensure_consumer_group(self.redis, self.stream, self.group)
+        await signal_codec.advertise_version(self.redis, self.group)  # decode_entry reads both formats
+        await self.recover_pending()
+
+        self._running = True
+        loop = asyncio.get_running_loop()
+        next_claim = loop.time() + STREAM_CLAIM_INTERVAL
+        while self._running:
+            try:
+                entries = await self._read(">", block=self.block_ms)
+                if entries:
+                    await self._process(entries)
+                if loop.time() >= next_claim:
+                    await self.claim_stale()
+                    next_claim = loop.time() + STREAM_CLAIM_INTERVAL
+            except Exception as e:
+                logging.error(json.dumps({
+                    "module": MODULE_NAME,
+                    "action": "read_error",
+                    "stream": self.stream,
+                    "group": self.group,
+                    "message": str(e)
+                }))
+                await asyncio.sleep(1)
+
+    def stop(self):
+        self._running = False
+
+# === Titan Module Footnotes ===
+# Implemented Features: XADD with MAXLEN trimming, pipelined batch publish, consumer groups, ack-after-handle, restart recovery, stale-entry claiming
+# Deferred Features: dead-letter stream for entries that keep failing
+# Excluded Features: exactly-once delivery (handlers must tolerate redelivery)
+# Quality Rating: 10/10 reviewed by [Grok|Gemini|Claude] on [YYYY-MM-DD]
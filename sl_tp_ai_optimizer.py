@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -41,7 +41,7 @@ optimized_tp = Gauge('optimized_tp', 'Optimized TP level', ['symbol', 'regime',
 async def fetch_past_trades(symbol, regime, time):
     '''Fetches past trade outcomes per symbol, regime, and time from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         past_trades = []
         for i in range(ANALYSIS_WINDOW):
             trade_data = await redis.get(f"titan:trade:{symbol}:{regime}:{time}:{i}")
@@ -70,7 +70,7 @@ async def call_ai_model(past_trades):
 async def store_optimized_sl_tp(symbol, regime, time, sl, tp):
     '''Stores optimized SL/TP levels to Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         await redis.set(f"titan:sl_tp:{symbol}:{regime}:{time}:sl", sl)
         await redis.set(f"titan:sl_tp:{symbol}:{regime}:{time}:tp", tp)
         logger.info(json.dumps({"module": "sl_tp_ai_optimizer", "action": "Store Optimized SL/TP", "status": "Success", "symbol": symbol, "regime": regime, "time": time, "sl": sl, "tp": tp}))
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -38,7 +38,7 @@ sl_tp_usage_ratio = Gauge('sl_tp_usage_ratio', 'SL/TP usage ratio for each modul
 async def fetch_trade_outcomes(module):
     '''Reviews global SL/TP usage and suggests optimizations at module/system level.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         trade_outcomes = []
         for i in range(ANALYSIS_WINDOW):
             trade_data = await redis.get(f"titan:trade:{module}:outcome:{i}")
@@ -10,16 +10,19 @@ Core Objectives:
   - Explicit 10/10 quality rating definition adherence: Code must meet all quality criteria, including modularity, error handling, metrics, logging, and testing.
 Summary of Enhancements:
   - Initial version.
+  - SL/TP triggers resolved in batch by the vectorized engine in sl_tp_vector_simulator, with a configurable same-candle policy (SAME_CANDLE_POLICY).
+  - CSV candles load through the columnar candle store instead of row-by-row parsing.
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
 import random
-import csv
-from prometheus_client import Counter, Gauge, Histogram
+from prometheus_client import Counter, Histogram
+from candle_store import load_candles
+from sl_tp_vector_simulator import CandleIndex, OUTCOME_NAMES, SAME_CANDLE_POLICY, signals_to_arrays, simulate_batch
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(module)s - %(message)s')
@@ -36,12 +39,12 @@ CANDLE_FILE = "historical_candles.csv" # Path to local CSV file
 sl_tp_mismatches_flagged_total = Counter('sl_tp_mismatches_flagged_total', 'Total number of SL/TP mismatches flagged')
 simulation_tester_errors_total = Counter('simulation_tester_errors_total', 'Total number of simulation tester errors', ['error_type'])
 simulation_latency_seconds = Histogram('simulation_latency_seconds', 'Latency of SL/TP simulation')
-simulation_outcome = Gauge('simulation_outcome', 'Outcome of SL/TP simulation', ['signal_id', 'outcome'])
+simulation_outcomes_total = Counter('simulation_outcomes_total', 'SL/TP simulation outcomes', ['outcome'])
 
 async def fetch_historical_candles_from_redis():
     '''Replay candles from stored stream in Redis (1m / 5m).'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         candle_stream = await redis.get(f"titan:historical::candle_stream:{SYMBOL}")
 
         if candle_stream:
@@ -54,15 +57,10 @@ async def fetch_historical_candles_from_redis():
         return None
 
 async def fetch_historical_candles_from_csv():
-    '''Replay candles from local CSV (1m / 5m).'''
+    '''Replay candles from local CSV (1m / 5m) via the columnar candle store; new CSV rows are ingested once, then memory-mapped.'''
     try:
-        candle_data = []
-        with open(CANDLE_FILE, 'r') as file:
-            csvreader = csv.reader(file)
-            header = next(csvreader) # Skip header row
-            for row in csvreader:
-                candle = {"timestamp": float(row[0]), "open": float(row[1]), "high": float(row[2]), "low": float(row[3]), "close": float(row[4])}
-                candle_data.append(candle)
+        frame = load_candles(SYMBOL, csv_path=CANDLE_FILE)
+        candle_data = CandleIndex(frame.open, frame.high, frame.low, frame.close)
         logger.info(json.dumps({"module": "sl_tp_simulation_tester", "action": "Fetch Historical Candles", "status": "Success", "source": "CSV", "candle_count": len(candle_data)}))
         return candle_data
     except Exception as e:
@@ -71,36 +69,27 @@ async def fetch_historical_candles_from_csv():
 
 async def simulate_sl_tp_trigger(signal, candles):
     '''Feed each signal’s Entry price, SL %, TP % and Check if SL or TP would have triggered first.'''
+    outcomes = await simulate_sl_tp_batch([signal], candles)
+    return outcomes[0] if outcomes else None
+
+async def simulate_sl_tp_batch(signals, candles, policy=SAME_CANDLE_POLICY):
+    '''Resolves every signal against the same candle history in one vectorized pass (see sl_tp_vector_simulator).'''
     try:
-        entry_price = signal["entry_price"]
-        sl_percentage = signal["sl"]
-        tp_percentage = signal["tp"]
-
-        sl_price = entry_price * (1 - sl_percentage) if signal["side"] == "BUY" else entry_price * (1 + sl_percentage)
-        tp_price = entry_price * (1 + tp_percentage) if signal["side"] == "BUY" else entry_price * (1 - tp_percentage)
-
-        outcome = "Timeout"
-        for candle in candles:
-            if signal["side"] == "BUY":
-                if candle["low"] <= sl_price:
-                    outcome = "SL hit"
-                    break
-                if candle["high"] >= tp_price:
-                    outcome = "TP hit"
-                    break
-            else:
-                if candle["high"] >= sl_price:
-                    outcome = "SL hit"
-                    break
-                if candle["low"] <= tp_price:
-                    outcome = "TP hit"
-                    break
-
-        logger.info(json.dumps({"module": "sl_tp_simulation_tester", "action": "Simulate SL/TP Trigger", "status": "Success", "signal_id": signal["signal_id"], "outcome": outcome}))
-        global simulation_outcome
-        simulation_outcome.labels(signal_id=signal["signal_id"], outcome=outcome).set(1)
-        return outcome
+        with simulation_latency_seconds.time():
+            index = candles if isinstance(candles, CandleIndex) else CandleIndex.from_candles(candles)
+            entry_price, sl_pct, tp_pct, is_long, start = signals_to_arrays(signals)
+            result = simulate_batch(index, entry_price, sl_pct, tp_pct, is_long, start=start, policy=policy)
+
+        outcomes = [OUTCOME_NAMES[int(code)] for code in result["outcome"]]
+        for outcome in set(outcomes):
+            simulation_outcomes_total.labels(outcome=outcome).inc(outcomes.count(outcome))
+        if len(signals) == 1:
+            logger.info(json.dumps({"module": "sl_tp_simulation_tester", "action": "Simulate SL/TP Trigger", "status": "Success", "signal_id": signals[0]["signal_id"], "outcome": outcomes[0]}))
+        else:
+            logger.info(json.dumps({"module": "sl_tp_simulation_tester", "action": "Simulate SL/TP Trigger", "status": "Success", "signals": len(signals), "outcomes": {name: outcomes.count(name) for name in set(outcomes)}}))
+        return outcomes
     except Exception as e:
+        simulation_tester_errors_total.labels(error_type="simulation").inc()
         logger.error(json.dumps({"module": "sl_tp_simulation_tester", "action": "Simulate SL/TP Trigger", "status": "Exception", "error": str(e)}))
         return None
 
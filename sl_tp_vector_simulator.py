@@ -0,0 +1,204 @@
+'''
+Module: sl_tp_vector_simulator
+Version: 1.0.0
+Last Updated: 2026-10-16
+Purpose: Vectorized SL/TP first-hit engine: resolves thousands of signals against long OHLC histories in one pass.
+Core Objectives:
+  - Explicit profitability and risk targets alignment: Re-validate SL/TP outcomes for every signal quickly enough to run on each refit.
+  - Explicit ESG compliance adherence: Pure simulation; no orders or external calls.
+  - Explicit regulatory and compliance standards adherence: Deterministic, reproducible outcomes for audit.
+  - Explicit 10/10 quality rating definition adherence: Code must meet all quality criteria, including modularity, error handling, metrics, logging, and testing.
+Summary of Enhancements:
+  - Initial version. Sparse range-min/max tables over low/high plus a binary-lifting descent find each
+    signal's first SL and TP candle in O(log N), vectorized across all signals.
+'''
+
+import json
+import logging
+import os
+import time
+import numpy as np
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(module)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Constants
+SAME_CANDLE_POLICY = os.environ.get("SAME_CANDLE_POLICY", "sl_first")  # sl_first | tp_first | open_distance | ambiguous
+
+# Outcome codes
+TIMEOUT = 0
+SL_HIT = 1
+TP_HIT = 2
+AMBIGUOUS = 3
+OUTCOME_NAMES = {TIMEOUT: "Timeout", SL_HIT: "SL hit", TP_HIT: "TP hit", AMBIGUOUS: "Ambiguous"}
+
+SAME_CANDLE_POLICIES = ("sl_first", "tp_first", "open_distance", "ambiguous")
+
+class CandleIndex:
+    '''
+    Sparse tables over one OHLC history; build once, query many signal batches.
+
+    ``low_min[k][i]`` is min(low[i:i + 2**k]) and ``high_max[k][i]`` is
+    max(high[i:i + 2**k]).  Memory is about 2 * N * log2(N) floats.
+    '''
+
+    def __init__(self, open_, high, low, close):
+        self.open = np.ascontiguousarray(open_, dtype=np.float64)
+        self.high = np.ascontiguousarray(high, dtype=np.float64)
+        self.low = np.ascontiguousarray(low, dtype=np.float64)
+        self.close = np.ascontiguousarray(close, dtype=np.float64)
+        self.size = len(self.low)
+        self.low_min = [self.low]
+        self.high_max = [self.high]
+        width = 1
+        while width * 2 <= self.size:
+            self.low_min.append(np.minimum(self.low_min[-1][:-width], self.low_min[-1][width:]))
+            self.high_max.append(np.maximum(self.high_max[-1][:-width], self.high_max[-1][width:]))
+            width *= 2
+
+    def __len__(self):
+        return self.size
+
+    @classmethod
+    def from_candles(cls, candles):
+        '''Builds from the list-of-dicts candle format used by the replay loaders.'''
+        return cls(
+            [candle["open"] for candle in candles],
+            [candle["high"] for candle in candles],
+            [candle["low"] for candle in candles],
+            [candle["close"] for candle in candles],
+        )
+
+    def _first(self, tables, start, price, crossed):
+        '''First index >= start whose table value crosses ``price``; self.size (or start, if later) when none does.'''
+        position = start.copy()
+        if self.size == 0:
+            return position
+        for level in range(len(tables) - 1, -1, -1):
+            width = 1 << level
+            table = tables[level]
+            can_jump = position <= self.size - width
+            safe = np.where(can_jump, position, 0)
+            jump = can_jump & ~crossed(table[safe], price)
+            position += jump * width
+        return position
+
+    def first_low_at_or_below(self, start, price):
+        return self._first(self.low_min, start, price, lambda value, threshold: value <= threshold)
+
+    def first_high_at_or_above(self, start, price):
+        return self._first(self.high_max, start, price, lambda value, threshold: value >= threshold)
+
+def simulate_batch(index: CandleIndex, entry_price, sl_pct, tp_pct, is_long, start=None, max_bars=None,
+                   policy: str = SAME_CANDLE_POLICY) -> dict:
+    '''
+    Resolves every signal at once.
+
+    entry_price, sl_pct, tp_pct, is_long are arrays of one value per signal;
+    ``start`` is each signal's first candle index (default 0) and
+    ``max_bars`` an optional per-signal or scalar horizon after which the
+    outcome is a timeout.  Returns arrays ``outcome`` (codes above),
+    ``hit_index`` (-1 on timeout) and ``exit_price`` (NaN on timeout or
+    ambiguity).
+    '''
+    if policy not in SAME_CANDLE_POLICIES:
+        raise ValueError(f"Unknown same-candle policy: {policy}")
+
+    started = time.perf_counter()
+    entry_price = np.asarray(entry_price, dtype=np.float64)
+    sl_pct = np.asarray(sl_pct, dtype=np.float64)
+    tp_pct = np.asarray(tp_pct, dtype=np.float64)
+    is_long = np.asarray(is_long, dtype=bool)
+    count = len(entry_price)
+    start = np.zeros(count, dtype=np.int64) if start is None else np.asarray(start, dtype=np.int64)
+
+    sl_price = np.where(is_long, entry_price * (1 - sl_pct), entry_price * (1 + sl_pct))
+    tp_price = np.where(is_long, entry_price * (1 + tp_pct), entry_price * (1 - tp_pct))
+
+    # Longs stop out on lows and take profit on highs; shorts the reverse.
+    sl_index = np.where(is_long,
+                        index.first_low_at_or_below(start, sl_price),
+                        index.first_high_at_or_above(start, sl_price))
+    tp_index = np.where(is_long,
+                        index.first_high_at_or_above(start, tp_price),
+                        index.first_low_at_or_below(start, tp_price))
+
+    end = np.full(count, index.size, dtype=np.int64)
+    if max_bars is not None:
+        end = np.minimum(end, start + np.asarray(max_bars, dtype=np.int64))
+    sl_hit = sl_index < end
+    tp_hit = tp_index < end
+
+    outcome = np.full(count, TIMEOUT, dtype=np.int8)
+    outcome[sl_hit & (~tp_hit | (sl_index < tp_index))] = SL_HIT
+    outcome[tp_hit & (~sl_hit | (tp_index < sl_index))] = TP_HIT
+
+    same = sl_hit & tp_hit & (sl_index == tp_index)
+    if policy == "sl_first":
+        outcome[same] = SL_HIT
+    elif policy == "tp_first":
+        outcome[same] = TP_HIT
+    elif policy == "open_distance" and same.any():
+        # Assume price visited whichever level was nearer the candle open first.
+        candle_open = index.open[np.where(same, sl_index, 0)]
+        sl_nearer = np.abs(candle_open - sl_price) <= np.abs(candle_open - tp_price)
+        outcome[same & sl_nearer] = SL_HIT
+        outcome[same & ~sl_nearer] = TP_HIT
+    elif policy == "ambiguous":
+        outcome[same] = AMBIGUOUS
+
+    hit_index = np.where(outcome == SL_HIT, sl_index, np.where(outcome == TP_HIT, tp_index, -1))
+    if policy == "ambiguous":
+        hit_index = np.where(outcome == AMBIGUOUS, sl_index, hit_index)
+    exit_price = np.where(outcome == SL_HIT, sl_price, np.where(outcome == TP_HIT, tp_price, np.nan))
+
+    logger.info(json.dumps({
+        "module": "sl_tp_vector_simulator",
+        "action": "Simulate Batch",
+        "status": "Success",
+        "signals": int(count),
+        "candles": int(index.size),
+        "policy": policy,
+        "seconds": round(time.perf_counter() - started, 4)
+    }))
+    return {"outcome": outcome, "hit_index": hit_index, "exit_price": exit_price}
+
+def signals_to_arrays(signals):
+    '''Splits sl_tp_simulation_tester-style signal dicts into the column arrays simulate_batch takes.'''
+    return (
+        np.array([signal["entry_price"] for signal in signals], dtype=np.float64),
+        np.array([signal["sl"] for signal in signals], dtype=np.float64),
+        np.array([signal["tp"] for signal in signals], dtype=np.float64),
+        np.array([signal["side"].upper() == "BUY" for signal in signals], dtype=bool),
+        np.array([signal.get("start_index", 0) for signal in signals], dtype=np.int64),
+    )
+
+def benchmark(signals: int = 100_000, candles: int = 500_000, seed: int = 7) -> dict:
+    '''Random-walk candles and random signals; returns index build and batch timings.'''
+    rng = np.random.default_rng(seed)
+    close = 30000 * np.exp(np.cumsum(rng.normal(0, 0.0008, candles)))
+    open_ = np.concatenate(([close[0]], close[:-1]))
+    spread = np.abs(rng.normal(0, 0.0005, candles)) * close
+    high = np.maximum(open_, close) + spread
+    low = np.minimum(open_, close) - spread
+
+    started = time.perf_counter()
+    index = CandleIndex(open_, high, low, close)
+    built = time.perf_counter() - started
+
+    start = rng.integers(0, candles - 1, signals)
+    started = time.perf_counter()
+    result = simulate_batch(index, close[start], rng.uniform(0.002, 0.02, signals), rng.uniform(0.004, 0.04, signals),
+                            rng.random(signals) < 0.5, start=start)
+    simulated = time.perf_counter() - started
+    return {
+        "signals": signals,
+        "candles": candles,
+        "index_seconds": round(built, 3),
+        "simulate_seconds": round(simulated, 3),
+        "outcomes": {OUTCOME_NAMES[code]: int((result["outcome"] == code).sum()) for code in OUTCOME_NAMES},
+    }
+
+if __name__ == "__main__":
+    logger.info(json.dumps({"module": "sl_tp_vector_simulator", "action": "Benchmark", **benchmark()}))
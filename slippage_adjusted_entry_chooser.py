@@ -6,7 +6,7 @@ Purpose: Dynamically chooses between market and limit orders based on current sl
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -32,7 +32,7 @@ WHALE_SIGNAL_THRESHOLD = config.get("WHALE_SIGNAL_THRESHOLD", 100000)  # Volume
 async def get_average_slippage(symbol):
     '''Retrieves the average slippage for a symbol from Redis (placeholder).'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         # Placeholder: Replace with actual logic to fetch average slippage
         slippage = random.uniform(0.0001, 0.0005)  # Simulate slippage
         logger.info(json.dumps({"module": "slippage_adjusted_entry_chooser", "action": "get_average_slippage", "status": "success", "symbol": symbol, "slippage": slippage}))
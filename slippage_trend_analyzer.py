@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -38,7 +38,7 @@ slippage_trend = Gauge('slippage_trend', 'Slippage trend for each exchange, modu
 async def fetch_trade_executions(exchange, module, symbol):
     '''Tracks execution slippage trends per exchange, module, and symbol to adjust execution delay or size.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         trade_executions = []
         for i in range(ANALYSIS_WINDOW):
             trade_data = await redis.get(f"titan:trade:execution:{exchange}:{module}:{symbol}:{i}")
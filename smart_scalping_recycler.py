@@ -6,7 +6,7 @@ Purpose: Allows repeat scalps on same asset while spread conditions and micro-vo
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -59,7 +59,7 @@ async def check_chaos_level(symbol):
 async def execute_scalp_trade(original_signal, recycle_count):
     '''Executes a scalp trade and publishes a message to Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         channel = "titan:core:signal"
 
         scalp_signal = original_signal.copy()
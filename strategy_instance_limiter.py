@@ -15,7 +15,7 @@ import asyncio
 import json
 import logging
 import os
-import aioredis
+from redis_connection_manager import get_async_redis
 
 # Config from config.json or ENV
 MAX_INSTANCES_PER_STRATEGY = int(os.getenv("MAX_INSTANCES_PER_STRATEGY", 3))
@@ -24,7 +24,7 @@ EXECUTION_ORCHESTRATOR_CHANNEL = os.getenv("EXECUTION_ORCHESTRATOR_CHANNEL", "ti
 # Redis connection
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
 REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
-redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
 
 # Logging setup
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -32,18 +32,16 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 # Module name
 MODULE_NAME = "strategy_instance_limiter"
 
-# In-memory store for active strategy instances
-active_strategies = {}
+# Active instances per strategy, in a Redis hash (strategy -> count) so every process sees them; pre_trade_gate reads it each refresh
+INSTANCES_KEY = os.getenv("STRATEGY_INSTANCES_KEY", "titan:prod:strategy_instances")
 
 async def check_instance_limit(strategy: str) -> bool:
     """Checks if the maximum number of instances for a given strategy has been reached."""
-    if strategy not in active_strategies:
-        active_strategies[strategy] = 0
-
-    if active_strategies[strategy] < MAX_INSTANCES_PER_STRATEGY:
-        active_strategies[strategy] += 1
+    # Claim a slot first and hand it back if that went over the limit, so concurrent deployments cannot both pass
+    if await redis.hincrby(INSTANCES_KEY, strategy, 1) <= MAX_INSTANCES_PER_STRATEGY:
         return True
     else:
+        await redis.hincrby(INSTANCES_KEY, strategy, -1)
         logging.warning(json.dumps({
             "module": MODULE_NAME,
             "action": "instance_limit_reached",
@@ -55,10 +53,9 @@ async def check_instance_limit(strategy: str) -> bool:
 
 async def release_instance(strategy: str):
     """Releases an instance of a trading strategy when it is terminated."""
-    if strategy in active_strategies:
-        active_strategies[strategy] -= 1
-        if active_strategies[strategy] < 0:
-            active_strategies[strategy] = 0 # Ensure it doesn't go below zero
+    if await redis.hexists(INSTANCES_KEY, strategy):
+        if await redis.hincrby(INSTANCES_KEY, strategy, -1) < 0:
+            await redis.hset(INSTANCES_KEY, strategy, 0) # Ensure it doesn't go below zero
 
         logging.info(json.dumps({
             "module": MODULE_NAME,
@@ -142,7 +139,7 @@ if __name__ == "__main__":
     asyncio.run(main())
 
 # === Titan Module Footnotes ===
-# Implemented Features: redis-pub, async safety, strategy instance limiting
+# Implemented Features: redis-pub, async safety, strategy instance limiting, instance counts shared through Redis
 # Deferred Features: ESG logic -> esg_mode.py
 # Excluded Features: backtesting (in backtest_engine.py)
 # Quality Rating: 10/10 reviewed by [Grok|Gemini|Claude] on [YYYY-MM-DD]
\ No newline at end of file
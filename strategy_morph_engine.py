@@ -6,7 +6,7 @@ Purpose: Evolves which strategy clusters are prioritized based on rolling perfor
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -39,7 +39,7 @@ STRATEGY_CLUSTERS = {
 async def get_cluster_alpha(cluster_name):
     '''Retrieves the rolling 7-day alpha for a given strategy cluster from Redis (placeholder).'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         # Placeholder: Replace with actual logic to fetch alpha data
         alpha = random.uniform(-0.1, 0.2)  # Simulate alpha
         logger.info(json.dumps({"module": "strategy_morph_engine", "action": "get_cluster_alpha", "status": "success", "cluster_name": cluster_name, "alpha": alpha}))
@@ -51,7 +51,7 @@ async def get_cluster_alpha(cluster_name):
 async def adjust_capital_allocation(cluster_name, alpha):
     '''Adjusts capital allocation for a strategy cluster based on its alpha.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         key = f"titan:strategy_cluster_alpha:{cluster_name}"
         await redis.set(key, alpha)
 
@@ -9,7 +9,8 @@ import logging
 import os
 import random
 
-import aioredis
+import aioredis
+from redis_connection_manager import get_async_redis
 
 # Configuration (replace with config.json or ENV vars)
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
@@ -58,7 +59,7 @@ async def main():
     Main function to run strategy performance evaluation periodically.
     """
     try:
-        r = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        r = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         while True:
             await evaluate_strategy_performance(r)
             await asyncio.sleep(EVALUATION_INTERVAL)  # Run evaluation every EVALUATION_INTERVAL seconds
@@ -6,7 +6,7 @@ Purpose: Detects modules that recovered after losing streaks and temporarily boo
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -33,7 +33,7 @@ CAPITAL_BOOST_FACTOR = config.get("CAPITAL_BOOST_FACTOR", 1.5)  # Capital boost
 async def update_module_streak(module_name, trade_result):
     '''Updates the win/loss streak for a module in Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         key = f"titan:module:{module_name}:streak"
         current_streak = int(await redis.get(key) or 0)
 
@@ -52,7 +52,7 @@ async def update_module_streak(module_name, trade_result):
 async def check_and_apply_boost(module_name):
     '''Checks if a module qualifies for a capital boost and applies it.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         streak_key = f"titan:module:{module_name}:streak"
         repair_key = f"titan:module:{module_name}:repair_active"
 
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -40,7 +40,7 @@ resilience_test_latency_seconds = Histogram('resilience_test_latency_seconds', '
 async def inject_flat_market_candles():
     '''Inject flat market candles (no movement).'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         # Placeholder for flat candle injection logic (replace with actual injection)
         logger.info(json.dumps({"module": "strategy_resilience_tester", "action": "Inject Flat Candles", "status": "Injected"}))
         return True
@@ -51,7 +51,7 @@ async def inject_flat_market_candles():
 async def inject_pump_and_dump_candles():
     '''Inject pump-and-dump candles (1 green + 1 red).'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         # Placeholder for pump-and-dump candle injection logic (replace with actual injection)
         logger.info(json.dumps({"module": "strategy_resilience_tester", "action": "Inject Pump and Dump Candles", "status": "Injected"}))
         return True
@@ -62,7 +62,7 @@ async def inject_pump_and_dump_candles():
 async def suppress_signal_volume():
     '''Suppress signal volume by 90%.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         # Placeholder for signal volume suppression logic (replace with actual suppression)
         logger.warning(json.dumps({"module": "strategy_resilience_tester", "action": "Suppress Signal Volume", "status": "Suppressed", "factor": SIGNAL_SUPPRESSION_FACTOR}))
         return True
@@ -73,7 +73,7 @@ async def suppress_signal_volume():
 async def increase_signal_entropy():
     '''Increase signal entropy field to 0.99.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         # Placeholder for signal entropy increase logic (replace with actual increase)
         logger.warning(json.dumps({"module": "strategy_resilience_tester", "action": "Increase Signal Entropy", "status": "Increased", "entropy": HIGH_ENTROPY_VALUE}))
         return True
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -39,7 +39,7 @@ module_roi = Gauge('module_roi', 'ROI of each module', ['module'])
 async def fetch_module_roi(module):
     '''Fetches the ROI for a given module from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         roi = await redis.get(f"titan:performance:{module}:roi")
         if roi:
             return float(roi)
@@ -53,7 +53,7 @@ async def fetch_module_roi(module):
 async def retire_strategy(module):
     '''Automatically disables modules performing below threshold ROI over N-day window.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         await redis.set(f"{MODULE_STATUS_KEY_PREFIX}{module}", "retired")
         logger.warning(json.dumps({"module": "strategy_retirement_manager", "action": "Retire Strategy", "status": "Retired", "module": module}))
         global modules_retired_total
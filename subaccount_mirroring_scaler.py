@@ -6,7 +6,7 @@ Purpose: Mirrors top-performing logic across multiple subaccounts to scale capit
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -33,7 +33,7 @@ SIGNAL_DELAY_RANGE = config.get("SIGNAL_DELAY_RANGE", [1, 5])  # Range for signa
 async def route_signal_to_subaccount(signal, subaccount_id):
     '''Routes a trading signal to a subaccount with a slight delay and/or offset.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         channel = f"titan:subaccount:{subaccount_id}:signal"
 
         # Simulate slight signal variation
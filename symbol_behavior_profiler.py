@@ -15,7 +15,9 @@ import asyncio
 import json
 import logging
 import os
-import aioredis
+from redis_connection_manager import get_async_redis
+from candle_store import load_candles
+import numpy as np
 import datetime
 
 # Config from config.json or ENV
@@ -27,7 +29,7 @@ EXECUTION_ORCHESTRATOR_CHANNEL = os.getenv("EXECUTION_ORCHESTRATOR_CHANNEL", "ti
 # Redis connection
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
 REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
-redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
 
 # Logging setup
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -35,25 +37,20 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 # Module name
 MODULE_NAME = "symbol_behavior_profiler"
 
-async def load_historical_data(data_source: str) -> list:
-    """Loads historical market data from a file or API."""
-    # TODO: Implement logic to load historical data
-    # Placeholder: Return a list of historical data points
-    historical_data = [
-        {"timestamp": datetime.datetime(2024, 1, 1, 0, 0, 0), "open": 40000, "high": 41000, "low": 39000, "close": 40500},
-        {"timestamp": datetime.datetime(2024, 1, 1, 0, 1, 0), "open": 40500, "high": 41500, "low": 39500, "close": 41000}
-    ]
-    return historical_data
-
-async def calculate_volatility(historical_data: list) -> float:
-    """Calculates the volatility of a symbol based on historical data."""
-    # TODO: Implement logic to calculate volatility
-    # Placeholder: Return a sample volatility value
-    return 0.04
+async def load_historical_data(data_source: str, symbol: str = "BTCUSDT", start=None):
+    """Loads historical candles from the local candle store as a zero-copy CandleFrame."""
+    return load_candles(symbol, start=start, csv_path=data_source)
+
+async def calculate_volatility(historical_data) -> float:
+    """Calculates the volatility of a symbol as the standard deviation of close-to-close log returns."""
+    if len(historical_data) < 2:
+        return 0.0
+    return float(np.std(np.diff(np.log(historical_data.close))))
 
 async def analyze_symbol_behavior(symbol: str):
     """Analyzes the historical behavior of a trading symbol."""
-    historical_data = await load_historical_data(HISTORICAL_DATA_SOURCE)
+    window_start = datetime.datetime.utcnow() - datetime.timedelta(seconds=VOLATILITY_WINDOW)
+    historical_data = await load_historical_data(HISTORICAL_DATA_SOURCE, symbol, start=window_start)
     volatility = await calculate_volatility(historical_data)
 
     # TODO: Implement logic to identify patterns and inform strategy selection
@@ -108,7 +105,7 @@ if __name__ == "__main__":
     asyncio.run(main())
 
 # === Titan Module Footnotes ===
-# Implemented Features: redis-pub, async safety, symbol behavior profiling
-# Deferred Features: ESG logic -> esg_mode.py, historical data loading, volatility calculation
+# Implemented Features: redis-pub, async safety, symbol behavior profiling, candle store loading, log-return volatility
+# Deferred Features: ESG logic -> esg_mode.py
 # Excluded Features: backtesting (in backtest_engine.py)
 # Quality Rating: 10/10 reviewed by [Grok|Gemini|Claude] on [YYYY-MM-DD]
\ No newline at end of file
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -37,7 +37,7 @@ heatmap_generation_latency_seconds = Histogram('heatmap_generation_latency_secon
 async def fetch_symbol_performance(symbol, timeframe):
     '''Fetches performance data for a given symbol and timeframe from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         # Placeholder for fetching performance data logic (replace with actual fetching)
         winrate = random.uniform(0.4, 0.8) # Simulate winrate
         pnl = random.uniform(-0.05, 0.1) # Simulate PnL
@@ -71,7 +71,7 @@ async def generate_heatmap_data():
 async def store_heatmap_data(heatmap_data):
     '''Stores the heatmap data to Redis for visualization.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         await redis.set("titan:heatmap:data", json.dumps(heatmap_data))
         logger.info(json.dumps({"module": "symbol_heatmap_generator", "action": "Store Heatmap Data", "status": "Success"}))
         global heatmaps_generated_total
@@ -7,7 +7,7 @@ import asyncio
 import json
 import logging
 import os
-import aioredis
+from redis_connection_manager import get_async_redis
 
 async def main():
 PROFIT_THRESHOLD = float(os.getenv("PROFIT_THRESHOLD", 0.01))
@@ -17,7 +17,7 @@ COMMANDER_OVERRIDE_LEDGER = os.getenv("COMMANDER_OVERRIDE_LEDGER", "commander_ov
 
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
 REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
-redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
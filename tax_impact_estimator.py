@@ -6,7 +6,7 @@ Purpose: Creates PnL + tax reports.
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -31,7 +31,7 @@ REPORT_PATH = config.get("REPORT_PATH", "/reports")
 async def estimate_tax_impact(trade_data):
     '''Estimates the tax impact of a trade and logs the data to Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         month = datetime.datetime.now().strftime("%Y-%m")
         key = f"titan:report:tax:{month}"
 
@@ -59,7 +59,7 @@ async def estimate_tax_impact(trade_data):
 async def generate_tax_report():
     '''Generates a tax report and saves it to a file.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         month = datetime.datetime.now().strftime("%Y-%m")
         key = f"titan:report:tax:{month}"
 
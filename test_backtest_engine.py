@@ -0,0 +1,65 @@
+import math
+import unittest
+
+import numpy as np
+
+import backtest_engine
+from backtest_engine import BacktestEngine, FillModel, Strategy, run_vectorized
+
+class BuyOnce(Strategy):
+    """Orders one unit on the first bar and then waits."""
+
+    def on_bar(self, ctx):
+        if ctx.index == 0:
+            ctx.order(1.0)
+
+def candles(volume):
+    bars = len(volume)
+    return {"open": np.full(bars, 100.0), "high": np.full(bars, 101.0), "low": np.full(bars, 99.0),
+            "close": np.full(bars, 100.0), "volume": np.asarray(volume, dtype=np.float64)}
+
+class TestFillModel(unittest.TestCase):
+
+    def setUp(self):
+        self.model = FillModel(fee_rate=0.0, slippage_bps=0.0, max_participation=0.1)
+
+    def test_zero_volume_fills_nothing(self):
+        quantity, price, fee = self.model.fill(5.0, 100.0, 0.0)
+        self.assertEqual(quantity, 0.0)
+        self.assertEqual(fee, 0.0)
+
+    def test_volume_caps_the_fill(self):
+        self.assertEqual(self.model.fill(-5.0, 100.0, 20.0)[0], -2.0)
+
+    def test_missing_volume_fills_in_full(self):
+        self.assertEqual(self.model.fill(5.0, 100.0, math.nan)[0], 5.0)
+
+    def test_order_waits_through_zero_volume_bars(self):
+        fill_model = FillModel(fee_rate=0.0, slippage_bps=0.0, max_participation=1.0)
+        result = BacktestEngine(candles([0.0, 0.0, 0.0, 10.0]), BuyOnce(), fill_model, initial_capital=1000.0).run()
+        self.assertEqual(result["position"].tolist(), [0.0, 0.0, 0.0, 1.0])
+        self.assertEqual(result["trades"], 1)
+
+class TestRunVectorized(unittest.TestCase):
+
+    def test_empty_input_returns_empty_result(self):
+        result = run_vectorized(candles([]), [], initial_capital=1000.0)
+        self.assertEqual(result["bars"], 0)
+        self.assertEqual(result["trades"], 0)
+        self.assertEqual(result["total_profit"], 0.0)
+        self.assertEqual(result["sharpe_ratio"], 0.0)
+        self.assertEqual(len(result["equity"]), 0)
+
+    def test_matches_event_engine_without_participation_limit(self):
+        rng = np.random.default_rng(1)
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, 300)))
+        bars = {"open": close, "high": close, "low": close, "close": close, "volume": np.full(300, math.nan)}
+        target = backtest_engine.momentum_signals(close, 20, 0.8)
+        strategy = backtest_engine.MomentumStrategy(20, 0.8)
+        vectorized = run_vectorized(bars, target)
+        event = BacktestEngine(bars, strategy).run()
+        self.assertAlmostEqual(vectorized["total_profit"], event["total_profit"], places=6)
+        self.assertEqual(vectorized["trades"], event["trades"])
+
+if __name__ == '__main__':
+    unittest.main()
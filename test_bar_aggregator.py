@@ -0,0 +1,95 @@
+import tempfile
+import unittest
+
+from bar_aggregator import NEVER, BarAggregator, benchmark, interval_ns, persist
+from candle_store import CandleStore
+
+T0 = 1_700_000_100 * 1_000_000_000  # A 5m boundary
+MINUTE = interval_ns("1m")
+
+class TestRestart(unittest.TestCase):
+    """An aggregator restarted mid-bar picks up the coarser bar the previous process left open."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = CandleStore(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_open_parent_bar_is_rebuilt_from_stored_children(self):
+        before = BarAggregator("1m,5m", grace_ms=0)
+        before.add_trade("BTCUSDT", T0 + 1_000_000_000, 100.0, 30.0)
+        before.advance(T0 + MINUTE + 1)
+        self.assertEqual(persist(before.drain(), self.store), 1)  # Only the 1m bar; the 5m bar is still open
+
+        after = BarAggregator("1m,5m", grace_ms=0)
+        after.load_history("BTCUSDT", self.store)
+        after.add_trade("BTCUSDT", T0 + MINUTE + 10_000_000_000, 130.0, 30.0)
+        after.advance(T0 + 5 * MINUTE + 1)
+        drained = after.drain()
+        bars = {(interval, start): bar for _, interval, start, bar in drained}
+
+        five = bars[("5m", T0)]
+        self.assertEqual(five[:5], [100.0, 130.0, 100.0, 130.0, 60.0])
+        self.assertNotIn(("1m", T0), bars)  # Stored bars are not re-emitted
+        self.assertEqual(persist(drained, self.store), 2)
+        self.assertEqual(self.store.load("BTCUSDT", "5m").open.tolist(), [100.0])
+
+    def test_stored_parent_is_not_reopened(self):
+        before = BarAggregator("1m,5m", grace_ms=0)
+        before.add_trade("BTCUSDT", T0 + 1_000_000_000, 100.0, 30.0)
+        before.advance(T0 + 5 * MINUTE + 1)
+        persist(before.drain(), self.store)
+
+        after = BarAggregator("1m,5m", grace_ms=0)
+        after.load_history("BTCUSDT", self.store)
+        self.assertEqual(after.symbols["BTCUSDT"].open[1], {})
+
+class TestQuietMarket(unittest.TestCase):
+    """With no further trades, wall-clock advances alone close every interval on time."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def closed(self, aggregator):
+        return {(interval, start) for _, interval, start, _ in aggregator.drain()}
+
+    def test_coarser_bars_close_without_trades(self):
+        aggregator = BarAggregator("1s,1m,5m", grace_ms=0)
+        aggregator.add_trade("BTCUSDT", T0 + 1_000_000_000, 100.0, 1.0)
+        closed = set()
+        for second in range(1, 5 * 60 + 1):
+            aggregator.advance(T0 + second * 1_000_000_000)
+            closed |= self.closed(aggregator)
+            if second == 2:
+                self.assertEqual(closed, {("1s", T0 + 1_000_000_000)})
+            if second == 60:
+                self.assertIn(("1m", T0), closed)
+                self.assertNotIn(("5m", T0), closed)
+        self.assertIn(("5m", T0), closed)
+        self.assertEqual(aggregator.symbols["BTCUSDT"].next_sweep, NEVER)
+
+    def test_reopened_bar_closes_without_trades(self):
+        store = CandleStore(self.tmp.name)
+        store.append("BTCUSDT", "1m", {"timestamp": [T0], "open": [100.0], "high": [100.0], "low": [100.0], "close": [100.0],
+                                       "volume": [1.0]})
+        aggregator = BarAggregator("1m,5m", grace_ms=0)
+        aggregator.load_history("BTCUSDT", store)
+        aggregator.advance(T0 + 5 * MINUTE - 1)
+        self.assertEqual(self.closed(aggregator), set())
+        aggregator.advance(T0 + 5 * MINUTE)
+        self.assertEqual(self.closed(aggregator), {("5m", T0)})
+
+class TestBenchmark(unittest.TestCase):
+
+    def test_short_tape_without_hourly_bars(self):
+        result = benchmark(trades=20000)
+        self.assertEqual(result["bars"]["1h"], 0)
+        self.assertEqual(result["hourly_volume_error"], 0.0)
+
+if __name__ == '__main__':
+    unittest.main()
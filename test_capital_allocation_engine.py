@@ -0,0 +1,116 @@
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+import capital_reallocation_engine
+from capital_allocation_engine import CapitalAllocationEngine
+
+def factor_returns(periods, strategies, seed=3):
+    rng = np.random.default_rng(seed)
+    loadings = rng.normal(0.5, 0.3, (strategies, 2))
+    return rng.normal(0.001, 0.002, strategies) + rng.normal(0, 0.01, (periods, 2)) @ loadings.T + rng.normal(0, 0.01, (periods, strategies))
+
+def random_covariance(n, seed=5):
+    rng = np.random.default_rng(seed)
+    factors = rng.normal(0, 0.1, (n, n))
+    return factors @ factors.T / n + np.diag(rng.uniform(0.001, 0.01, n))
+
+class TestSolvers(unittest.TestCase):
+    """Each method against its closed form or defining condition, inside the budget and box."""
+
+    def setUp(self):
+        self.names = [f"S{n}" for n in range(12)]
+
+    def test_weights_respect_budget_and_box(self):
+        for method in ("mean_variance", "risk_parity", "kelly"):
+            engine = CapitalAllocationEngine(self.names, method=method, reserve=0.2, max_weight=0.1, min_weight=0.02)
+            engine.set_bounds("S0", max_weight=0.05)
+            engine.load_history(factor_returns(120, 12), self.names)
+            weights = np.array(list(engine.solve().values()))
+            with self.subTest(method=method):
+                self.assertLessEqual(weights.sum(), 0.8 + 1e-9)
+                if method != "kelly":
+                    self.assertAlmostEqual(weights.sum(), 0.8)
+                self.assertTrue((weights >= 0.02 - 1e-9).all())
+                self.assertTrue((weights <= 0.1 + 1e-9).all())
+                self.assertLessEqual(weights[0], 0.05 + 1e-9)
+
+    def test_uncapped_kelly_is_fraction_of_inverse_covariance_times_mean(self):
+        covariance = random_covariance(6)
+        mean = covariance @ np.full(6, 0.2)  # Full Kelly of 0.2 per strategy: all long, total 1.2
+        engine = CapitalAllocationEngine([f"S{n}" for n in range(6)], method="kelly", reserve=0.0, max_weight=1.0, kelly_fraction=0.5)
+        weights = np.array(list(engine.solve(mean=mean, covariance=covariance).values()))
+        np.testing.assert_allclose(weights, 0.5 * np.linalg.solve(covariance, mean), atol=1e-6)
+
+    def test_risk_parity_equalises_risk_contributions(self):
+        covariance = random_covariance(8)
+        engine = CapitalAllocationEngine([f"S{n}" for n in range(8)], method="risk_parity", reserve=0.1, max_weight=1.0)
+        weights = np.array(list(engine.solve(covariance=covariance, mean=np.zeros(8)).values()))
+        contributions = weights * (covariance @ weights)
+        np.testing.assert_allclose(contributions / contributions.sum(), np.full(8, 1 / 8), atol=1e-6)
+        self.assertAlmostEqual(weights.sum(), 0.9)
+
+    def test_warm_and_cold_solves_agree(self):
+        history = factor_returns(101, 12)
+        for method in ("mean_variance", "risk_parity", "kelly"):
+            warm = CapitalAllocationEngine(self.names, method=method, max_weight=0.15)
+            warm.load_history(history[:100], self.names)
+            warm.solve()
+            warm.add_returns(history[100])
+            cold = CapitalAllocationEngine(self.names, method=method, max_weight=0.15)
+            cold.load_history(history, self.names)
+            with self.subTest(method=method):
+                np.testing.assert_allclose(list(warm.solve().values()), list(cold.solve().values()), atol=1e-5)
+
+class TestUnevenHistory(unittest.TestCase):
+    """A strategy added partway through is estimated from its own periods and waits for a minimum history."""
+
+    def test_late_strategy_is_estimated_from_its_own_periods(self):
+        history = factor_returns(60, 3)
+        late = CapitalAllocationEngine(["A", "B"], window=100)
+        late.load_history(history[:40, :2], ["A", "B"])
+        for row in history[40:]:
+            late.add_returns(dict(zip(["A", "B", "C"], row)))
+        self.assertEqual(late.history().tolist(), [60, 60, 20])
+        mean, covariance = late.estimate()
+        np.testing.assert_allclose(mean, [history[:, 0].mean(), history[:, 1].mean(), history[40:, 2].mean()])
+        target = np.trace(covariance) / 3
+        unshrunk = (covariance - late.shrinkage * target * np.eye(3)) / (1 - late.shrinkage)
+        self.assertAlmostEqual(unshrunk[2, 2], history[40:, 2].var())  # Not diluted by 40 zero-padded periods
+        self.assertAlmostEqual(unshrunk[0, 0], history[:, 0].var())
+        self.assertTrue((np.linalg.eigvalsh(covariance) > 0).all())
+
+    def test_late_strategy_stays_at_floor_until_min_history(self):
+        engine = CapitalAllocationEngine(["A", "B"], max_weight=0.5, min_history=5)
+        engine.load_history(factor_returns(30, 2), ["A", "B"])
+        engine.add_returns({"A": 0.001, "B": 0.0, "C": 0.05})
+        self.assertEqual(engine.solve()["C"], 0.0)
+        for _ in range(4):
+            engine.add_returns({"A": 0.001, "B": 0.0, "C": 0.01})
+        self.assertGreater(engine.solve()["C"], 0.0)
+
+class TestReallocation(unittest.IsolatedAsyncioTestCase):
+    """capital_reallocation_engine does not hand a newcomer its cap off one period."""
+
+    async def asyncSetUp(self):
+        self.patches = [patch.object(capital_reallocation_engine, "reallocation_allocator", CapitalAllocationEngine(method="mean_variance", max_weight=0.5)),
+                        patch.object(capital_reallocation_engine, "current_weights", {})]
+        for patcher in self.patches:
+            patcher.start()
+
+    async def asyncTearDown(self):
+        for patcher in self.patches:
+            patcher.stop()
+
+    async def test_new_strategy_with_one_good_period_stays_at_floor(self):
+        rng = np.random.default_rng(1)
+        for _ in range(30):
+            await capital_reallocation_engine.reallocate_capital({"p": 1.0}, {name: {"profitability": float(rng.normal(0.001, 0.01))} for name in ("a", "b", "c")})
+        logs = await capital_reallocation_engine.reallocate_capital({"p": 1.0}, {"a": {"profitability": 0.0}, "b": {"profitability": 0.0},
+                                                                                 "c": {"profitability": 0.0}, "late": {"profitability": 0.05}})
+        self.assertEqual(logs["late"]["weight"], 0.0)
+        self.assertAlmostEqual(sum(log["weight"] for log in logs.values()), 0.9)
+
+if __name__ == '__main__':
+    unittest.main()
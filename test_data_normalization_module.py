@@ -0,0 +1,37 @@
+import unittest
+
+import numpy as np
+
+from Data_Normalization_Module import LEVEL_DTYPE, book_levels, level_array
+
+class TestLevelArray(unittest.TestCase):
+
+    def test_string_pairs(self):
+        levels = level_array([["100.5", "2"], ["100.4", "3.25"]])
+        self.assertEqual(levels.dtype, LEVEL_DTYPE)
+        self.assertEqual(levels.tolist(), [(100.5, 2.0), (100.4, 3.25)])
+
+    def test_three_column_levels_keep_price_and_size(self):
+        # e.g. [price, size, order_count] snapshots
+        levels = level_array([["100.5", "2", "7"], ["100.4", "3", "1"], ["100.3", "4", "12"]])
+        self.assertEqual(levels["price"].tolist(), [100.5, 100.4, 100.3])
+        self.assertEqual(levels["size"].tolist(), [2.0, 3.0, 4.0])
+
+    def test_three_column_array(self):
+        levels = level_array(np.array([[100.5, 2.0, 7.0], [100.4, 3.0, 1.0]]))
+        self.assertEqual(levels.tolist(), [(100.5, 2.0), (100.4, 3.0)])
+
+    def test_two_column_array_is_viewed(self):
+        raw = np.array([[100.5, 2.0], [100.4, 3.0]])
+        self.assertTrue(np.shares_memory(level_array(raw), raw))
+
+    def test_dicts_and_empty(self):
+        self.assertEqual(level_array([{"price": "1.5", "size": 2}]).tolist(), [(1.5, 2.0)])
+        self.assertEqual(len(level_array([])), 0)
+
+    def test_book_levels_binance_keys(self):
+        bids, asks = book_levels({"b": [["10", "1", "3"]], "a": [["11", "2", "5"]]})
+        self.assertEqual((bids.tolist(), asks.tolist()), ([(10.0, 1.0)], [(11.0, 2.0)]))
+
+if __name__ == '__main__':
+    unittest.main()
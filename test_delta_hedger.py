@@ -0,0 +1,85 @@
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+
+import delta_hedger
+from delta_hedger import DeltaHedger
+
+def risk_engine(prices=None, covariance=None):
+    """Risk engine stand-in: live prices and the covariance behind cross-hedge betas."""
+    symbols = list(prices or {})
+    return SimpleNamespace(symbols=symbols, index={symbol: i for i, symbol in enumerate(symbols)},
+                           price=np.array([prices[symbol] for symbol in symbols], dtype=float),
+                           covariance=np.asarray(covariance if covariance is not None else np.zeros((len(symbols), len(symbols))), dtype=float))
+
+def fill(symbol, side, quantity, price, strategy="momentum"):
+    return {"strategy": strategy, "symbol": symbol, "side": side, "quantity": quantity, "price": price}
+
+def summary(orders):
+    return [(order["symbol"], order["side"], round(order["quantity"], 9)) for order in orders]
+
+class TestOrders(unittest.TestCase):
+    """One netted order per perpetual, traded only outside the band, with pending quantity tracked."""
+
+    def hedger(self, band=0.0, inner_band=0.0, engine=None):
+        hedger = DeltaHedger(target_delta=0.5, hedging_asset="ETHUSDT", perps=["BTCUSDT", "ETHUSDT"], band=band, inner_band=inner_band,
+                             risk_engine=engine or risk_engine())
+        hedger.on_price("BTCUSDT", 100.0)
+        hedger.on_price("ETHUSDT", 2000.0)
+        return hedger
+
+    def test_spot_and_perp_fills_net_into_one_order(self):
+        hedger = self.hedger()
+        hedger.on_fill(fill("BTCUSDT", "BUY", 3, 100.0))
+        hedger.on_fill(fill("BTCUSDT-PERP", "SELL", 1, 100.0, strategy="basis"))
+        self.assertEqual(summary(hedger.orders(now=0.0)), [("BTCUSDT-PERP", "SELL", 1.0)])  # Half of the net 2 BTC
+
+    def test_band_and_inner_band(self):
+        hedger = self.hedger(band=150.0, inner_band=50.0)
+        hedger.on_fill(fill("BTCUSDT", "BUY", 2, 100.0))
+        self.assertEqual(hedger.orders(now=0.0), [])  # 1 BTC = 100 of error, inside the band
+        hedger.on_fill(fill("BTCUSDT", "BUY", 2, 100.0))
+        self.assertEqual(summary(hedger.orders(now=0.0)), [("BTCUSDT-PERP", "SELL", 1.5)])  # 2 BTC of error, back to 50 from target
+        hedger.on_fill(fill("BTCUSDT-PERP", "SELL", 1.5, 100.0, strategy=delta_hedger.MODULE_NAME))
+        self.assertEqual(hedger.pending[hedger.index["BTCUSDT"]], 0.0)
+        self.assertEqual(hedger.orders(now=1.0), [])
+
+    def test_pending_quantity_is_not_resent_until_it_times_out(self):
+        hedger = self.hedger(band=50.0)
+        hedger.on_fill(fill("BTCUSDT", "BUY", 4, 100.0))
+        self.assertEqual(summary(hedger.orders(now=0.0)), [("BTCUSDT-PERP", "SELL", 2.0)])
+        self.assertEqual(hedger.orders(now=1.0), [])
+        hedger.on_fill(fill("BTCUSDT-PERP", "SELL", 1.0, 100.0, strategy=delta_hedger.MODULE_NAME))  # Partial fill
+        self.assertEqual(hedger.orders(now=2.0), [])  # The other 1 BTC is still pending
+        self.assertEqual(summary(hedger.orders(now=2.0 + delta_hedger.HEDGE_PENDING_TIMEOUT)), [("BTCUSDT-PERP", "SELL", 1.0)])
+
+    def test_cross_hedge_without_covariance_uses_fallback_beta(self):
+        hedger = self.hedger(band=100.0)
+        hedger.on_price("DOGEUSDT", 0.1)
+        hedger.on_fill(fill("DOGEUSDT", "BUY", 10000, 0.1))
+        hedger.on_fill(fill("ETHUSDT", "BUY", 0.5, 2000.0))
+        with self.assertLogs(level="WARNING") as logs:
+            orders = hedger.orders(now=0.0)
+        # DOGE: half of 1000 notional at beta 1 = 0.25 ETH, netted with half of ETH's own 0.5
+        self.assertEqual(summary(orders), [("ETHUSDT-PERP", "SELL", 0.5)])
+        self.assertIn("fallback_beta", logs.output[0])
+
+    def test_cross_hedge_uses_covariance_beta(self):
+        engine = risk_engine({"ETHUSDT": 2000.0, "DOGEUSDT": 0.1}, [[0.0004, 0.0006], [0.0006, 0.0025]])
+        hedger = self.hedger(band=100.0, engine=engine)
+        hedger.on_fill(fill("DOGEUSDT", "BUY", 10000, 0.1))
+        hedger._refresh_prices()
+        self.assertEqual(summary(hedger.orders(now=0.0)), [("ETHUSDT-PERP", "SELL", 0.375)])  # Beta 1.5 on 500 of notional
+
+    def test_unpriced_hedging_asset_is_reported(self):
+        hedger = self.hedger(band=100.0)
+        hedger.on_price("ETHUSDT", 0.0)
+        hedger.on_price("DOGEUSDT", 0.1)
+        hedger.on_fill(fill("DOGEUSDT", "BUY", 10000, 0.1))
+        with self.assertLogs(level="WARNING") as logs:
+            self.assertEqual(hedger.orders(now=0.0), [])
+        self.assertIn("cross_hedge_skipped", logs.output[0])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+from unittest.mock import patch
+
+import fakeredis.aioredis
+
+import tenant_rate_limiter
+from exchange_api import ExchangeAPI
+from Fake_Exchange_Server import FakeExchangeServer
+from rate_limiter import RateLimiter, endpoint_cost
+
+class BinanceLike(ExchangeAPI):
+    name = "binance"
+
+class TestExchangeAPIBudgets(unittest.IsolatedAsyncioTestCase):
+    """REST calls against Fake_Exchange_Server draw on the venue budget by endpoint weight and on the tenant budget."""
+
+    async def asyncSetUp(self):
+        self.server = FakeExchangeServer(symbols=["BTCUSDT"])
+        base_url = await self.server.start(port=0)
+        self.redis = fakeredis.aioredis.FakeRedis()
+        self.venue = RateLimiter(self.redis, {("binance", "request_weight"): (10, 3600)})  # No refill or lease within a test
+        self.tenants = RateLimiter(self.redis, {tenant_rate_limiter.TENANT_BUCKET: (2, 60)})
+        self.patches = [patch.object(tenant_rate_limiter, "limiter", self.tenants)]
+        for patcher in self.patches:
+            patcher.start()
+        self.api = BinanceLike(base_url, rate_limiter=self.venue, tenant="client-a")
+
+    async def asyncTearDown(self):
+        await self.api.close()
+        for patcher in self.patches:
+            patcher.stop()
+        await self.server.stop()
+
+    def test_query_string_does_not_change_endpoint_cost(self):
+        self.assertEqual(endpoint_cost("binance", "/api/v3/depth?symbol=BTCUSDT&limit=10"), ("request_weight", 5))
+
+    async def test_signed_style_get_is_charged_its_endpoint_weight(self):
+        await self.api.request("GET", "/api/v3/depth?symbol=BTCUSDT&limit=10")
+        self.assertEqual(await self.venue.used("binance", "request_weight"), 5)
+        self.assertEqual(await tenant_rate_limiter.get_api_call_count("client-a"), 1)
+
+    async def test_tenant_over_limit_is_refused(self):
+        for _ in range(2):
+            await self.api.get("/api/v3/depth", params={"symbol": "BTCUSDT", "limit": 10})
+        with self.assertRaises(tenant_rate_limiter.TenantLimitExceeded):
+            await self.api.get("/api/v3/depth", params={"symbol": "BTCUSDT", "limit": 10})
+        self.assertEqual(await tenant_rate_limiter.get_api_call_count("client-b"), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+import asyncio
+import json
+import time
+import unittest
+from unittest.mock import patch
+
+import fakeredis.aioredis
+import numpy as np
+
+import duplicate_trade_guard
+import Exchange_Compliance_Engine
+import execution_orchestrator
+import execution_throttle_controller
+import mock_order_executor
+import portfolio_risk_engine
+import pre_trade_gate
+import redundant_signal_filter
+import strategy_instance_limiter
+from execution_orchestrator import ExecutionOrchestrator
+from rate_limiter import RateLimiter
+
+def signal(symbol, confidence=0.9):
+    return {"symbol": symbol, "side": "BUY", "strategy": "momentum", "confidence": confidence,
+            "price": 100.0, "quantity": 1.0, "timestamp_ns": time.time_ns()}
+
+def warm_engine(positions=None):
+    symbols = ["BTCUSDT", "ETHUSDT"]
+    engine = portfolio_risk_engine.PortfolioRiskEngine(symbols)
+    closes = 100 * np.exp(np.cumsum(np.random.default_rng(1).normal(0, 0.001, (portfolio_risk_engine.RISK_MIN_SCENARIOS + 1, 2)), axis=0))
+    engine.load_history(closes, symbols)
+    engine.seed_positions(positions or {}, {symbol: 100.0 for symbol in positions or {}})
+    return engine
+
+def warm_gate(engine=None):
+    state = pre_trade_gate.GateState()
+    state.refreshed_at = time.monotonic() + 3600
+    state.exchange_rules = {}
+    return pre_trade_gate.PreTradeGate(state, engine if engine is not None else warm_engine())
+
+class TestExecutionOrchestrator(unittest.IsolatedAsyncioTestCase):
+    """Signals through the default pipeline to the mock executor, with the throttle budget on fake Redis."""
+
+    async def asyncSetUp(self):
+        self.redis = fakeredis.aioredis.FakeRedis()
+        self.limiter = RateLimiter(self.redis, {execution_throttle_controller.THROTTLE_BUCKET: (1, 60)})
+        gate = warm_gate()
+        self.patches = [
+            patch.object(execution_throttle_controller, "limiter", self.limiter),
+            patch.object(mock_order_executor, "redis", self.redis),
+            patch.object(pre_trade_gate, "ensure_refresh", lambda redis=None: gate),
+            patch.object(mock_order_executor, "EXECUTION_LATENCY", 0),
+            patch.dict(duplicate_trade_guard.recent_signals, clear=True),
+            patch.object(redundant_signal_filter, "redis", self.redis),
+        ]
+        for patcher in self.patches:
+            patcher.start()
+        self.orchestrator = ExecutionOrchestrator(pipeline=execution_orchestrator.build_default_pipeline())
+
+    async def asyncTearDown(self):
+        for patcher in self.patches:
+            patcher.stop()
+
+    async def test_accepted_signal_reaches_executor_and_spends_one_order(self):
+        result = await self.orchestrator.handle_signal(signal("BTCUSDT"))
+        self.assertEqual(result["symbol"], "BTCUSDT")
+        self.assertEqual(await self.limiter.remaining(*execution_throttle_controller.THROTTLE_BUCKET), 0)
+        self.assertIsNone(await self.orchestrator.handle_signal(signal("ETHUSDT")))
+
+    async def test_rejected_signal_spends_nothing(self):
+        self.assertIsNone(await self.orchestrator.handle_signal(signal("BTCUSDT", confidence=0.1)))
+        self.assertEqual(await self.limiter.remaining(*execution_throttle_controller.THROTTLE_BUCKET), 1)
+        self.assertEqual((await self.orchestrator.handle_signal(signal("ETHUSDT")))["symbol"], "ETHUSDT")
+
+class TestGateRules(unittest.IsolatedAsyncioTestCase):
+    """Instance counts come from strategy_instance_limiter's shared hash; positions from a warm risk engine."""
+
+    async def asyncSetUp(self):
+        self.redis = fakeredis.aioredis.FakeRedis()
+        await self.redis.set(f"titan:prod::{Exchange_Compliance_Engine.EXCHANGE_NAME}_rules", json.dumps({}))
+
+    async def test_instance_limit_reads_shared_count(self):
+        gate = warm_gate()
+        limit = strategy_instance_limiter.MAX_INSTANCES_PER_STRATEGY
+        await self.redis.hset(strategy_instance_limiter.INSTANCES_KEY, "momentum", limit - 1)
+        await gate.refresh(self.redis)
+        self.assertEqual(gate.check(signal("BTCUSDT")), (True, None))
+        await self.redis.hset(strategy_instance_limiter.INSTANCES_KEY, "momentum", limit)
+        await gate.refresh(self.redis)
+        self.assertEqual(gate.check(signal("BTCUSDT")), (False, "strategy_instance_limit"))
+
+    async def test_cold_engine_rejects(self):
+        gate = warm_gate(portfolio_risk_engine.PortfolioRiskEngine())
+        self.assertEqual(gate.check(signal("BTCUSDT")), (False, "risk_engine_warm"))
+
+    async def test_open_positions_counted_from_engine(self):
+        held = {f"S{n}": 1.0 for n in range(Exchange_Compliance_Engine.MAX_OPEN_POSITIONS)}
+        gate = warm_gate(warm_engine(held))
+        self.assertEqual(gate.check(signal("BTCUSDT")), (False, "max_open_positions"))
+        self.assertEqual(gate.check(signal("S0")), (True, None))  # Adds to a held symbol
+
+class TestGateStartup(unittest.IsolatedAsyncioTestCase):
+    """The gate's first refresh completes at start, so the first signal is not rejected as stale; the risk feed starts with it."""
+
+    async def asyncSetUp(self):
+        self.redis = fakeredis.aioredis.FakeRedis()
+        await self.redis.set(f"titan:prod::{Exchange_Compliance_Engine.EXCHANGE_NAME}_rules", json.dumps({}))
+        self.feeds = []
+        self.patches = [patch.object(pre_trade_gate, "default_gate", pre_trade_gate.PreTradeGate(engine=warm_engine())),
+                        patch.object(pre_trade_gate, "_refresher", None),
+                        patch.object(portfolio_risk_engine, "ensure_feed", lambda symbols=None, redis=None: self.feeds.append(redis))]
+        for patcher in self.patches:
+            patcher.start()
+
+    async def asyncTearDown(self):
+        pre_trade_gate._refresher.cancel()
+        await asyncio.gather(pre_trade_gate._refresher, return_exceptions=True)
+        for patcher in self.patches:
+            patcher.stop()
+
+    async def test_first_signal_after_start_passes_gate(self):
+        self.assertFalse(pre_trade_gate.default_gate.allows(signal("BTCUSDT")))  # Cold gate: stale state
+        await pre_trade_gate.start_refresh(self.redis)
+        self.assertEqual(self.feeds, [self.redis])
+        self.assertTrue(await execution_orchestrator.pre_trade_allowed(signal("BTCUSDT")))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import json
+import unittest
+from unittest.mock import AsyncMock, patch
+
+import fakeredis.aioredis
+
+import futures_execution_engine
+import pnl_ledger
+
+def hedge(symbol="BTCUSDT-PERP", side="BUY", quantity=2.0):
+    return {"symbol": symbol, "underlying": symbol.split("-")[0], "side": side, "quantity": quantity, "price": 30000.0, "strategy": "delta_hedger"}
+
+class FakeVenue:
+    """Bybit v5 order and execution endpoints: each order fills in the reported ``executions`` (qty, price) pieces."""
+
+    def __init__(self, executions=None, reject=()):
+        self.executions = executions or {}
+        self.reject = set(reject)
+        self.orders = {}
+
+    async def signed_request(self, method, endpoint, params=None, body=None):
+        if endpoint == "/v5/order/create":
+            if body["symbol"] in self.reject:
+                return {"retCode": 10001, "retMsg": "rejected"}
+            order_id = f"order-{len(self.orders)}"
+            self.orders[order_id] = body
+            return {"retCode": 0, "result": {"orderId": order_id}}
+        body = self.orders[params["orderId"]]
+        pieces = self.executions.get(body["symbol"], [(float(body["qty"]), 30010.0)])
+        return {"retCode": 0, "result": {"list": [{"execId": f"{params['orderId']}-{n}", "side": body["side"], "execQty": str(qty), "execPrice": str(price),
+                                                    "execFee": "0.5", "execTime": "1700000000000"} for n, (qty, price) in enumerate(pieces)]}}
+
+class TestHedgeExecution(unittest.IsolatedAsyncioTestCase):
+    """Hedge orders go to the futures venue and only reported executions reach the ledger."""
+
+    async def asyncSetUp(self):
+        self.redis = fakeredis.aioredis.FakeRedis()
+        self.venue = FakeVenue(executions={"ETHUSDT": [(0.5, 2000.0)]}, reject={"SOLUSDT"})
+        self.patches = [patch.object(futures_execution_engine, "redis", self.redis),
+                        patch.object(futures_execution_engine, "bybit_api", self.venue),
+                        patch.object(futures_execution_engine, "HEDGE_FILL_POLL_INTERVAL", 0.0)]
+        for patcher in self.patches:
+            patcher.start()
+
+    async def asyncTearDown(self):
+        for patcher in self.patches:
+            patcher.stop()
+
+    async def test_ledger_records_reported_executions_only(self):
+        fills = await futures_execution_engine.execute_hedge_batch({"cycle": 7, "orders": [hedge(), hedge("ETHUSDT-PERP", "SELL", 1.0), hedge("SOLUSDT-PERP")]})
+        self.assertEqual([order["category"] for order in self.venue.orders.values()], ["linear", "linear"])
+        self.assertEqual([(fill["symbol"], fill["side"], fill["quantity"], fill["price"]) for fill in fills],
+                         [("BTCUSDT-PERP", "BUY", 2.0, 30010.0), ("ETHUSDT-PERP", "SELL", 0.5, 2000.0)])  # Partial ETH fill, rejected SOL order
+        self.assertEqual(fills[0]["timestamp_ns"], 1700000000000 * 1_000_000)
+        entries = await self.redis.xrange(pnl_ledger.LEDGER_STREAM)
+        self.assertEqual(len(entries), 2)
+
+    async def test_nothing_reported_records_nothing(self):
+        self.venue.reject = {"BTCUSDT"}
+        self.assertEqual(await futures_execution_engine.execute_hedge_batch({"cycle": 8, "orders": [hedge()]}), [])
+        self.assertEqual(await self.redis.xlen(pnl_ledger.LEDGER_STREAM), 0)
+
+class TestDispatch(unittest.IsolatedAsyncioTestCase):
+    """Dispatcher messages route by channel: hedge batches whole, execution requests one signal at a time."""
+
+    async def test_routes_by_channel(self):
+        batch = {"cycle": 1, "orders": [hedge()]}
+        with patch.object(futures_execution_engine, "execute_hedge_batch", AsyncMock()) as execute_hedge_batch, \
+                patch.object(futures_execution_engine, "execute_order", AsyncMock()) as execute_order:
+            await futures_execution_engine.handle_message({"channel": futures_execution_engine.HEDGE_EXECUTION_CHANNEL.encode(), "data": json.dumps(batch).encode()})
+            await futures_execution_engine.handle_message({"channel": b"titan:prod:execution_requests", "data": json.dumps({"symbol": "BTCUSDT", "side": "BUY", "confidence": 0.9}).encode()})
+        execute_hedge_batch.assert_awaited_once_with(batch)
+        execute_order.assert_awaited_once()
+        self.assertEqual(execute_order.await_args.args[0]["symbol"], "BTCUSDT")
+
+if __name__ == '__main__':
+    unittest.main()
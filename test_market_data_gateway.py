@@ -0,0 +1,84 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+
+import Market_Data_Gateway
+from Fake_Exchange_Server import FakeExchangeServer
+from Market_Data_Gateway import MarketDataGateway, gateway_reconnects_total
+
+EXCHANGES = ["binance", "bybit", "kucoin"]
+SYMBOLS = ["BTCUSDT", "ETHUSDT"]
+DEPTH = 10
+
+class TestMarketDataGateway(unittest.IsolatedAsyncioTestCase):
+    """Runs the gateway against Fake_Exchange_Server with dropped diffs and forced disconnects."""
+
+    async def asyncSetUp(self):
+        self.server = FakeExchangeServer(symbols=SYMBOLS, tick_interval=0.005, gap_every=9, disconnect_after=600, seed=3)
+        base_url = await self.server.start(port=0)
+        ws_url = base_url.replace("http", "ws", 1)
+        self.patches = [
+            patch.object(Market_Data_Gateway, "BINANCE_WS_URL", f"{ws_url}/stream"),
+            patch.object(Market_Data_Gateway, "BINANCE_REST_URL", base_url),
+            patch.object(Market_Data_Gateway, "BYBIT_WS_URL", f"{ws_url}/bybit"),
+            patch.object(Market_Data_Gateway, "KUCOIN_REST_URL", base_url),
+            patch.object(Market_Data_Gateway, "RECONNECT_DELAY", 0.05),
+            patch.object(Market_Data_Gateway, "RECOVERY_RETRY_DELAY", 0.05),
+        ]
+        for patcher in self.patches:
+            patcher.start()
+
+    async def asyncTearDown(self):
+        for patcher in self.patches:
+            patcher.stop()
+        await self.server.stop()
+
+    def _reconnects(self):
+        return {exchange: gateway_reconnects_total.labels(exchange=exchange)._value.get() for exchange in EXCHANGES}
+
+    async def _settled(self, gateway, timeout=10.0):
+        """Waits until every queued frame is sent and every book is back in sync."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while loop.time() < deadline:
+            drained = all(connection.queue.empty() for connection in self.server.connections)
+            synced = all(gateway.book(exchange, symbol).synced for exchange in EXCHANGES for symbol in SYMBOLS)
+            if drained and synced:
+                await asyncio.sleep(0.2)  # Frames already on the wire
+                return True
+            await asyncio.sleep(0.05)
+        return False
+
+    async def test_books_match_fake_exchange_after_gaps_and_reconnects(self):
+        reconnects_before = self._reconnects()
+        gateway = MarketDataGateway(exchanges=EXCHANGES, symbols=SYMBOLS)
+        trades = {exchange: 0 for exchange in EXCHANGES}
+
+        def on_event(event):
+            if event["type"] == "trade":
+                trades[event["exchange"]] += 1
+
+        gateway.add_listener(on_event)
+        task = asyncio.create_task(gateway.run())
+        try:
+            await asyncio.sleep(4)
+            self.server.gap_every = 0  # A dropped final diff is only detectable from the diff after it
+            await asyncio.sleep(0.5)
+            self.server.ticker.cancel()  # Freeze the markets so both sides can be compared
+            self.assertTrue(await self._settled(gateway), "gateway books did not resync")
+
+            for exchange in EXCHANGES:
+                self.assertGreater(trades[exchange], 0, exchange)
+                self.assertGreater(self._reconnects()[exchange], reconnects_before[exchange], exchange)
+                for symbol in SYMBOLS:
+                    bids, asks, _ = self.server.markets[(exchange, symbol)].snapshot(DEPTH)
+                    book = gateway.book(exchange, symbol)
+                    self.assertEqual(book.bids.top(DEPTH), [[float(p), float(q)] for p, q in bids], (exchange, symbol))
+                    self.assertEqual(book.asks.top(DEPTH), [[float(p), float(q)] for p, q in asks], (exchange, symbol))
+            self.assertGreater(self.server.dropped_diffs, 0)
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+from unittest.mock import patch
+
+import fakeredis.aioredis
+
+import pnl_ledger
+
+DAY_NS = 86400 * 1_000_000_000
+
+def fill(side, price, **extra):
+    return {"strategy": "momentum", "symbol": "BTCUSDT", "side": side, "quantity": 1.0, "price": price, **extra}
+
+class TestFillSessions(unittest.IsolatedAsyncioTestCase):
+    """A fill lands in the same session on every replay, whenever the replay runs."""
+
+    async def asyncSetUp(self):
+        self.redis = fakeredis.aioredis.FakeRedis()
+
+    async def test_unstamped_fills_are_stamped_before_they_are_written(self):
+        with patch.object(pnl_ledger.time, "time_ns", return_value=10 * DAY_NS + pnl_ledger.SESSION_START_HOUR * 3600 * 10**9):
+            await pnl_ledger.record_fill(self.redis, fill("buy", 100.0))
+            await pnl_ledger.record_fills(self.redis, [fill("sell", 110.0)])
+        session = pnl_ledger.session_of(10 * DAY_NS + pnl_ledger.SESSION_START_HOUR * 3600 * 10**9)
+        for later in (11, 40):  # Replays on later days
+            with patch.object(pnl_ledger.time, "time_ns", return_value=later * DAY_NS):
+                state = await pnl_ledger.replay(self.redis, pnl_ledger.LedgerState())
+            self.assertEqual(state.session(session)["realized"], 10.0)
+
+    async def test_stamped_fills_keep_their_own_time(self):
+        await pnl_ledger.record_fill(self.redis, fill("buy", 100.0, timestamp_ns=3 * DAY_NS + DAY_NS // 2))
+        entries = await self.redis.xrange(pnl_ledger.LEDGER_STREAM)
+        self.assertEqual(pnl_ledger._decode(entries[0][1])["timestamp_ns"], 3 * DAY_NS + DAY_NS // 2)
+
+    def test_legacy_fill_without_timestamp_is_dated_by_entry_id(self):
+        state = pnl_ledger.LedgerState()
+        entry_ms = (5 * DAY_NS + DAY_NS // 2) // 1_000_000
+        state.apply(fill("buy", 100.0), f"{entry_ms}-0")
+        state.apply(fill("sell", 105.0), f"{entry_ms + 1}-0")
+        self.assertEqual(state.session(pnl_ledger.session_of(5 * DAY_NS + DAY_NS // 2))["realized"], 5.0)
+
+if __name__ == '__main__':
+    unittest.main()
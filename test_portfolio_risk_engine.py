@@ -0,0 +1,81 @@
+import asyncio
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import fakeredis.aioredis
+import numpy as np
+
+import pnl_ledger
+from candle_store import CandleStore
+from portfolio_risk_engine import PortfolioRiskEngine, parse_fill, warm_up
+
+MINUTE = 60_000_000_000
+
+def store_closes(store, symbol, closes, start=1_700_000_000 * 1_000_000_000):
+    timestamps = start + MINUTE * np.arange(len(closes))
+    store.append(symbol, "1m", {"timestamp": timestamps, "open": closes, "high": closes, "low": closes, "close": closes,
+                               "volume": np.ones(len(closes))})
+
+class TestWarmUp(unittest.IsolatedAsyncioTestCase):
+    """A fresh engine is not warm; warm_up seeds it from the candle store and the ledger, then follows the ledger."""
+
+    async def asyncSetUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = CandleStore(self.tmp.name)
+        rng = np.random.default_rng(4)
+        store_closes(self.store, "BTCUSDT", 30000 * np.exp(np.cumsum(rng.normal(0, 0.002, 60))))
+        store_closes(self.store, "ETHUSDT", 2000 * np.exp(np.cumsum(rng.normal(0, 0.003, 60))))
+        self.redis = fakeredis.aioredis.FakeRedis()
+        self.patches = [patch.object(pnl_ledger, "default_ledger", pnl_ledger.PnLLedger()),
+                        patch.object(pnl_ledger, "_feed", None), patch.object(pnl_ledger, "LEDGER_BLOCK_MS", 50)]
+        for patcher in self.patches:
+            patcher.start()
+
+    async def asyncTearDown(self):
+        if pnl_ledger._feed is not None:
+            pnl_ledger._feed.cancel()
+            await asyncio.gather(pnl_ledger._feed, return_exceptions=True)
+        for patcher in self.patches:
+            patcher.stop()
+        self.tmp.cleanup()
+
+    async def test_engine_starts_cold(self):
+        engine = PortfolioRiskEngine(["BTCUSDT"])
+        self.assertFalse(engine.is_warm())
+        self.assertEqual(engine.risk_fraction(), 0.0)
+        self.assertFalse(engine.snapshot()["warm"])
+
+    async def test_seeded_from_ledger_and_store_then_follows_ledger(self):
+        await pnl_ledger.record_fill(self.redis, {"strategy": "a", "symbol": "BTCUSDT", "side": "buy", "quantity": 2.0, "price": 30000.0})
+        await pnl_ledger.record_fill(self.redis, {"strategy": "b", "symbol": "BTCUSDT", "side": "sell", "quantity": 0.5, "price": 30100.0})
+        engine = PortfolioRiskEngine()
+        applied = []
+
+        def on_fill(fill):
+            engine.on_fill(*parse_fill(fill))
+            applied.append(fill)
+
+        await warm_up(self.redis, ["BTCUSDT", "ETHUSDT"], engine, self.store, on_fill)
+        self.assertTrue(engine.is_warm())
+        self.assertEqual(engine.position("BTCUSDT")["quantity"], 1.5)
+        self.assertEqual(engine.scenarios, 59)
+        self.assertGreater(engine.risk_fraction(), 0.0)
+
+        await pnl_ledger.record_fill(self.redis, {"strategy": "a", "symbol": "ETHUSDT", "side": "buy", "quantity": 3.0, "price": 2000.0})
+        for _ in range(100):
+            if applied:
+                break
+            await asyncio.sleep(0.01)
+        self.assertEqual(len(applied), 1)  # Only the fill after the seed
+        self.assertEqual(engine.position("ETHUSDT")["quantity"], 3.0)
+        self.assertEqual(engine.position("BTCUSDT")["quantity"], 1.5)
+
+    async def test_no_history_stays_cold(self):
+        engine = PortfolioRiskEngine()
+        await warm_up(self.redis, ["SOLUSDT"], engine, self.store)
+        self.assertTrue(engine.seeded)
+        self.assertFalse(engine.is_warm())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, patch
+
+import fakeredis.aioredis
+
+from redis_connection_manager import AsyncRedisPoolRegistry
+
+FAKE = fakeredis.aioredis.FakeAsyncRedisConnection  # Connection-level PING checks are off below: fakeredis does not answer them
+
+class TestHealthCheckStartup(unittest.IsolatedAsyncioTestCase):
+    """The registry's health-check loop starts with the first command on any pool, once per event loop."""
+
+    async def asyncSetUp(self):
+        self.registry = AsyncRedisPoolRegistry()
+        # Clients are created before the loop is used, as module-level clients are at import
+        self.client = self.registry.get_client("redis://localhost:6379/0", connection_class=FAKE, health_check_interval=0)
+        self.other = self.registry.get_client("redis://localhost:6379/1", connection_class=FAKE, health_check_interval=0)
+
+    async def asyncTearDown(self):
+        await self.registry.close_all()
+
+    async def test_first_command_starts_one_health_check_task(self):
+        self.assertIsNone(self.registry._health_task)
+        await self.client.set("key", "value")
+        task = self.registry._health_task
+        self.assertIsNotNone(task)
+        self.assertIs(task.get_loop(), asyncio.get_running_loop())
+        await self.other.get("key")
+        await self.client.get("key")
+        self.assertIs(self.registry._health_task, task)
+        self.assertFalse(task.done())
+
+    async def test_close_all_stops_the_task(self):
+        await self.client.ping()
+        task = self.registry._health_task
+        await self.registry.close_all()
+        await asyncio.gather(task, return_exceptions=True)
+        self.assertTrue(task.cancelled())
+
+    async def test_loop_checks_every_pool_on_its_interval(self):
+        registry = AsyncRedisPoolRegistry(health_check_interval=0.01)
+        client = registry.get_client("redis://localhost:6379/3", connection_class=FAKE, health_check_interval=0)
+        with patch.object(registry, "health_check", AsyncMock(return_value={})) as health_check:
+            await client.ping()
+            await asyncio.sleep(0.1)
+            await registry.close_all()
+        self.assertGreaterEqual(health_check.await_count, 2)
+
+    async def test_non_positive_interval_disables_it(self):
+        registry = AsyncRedisPoolRegistry(health_check_interval=0)
+        client = registry.get_client("redis://localhost:6379/2", connection_class=FAKE, health_check_interval=0)
+        await client.ping()
+        self.assertIsNone(registry._health_task)
+        await registry.close_all()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, patch
+
+import fakeredis.aioredis
+
+import redundant_signal_filter
+
+def signal(confidence=0.9):
+    return {"symbol": "BTCUSDT", "side": "BUY", "strategy": "momentum", "confidence": confidence}
+
+class TestSharedWindow(unittest.IsolatedAsyncioTestCase):
+    """The dedupe window lives in Redis, so consumers in one group share it."""
+
+    async def asyncSetUp(self):
+        self.redis = fakeredis.aioredis.FakeRedis()
+        self.patches = [patch.object(redundant_signal_filter, "redis", self.redis)]
+        for patcher in self.patches:
+            patcher.start()
+
+    async def asyncTearDown(self):
+        for patcher in self.patches:
+            patcher.stop()
+
+    async def test_concurrent_copies_forward_once(self):
+        claims = await asyncio.gather(*(redundant_signal_filter.claim_signal(signal()) for _ in range(5)))
+        self.assertEqual(claims.count(True), 1)
+
+    async def test_window_expires(self):
+        with patch.object(redundant_signal_filter, "SIGNAL_TIME_WINDOW", 0.05):
+            await redundant_signal_filter.remember_signal(signal())
+            self.assertTrue(await redundant_signal_filter.is_redundant(signal()))
+            await asyncio.sleep(0.1)
+            self.assertFalse(await redundant_signal_filter.is_redundant(signal()))
+
+    async def test_handle_signal_publishes_first_copy_only(self):
+        with patch.object(self.redis, "publish", AsyncMock()) as publish:
+            await redundant_signal_filter.handle_signal(signal())
+            await redundant_signal_filter.handle_signal(signal())
+        self.assertEqual(publish.await_count, 1)
+
+if __name__ == '__main__':
+    unittest.main()
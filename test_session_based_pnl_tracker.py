@@ -0,0 +1,62 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+
+import fakeredis.aioredis
+
+import mock_order_executor
+import pnl_ledger
+import session_based_pnl_tracker
+
+def signal(side, price):
+    return {"symbol": "BTCUSDT", "side": side, "strategy": "momentum", "price": price, "quantity": 2.0}
+
+class TestExecutorFillsToSessionPnL(unittest.IsolatedAsyncioTestCase):
+    """Fills from the mock executor reach the ledger and the session PnL the tracker reports."""
+
+    async def asyncSetUp(self):
+        self.redis = fakeredis.aioredis.FakeRedis()
+        self.patches = [
+            patch.object(mock_order_executor, "redis", self.redis),
+            patch.object(mock_order_executor, "EXECUTION_LATENCY", 0),
+            patch.object(session_based_pnl_tracker, "redis", self.redis),
+            patch.object(pnl_ledger, "default_ledger", pnl_ledger.PnLLedger()),
+            patch.object(pnl_ledger, "_feed", None),
+            patch.object(pnl_ledger, "LEDGER_BLOCK_MS", 50),
+        ]
+        for patcher in self.patches:
+            patcher.start()
+        pnl_ledger.ensure_feed(self.redis)
+        await pnl_ledger.ready_state()
+
+    async def asyncTearDown(self):
+        pnl_ledger._feed.cancel()
+        await asyncio.gather(pnl_ledger._feed, return_exceptions=True)
+        for patcher in self.patches:
+            patcher.stop()
+
+    async def wait_for_fills(self, count):
+        state = pnl_ledger.default_ledger.state
+        for _ in range(200):
+            if state.fills >= count:
+                return state
+            await asyncio.sleep(0.01)
+        self.fail(f"ledger saw {state.fills} of {count} fills")
+
+    async def test_round_trip_shows_in_session_pnl(self):
+        await mock_order_executor.simulate_order_execution(signal("BUY", 100.0))
+        await mock_order_executor.simulate_order_execution(signal("SELL", 110.0))
+        state = await self.wait_for_fills(2)
+
+        self.assertEqual(state.position("momentum", "BTCUSDT")["quantity"], 0.0)
+        self.assertEqual(await session_based_pnl_tracker.get_session_pnl("BTCUSDT"), 20.0)
+        report = await session_based_pnl_tracker.report_session_pnl()
+        self.assertEqual(report["symbols"], {"BTCUSDT": 20.0})
+        self.assertEqual(float(await self.redis.get(session_based_pnl_tracker.SESSION_PNL_KEY)), 20.0)
+
+    async def test_rejected_order_records_nothing(self):
+        self.assertEqual(await mock_order_executor.simulate_order_execution({"symbol": "BTCUSDT", "side": "BUY"}), {})
+        self.assertEqual(await self.redis.xlen(pnl_ledger.LEDGER_STREAM), 0)
+
+if __name__ == '__main__':
+    unittest.main()
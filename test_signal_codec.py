@@ -0,0 +1,106 @@
+import asyncio
+import datetime
+import math
+import struct
+import unittest
+from unittest.mock import patch
+
+import signal_codec
+
+class FakeRegistry:
+    """Just enough of a Redis client for the codec version registry."""
+
+    def __init__(self):
+        self.hash = {}
+
+    async def hset(self, key, field, value):
+        self.hash[field] = str(value).encode()
+
+    async def hgetall(self, key):
+        return dict(self.hash)
+
+class TestSignalCodec(unittest.TestCase):
+
+    def round_trip(self, signal):
+        return signal_codec.decode(signal_codec.encode(signal, "binary"))
+
+    def test_round_trip_full_signal(self):
+        signal = {"timestamp_ns": 1_700_000_000_123_456_789, "symbol": "BTCUSDT", "side": "buy", "strategy": "momentum",
+                  "signal_id": "abc", "confidence": 0.9, "price": 50000.5, "quantity": 0.25, "leverage": 3}
+        self.assertEqual(self.round_trip(signal), signal)
+
+    def test_upper_case_side_is_preserved(self):
+        signal = {"symbol": "BTCUSDT", "side": "BUY", "strategy": "momentum", "confidence": 0.9}
+        self.assertEqual(self.round_trip(signal), signal)
+
+    def test_int_signal_id_stays_int(self):
+        signal = {"symbol": "BTCUSDT", "side": "sell", "strategy": "momentum", "signal_id": 42}
+        decoded = self.round_trip(signal)
+        self.assertEqual(decoded, signal)
+        self.assertIsInstance(decoded["signal_id"], int)
+
+    def test_missing_fields_stay_missing(self):
+        signal = {"symbol": "BTCUSDT", "side": "buy", "confidence": 0.5}
+        decoded = self.round_trip(signal)
+        self.assertEqual(decoded, signal)
+        self.assertNotIn("strategy", decoded)
+        self.assertNotIn("timestamp", decoded)
+        self.assertNotIn("timestamp_ns", decoded)
+
+    def test_iso_timestamp_and_number_types_are_preserved(self):
+        signal = {"timestamp": "2024-07-24T10:00:00", "symbol": "ETHUSDT", "strategy": "", "confidence": 1,
+                  "price": None, "quantity": math.nan}
+        decoded = self.round_trip(signal)
+        self.assertEqual(decoded["timestamp"], "2024-07-24T10:00:00")
+        self.assertEqual(decoded["strategy"], "")
+        self.assertIsInstance(decoded["confidence"], int)
+        self.assertIsNone(decoded["price"])
+        self.assertTrue(math.isnan(decoded["quantity"]))
+
+    def test_unrepresentable_field_is_rejected(self):
+        with self.assertRaises(signal_codec.CodecError):
+            signal_codec.encode({"symbol": "BTCUSDT", "created": datetime.datetime.now()}, "binary")
+
+    def test_version_1_frames_still_decode(self):
+        frame = (signal_codec.HEADER.pack(signal_codec.MAGIC, 1, 1, 0, 5, 0.7, math.nan, math.nan)
+                 + b"\x07BTCUSDT" + b"\x08momentum" + b"\x00")
+        self.assertEqual(signal_codec.decode(frame),
+                         {"timestamp_ns": 5, "side": "buy", "symbol": "BTCUSDT", "strategy": "momentum", "confidence": 0.7})
+
+    def test_numeric_epochs(self):
+        expected = 1_700_000_000_500_000_000
+        self.assertEqual(signal_codec.to_epoch_ns(1_700_000_000.5), expected)
+        self.assertEqual(signal_codec.to_epoch_ns(1_700_000_000_500), expected)
+        self.assertEqual(signal_codec.to_epoch_ns(expected), expected)
+        self.assertEqual(signal_codec.signal_time_ns({"timestamp": 1_700_000_000.5}), expected)
+
+    def test_bad_timestamps_raise_value_or_type_error(self):
+        for timestamp in ("not a time", [1, 2], math.inf, True):
+            with self.assertRaises((TypeError, ValueError)):
+                signal_codec.to_epoch_ns(timestamp)
+
+    def test_stamp_time_ns_from_iso_or_now(self):
+        stamped = signal_codec.stamp_time_ns({"timestamp": "2023-11-14T22:13:20.5", "symbol": "BTCUSDT"})
+        self.assertEqual(stamped["timestamp_ns"], 1_700_000_000_500_000_000)
+        self.assertEqual(stamped["timestamp"], "2023-11-14T22:13:20.5")  # Kept for JSON-only readers
+        self.assertIsInstance(signal_codec.stamp_time_ns({"symbol": "BTCUSDT"})["timestamp_ns"], int)
+        signal = {"timestamp_ns": 5}
+        self.assertIs(signal_codec.stamp_time_ns(signal), signal)
+
+    def test_default_encoding_is_json(self):
+        self.assertIsInstance(signal_codec.encode({"symbol": "BTCUSDT"}), str)
+
+    def test_stream_codec_needs_every_consumer(self):
+        registry = FakeRegistry()
+        signal_codec._negotiated.update(codec="json", expires=0.0)
+        with patch.object(signal_codec, "SIGNAL_CODEC", "binary"), patch.object(signal_codec, "CODEC_NEGOTIATION_TTL", 0):
+            self.assertEqual(asyncio.run(signal_codec.stream_codec(registry)), "json")
+            asyncio.run(signal_codec.advertise_version(registry, "signal_age_filter"))
+            self.assertEqual(asyncio.run(signal_codec.stream_codec(registry)), "binary")
+            asyncio.run(signal_codec.advertise_version(registry, "legacy_reader", signal_codec.JSON_VERSION))
+            self.assertEqual(asyncio.run(signal_codec.stream_codec(registry)), "json")
+        with patch.object(signal_codec, "SIGNAL_CODEC", "json"):
+            self.assertEqual(asyncio.run(signal_codec.stream_codec(registry)), "json")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import unittest
+
+from Triangular_Micro_Arb_Engine import ArbitrageGraph
+
+PAIRS = ["BTCUSDT", "ETHUSDT", "ETHBTC", "SOLETH", "SOLUSDT"]
+
+def mispriced_books(graph):
+    '''BTC -> ETH -> USDT -> BTC and BTC -> ETH -> SOL -> USDT -> BTC return 10% at the top of book; every other triangle loses.'''
+    graph.set_book("ETHBTC", [[0.099, 50]], [[0.1, 5], [0.102, 10]])
+    graph.set_book("ETHUSDT", [[11, 2], [10.5, 10]], [[11.1, 50]])
+    graph.set_book("SOLETH", [[0.45, 500]], [[0.5, 500]])
+    graph.set_book("SOLUSDT", [[5.5, 500]], [[5.6, 500]])
+    return graph.update("BTCUSDT", [[99, 50]], [[100, 1], [120, 5]])
+
+def from_btc(graph, cycles):
+    '''Currency paths of ``cycles`` rotated to start and end at BTC.'''
+    paths = []
+    for cycle in cycles:
+        path = graph.describe(cycle)["cycle"][:-1]
+        first = path.index("BTC")
+        paths.append(path[first:] + path[:first] + ["BTC"])
+    return paths
+
+class TestDetection(unittest.TestCase):
+    """Triangles through the updated pair and longer cycles through the swept pairs."""
+
+    def test_update_reports_the_profitable_triangle(self):
+        graph = ArbitrageGraph(PAIRS, fee=0.0, threshold=0.001)
+        opportunities = mispriced_books(graph)
+        self.assertEqual([opportunity["cycle"] for opportunity in opportunities], [["BTC", "ETH", "USDT", "BTC"]])
+        self.assertEqual([leg["side"] for leg in opportunities[0]["legs"]], ["BUY", "SELL", "BUY"])
+        self.assertAlmostEqual(opportunities[0]["net_return"], 0.1)
+
+    def test_consistent_prices_report_nothing(self):
+        graph = ArbitrageGraph(PAIRS, fee=0.0, threshold=0.001)
+        graph.set_book("ETHBTC", [[0.0999, 5]], [[0.1001, 5]])
+        graph.set_book("ETHUSDT", [[9.99, 5]], [[10.01, 5]])
+        self.assertEqual(graph.update("BTCUSDT", [[99.9, 5]], [[100.1, 5]]), [])
+        self.assertEqual(graph.find_negative_cycles(), [])
+
+    def test_unchanged_book_is_not_reported_twice(self):
+        graph = ArbitrageGraph(PAIRS, fee=0.0, threshold=0.001)
+        mispriced_books(graph)
+        self.assertEqual(graph.update("BTCUSDT", [[99, 50]], [[100, 1], [120, 5]]), [])
+        self.assertEqual(len(graph.update("BTCUSDT", [[99, 50]], [[100, 2], [120, 5]])), 1)  # Deeper size moved
+
+    def test_profitable_triangle_does_not_hide_longer_cycles(self):
+        graph = ArbitrageGraph(PAIRS, fee=0.0, threshold=0.001)
+        mispriced_books(graph)
+        self.assertEqual(from_btc(graph, graph.find_negative_cycles(["BTCUSDT"], min_length=4)), [["BTC", "ETH", "SOL", "USDT", "BTC"]])
+        every = from_btc(graph, graph.find_negative_cycles())
+        self.assertCountEqual(every, [["BTC", "ETH", "USDT", "BTC"], ["BTC", "ETH", "SOL", "USDT", "BTC"]])  # Each cycle once, whichever edge found it
+
+    def test_fees_remove_a_thin_cycle(self):
+        prices = lambda graph: (graph.set_book("ETHBTC", [[0.0999, 5]], [[0.1, 5]]), graph.set_book("ETHUSDT", [[10.02, 5]], [[10.05, 5]]),
+                                graph.update("BTCUSDT", [[99.9, 5]], [[100, 5]]))[-1]
+        self.assertEqual(len(prices(ArbitrageGraph(PAIRS, fee=0.0, threshold=0.0005))), 1)
+        self.assertEqual(prices(ArbitrageGraph(PAIRS, fee=0.001, threshold=0.0005)), [])
+
+class TestSizing(unittest.TestCase):
+    """Executable size walks each leg's levels while the marginal cycle rate clears the threshold."""
+
+    def test_size_walks_levels_until_the_marginal_cycle_stops_paying(self):
+        graph = ArbitrageGraph(PAIRS, fee=0.0, threshold=0.001)
+        opportunity = mispriced_books(graph)[0]
+        # 0.2 BTC until ETHUSDT's 2 ETH bid is used, 0.3 BTC until ETHBTC's 5 ETH ask is used,
+        # then until BTCUSDT's 100 USDT ask is used; the 120 ask level would lose money.
+        third = (100 - 0.2 * 110 - 0.3 * 105) * 0.102 / 10.5
+        self.assertAlmostEqual(opportunity["max_start_amount"], 0.5 + third)
+        self.assertAlmostEqual(opportunity["expected_profit"], 0.2 * 0.1 + 0.3 * 0.05 + third * (10.5 / 10.2 - 1))
+        self.assertEqual([leg["limit_price"] for leg in opportunity["legs"]], [0.102, 10.5, 100])
+
+    def test_fees_are_netted_per_level(self):
+        # 3% per leg leaves the top level (10%) profitable but not the second (5%)
+        graph = ArbitrageGraph(PAIRS, fee=0.03, threshold=0.001)
+        opportunity = mispriced_books(graph)[0]
+        first = 2 / (10 * 0.97)  # BTC whose ETH after the first fee uses ETHUSDT's 2 ETH bid
+        self.assertAlmostEqual(opportunity["max_start_amount"], first)
+        self.assertAlmostEqual(opportunity["expected_profit"], first * (1.1 * 0.97 ** 3 - 1))
+        self.assertEqual([leg["limit_price"] for leg in opportunity["legs"]], [0.1, 11, 100])
+
+    def test_size_stops_at_visible_depth(self):
+        graph = ArbitrageGraph(PAIRS, fee=0.0, threshold=0.001)
+        graph.set_book("ETHBTC", [[0.099, 50]], [[0.1, 5]])
+        graph.set_book("ETHUSDT", [[11, 50]], [[11.1, 50]])
+        opportunity = graph.update("BTCUSDT", [[99, 50]], [[100, 50]])[0]
+        self.assertAlmostEqual(opportunity["max_start_amount"], 0.5)  # All of the 5 ETH offered
+        self.assertAlmostEqual(opportunity["expected_profit"], 0.05)
+
+if __name__ == '__main__':
+    unittest.main()
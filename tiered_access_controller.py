@@ -6,7 +6,7 @@ Purpose: Module access control.
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -29,7 +29,7 @@ REDIS_PORT = config.get("REDIS_PORT", 6379)
 async def check_module_access(user_id, module_name):
     '''Checks if a user has access to a specific module based on their tier.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         tier_key = f"titan:auth:{user_id}:tier"
         user_tier = await redis.get(tier_key)
 
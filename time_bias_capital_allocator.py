@@ -6,7 +6,7 @@ Purpose: Allocates more capital during historically profitable hours (e.g., Asia
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -33,7 +33,7 @@ TOP_ROI_HOURS = config.get("TOP_ROI_HOURS", 3)  # Number of top ROI hours to boo
 async def get_hourly_pnl_stats():
     '''Retrieves hourly PnL statistics from Redis (placeholder).'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         # Placeholder: Replace with actual logic to fetch hourly PnL data
         hourly_pnl = {}
         for hour in range(24):
@@ -6,7 +6,7 @@ Purpose: Dynamically assesses current market environment and defines Titan’s o
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis, fetch_state
 import json
 import logging
 import os
@@ -28,6 +28,13 @@ except (FileNotFoundError, KeyError, json.JSONDecodeError) as e:
 REDIS_HOST = config.get("REDIS_HOST", "localhost")
 REDIS_PORT = config.get("REDIS_PORT", 6379)
 CONTEXT_UPDATE_INTERVAL = config.get("CONTEXT_UPDATE_INTERVAL", 60)  # Seconds
+CONTEXT_STATE_KEYS = {
+    "trend": "titan:prod::trend_detection",
+    "volatility": "titan:prod::volatility_analysis",
+    "chaos": "titan:chaos:index",
+    "velocity": "titan:prod::symbol_rotation_velocity",
+    "concentration": "titan:prod::whale_concentration",
+}
 
 async def get_trend_detection():
     '''Retrieves trend detection data (placeholder).'''
@@ -59,14 +66,26 @@ async def get_whale_concentration():
     concentration = random.uniform(0, 100)
     return concentration
 
+async def fetch_context_state():
+    '''Fetches every context input from Redis in one round trip.'''
+    try:
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        return await fetch_state(redis, CONTEXT_STATE_KEYS)
+    except Exception as e:
+        logger.error(json.dumps({"module": "titan_context_engine", "action": "fetch_context_state", "status": "error", "error": str(e)}))
+        return {}
+
 async def assess_market_context():
     '''Assesses the current market environment and defines Titan’s operating mode.'''
     try:
-        trend = await get_trend_detection()
-        volatility = await get_volatility_analysis()
-        chaos = await get_chaos_index()
-        velocity = await get_symbol_rotation_velocity()
-        concentration = await get_whale_concentration()
+        state = await fetch_context_state()
+
+        # Inputs missing from Redis fall back to the local estimators
+        trend = state["trend"].decode() if state.get("trend") else await get_trend_detection()
+        volatility = state["volatility"].decode() if state.get("volatility") else await get_volatility_analysis()
+        chaos = float(state["chaos"]) if state.get("chaos") else await get_chaos_index()
+        velocity = float(state["velocity"]) if state.get("velocity") else await get_symbol_rotation_velocity()
+        concentration = float(state["concentration"]) if state.get("concentration") else await get_whale_concentration()
 
         context = {
             "trend": trend,
@@ -108,7 +127,7 @@ if morphic_mode == "aggressive":
 async def post_context_to_redis(current_context):
     '''Posts the current market context to Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         key = "titan:prod:titan_context_engine:current_context"
         await redis.set(key, current_context)
         logger.info(json.dumps({"module": "titan_context_engine", "action": "post_context_to_redis", "status": "success", "current_context": current_context}))
@@ -140,7 +159,7 @@ if __name__ == "__main__":
     asyncio.run(main())
 
 # === Titan Module Footnotes ===
-# Implemented Features: async safety, market context assessment, Redis posting, chaos hook, morphic mode control
+# Implemented Features: async safety, single round-trip context fetch, market context assessment, Redis posting, chaos hook, morphic mode control
 # Deferred Features: integration with actual market data sources, more sophisticated context definitions
 # Excluded Features: direct trading actions
 # Quality Rating: 10/10 reviewed by Roo on 2025-03-28
\ No newline at end of file
@@ -6,7 +6,7 @@ Purpose: Master runtime hub for all user control.
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -29,7 +29,7 @@ REDIS_PORT = config.get("REDIS_PORT", 6379)
 async def set_control_parameter(parameter, value):
     '''Sets a control parameter in Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         key = f"titan:prod:titan_control_center:{parameter}"
         await redis.set(key, value)
         logger.info(json.dumps({"module": "titan_control_center", "action": "set_control_parameter", "status": "success", "parameter": parameter, "value": value}))
@@ -41,7 +41,7 @@ async def set_control_parameter(parameter, value):
 async def get_control_parameter(parameter):
     '''Gets a control parameter from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         key = f"titan:prod:titan_control_center:{parameter}"
         value = await redis.get(key)
         if value:
@@ -57,7 +57,7 @@ async def get_control_parameter(parameter):
 async def publish_control_message(message):
     '''Publishes a control message to Redis pub/sub.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         channel = "titan:prod:titan_control_center:control_channel"
         await redis.publish(channel, message)
         logger.info(json.dumps({"module": "titan_control_center", "action": "publish_control_message", "status": "success", "message": message}))
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -36,7 +36,7 @@ dashboard_latency_seconds = Histogram('dashboard_latency_seconds', 'Latency of d
 async def fetch_data():
     '''Fetches data from Redis for the React frontend.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         # Placeholder for fetching data logic (replace with actual fetching)
         trades = [{"symbol": "BTCUSDT", "side": "BUY", "pnl": 0.01}, {"symbol": "ETHUSDT", "side": "SELL", "pnl": -0.005}] # Simulate trades
         modules = {"MomentumStrategy": "Running", "ScalpingModule": "Halted"} # Simulate module status
@@ -81,7 +81,7 @@ async def generate_react_frontend(trades, modules, chaos_state, pnl):
 async def store_dashboard_data(html_content):
     '''Stores the dashboard data to Redis for serving.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         await redis.set("titan:dashboard:html", html_content)
         logger.info(json.dumps({"module": "titan_dashboard_react", "action": "Store Dashboard Data", "status": "Success"}))
         global dashboard_renders_total
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -39,7 +39,7 @@ module_health_status = Gauge('module_health_status', 'Health status of each modu
 async def check_module_health(module_name):
     '''Checks the health of a given module by monitoring Redis TTL decay, async thread leaks, memory spikes, and CPU/memory overuse.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         ttl_decay = await redis.get(f"titan:health:{module_name}:ttl_decay")
         thread_leaks = await redis.get(f"titan:health:{module_name}:thread_leaks")
         memory_spikes = await redis.get(f"titan:health:{module_name}:memory_spikes")
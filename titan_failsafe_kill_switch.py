@@ -6,7 +6,7 @@ Purpose: Emergency global halt.
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -29,7 +29,7 @@ REDIS_PORT = config.get("REDIS_PORT", 6379)
 async def trigger_kill_switch(reason):
     '''Triggers the failsafe kill switch and publishes a message to Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         key = "titan:core:halt"
         await redis.set(key, "true")
         logger.critical(json.dumps({"module": "titan_failsafe_kill_switch", "action": "trigger_kill_switch", "status": "triggered", "reason": reason}))
@@ -6,7 +6,7 @@ Purpose: Controls regional deployment rights.
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -32,7 +32,7 @@ FRANCHISE_CAP = config.get("FRANCHISE_CAP", 10)  # Maximum number of franchises
 async def create_franchise(region):
     '''Creates a new franchise and stores its details in Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         franchise_id = str(uuid.uuid4())
         license_key = str(uuid.uuid4())  # Generate a unique license key
         creation_date = datetime.datetime.now().isoformat()
@@ -55,7 +55,7 @@ async def create_franchise(region):
 async def get_franchise_count():
     '''Gets the total number of active franchises.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         count = 0
         async for key in redis.scan_iter(match="titan:franchise:*"):
             count += 1
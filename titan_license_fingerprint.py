@@ -6,7 +6,7 @@ Purpose: Traceable instance identity.
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -48,7 +48,7 @@ def generate_fingerprint():
 async def store_fingerprint(fingerprint):
     '''Stores the fingerprint in Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         key = "titan:fingerprint"
         await redis.set(key, fingerprint)
         logger.info(json.dumps({"module": "titan_license_fingerprint", "action": "store_fingerprint", "status": "success", "fingerprint": fingerprint, "redis_key": key}))
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -36,7 +36,7 @@ monitoring_latency_seconds = Histogram('monitoring_latency_seconds', 'Latency of
 async def fetch_data():
     '''Fetches data from Redis for monitoring.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         # Placeholder for fetching data logic (replace with actual fetching)
         trades = [{"symbol": "BTCUSDT", "side": "BUY", "pnl": 0.01}, {"symbol": "ETHUSDT", "side": "SELL", "pnl": -0.005}] # Simulate trades
         modules = {"MomentumStrategy": "Running", "ScalpingModule": "Halted"} # Simulate module status
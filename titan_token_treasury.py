@@ -6,7 +6,7 @@ Purpose: DAO-style treasury ledger.
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -31,7 +31,7 @@ TREASURY_WALLET = config.get("TREASURY_WALLET", "YOUR_TREASURY_WALLET_ADDRESS")
 async def record_treasury_transaction(token, amount, transaction_type):
     '''Records a transaction in the treasury ledger.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         key = f"titan:treasury:{token}"
         timestamp = datetime.datetime.now().isoformat()
         transaction = {"timestamp": timestamp, "amount": amount, "type": transaction_type}
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -38,7 +38,7 @@ logging_latency_seconds = Histogram('logging_latency_seconds', 'Latency of trade
 async def log_trade_data(trade):
     '''Logs entry/exit, SL, latency, confidence, module name to Redis + rotating file logs.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         log_message = json.dumps(trade)
 
         # Log to Redis
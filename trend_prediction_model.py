@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -40,7 +40,7 @@ trend_prediction_confidence = Gauge('trend_prediction_confidence', 'Confidence o
 async def fetch_market_data():
     '''AI model that predicts future macro or asset-level trends and warns modules to avoid risky assets.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         # Placeholder for fetching market data logic (replace with actual fetching)
         market_data = {"volatility": 0.05, "momentum": 0.6, "sentiment": 0.7} # Simulate market data
         logger.info(json.dumps({"module": "trend_prediction_model", "action": "Fetch Market Data", "status": "Success"}))
@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -47,7 +47,7 @@ TEST_KEYS = [
 async def publish_test_signals():
     '''Publish mock test signals to Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         for key in TEST_KEYS:
             signal = {"test": "signal"}
             await redis.setex(key, TEST_SIGNAL_EXPIRY, json.dumps(signal))
@@ -60,7 +60,7 @@ async def publish_test_signals():
 async def validate_ttl_hygiene():
     '''Validate TTL hygiene and key expiration across Titan Redis signals.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         ttl_violations = 0
         for key in TEST_KEYS:
             ttl = await redis.ttl(key)
@@ -82,7 +82,7 @@ async def validate_ttl_hygiene():
 async def cleanup_test_keys():
     '''Clean up all keys after test.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         for key in TEST_KEYS:
             await redis.delete(key)
         logger.info(json.dumps({"module": "ttl_and_signal_integrity_test", "action": "Cleanup Test Keys", "status": "Success"}))
@@ -6,7 +6,7 @@ Purpose: Secure store for API keys/user config.
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -61,7 +61,7 @@ def decrypt_data(encrypted_data, key):
 async def store_user_data(user_id, data, password):
     '''Stores encrypted user data in Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         key, salt = generate_key(password)
         encrypted_data = encrypt_data(json.dumps(data), key)
         await redis.set(f"titan:user:{user_id}:vault", encrypted_data)
@@ -75,7 +75,7 @@ async def store_user_data(user_id, data, password):
 async def retrieve_user_data(user_id, password):
     '''Retrieves and decrypts user data from Redis.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         salt_b64 = await redis.get(f"titan:user:{user_id}:salt")
         if not salt_b64:
             logger.warning(json.dumps({"module": "user_data_vault", "action": "retrieve_user_data", "status": "no_salt", "user_id": user_id}))
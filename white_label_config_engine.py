@@ -13,7 +13,7 @@ Summary of Enhancements:
 '''
 
 import asyncio
-import aioredis
+from redis_connection_manager import get_async_redis
 import json
 import logging
 import os
@@ -37,7 +37,7 @@ config_loading_latency_seconds = Histogram('config_loading_latency_seconds', 'La
 async def load_client_config(client_id):
     '''Isolates per-client deployments. Switches logo, headers, keys.'''
     try:
-        redis = aioredis.from_url(f"redis://{REDIS_HOST}:{REDIS_PORT}")
+        redis = get_async_redis(f"redis://{REDIS_HOST}:{REDIS_PORT}")
         config_json = await redis.get(f"{CLIENT_CONFIG_KEY_PREFIX}{client_id}:config")
         if config_json:
             config = json.loads(config_json)